@@ -0,0 +1,63 @@
+"""
+Run the backend service microbenchmarks.
+
+Usage example:
+    python -m backend.benchmarks --save backend/benchmarks/baselines/sqlite.json
+    python -m backend.benchmarks --compare backend/benchmarks/baselines/sqlite.json
+    python -m backend.benchmarks --filter "^requests\\." --scale 0.1
+
+Exits with status 1 when a benchmark's median is slower than its baseline by more
+than the tolerance.
+"""
+
+import argparse
+import logging
+import sys
+
+from backend.benchmarks import harness, services
+
+
+def main() -> int:
+    """Run the benchmarks and report them."""
+    parser = argparse.ArgumentParser(description="Run the backend service microbenchmarks.")
+    parser.add_argument("--filter", help="Only run benchmarks matching this regex.")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--scale", type=float, default=1.0, help="Scale the calls per measurement.")
+    parser.add_argument("--save", metavar="PATH", help="Save the results as a baseline.")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    with services.Environment() as environment:
+        results = harness.run(
+            environment, harness.select(args.filter), args.repeat, args.scale
+        )
+
+    print(f"{'benchmark':<36}{'min us':>12}{'median us':>12}{'p95 us':>12}")
+    for result in results:
+        print(
+            f"{result.name:<36}{result.min_us:>12.1f}"
+            f"{result.median_us:>12.1f}{result.p95_us:>12.1f}"
+        )
+
+    if args.save:
+        harness.save(results, args.save)
+
+    if not args.compare:
+        return 0
+
+    rows = harness.compare(results, harness.load(args.compare), args.tolerance)
+    print(f"\n{'benchmark':<36}{'baseline us':>12}{'median us':>12}{'ratio':>8}")
+    for row in rows:
+        ratio = f"{row['ratio']:.2f}" if row["ratio"] is not None else "new"
+        baseline = row["baseline_us"] or 0.0
+        flag = "  REGRESSED" if row["regressed"] else ""
+        print(
+            f"{row['name']:<36}{baseline:>12.1f}{row['median_us']:>12.1f}{ratio:>8}{flag}"
+        )
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""
+This module provides in-memory stand-ins for the boto3 clients used by the services.
+They keep just enough state to exercise the services without AWS, for the
+benchmarks and the tests.
+"""
+
+import io
+import json
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from hashlib import md5
+from typing import Any, Dict, Generator, List, Optional
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError
+
+
+def _client_error(code: str, message: str, status: int, operation: str) -> ClientError:
+    """Build a ClientError shaped like the ones boto3 raises."""
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": message},
+            "ResponseMetadata": {"HTTPStatusCode": status},
+        },
+        operation,
+    )
+
+
+class FakeS3Client:
+    """
+    In-memory S3 client.
+
+    Attributes:
+        objects (dict): Object bodies by (bucket, key).
+    """
+
+    def __init__(self, objects: Optional[Dict[tuple, bytes]] = None) -> None:
+        self.objects: Dict[tuple, bytes] = dict(objects or {})
+        self.modified: Dict[tuple, datetime] = {}
+
+    def put_object(self, Bucket: str, Key: str, Body: Any, **_: Any) -> dict:
+        # pylint: disable=invalid-name
+        """
+        Store an object.
+
+        Args:
+            Bucket (str): The bucket.
+            Key (str): The key.
+            Body (bytes | str | file): The body.
+
+        Returns:
+            dict: The response, with the object's ETag.
+        """
+        if hasattr(Body, "read"):
+            Body = Body.read()
+        if isinstance(Body, str):
+            Body = Body.encode("utf-8")
+        self.objects[(Bucket, Key)] = Body
+        self.modified[(Bucket, Key)] = datetime.now(timezone.utc)
+        return {"ETag": f'"{md5(Body).hexdigest()}"'}  # nosec B324
+
+    def head_object(self, Bucket: str, Key: str, **_: Any) -> dict:
+        # pylint: disable=invalid-name
+        """
+        Describe an object without its body.
+
+        Args:
+            Bucket (str): The bucket.
+            Key (str): The key.
+
+        Returns:
+            dict: The response, with the object's size, ETag and last modified time.
+
+        Raises:
+            ClientError: If there is no such object, with the code "404".
+        """
+        if (Bucket, Key) not in self.objects:
+            raise _client_error("404", "Not Found", 404, "HeadObject")
+        body = self.objects[(Bucket, Key)]
+        return {
+            "ContentLength": len(body),
+            "ETag": f'"{md5(body).hexdigest()}"',  # nosec B324
+            "LastModified": self.modified.get(
+                (Bucket, Key), datetime(2025, 1, 1, tzinfo=timezone.utc)
+            ),
+        }
+
+    def get_object(self, Bucket: str, Key: str, **_: Any) -> dict:
+        # pylint: disable=invalid-name
+        """
+        Get an object.
+
+        Args:
+            Bucket (str): The bucket.
+            Key (str): The key.
+
+        Returns:
+            dict: The response, with the object's body, ETag and last modified time.
+
+        Raises:
+            ClientError: If there is no such object, with the code "NoSuchKey".
+        """
+        if (Bucket, Key) not in self.objects:
+            raise _client_error("NoSuchKey", "Not Found", 404, "GetObject")
+        body = self.objects[(Bucket, Key)]
+        return {
+            "Body": io.BytesIO(body),
+            "ETag": f'"{md5(body).hexdigest()}"',  # nosec B324
+            "LastModified": self.modified.get(
+                (Bucket, Key), datetime(2025, 1, 1, tzinfo=timezone.utc)
+            ),
+        }
+
+
+class FakeSSMClient:
+    """
+    In-memory SSM client. Unknown parameters resolve to their own name.
+
+    Attributes:
+        parameters (dict): Parameter values by name.
+    """
+
+    def __init__(self, parameters: Optional[Dict[str, str]] = None) -> None:
+        self.parameters = dict(parameters or {})
+
+    def get_parameter(self, Name: str, **_: Any) -> dict:
+        # pylint: disable=invalid-name
+        """
+        Get a parameter.
+
+        Args:
+            Name (str): The parameter name.
+
+        Returns:
+            dict: The response, with the parameter's value.
+        """
+        return {"Parameter": {"Name": Name, "Value": self.parameters.get(Name, Name)}}
+
+
+class FakeSecretsManagerClient:
+    """
+    In-memory Secrets Manager client returning the same secret for every id.
+
+    Attributes:
+        secret (dict): The secret value.
+    """
+
+    def __init__(self, secret: Optional[Dict[str, str]] = None) -> None:
+        self.secret = dict(secret or {})
+
+    def get_secret_value(self, SecretId: str, **_: Any) -> dict:
+        # pylint: disable=invalid-name
+        """
+        Get the secret.
+
+        Args:
+            SecretId (str): The secret's id.
+
+        Returns:
+            dict: The response, with the secret as a JSON string.
+        """
+        return {"Name": SecretId, "SecretString": json.dumps(self.secret)}
+
+
+class FakeCognitoClient:
+    """
+    In-memory Cognito client.
+
+    Attributes:
+        users (list): The users in the pool, with their groups under "Groups".
+    """
+
+    def __init__(self, users: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.users = list(users or [])
+
+    def list_users(self, UserPoolId: str, **_: Any) -> dict:
+        # pylint: disable=invalid-name, unused-argument
+        """
+        List the users in the pool.
+
+        Args:
+            UserPoolId (str): The user pool.
+
+        Returns:
+            dict: The response, with the users without their groups.
+        """
+        return {
+            "Users": [
+                {key: value for key, value in user.items() if key != "Groups"}
+                for user in self.users
+            ]
+        }
+
+    def admin_list_groups_for_user(self, Username: str, **_: Any) -> dict:
+        # pylint: disable=invalid-name
+        """
+        List a user's groups.
+
+        Args:
+            Username (str): The user.
+
+        Returns:
+            dict: The response, with the groups.
+        """
+        user = next((user for user in self.users if user["Username"] == Username), {})
+        return {"Groups": [{"GroupName": group} for group in user.get("Groups", [])]}
+
+    def initiate_auth(self, AuthParameters: Dict[str, str], **_: Any) -> dict:
+        # pylint: disable=invalid-name
+        """
+        Sign a user in.
+
+        Args:
+            AuthParameters (dict): The USERNAME and PASSWORD.
+
+        Returns:
+            dict: The response, with an ID token.
+
+        Raises:
+            ClientError: If there is no such user, with the code "NotAuthorizedException".
+        """
+        if not any(
+            user["Username"] == AuthParameters.get("USERNAME") for user in self.users
+        ):
+            raise _client_error(
+                "NotAuthorizedException", "Incorrect username or password.", 400,
+                "InitiateAuth",
+            )
+        return {"AuthenticationResult": {"IdToken": "id-token"}}
+
+
+class FakeAws:  # pylint: disable=too-few-public-methods
+    """
+    A set of fake clients, handed out by service name.
+    """
+
+    def __init__(
+        self,
+        s3: Optional[FakeS3Client] = None,
+        ssm: Optional[FakeSSMClient] = None,
+        secretsmanager: Optional[FakeSecretsManagerClient] = None,
+        cognito: Optional[FakeCognitoClient] = None,
+    ) -> None:
+        self.clients = {
+            "s3": s3 or FakeS3Client(),
+            "ssm": ssm or FakeSSMClient(),
+            "secretsmanager": secretsmanager or FakeSecretsManagerClient(),
+            "cognito-idp": cognito or FakeCognitoClient(),
+        }
+
+    def client(self, service_name: str, *_: Any, **__: Any) -> Any:
+        """Return the fake client for a service, as boto3.client would."""
+        return self.clients[service_name]
+
+
+@contextmanager
+def fake_boto3(aws: FakeAws) -> Generator[FakeAws, None, None]:
+    """
+    Patch boto3.client so every service gets its client from aws.
+
+    Args:
+        aws (FakeAws): The fake clients.
+    """
+    with patch("boto3.client", side_effect=aws.client):
+        yield aws
@@ -0,0 +1,225 @@
+"""
+Microbenchmark harness for the backend services.
+
+Benchmarks are registered with the benchmark decorator. Each one takes the shared
+Environment, does its setup and returns the zero-argument callable to time.
+Results can be saved as a JSON baseline and later compared against it.
+"""
+
+import json
+import platform
+import re
+import statistics
+import timeit
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+Case = Callable[[Any], Callable[[], Any]]
+
+BENCHMARKS: Dict[str, "Benchmark"] = {}
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    A registered benchmark.
+
+    Attributes:
+        name (str): The benchmark name, e.g. "data.execute".
+        case (Case): Returns the callable to time, given the environment.
+        number (int): The calls per measurement.
+    """
+
+    name: str
+    case: Case
+    number: int
+
+
+@dataclass(frozen=True)
+class Result:
+    """
+    The timings of a benchmark, in microseconds per call.
+
+    Attributes:
+        name (str): The benchmark name.
+        number (int): The calls per measurement.
+        repeat (int): The number of measurements.
+        min_us (float): The fastest measurement.
+        median_us (float): The median measurement.
+        p95_us (float): The 95th percentile measurement.
+    """
+
+    name: str
+    number: int
+    repeat: int
+    min_us: float
+    median_us: float
+    p95_us: float
+
+
+def benchmark(name: str, number: int = 100) -> Callable[[Case], Case]:
+    """
+    Decorator to register a benchmark case.
+
+    Args:
+        name (str): The benchmark name.
+        number (int): The calls per measurement.
+
+    Returns:
+        function: The decorator.
+    """
+
+    def decorator(case: Case) -> Case:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark {name} is already registered.")
+        BENCHMARKS[name] = Benchmark(name, case, number)
+        return case
+
+    return decorator
+
+
+def select(pattern: Optional[str] = None) -> List[Benchmark]:
+    """
+    Select the registered benchmarks whose name matches a pattern.
+
+    Args:
+        pattern (str, optional): A regular expression searched in the names.
+
+    Returns:
+        List[Benchmark]: The benchmarks, sorted by name.
+    """
+    return [
+        BENCHMARKS[name]
+        for name in sorted(BENCHMARKS)
+        if pattern is None or re.search(pattern, name)
+    ]
+
+
+def measure(
+    name: str, call: Callable[[], Any], number: int, repeat: int = 7
+) -> Result:
+    """
+    Time a callable.
+
+    Args:
+        name (str): The benchmark name.
+        call (Callable): The callable to time.
+        number (int): The calls per measurement.
+        repeat (int): The number of measurements.
+
+    Returns:
+        Result: The timings.
+    """
+    call()
+    timings = sorted(
+        total / number * 1_000_000
+        for total in timeit.repeat(call, number=number, repeat=repeat)
+    )
+    p95 = timings[min(len(timings) - 1, round(0.95 * (len(timings) - 1)))]
+    return Result(
+        name=name,
+        number=number,
+        repeat=repeat,
+        min_us=timings[0],
+        median_us=statistics.median(timings),
+        p95_us=p95,
+    )
+
+
+def run(
+    environment: Any,
+    benchmarks: List[Benchmark],
+    repeat: int = 7,
+    scale: float = 1.0,
+) -> List[Result]:
+    """
+    Run benchmarks against an environment.
+
+    Args:
+        environment (Any): Passed to every case.
+        benchmarks (List[Benchmark]): The benchmarks to run.
+        repeat (int): The number of measurements per benchmark.
+        scale (float): Multiplies the calls per measurement.
+
+    Returns:
+        List[Result]: One result per benchmark.
+    """
+    return [
+        measure(
+            item.name,
+            item.case(environment),
+            max(1, int(item.number * scale)),
+            repeat,
+        )
+        for item in benchmarks
+    ]
+
+
+def save(results: List[Result], path: str) -> None:
+    """
+    Save results as a JSON baseline.
+
+    Args:
+        results (List[Result]): The results.
+        path (str): The baseline file.
+    """
+    baseline = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {
+            result.name: {
+                key: round(value, 3) if isinstance(value, float) else value
+                for key, value in asdict(result).items()
+            }
+            for result in results
+        },
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def load(path: str) -> Dict[str, Result]:
+    """
+    Load a JSON baseline.
+
+    Args:
+        path (str): The baseline file.
+
+    Returns:
+        Dict[str, Result]: The baseline results by name.
+    """
+    with open(path, encoding="utf-8") as file:
+        baseline = json.load(file)
+    return {name: Result(**result) for name, result in baseline["results"].items()}
+
+
+def compare(
+    results: List[Result], baseline: Dict[str, Result], tolerance: float = 0.25
+) -> List[Dict[str, Any]]:
+    """
+    Compare results against a baseline by their medians.
+
+    Args:
+        results (List[Result]): The current results.
+        baseline (Dict[str, Result]): The baseline results by name.
+        tolerance (float): The allowed slowdown, e.g. 0.25 for 25%.
+
+    Returns:
+        List[Dict[str, Any]]: One row per result, with its ratio to the baseline
+            and whether it regressed. Benchmarks missing from the baseline have no ratio.
+    """
+    rows = []
+    for result in results:
+        previous = baseline.get(result.name)
+        ratio = result.median_us / previous.median_us if previous else None
+        rows.append(
+            {
+                "name": result.name,
+                "median_us": result.median_us,
+                "baseline_us": previous.median_us if previous else None,
+                "ratio": ratio,
+                "regressed": ratio is not None and ratio > 1 + tolerance,
+            }
+        )
+    return rows
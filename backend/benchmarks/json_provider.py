@@ -0,0 +1,93 @@
+"""
+Microbenchmark of the JSON encode cost per public endpoint payload.
+
+Compares, for the songs, shows and upcoming shows payloads:
+    before: Flask's DefaultJSONProvider (stdlib json) encoding every response
+    fast: JSONProvider encoding every response with orjson
+    cached: JSONProvider serving the pre-encoded bytes
+
+Usage example:
+    python -m backend.benchmarks.json_provider --number 2000
+"""
+
+import argparse
+import json
+import os
+import timeit
+from typing import Any, Callable, Dict, List
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from backend.flask.catalog.snapshot import catalog_digest, create_hash
+from backend.flask.providers.json import JSONProvider
+
+ASSETS = os.path.join(os.path.dirname(__file__), "..", "..", "infra", "assets")
+
+
+def load_payloads(assets: str = ASSETS) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Load the endpoint payloads from the catalog assets.
+
+    Args:
+        assets (str): The assets directory.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: The payload of each endpoint.
+    """
+    payloads = {}
+    for name in ("songs", "shows"):
+        with open(os.path.join(assets, name, f"{name}.json"), encoding="utf-8") as file:
+            records = json.load(file)
+        for record in records:
+            record.setdefault("hash", create_hash(record))
+        payloads[name] = records
+
+    payloads["upcoming_shows"] = list(payloads["shows"])
+    return payloads
+
+
+def run(number: int) -> List[Dict[str, Any]]:
+    """
+    Time each encoding strategy for each payload.
+
+    Args:
+        number (int): The number of responses to time per measurement.
+
+    Returns:
+        List[Dict[str, Any]]: One result per payload, in microseconds per response.
+    """
+    app = Flask(__name__)
+    before = DefaultJSONProvider(app)
+    fast = JSONProvider(app)
+
+    results = []
+    with app.app_context():
+        for name, payload in load_payloads().items():
+            version = catalog_digest(payload)
+            strategies: Dict[str, Callable[[], Any]] = {
+                "before": lambda payload=payload: before.response(payload),
+                "fast": lambda payload=payload: fast.response(payload),
+                "cached": lambda name=name, version=version, payload=payload: (
+                    fast.cached_response(name, version, lambda: payload)
+                ),
+            }
+            result: Dict[str, Any] = {"payload": name, "bytes": len(fast.encode(payload))}
+            for strategy, call in strategies.items():
+                best = min(timeit.repeat(call, number=number, repeat=5))
+                result[strategy] = best / number * 1_000_000
+            results.append(result)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=2000)
+
+    print(f"{'payload':<16}{'bytes':>8}{'before us':>12}{'fast us':>12}{'cached us':>12}")
+    for row in run(parser.parse_args().number):
+        print(
+            f"{row['payload']:<16}{row['bytes']:>8}"
+            f"{row['before']:>12.1f}{row['fast']:>12.1f}{row['cached']:>12.1f}"
+        )
@@ -0,0 +1,385 @@
+"""
+Microbenchmarks of the hot backend service functions.
+
+The services run against in-memory AWS clients and a local database: SQLite by
+default, or the Postgres at DATABASE_URL.
+"""
+
+import json
+import tempfile
+import uuid
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Dict, List
+
+from flask import Flask
+from sqlalchemy import text
+
+from backend.benchmarks.aws import (
+    FakeAws,
+    FakeS3Client,
+    FakeSecretsManagerClient,
+    FakeSSMClient,
+    fake_boto3,
+)
+from backend.benchmarks.database import create_local_engine, local_database, truncate
+from backend.benchmarks.harness import benchmark
+from backend.flask.blueprints.render import RenderBlueprint
+from backend.flask.config import Config
+from backend.flask.providers.sqlalchemy import SQLALchemyJSONProvider
+from backend.flask.services.data import DataService
+from backend.flask.services.request import RequestService
+from backend.flask.services.s3 import S3Service
+from backend.flask.services.show import ShowService
+from backend.flask.services.statements import HOT_QUERIES
+
+BUCKET = "benchmark-bucket"
+SHOW_HASH = "benchmark-show"
+
+# The hot queries as the raw strings they replaced, with the parameters to run them with.
+HOT_QUERY_TEXT = {
+    "request_counts": (
+        "SELECT song_id, COUNT(*) as request_count FROM requests GROUP BY song_id",
+        {},
+    ),
+    "show_request_counts": (
+        "SELECT song_id, COUNT(*) as request_count FROM requests "
+        "WHERE show_hash = :show_hash GROUP BY song_id",
+        {"show_hash": SHOW_HASH},
+    ),
+    "duplicate_request": (
+        "SELECT 1 FROM requests "
+        "WHERE request_id = :request_id AND show_hash = :show_hash LIMIT 1",
+        {"request_id": uuid.UUID(int=0).hex, "show_hash": SHOW_HASH},
+    ),
+    "requested_song": (
+        "SELECT song_id FROM requests WHERE request_id = :request_id",
+        {"request_id": uuid.UUID(int=0).hex},
+    ),
+    "song": (
+        "SELECT * FROM songs WHERE id = :song_id",
+        {"song_id": str(uuid.UUID(int=0))},
+    ),
+}
+
+
+def generate_songs(count: int) -> List[Dict[str, Any]]:
+    """Generate song rows."""
+    return [
+        {
+            "id": str(uuid.UUID(int=index)),
+            "band_name": f"Band {index}",
+            "song_name": f"Song {index}",
+        }
+        for index in range(count)
+    ]
+
+
+def generate_shows(count: int) -> List[Dict[str, Any]]:
+    """Generate shows, half of them in the past."""
+    now = datetime.now()
+    shows = []
+    for index in range(count):
+        start = now + timedelta(days=index - count // 2)
+        shows.append(
+            {
+                "name": f"Show {index}",
+                "venue": f"Venue {index % 7}",
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(hours=3)).isoformat(),
+            }
+        )
+    return shows
+
+
+class Environment:
+    """
+    The services wired to fake AWS clients and a local database, inside an
+    application context.
+
+    Attributes:
+        app (Flask): The application.
+        config (Config): The configuration.
+        engine (Engine): The local database engine.
+        data (DataService): The data service.
+        requests (RequestService): The request service.
+        shows (ShowService): The show service.
+        songs (List[Dict[str, Any]]): The song rows.
+    """
+
+    def __init__(self, songs: int = 200, shows: int = 200, requests: int = 1000) -> None:
+        self.songs = generate_songs(songs)
+        self._shows = generate_shows(shows)
+        self._requests = requests
+        self._stack = ExitStack()
+
+    def __enter__(self) -> "Environment":
+        aws = FakeAws(
+            s3=FakeS3Client(
+                {(BUCKET, "shows/shows.json"): json.dumps(self._shows).encode("utf-8")}
+            ),
+            ssm=FakeSSMClient({"/benchmark-local/bucket-name": BUCKET}),
+            secretsmanager=FakeSecretsManagerClient({"engine": "sqlite"}),
+        )
+        self._stack.enter_context(fake_boto3(aws))
+        self.engine = create_local_engine()
+        self._stack.enter_context(local_database(self.engine))
+
+        self.config = Config(
+            project_name="benchmark",
+            environment="local",
+            catalog_cache_dir=self._stack.enter_context(tempfile.TemporaryDirectory()),
+        )
+        self.app = Flask(__name__)
+        self.app.json = SQLALchemyJSONProvider(self.app)
+        self.app.register_blueprint(RenderBlueprint())
+        self._stack.enter_context(self.app.app_context())
+
+        self.data = DataService(self.config)
+        self.requests = RequestService(self.config)
+        self.shows = ShowService(self.config)
+        self.seed()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stack.close()
+
+    def seed(self) -> None:
+        """Reset the database to the seeded songs and requests."""
+        truncate(self.engine)
+        self.data.write_table("songs", self.songs)
+        self.data.insert_rows(
+            "requests",
+            [
+                {
+                    "request_id": uuid.UUID(int=index).hex,
+                    "show_hash": SHOW_HASH,
+                    "song_id": self.songs[index % len(self.songs)]["id"],
+                    "request_time": datetime.now().isoformat(),
+                }
+                for index in range(self._requests)
+            ],
+        )
+
+
+@benchmark("data.execute", number=200)
+def data_execute(env: Environment) -> Callable[[], Any]:
+    """
+    Time a page of a show's requests read through DataService.execute.
+
+    Args:
+        env (Environment): The services.
+
+    Returns:
+        Callable[[], Any]: The call to time.
+    """
+    env.seed()
+    return lambda: env.data.execute(
+        "SELECT * FROM requests WHERE show_hash = :show_hash LIMIT 50",
+        {"show_hash": SHOW_HASH},
+    )
+
+
+@benchmark("data.insert", number=200)
+def data_insert(env: Environment) -> Callable[[], Any]:
+    """
+    Time inserting ten songs through DataService._insert.
+
+    Args:
+        env (Environment): The services.
+
+    Returns:
+        Callable[[], Any]: The call to time.
+    """
+    table = env.data.get_table("songs")
+    rows = env.songs[:10]
+    return lambda: env.data._insert(table, rows)  # pylint: disable=protected-access
+
+
+@benchmark("data.write_table", number=10)
+def data_write_table(env: Environment) -> Callable[[], Any]:
+    """
+    Time writing the whole songs table through DataService.write_table.
+
+    Args:
+        env (Environment): The services.
+
+    Returns:
+        Callable[[], Any]: The call to time.
+    """
+    return lambda: env.data.write_table("songs", env.songs)
+
+
+@benchmark("requests.redirect.new", number=500)
+def requests_redirect_new(env: Environment) -> Callable[[], Any]:
+    """
+    Time a fan's first scan of a show's QR code.
+
+    Args:
+        env (Environment): The services.
+
+    Returns:
+        Callable[[], Any]: The call to time.
+    """
+    env.seed()
+
+    def call() -> Any:
+        with env.app.test_request_context(f"/requests/redirect/{SHOW_HASH}"):
+            return env.requests.redirect(SHOW_HASH)
+
+    return call
+
+
+@benchmark("requests.redirect.duplicate", number=200)
+def requests_redirect_duplicate(env: Environment) -> Callable[[], Any]:
+    """
+    Time a scan by a fan who has already requested a song.
+
+    Args:
+        env (Environment): The services.
+
+    Returns:
+        Callable[[], Any]: The call to time.
+    """
+    env.seed()
+    cookie = f"totalRequestLiveRequestId={uuid.UUID(int=0).hex}"
+
+    def call() -> Any:
+        with env.app.test_request_context(
+            f"/requests/redirect/{SHOW_HASH}", headers={"Cookie": cookie}
+        ):
+            return env.requests.redirect(SHOW_HASH)
+
+    return call
+
+
+@benchmark("requests.write_request", number=200)
+def requests_write_request(env: Environment) -> Callable[[], Any]:
+    """
+    Time writing a song request.
+
+    Args:
+        env (Environment): The services.
+
+    Returns:
+        Callable[[], Any]: The call to time.
+    """
+    env.seed()
+
+    def call() -> Any:
+        with env.app.test_request_context("/requests", method="POST"):
+            return env.requests.write_request(
+                {"show_hash": SHOW_HASH, "song_id": env.songs[0]["id"]}
+            )
+
+    return call
+
+
+@benchmark("requests.get_requests_counts", number=200)
+def requests_get_requests_counts(env: Environment) -> Callable[[], Any]:
+    """
+    Time counting the requests per song.
+
+    Args:
+        env (Environment): The services.
+
+    Returns:
+        Callable[[], Any]: The call to time.
+    """
+    env.seed()
+    return env.requests.get_requests_counts
+
+
+def hot_query(env: Environment, name: str, cached: bool) -> Callable[[], Any]:
+    """
+    Run a hot query on an autocommit connection, as DataService.fetch does.
+
+    Cached runs the named Core construct with the compiled cache and, on psycopg,
+    prepares it on the server from its first run. Uncached parses the raw string
+    with text() on every call, without the compiled cache or prepared statements.
+
+    Args:
+        env (Environment): The services.
+        name (str): The hot query, a key of HOT_QUERIES.
+        cached (bool): Whether to run it cached.
+
+    Returns:
+        Callable[[], Any]: The call to time.
+    """
+    env.seed()
+    sql, params = HOT_QUERY_TEXT[name]
+    options: Dict[str, Any] = {"isolation_level": "AUTOCOMMIT"}
+    if not cached:
+        options["compiled_cache"] = None
+    engine = env.engine.execution_options(**options)
+
+    def call() -> Any:
+        with engine.connect() as connection:
+            dbapi_connection = connection.connection.dbapi_connection
+            threshold = getattr(dbapi_connection, "prepare_threshold", None)
+            if hasattr(dbapi_connection, "prepare_threshold"):
+                dbapi_connection.prepare_threshold = 0 if cached else None
+            try:
+                statement = HOT_QUERIES[name] if cached else text(sql)
+                return connection.execute(statement, params).all()
+            finally:
+                if hasattr(dbapi_connection, "prepare_threshold"):
+                    dbapi_connection.prepare_threshold = threshold
+
+    return call
+
+
+for _name in HOT_QUERIES:
+    benchmark(f"queries.{_name}.cached", number=500)(
+        partial(hot_query, name=_name, cached=True)
+    )
+    benchmark(f"queries.{_name}.uncached", number=500)(
+        partial(hot_query, name=_name, cached=False)
+    )
+
+
+@benchmark("providers.sqlalchemy.default", number=50)
+def providers_sqlalchemy_default(env: Environment) -> Callable[[], Any]:
+    """
+    Time the JSON provider serializing a SQLAlchemy table.
+
+    Args:
+        env (Environment): The services.
+
+    Returns:
+        Callable[[], Any]: The call to time.
+    """
+    provider = env.app.json
+    table = env.data.get_table("requests")
+    return lambda: provider.default(table)
+
+
+@benchmark("s3.create_hash", number=20000)
+def s3_create_hash(env: Environment) -> Callable[[], Any]:
+    """
+    Time hashing a catalog record.
+
+    Args:
+        env (Environment): The services.
+
+    Returns:
+        Callable[[], Any]: The call to time.
+    """
+    service: S3Service = env.shows
+    song = env.songs[0]
+    return lambda: service._create_hash(song)  # pylint: disable=protected-access
+
+
+@benchmark("shows.get_upcoming_shows", number=200)
+def shows_get_upcoming_shows(env: Environment) -> Callable[[], Any]:
+    """
+    Time listing the upcoming shows, once built.
+
+    Args:
+        env (Environment): The services.
+
+    Returns:
+        Callable[[], Any]: The call to time.
+    """
+    return env.shows.get_upcoming_shows
@@ -6,32 +6,50 @@ services, and API blueprints. The application can be run in different environmen
 by setting the appropriate configuration.
 """
 
+import functools
 import logging
 import os
+import signal
+import sys
+import tempfile
 
+import boto3
 from flask import Flask
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 
-from errors import register_error_handlers
-
 from backend.flask.blueprints.auth import AuthBlueprint
 from backend.flask.blueprints.data import DataBlueprint
 from backend.flask.blueprints.demo import DemoBlueprint
+from backend.flask.blueprints.health import HealthBlueprint
 from backend.flask.blueprints.render import RenderBlueprint
 from backend.flask.blueprints.request import RequestBlueprint
 from backend.flask.blueprints.show import ShowBlueprint
 from backend.flask.blueprints.song import SongBlueprint
 from backend.flask.blueprints.user import UserBlueprint
 from backend.flask.config import Config
+from backend.flask.errors import register_error_handlers
+from backend.flask.limits.admission import AdmissionController
+from backend.flask.limits.breaker import CircuitBreaker
+from backend.flask.limits.bucket import Rate, cache_location, create_backend
+from backend.flask.limits.limiter import Limits
+from backend.flask.limits.parking import DatabaseState
 from backend.flask.providers.json import JSONProvider
 from backend.flask.services.auth import AuthService
 from backend.flask.services.cognito import CognitoService
 from backend.flask.services.data import DataService
 from backend.flask.services.demo import DemoService
+from backend.flask.services.health import HealthService
+from backend.flask.services.partition import PartitionService
 from backend.flask.services.request import RequestService
 from backend.flask.services.show import ShowService
 from backend.flask.services.song import SongService
+from backend.flask.services.spool import RequestSpool, SpoolReplayer
+from backend.flask.telemetry.log import LogPipeline, parse_sample_rates
+from backend.flask.telemetry.metrics import BreakerCollector, Metrics
+from backend.flask.telemetry.scaling import RequestRateReporter
+from backend.flask.telemetry.queries import QueryProfiler
+from backend.flask.telemetry.tracing import SpanExporter, Tracer
 
 
 def _create_app(app_config: Config) -> Flask:
@@ -49,17 +67,81 @@ def _create_app(app_config: Config) -> Flask:
     flask_app.config.from_object(app_config)  # pylint: disable=no-member
 
     # Logging
+    LogPipeline(
+        app_config.log_level,
+        app_config.log_format,
+        parse_sample_rates(app_config.log_sample_rates),
+    ).init_app(flask_app)
     flask_app.logger.setLevel(app_config.log_level or "INFO")
-    logging.basicConfig(
-        level=app_config.log_level,
-        format="%(asctime)s %(name)s:%(levelname)s:%(pathname)s:%(lineno)d:%(message)s",
-    )
     flask_app.logger.debug("App Config : %s", app_config.__dict__)
     flask_app.logger.debug("Flask Config : %s", flask_app.config)
 
     # JSON Provider
     flask_app.json = JSONProvider(flask_app)
 
+    # Metrics (before the services, so their boto3 clients are instrumented)
+    metrics = Metrics()
+    metrics.init_app(flask_app)
+    if app_config.metrics_port:
+        metrics.serve(int(app_config.metrics_port))
+    if float(app_config.request_rate_interval or 0) > 0:
+        RequestRateReporter(
+            f"{app_config.project_name}-{app_config.environment}",
+            float(app_config.request_rate_interval),
+        ).init_app(flask_app)
+
+    # Tracing (before the services, so their boto3 clients are instrumented)
+    Tracer(SpanExporter.from_setting(app_config.trace_export)).init_app(flask_app)
+
+    # Query Profiler
+    QueryProfiler(
+        app_config.slow_query_ms, app_config.repeated_query_threshold
+    ).init_app(flask_app)
+
+    # Limits, shared through the show cache while it is deployed
+    locate = None
+    if app_config.cache_parameter:
+        locate = functools.partial(
+            cache_location,
+            boto3.client("ssm", region_name=app_config.AWS_DEFAULT_REGION),
+            app_config.cache_parameter,
+        )
+    Limits(
+        create_backend(
+            app_config.rate_limit_backend,
+            app_config.redis_host,
+            app_config.redis_port,
+            locate,
+        ),
+        Rate.parse(app_config.rate_limit_ip),
+        Rate.parse(app_config.rate_limit_show),
+        AdmissionController(int(app_config.admission_capacity or 64)),
+    ).init_app(flask_app)
+
+    # Database Circuit Breaker
+    breaker = CircuitBreaker(
+        int(app_config.db_breaker_threshold or 5),
+        float(app_config.db_breaker_reset or 10),
+    )
+    flask_app.extensions["db_breaker"] = breaker
+    metrics.registry.register(BreakerCollector(breaker))
+    # The database is parked outside shows, the scheduler publishes its state
+    if app_config.db_state_parameter:
+        flask_app.extensions["db_state"] = DatabaseState(
+            app_config.db_state_parameter,
+            boto3.client("ssm", region_name=app_config.AWS_DEFAULT_REGION),
+        )
+    # Shows created while the database is parked, or on other tasks, get their
+    # partitions on warm-up
+    show_service = ShowService(app_config, PartitionService(app_config))
+    flask_app.register_blueprint(
+        HealthBlueprint(
+            service=HealthService(
+                app_config, maintenance=show_service.maintain
+            )
+        )
+    )
+
     # CORS
     CORS(flask_app, resources={r"/*": {"origins": "https://throwbackrequestlive.com"}})
 
@@ -81,14 +163,21 @@ def _create_app(app_config: Config) -> Flask:
 
     # API Blueprints (Public)
     flask_app.register_blueprint(
-        ShowBlueprint(service=ShowService(app_config), url_prefix="/api")
+        ShowBlueprint(service=show_service, url_prefix="/api")
     )
     flask_app.register_blueprint(
         SongBlueprint(service=SongService(app_config), url_prefix="/api")
     )
 
+    # Requests are spooled while the database is down and replayed once it is back
+    spool = RequestSpool(
+        app_config.spool_dir
+        or os.path.join(tempfile.gettempdir(), f"{app_config.project_name}-spool")
+    )
+    request_service = RequestService(app_config, spool)
+    SpoolReplayer(spool, request_service.replay_requests).init_app(flask_app)
     flask_app.register_blueprint(
-        RequestBlueprint(service=RequestService(app_config)), url_prefix="/api"
+        RequestBlueprint(service=request_service), url_prefix="/api"
     )
     flask_app.register_blueprint(DemoBlueprint(service=DemoService(app_config)))
 
@@ -107,4 +196,11 @@ if __name__ == "__main__":
 
     config = Config(environment)
     app = _create_app(config)
+
+    def _terminate(*_):
+        # ECS stops a task with SIGTERM, so its spooled requests are handed over first
+        app.extensions["spool_replayer"].drain()
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, _terminate)
     app.run(host="0.0.0.0", port=5000, debug=config.debug)  # nosec B104
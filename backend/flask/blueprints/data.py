@@ -3,7 +3,6 @@ This module defines the DataBlueprint class and related functions
 for handling data-related routes in a Flask application.
 """
 
-import json
 from functools import wraps
 from typing import Any, Callable, Dict, List, Tuple
 
@@ -26,7 +25,7 @@ def override_json_provider(provider: Callable[[Flask], Any]) -> Callable:
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            app.logger.debug(f"Overriding JSON provider with {provider}")
+            app.logger.debug("Overriding JSON provider with %s", provider)
             original_provider = app.json
             app_instance = Flask(__name__)
             app.json = provider(app_instance)
@@ -61,7 +60,7 @@ class DataBlueprint(Blueprint):
             """
             app.logger.debug("Listing tables")
             tables = self._service.list_tables()
-            app.logger.debug(f"Tables: {tables}")
+            app.logger.debug("Tables: %s", tables)
             return jsonify(list(tables)), 200
 
         @self.route("/tables/<table_name>", methods=["GET"])
@@ -73,12 +72,10 @@ class DataBlueprint(Blueprint):
             :param table_name: The name of the table.
             :return: JSON response with the table details.
             """
-            app.logger.debug(f"Getting table {table_name}")
+            app.logger.debug("Getting table %s", table_name)
             self._service.validate_table_name(table_name)
             table = self._service.get_table(table_name)
-            app.logger.debug(
-                f"Table {table_name} details: {json.dumps(table, default=str,indent=2),}"
-            )
+            app.logger.debug("Table %s details: %s", table_name, table)
 
             return jsonify(table), 200
 
@@ -90,7 +87,7 @@ class DataBlueprint(Blueprint):
             :param table_name: The name of the table.
             :return: JSON response with the rows.
             """
-            app.logger.debug(f"Reading rows from {table_name}")
+            app.logger.debug("Reading rows from %s", table_name)
             rows = self._get_rows(table_name)
             return rows, 200
 
@@ -104,7 +101,7 @@ class DataBlueprint(Blueprint):
             """
             data = request.get_json()
             rows = data.get("rows", [])
-            app.logger.debug(f"Writing rows to {table_name} : {rows}")
+            app.logger.debug("Writing rows to %s : %s", table_name, rows)
             self._service.validate_table_name(table_name)
             result = self._service.write_table(table_name, rows)
             return jsonify(result), 200
@@ -116,7 +113,7 @@ class DataBlueprint(Blueprint):
         :return: List[Dict[str, Any]]: A list of rows from the table.
         """
         self._service.validate_table_name(table_name)
-        app.logger.debug(f"Getting rows from {table_name}")
-        rows = self._service.execute(f"SELECT * FROM {table_name}")  # nosec B608
-        app.logger.debug(f"First 10 Rows from {table_name}: {rows[:10]}")
+        app.logger.debug("Getting rows from %s", table_name)
+        rows = self._service.fetch(f"SELECT * FROM {table_name}", as_dicts=True)  # nosec B608
+        app.logger.debug("First 10 Rows from %s: %s", table_name, rows[:10])
         return rows
@@ -9,6 +9,8 @@ from typing import Any, Tuple
 from flask import make_response, request, send_file, jsonify, current_app as app
 
 from backend.flask.blueprints.request import RequestBlueprint
+from backend.flask.decorators.limit import priority
+from backend.flask.limits.admission import POLL
 from backend.flask.services.demo import DemoService
 
 
@@ -69,6 +71,7 @@ class DemoBlueprint(RequestBlueprint):
             return response
 
         @self.route("/api/requests/counts/DEMO", methods=["GET"])
+        @priority(POLL)
         def get_requests_counts() -> Tuple[Any, int]:
             """
             Gets the count of requests for the demo show.
@@ -0,0 +1,96 @@
+"""
+This module defines the HealthBlueprint class for the liveness and readiness checks
+and the warm-up before a show.
+"""
+
+from typing import Any, Tuple
+
+from flask import current_app as app
+from flask import jsonify
+from sqlalchemy.exc import OperationalError
+
+from backend.flask.blueprints.blueprint import Blueprint
+from backend.flask.decorators.limit import internal, priority, rate_limited
+from backend.flask.limits.admission import ADMIN
+from backend.flask.services.health import HealthService
+
+# Responses cached per task, built by requesting them once
+WARM_UP_PATHS = ("/api/shows", "/api/shows/upcoming", "/api/songs")
+
+
+class HealthBlueprint(Blueprint):
+    """
+    Blueprint for the health check routes.
+    """
+
+    _service: HealthService
+
+    def register_routes(self) -> None:
+        """
+        Register the health check routes.
+        """
+
+        @self.route("/health/live", methods=["GET"])
+        def live() -> Tuple[Any, int]:
+            """
+            Returns whether the process is serving requests.
+            """
+            return jsonify({"status": "ok"}), 200
+
+        @self.route("/health/ready", methods=["GET"])
+        def ready() -> Tuple[Any, int]:
+            """
+            Returns whether the database can be reached.
+            """
+            try:
+                return jsonify(self._service.readiness()), 200
+            except OperationalError as e:
+                return self._unavailable(e)
+
+        @self.route("/health/warm", methods=["POST"])
+        @internal
+        @priority(ADMIN)
+        @rate_limited()
+        def warm() -> Tuple[Any, int]:
+            """
+            Warms the task up before a show: opens the database connections,
+            runs the hot queries, maintains the request partitions and builds the
+            cached responses. Only the scheduler calls it, not the API.
+            """
+            try:
+                warmed = self._service.warm()
+            except OperationalError as e:
+                return self._unavailable(e)
+
+            if warmed["warmed"]:
+                client = app.test_client()
+                for path in WARM_UP_PATHS:
+                    client.get(path)
+            return jsonify(warmed), 200
+
+        @self.route("/health/spool", methods=["GET"])
+        @internal
+        def spool() -> Tuple[Any, int]:
+            """
+            Returns how many spooled request segments wait to be replayed, which the
+            scheduler checks before scaling in or stopping the database.
+            """
+            replayer = app.extensions.get("spool_replayer")
+            pending = replayer.spool.pending() if replayer is not None else 0
+            return jsonify({"status": "ok", "pending": pending}), 200
+
+    @staticmethod
+    def _unavailable(error: OperationalError) -> Tuple[Any, int]:
+        """
+        Respond that the database is unavailable, with its circuit's state.
+        """
+        breaker = app.extensions.get("db_breaker")
+        response = jsonify(
+            {
+                "status": "error",
+                "message": "The database is currently unavailable.",
+                "database": breaker.state if breaker is not None else None,
+            }
+        )
+        response.headers["Retry-After"] = str(getattr(error, "retry_after", 1))
+        return response, 503
@@ -10,6 +10,8 @@ from flask import request, redirect, url_for
 from sqlalchemy.exc import OperationalError
 
 from backend.flask.blueprints.data import DataBlueprint
+from backend.flask.decorators.limit import priority, rate_limited
+from backend.flask.limits.admission import POLL, SUBMIT
 from backend.flask.services.request import RequestService
 
 
@@ -26,6 +28,8 @@ class RequestBlueprint(DataBlueprint):
         """
 
         @self.route("/requests/redirect/<string:show_hash>", methods=["GET"])
+        @priority(SUBMIT)
+        @rate_limited(per_show=True)
         def redirect_request(show_hash: str) -> Tuple[Any, int]:
             """
             Redirects to the request page for a specific show.
@@ -37,6 +41,8 @@ class RequestBlueprint(DataBlueprint):
 
 
         @self.route("/requests", methods=["POST"])
+        @priority(SUBMIT)
+        @rate_limited(per_show=True)
         def write_request() -> Tuple[Any, int]:
             """
             Writes a new row in the 'requests' table.
@@ -45,7 +51,10 @@ class RequestBlueprint(DataBlueprint):
             song_request = request.get_json()
             return self._service.write_request(song_request), 201
 
+        # Polls are left out of the per-IP bucket, which a venue behind one address
+        # would drain on polls alone; admission sheds them first under overload
         @self.route("/requests/count", methods=["GET"])
+        @priority(POLL)
         def get_requests_count() -> Tuple[Any, int]:
             """
             Returns the count of requests for the songs.
@@ -53,3 +62,13 @@ class RequestBlueprint(DataBlueprint):
             :return: JSON response with the count of requests.
             """
             return self._service.get_requests_counts(), 200
+
+        @self.route("/requests/count/<string:show_hash>", methods=["GET"])
+        @priority(POLL)
+        def get_show_requests_count(show_hash: str) -> Tuple[Any, int]:
+            """
+            Returns the count of requests for the songs of a show.
+
+            :return: JSON response with the count of requests.
+            """
+            return self._service.get_show_requests_counts(show_hash), 200
@@ -10,6 +10,12 @@ from flask import jsonify, request
 
 from backend.flask.blueprints.data import DataBlueprint
 from backend.flask.decorators.auth import restrict_access
+from backend.flask.decorators.cache import (
+    SHOWS_CACHE_CONTROL,
+    UPCOMING_SHOWS_CACHE_CONTROL,
+    conditional,
+)
+from backend.flask.providers.json import cached_jsonify
 from backend.flask.services.show import ShowService
 
 
@@ -24,13 +30,23 @@ class ShowBlueprint(DataBlueprint):
         """
         Register routes for show operations.
         """
+        # Pick up the shows created on other tasks
+        self.before_request(self._service.refresh)
 
         @self.route("/shows", methods=["GET"])
+        @conditional(
+            lambda: self._service.digest,
+            SHOWS_CACHE_CONTROL,
+            lambda: self._service.last_modified,
+        )
         def read_shows() -> Tuple[Any, int]:
             """
             Read rows from the 'shows' table.
             """
-            return jsonify(self._service.get_shows()), 200
+            return (
+                cached_jsonify("shows", self._service.digest, self._service.get_shows),
+                200,
+            )
 
         @self.route("/shows", methods=["POST"])
         @restrict_access(["superuser"])
@@ -40,7 +56,7 @@ class ShowBlueprint(DataBlueprint):
             :return: JSON response with the result of the operation.
             """
             show = request.get_json()
-            app.logger.info(f"Show received to insert: {show}")
+            app.logger.info("Show received to insert: %s", show)
             if not show:
                 return {"message": "No data provided"}, 400
 
@@ -49,9 +65,17 @@ class ShowBlueprint(DataBlueprint):
             return jsonify({"success": True}), 201
 
         @self.route("/shows/upcoming", methods=["GET"])
+        @conditional(self._service.get_upcoming_digest, UPCOMING_SHOWS_CACHE_CONTROL)
         def get_upcoming_shows() -> Tuple[Any, int]:
             """
             Get upcoming shows.
             :return: JSON response with the upcoming shows.
             """
-            return self._service.get_upcoming_shows(), 200
+            return (
+                cached_jsonify(
+                    "upcoming_shows",
+                    self._service.get_upcoming_digest(),
+                    self._service.get_upcoming_shows,
+                ),
+                200,
+            )
@@ -5,9 +5,9 @@ for handling song related public routes in a Flask application.
 
 from typing import Any, Tuple
 
-from flask import jsonify
-
 from backend.flask.blueprints.blueprint import Blueprint
+from backend.flask.decorators.cache import SONGS_CACHE_CONTROL, conditional
+from backend.flask.providers.json import cached_jsonify
 from backend.flask.services.song import SongService
 
 
@@ -24,8 +24,16 @@ class SongBlueprint(Blueprint):
         """
 
         @self.route("/songs", methods=["GET"])
+        @conditional(
+            lambda: self._service.digest,
+            SONGS_CACHE_CONTROL,
+            lambda: self._service.last_modified,
+        )
         def read_songs() -> Tuple[Any, int]:
             """
             Read all songs.
             """
-            return jsonify(self._service.get_songs()), 200
+            return (
+                cached_jsonify("songs", self._service.digest, self._service.get_songs),
+                200,
+            )
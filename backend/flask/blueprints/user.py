@@ -33,7 +33,7 @@ class UserBlueprint(Blueprint):
             :return: JSON response with the list of users.
             """
             users = self._service.read_rows()
-            app.logger.debug(f"Listing users: {users}")
+            app.logger.debug("Listing users: %s", users)
             return jsonify(users), 200
 
         @self.route("/users", methods=["PUT"])
@@ -44,7 +44,7 @@ class UserBlueprint(Blueprint):
             :return: JSON response with the result of the operation.
             """
             response = request.json
-            app.logger.debug(f"Writing users: {response}")
+            app.logger.debug("Writing users: %s", response)
             if response and "rows" in response:
                 self._service.write_rows(response["rows"])
             else:
@@ -0,0 +1,89 @@
+"""
+Offline build step for the catalog snapshots.
+
+Validates the song and show catalogs under an assets directory and writes a
+snapshot next to each JSON file, e.g. songs/songs.json -> songs/songs.snapshot.
+
+Usage example:
+    python -m backend.flask.catalog.build infra/assets
+"""
+
+import argparse
+import json
+import logging
+import os
+from typing import Any, Dict, List
+
+from backend.flask.catalog.snapshot import build_snapshot
+from backend.flask.catalog.times import show_time
+
+CATALOGS: Dict[str, List[str]] = {
+    "songs": ["band_name", "song_name"],
+    "shows": ["name", "venue", "start_time", "end_time"],
+}
+
+
+def validate(name: str, records: Any) -> None:
+    """
+    Validate the records of a catalog.
+
+    Args:
+        name (str): The catalog name, one of CATALOGS.
+        records (Any): The decoded catalog JSON.
+
+    Raises:
+        ValueError: If the catalog is malformed.
+    """
+    if not isinstance(records, list):
+        raise ValueError(f"{name}: catalog must be a JSON array")
+
+    for position, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise ValueError(f"{name}[{position}]: record must be a JSON object")
+
+        for field in CATALOGS[name]:
+            if not isinstance(record.get(field), str) or not record[field]:
+                raise ValueError(f"{name}[{position}]: '{field}' is required")
+
+        if name == "shows":
+            try:
+                start_time = show_time(record["start_time"])
+                end_time = show_time(record["end_time"])
+            except ValueError as e:
+                raise ValueError(f"{name}[{position}]: {e}") from e
+            if end_time <= start_time:
+                raise ValueError(f"{name}[{position}]: end_time must follow start_time")
+
+
+def build(assets: str) -> Dict[str, str]:
+    """
+    Build a snapshot for every catalog under an assets directory.
+
+    Args:
+        assets (str): The assets directory, laid out as in the project bucket.
+
+    Returns:
+        Dict[str, str]: The written snapshot path for each catalog.
+    """
+    written = {}
+    for name in CATALOGS:
+        source = os.path.join(assets, name, f"{name}.json")
+        with open(source, encoding="utf-8") as file:
+            records = json.load(file)
+
+        validate(name, records)
+        target = os.path.join(assets, name, f"{name}.snapshot")
+        with open(target, "wb") as file:
+            file.write(build_snapshot(records))
+
+        logging.info("Built %s with %d records", target, len(records))
+        written[name] = target
+
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("assets", help="Directory holding songs/ and shows/")
+    logging.basicConfig(level="INFO")
+    build(parser.parse_args().assets)
@@ -0,0 +1,215 @@
+"""
+This module defines the catalog snapshot format.
+
+A snapshot is a compact, versioned binary file holding a catalog (songs, shows)
+whose content hashes and lookup index have already been computed. It is produced
+offline by the catalog build step and loaded by the services at boot, optionally
+memory-mapped so that worker processes share the same pages.
+
+Layout (little endian):
+    header: magic (4s), version (H), flags (H), record count (I),
+        payload length (I), payload SHA-256 digest (32s)
+    payload: the records as a compact, key-sorted JSON array
+    index: one entry per record, sorted by key: key (64s), offset (I), length (I)
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+from typing import Any, Dict, List, Optional, Union
+
+MAGIC = b"TRLC"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHII32s")
+INDEX_ENTRY = struct.Struct("<64sII")
+
+
+def _encode(obj: Any) -> bytes:
+    """Encode an object as canonical JSON bytes."""
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def create_hash(record: Dict[str, Any]) -> str:
+    """
+    Create a hash from a record for use as a machine-readable key.
+    The record's own "hash" field is not part of its hash.
+
+    Args:
+        record (dict): The record to hash.
+
+    Returns:
+        str: The hex SHA-256 of the record's canonical JSON.
+    """
+    record_copy = record.copy()
+    record_copy.pop("hash", None)
+    return hashlib.sha256(_encode(record_copy)).hexdigest()
+
+
+def catalog_digest(records: List[Dict[str, Any]]) -> str:
+    """
+    Compute the content digest of a catalog.
+
+    This matches the digest stored in a snapshot built from the same records,
+    so it can be used as a version for catalogs loaded either way.
+
+    Args:
+        records (list): The catalog records, hashes included.
+
+    Returns:
+        str: The hex SHA-256 of the catalog's canonical JSON.
+    """
+    return hashlib.sha256(_encode(records)).hexdigest()
+
+
+def build_snapshot(records: List[Dict[str, Any]]) -> bytes:
+    """
+    Build a snapshot from catalog records.
+    Records without a "hash" field are given one with create_hash.
+
+    Args:
+        records (list): The catalog records.
+
+    Returns:
+        bytes: The encoded snapshot.
+
+    Raises:
+        ValueError: If two records share a hash or a hash does not fit the index.
+    """
+    hashed = []
+    for record in records:
+        record = dict(record)
+        if "hash" not in record:
+            record["hash"] = create_hash(record)
+        hashed.append(record)
+
+    parts = [_encode(record) for record in hashed]
+    payload = b"[" + b",".join(parts) + b"]"
+
+    entries = []
+    offset = 1
+    for record, part in zip(hashed, parts):
+        key = str(record["hash"]).encode("utf-8")
+        if len(key) > INDEX_ENTRY.size - 8:
+            raise ValueError(f"Hash '{record['hash']}' is too long to index")
+        entries.append((key, offset, len(part)))
+        offset += len(part) + 1
+
+    entries.sort()
+    keys = [key for key, _, _ in entries]
+    if len(set(keys)) != len(keys):
+        raise ValueError("Catalog contains duplicate hashes")
+
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        0,
+        len(hashed),
+        len(payload),
+        hashlib.sha256(payload).digest(),
+    )
+    index = b"".join(INDEX_ENTRY.pack(*entry) for entry in entries)
+    return header + payload + index
+
+
+class CatalogSnapshot:
+    """
+    Read access to an encoded catalog snapshot.
+
+    Attributes:
+        digest (str): The hex SHA-256 of the snapshot's payload.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap], verify: bool = True) -> None:
+        """
+        Initialize the CatalogSnapshot.
+
+        Args:
+            buffer (bytes | mmap): The encoded snapshot.
+            verify (bool): Whether to check the payload against its digest.
+
+        Raises:
+            ValueError: If the buffer is not a readable snapshot.
+        """
+        if len(buffer) < HEADER.size:
+            raise ValueError("Snapshot is truncated")
+
+        magic, version, _, count, length, digest = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("Not a catalog snapshot")
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}")
+        if len(buffer) != HEADER.size + length + count * INDEX_ENTRY.size:
+            raise ValueError("Snapshot is truncated")
+
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._count = count
+        self._payload = self._view[HEADER.size : HEADER.size + length]
+        self._index_offset = HEADER.size + length
+        self._records: Optional[List[Dict[str, Any]]] = None
+        self.digest: str = digest.hex()
+
+        if verify and hashlib.sha256(self._payload).digest() != digest:
+            raise ValueError("Snapshot payload does not match its digest")
+
+    @classmethod
+    def open(cls, path: str, verify: bool = True) -> "CatalogSnapshot":
+        """
+        Memory-map a snapshot file read-only.
+
+        Args:
+            path (str): The path of the snapshot file.
+            verify (bool): Whether to check the payload against its digest.
+
+        Returns:
+            CatalogSnapshot: The mapped snapshot.
+        """
+        with open(path, "rb") as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), verify)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """The decoded catalog records."""
+        if self._records is None:
+            self._records = json.loads(bytes(self._payload))
+        return self._records
+
+    def _entry(self, position: int) -> tuple:
+        """Unpack the index entry at a position."""
+        key, offset, length = INDEX_ENTRY.unpack_from(
+            self._buffer, self._index_offset + position * INDEX_ENTRY.size
+        )
+        return key.rstrip(b"\0"), offset, length
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a single record by hash without decoding the whole catalog.
+
+        Args:
+            key (str): The hash of the record.
+
+        Returns:
+            dict | None: The record, or None if it is not in the snapshot.
+        """
+        encoded = key.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._entry(middle)[0] < encoded:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == self._count:
+            return None
+
+        found, offset, length = self._entry(low)
+        if found != encoded:
+            return None
+
+        return json.loads(bytes(self._payload[offset : offset + length]))
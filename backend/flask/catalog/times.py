@@ -0,0 +1,46 @@
+"""
+This module reads the start and end times of shows.
+
+Shows are created with ISO 8601 times carrying the admin's UTC offset, so each
+names an instant. Older shows were written without one, in the venue's wall
+time, so the instant they name is only known to lie within the span of UTC
+offsets, from UTC-12:00 to UTC+14:00. Whatever takes capacity away, e.g.
+archiving a show's partition, waits for the latest instant such a time may be.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+# A wall time is this much later in UTC at most, at UTC-12:00
+LATEST_OFFSET = timedelta(hours=12)
+
+
+def show_time(value: str) -> datetime:
+    """
+    Read a show time, taking one without an offset as UTC, the tasks' clock.
+
+    Args:
+        value (str): The ISO 8601 time.
+
+    Returns:
+        datetime: The time, in UTC.
+    """
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def latest_time(value: str) -> datetime:
+    """
+    The latest instant a show time may name, the time itself if it has an offset.
+
+    Args:
+        value (str): The ISO 8601 time.
+
+    Returns:
+        datetime: The instant, in UTC.
+    """
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc) + LATEST_OFFSET
+    return moment.astimezone(timezone.utc)
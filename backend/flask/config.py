@@ -33,8 +33,46 @@ class Config:
         db_name (str): Database name.
         db_engine (str): Database engine.
         db_port (str): Database port.
+        db_connect_timeout (str): Seconds to wait for a database connection.
+        db_statement_timeout (str): Milliseconds a database statement may run.
+        db_breaker_threshold (str): Consecutive database failures that open the circuit.
+        db_breaker_reset (str): Seconds the open circuit fails fast before a probe.
+        db_state_parameter (str): The SSM parameter the scheduler publishes the
+            database's state to while it is parked outside shows. Unset, the
+            database is taken to be always available.
+        db_prepare_threshold (str): Runs of a query on a connection before psycopg
+            prepares it on the server.
+        db_pooler (str): The transaction pooler in front of the database, e.g.
+            "pgbouncer" or "rds-proxy". Behind one, connections keep no session
+            state and server-side prepared statements are off.
+        db_pool_size (str): Connections each database engine keeps open. Defaults
+            to SQLAlchemy's 5, or to 2 with no overflow behind a pooler.
+        db_replica_hosts (str): Comma separated read replica hosts, "<host>[:<port>]".
+        db_sticky_seconds (str): Seconds a client reads from the primary after a write.
         redis_host (str): Redis host.
         redis_port (str): Redis port.
+        cache_parameter (str): The SSM parameter holding the show cache's
+            "<host>:<port>" while it is deployed, for the "auto" rate limit backend.
+        catalog_cache_dir (str): Local directory for memory-mapped catalog snapshots.
+        spool_dir (str): Directory for requests spooled while the database is down,
+            shared by the tasks. Defaults to a temporary directory, which does not
+            outlive the task.
+        slow_query_ms (str): Queries at least this slow, in milliseconds, are logged.
+        repeated_query_threshold (str): Requests running a query this many times are flagged.
+        trace_export (str): Where request spans are exported, "stdout" or "file:<path>".
+        log_format (str): Log record format, "json" or "text".
+        log_sample_rates (str): Share of sub-warning records kept per logger,
+            e.g. "backend.flask.services.request=0.1".
+        request_rate_interval (str): Seconds between reports of the task's request
+            count to CloudWatch, which the service scales on. 0 turns them off.
+        metrics_port (str): Port /metrics is served on, apart from the app's.
+            Empty turns it off.
+        rate_limit_backend (str): Where rate limit buckets are kept, "memory",
+            "redis" or "auto", i.e. Redis while the cache is there and memory otherwise.
+        rate_limit_ip (str): Requests allowed per client IP, "<per second>:<burst>",
+            enough for a venue's fans sharing one address to submit at once.
+        rate_limit_show (str): Requests allowed per show, "<per second>:<burst>".
+        admission_capacity (str): Requests a task handles at once before shedding load.
     """
 
     # pylint: disable=invalid-name
@@ -108,6 +146,36 @@ class Config:
         self.db_port: Optional[str] = overrides.get(
             "db_port", os.getenv("DB_PORT", self.db_secrets.get("port", "5432"))
         )
+        self.db_connect_timeout: Optional[str] = overrides.get(
+            "db_connect_timeout", os.getenv("DB_CONNECT_TIMEOUT", "3")
+        )
+        self.db_statement_timeout: Optional[str] = overrides.get(
+            "db_statement_timeout", os.getenv("DB_STATEMENT_TIMEOUT", "5000")
+        )
+        self.db_breaker_threshold: Optional[str] = overrides.get(
+            "db_breaker_threshold", os.getenv("DB_BREAKER_THRESHOLD", "5")
+        )
+        self.db_breaker_reset: Optional[str] = overrides.get(
+            "db_breaker_reset", os.getenv("DB_BREAKER_RESET", "10")
+        )
+        self.db_state_parameter: Optional[str] = overrides.get(
+            "db_state_parameter", os.getenv("DB_STATE_PARAMETER", "")
+        )
+        self.db_prepare_threshold: Optional[str] = overrides.get(
+            "db_prepare_threshold", os.getenv("DB_PREPARE_THRESHOLD", "5")
+        )
+        self.db_pooler: Optional[str] = overrides.get(
+            "db_pooler", os.getenv("DB_POOLER", "")
+        )
+        self.db_pool_size: Optional[str] = overrides.get(
+            "db_pool_size", os.getenv("DB_POOL_SIZE", "")
+        )
+        self.db_replica_hosts: Optional[str] = overrides.get(
+            "db_replica_hosts", os.getenv("DB_REPLICA_HOSTS", "")
+        )
+        self.db_sticky_seconds: Optional[str] = overrides.get(
+            "db_sticky_seconds", os.getenv("DB_STICKY_SECONDS", "5")
+        )
 
         # Redis
         self.redis_host: Optional[str] = overrides.get(
@@ -116,3 +184,53 @@ class Config:
         self.redis_port: Optional[str] = overrides.get(
             "redis_port", os.getenv("REDIS_PORT", "6379")
         )
+        self.cache_parameter: Optional[str] = overrides.get(
+            "cache_parameter", os.getenv("CACHE_PARAMETER", "")
+        )
+
+        # Catalog
+        self.catalog_cache_dir: Optional[str] = overrides.get(
+            "catalog_cache_dir", os.getenv("CATALOG_CACHE_DIR")
+        )
+
+        # Spool
+        self.spool_dir: Optional[str] = overrides.get(
+            "spool_dir", os.getenv("SPOOL_DIR")
+        )
+
+        # Telemetry
+        self.slow_query_ms: Optional[str] = overrides.get(
+            "slow_query_ms", os.getenv("SLOW_QUERY_MS", "100")
+        )
+        self.repeated_query_threshold: Optional[str] = overrides.get(
+            "repeated_query_threshold", os.getenv("REPEATED_QUERY_THRESHOLD", "3")
+        )
+        self.trace_export: Optional[str] = overrides.get(
+            "trace_export", os.getenv("TRACE_EXPORT")
+        )
+        self.log_format: Optional[str] = overrides.get(
+            "log_format", os.getenv("LOG_FORMAT", "json")
+        )
+        self.log_sample_rates: Optional[str] = overrides.get(
+            "log_sample_rates", os.getenv("LOG_SAMPLE_RATES", "")
+        )
+        self.request_rate_interval: Optional[str] = overrides.get(
+            "request_rate_interval", os.getenv("REQUEST_RATE_INTERVAL", "0")
+        )
+        self.metrics_port: Optional[str] = overrides.get(
+            "metrics_port", os.getenv("METRICS_PORT", "")
+        )
+
+        # Limits
+        self.rate_limit_backend: Optional[str] = overrides.get(
+            "rate_limit_backend", os.getenv("RATE_LIMIT_BACKEND", "memory")
+        )
+        self.rate_limit_ip: Optional[str] = overrides.get(
+            "rate_limit_ip", os.getenv("RATE_LIMIT_IP", "50:500")
+        )
+        self.rate_limit_show: Optional[str] = overrides.get(
+            "rate_limit_show", os.getenv("RATE_LIMIT_SHOW", "200:1000")
+        )
+        self.admission_capacity: Optional[str] = overrides.get(
+            "admission_capacity", os.getenv("ADMISSION_CAPACITY", "64")
+        )
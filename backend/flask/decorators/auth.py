@@ -9,6 +9,8 @@ from flask import current_app as app
 from flask_jwt_extended import get_jwt, verify_jwt_in_request
 from werkzeug.exceptions import HTTPException
 
+from backend.flask.limits.admission import ADMIN
+
 
 def restrict_access(groups: List[str]) -> Callable:
     """
@@ -40,16 +42,16 @@ def restrict_access(groups: List[str]) -> Callable:
             try:
                 verify_jwt_in_request()
                 claims = get_jwt()
-                app.logger.debug(f"JWT Claims: {claims}")
+                app.logger.debug("JWT Claims: %s", claims)
             except Exception as e:
-                app.logger.error(f"JWT verification failed: {e}")
+                app.logger.error("JWT verification failed: %s", e)
                 http_exception = HTTPException("Unauthorized")
                 http_exception.code = 401
                 raise http_exception from e
 
             if not any(group in claims.get("groups", []) for group in groups):
                 app.logger.warning(
-                    f"User is not in any of the required groups: {groups}."
+                    "User is not in any of the required groups: %s.", groups
                 )
                 http_exception = HTTPException("Forbidden")
                 http_exception.code = 403
@@ -57,6 +59,8 @@ def restrict_access(groups: List[str]) -> Callable:
 
             return fn(*args, **kwargs)
 
+        # Restricted endpoints are admin reads and writes, admitted last under load.
+        wrapper.priority = ADMIN  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
@@ -0,0 +1,69 @@
+"""
+This module contains decorators for HTTP conditional caching of Flask endpoints.
+"""
+
+from datetime import datetime
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from flask import current_app as app
+from flask import make_response, request
+
+from backend.flask.telemetry.metrics import record_cache
+
+SONGS_CACHE_CONTROL = "public, max-age=300, s-maxage=3600, stale-while-revalidate=60"
+SHOWS_CACHE_CONTROL = "public, max-age=60, s-maxage=300, stale-while-revalidate=30"
+UPCOMING_SHOWS_CACHE_CONTROL = "public, max-age=60, s-maxage=60"
+
+
+def conditional(
+    etag: Callable[[], str],
+    cache_control: str,
+    last_modified: Optional[Callable[[], datetime]] = None,
+) -> Callable:
+    """
+    Decorator to add validators and a caching policy to an endpoint.
+
+    Requests whose If-None-Match (or, without it, If-Modified-Since) matches the
+    current validators get an empty 304 response before the endpoint runs, so
+    nothing is loaded or serialized.
+
+    Args:
+        etag (Callable): Returns the strong ETag of the current representation.
+        cache_control (str): The Cache-Control header, shared by browsers and CDNs.
+        last_modified (Callable, optional): Returns when the representation last
+            changed. Leave unset when it can change without the data changing.
+
+    Returns:
+        function: The decorated function.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            current_etag = etag()
+            modified = last_modified() if last_modified else None
+
+            if request.if_none_match:
+                not_modified = request.if_none_match.contains_weak(current_etag)
+            elif modified is not None and request.if_modified_since is not None:
+                not_modified = modified.replace(microsecond=0) <= request.if_modified_since
+            else:
+                not_modified = False
+
+            record_cache("conditional", not_modified)
+            if not_modified:
+                app.logger.debug("Not modified: %s", request.path)
+                response = app.response_class(status=304)
+            else:
+                response = make_response(fn(*args, **kwargs))
+
+            response.set_etag(current_etag)
+            if modified is not None:
+                response.last_modified = modified
+            response.headers["Cache-Control"] = cache_control
+            return response
+
+        return wrapper
+
+    return decorator
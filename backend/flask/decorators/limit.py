@@ -0,0 +1,82 @@
+"""
+This module contains decorators for rate limiting and prioritizing endpoints,
+and for keeping endpoints off the API.
+"""
+
+from functools import wraps
+from typing import Any, Callable
+
+from flask import current_app as app
+from flask import jsonify, request
+
+from backend.flask.limits.limiter import CLIENT_IP_HEADER
+
+
+def rate_limited(per_ip: bool = True, per_show: bool = False) -> Callable:
+    """
+    Decorator to rate limit an endpoint with the app's token buckets.
+
+    Args:
+        per_ip (bool): Limit each client IP.
+        per_show (bool): Limit each show, from the show_hash in the URL or body.
+
+    Returns:
+        function: The decorated function.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            limits = app.extensions.get("limits")
+            if limits is not None:
+                limited = limits.check(per_ip, per_show)
+                if limited is not None:
+                    return limited
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def priority(level: str) -> Callable:
+    """
+    Decorator to set the admission priority class of an endpoint.
+
+    Args:
+        level (str): The class, see backend.flask.limits.admission.
+
+    Returns:
+        function: The function, marked with its class.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        fn.priority = level  # type: ignore[attr-defined]
+        return fn
+
+    return decorator
+
+
+def internal(fn: Callable) -> Callable:
+    """
+    Decorator to serve an endpoint only to callers inside the VPC, e.g. the
+    scheduler calling a task directly.
+
+    The proxy Lambda and API Gateway's direct integration set X-Client-Ip on every
+    request, so a request carrying it came through the API and is refused as if
+    the endpoint did not exist.
+
+    Args:
+        fn (function): The function to decorate.
+
+    Returns:
+        function: The decorated function.
+    """
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if CLIENT_IP_HEADER in request.headers:
+            return jsonify({"status": "error", "message": "Not found."}), 404
+        return fn(*args, **kwargs)
+
+    return wrapper
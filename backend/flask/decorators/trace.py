@@ -0,0 +1,32 @@
+"""
+This module contains decorators for tracing service calls.
+"""
+
+from functools import wraps
+from typing import Any, Callable
+
+from backend.flask.telemetry.tracing import trace
+
+
+def traced(category: str) -> Callable:
+    """
+    Decorator to trace a function as a span of the current request.
+
+    Args:
+        category (str): The Server-Timing metric the calls count towards, e.g. "db".
+
+    Returns:
+        function: The decorated function.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        name = f"{category}.{fn.__qualname__}"
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with trace(name, category):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
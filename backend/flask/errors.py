@@ -10,4 +10,6 @@ def register_error_handlers(app):
             "status": "error",
             "message": "The database is currently unavailable."
         }
-        return jsonify(response), 503
+        response = jsonify(response)
+        response.headers["Retry-After"] = str(getattr(error, "retry_after", 1))
+        return response, 503
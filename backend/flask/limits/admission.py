@@ -0,0 +1,55 @@
+"""
+This module provides priority based admission control.
+
+Each task admits a bounded number of requests at once. Lower priority classes
+may only use part of that capacity, so under overload request submissions are
+still admitted after leaderboard polls and admin reads are turned away.
+"""
+
+import threading
+from typing import Dict, Optional
+
+SUBMIT = "submit"
+READ = "read"
+POLL = "poll"
+ADMIN = "admin"
+
+SHARES: Dict[str, float] = {SUBMIT: 1.0, READ: 0.8, POLL: 0.6, ADMIN: 0.4}
+
+
+class AdmissionController:
+    """
+    Admits requests while their priority class has capacity left.
+
+    Attributes:
+        capacity (int): The most requests in flight at once.
+        shares (dict): The share of the capacity each priority class may use.
+    """
+
+    def __init__(self, capacity: int, shares: Optional[Dict[str, float]] = None) -> None:
+        self.capacity = capacity
+        self.shares = shares or SHARES
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self, priority: str) -> bool:
+        """
+        Admit a request, if its class has capacity left.
+
+        Args:
+            priority (str): The request's priority class.
+
+        Returns:
+            bool: Whether the request was admitted, and must be released.
+        """
+        limit = max(1, int(self.capacity * self.shares.get(priority, self.shares[READ])))
+        with self._lock:
+            if self.in_flight >= limit:
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self) -> None:
+        """Release an admitted request."""
+        with self._lock:
+            self.in_flight -= 1
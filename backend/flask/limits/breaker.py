@@ -0,0 +1,154 @@
+"""
+This module provides a circuit breaker for the database.
+
+When the database is slow or stopped every query waits out its connection
+attempt. The breaker opens after consecutive failures and then fails queries at
+once, until a single probe query is let through to check whether the database
+is back.
+"""
+
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Generator
+
+from sqlalchemy.exc import OperationalError
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+# Waiting on a lock, e.g. under a lock_timeout, says nothing about the database's health.
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+class CircuitOpenError(OperationalError):
+    """
+    Raised instead of querying the database while the breaker is open.
+
+    It is an OperationalError, so it is handled as the database being
+    unavailable, without waiting for a connection attempt to fail.
+
+    Attributes:
+        retry_after (float): Seconds until the next probe is let through.
+    """
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(None, None, Exception("The database circuit is open."))
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Fails fast while the database is unavailable.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds the circuit stays open before a probe.
+        opened (int): How many times the circuit has opened.
+        rejected (int): How many calls were failed while open.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.opened = 0
+        self.rejected = 0
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """The circuit's state, half open once the reset timeout has passed."""
+        with self._lock:
+            if self._state == OPEN and self._retry_after() <= 0:
+                return HALF_OPEN
+            return self._state
+
+    def _retry_after(self) -> float:
+        return self._opened_at + self.reset_timeout - self._clock()
+
+    def _acquire(self) -> bool:
+        """
+        Let a call through, or fail it while the circuit is open.
+
+        Returns:
+            bool: Whether the call is the probe of a half open circuit.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return False
+            if self._state == OPEN and self._retry_after() <= 0:
+                self._state = HALF_OPEN
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+            retry_after = max(self._retry_after(), 0.0) if self._state == OPEN else 1.0
+        raise CircuitOpenError(math.ceil(retry_after))
+
+    def _succeeded(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                logging.info("Database circuit closed, the probe succeeded.")
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def _failed(self, probe: bool) -> None:
+        with self._lock:
+            self._failures += 1
+            if probe or (
+                self._state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self.opened += 1
+                logging.warning(
+                    "Database circuit opened after %d failures, failing fast for %ss.",
+                    self._failures,
+                    self.reset_timeout,
+                )
+            self._probing = False
+
+    def _released(self, probe: bool) -> None:
+        if probe:
+            with self._lock:
+                self._probing = False
+
+    @contextmanager
+    def guard(self) -> Generator[None, None, None]:
+        """
+        Guard a call to the database.
+
+        Operational errors, e.g. connection failures and statement timeouts,
+        count as failures. Lock timeouts and other errors leave the circuit as
+        it is.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        probe = self._acquire()
+        try:
+            yield
+        except OperationalError as error:
+            if getattr(error.orig, "sqlstate", None) == LOCK_NOT_AVAILABLE:
+                self._released(probe)
+            else:
+                self._failed(probe)
+            raise
+        except BaseException:
+            self._released(probe)
+            raise
+        self._succeeded()
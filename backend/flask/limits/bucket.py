@@ -0,0 +1,316 @@
+"""
+This module provides token buckets for rate limiting, kept in memory or in Redis.
+
+A bucket holds up to burst tokens and refills at a steady rate; each request
+takes a token, and is rejected while the bucket is empty. The in-memory backend
+limits each task on its own, the Redis backend shares the buckets across tasks.
+The detected backend uses Redis while a cache is there, e.g. while the show
+cache is deployed, and memory otherwise.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Protocol, Tuple
+
+import redis
+from botocore.exceptions import BotoCoreError, ClientError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Rate:
+    """
+    A token bucket's rate.
+
+    Attributes:
+        per_second (float): The tokens refilled every second.
+        burst (int): The most tokens the bucket holds.
+    """
+
+    per_second: float
+    burst: int
+
+    @classmethod
+    def parse(cls, setting: Optional[str]) -> Optional["Rate"]:
+        """
+        Parse a rate setting.
+
+        Args:
+            setting (str, optional): "<per second>:<burst>", e.g. "2:20", or
+                empty for no limit.
+
+        Returns:
+            Rate: The rate, or None when there is no limit.
+        """
+        if not setting:
+            return None
+        per_second, _, burst = setting.partition(":")
+        try:
+            rate = cls(float(per_second), int(burst or per_second))
+        except ValueError as e:
+            raise ValueError(f"Invalid rate {setting}.") from e
+        if rate.per_second <= 0 or rate.burst < 1:
+            raise ValueError(f"Invalid rate {setting}.")
+        return rate
+
+
+class Backend(Protocol):  # pylint: disable=too-few-public-methods
+    """Stores the token buckets."""
+
+    def take(self, key: str, rate: Rate) -> float:
+        """
+        Take a token from a bucket.
+
+        Args:
+            key (str): The bucket.
+            rate (Rate): The bucket's rate.
+
+        Returns:
+            float: 0 when a token was taken, otherwise the seconds until one is.
+        """
+
+
+class MemoryBackend:
+    """
+    Keeps the buckets of a single task in memory.
+
+    Attributes:
+        max_keys (int): The most buckets kept, the least recently used are dropped.
+    """
+
+    def __init__(
+        self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rate: Rate) -> float:
+        """
+        Take a token from a bucket in memory, dropping the least recently used
+        bucket once there are more than max_keys.
+
+        Args:
+            key (str): The bucket.
+            rate (Rate): The bucket's rate.
+
+        Returns:
+            float: 0 when a token was taken, otherwise the seconds until one is.
+        """
+        now = self._clock()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (float(rate.burst), now))
+            tokens = min(float(rate.burst), tokens + (now - updated) * rate.per_second)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / rate.per_second
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+class RedisBackend:  # pylint: disable=too-few-public-methods
+    """
+    Keeps the buckets in Redis, shared by every task.
+
+    Buckets are updated atomically by a script using the Redis clock, so tasks
+    with drifting clocks agree. When Redis is unavailable requests are let
+    through rather than failing.
+    """
+
+    SCRIPT = """
+        local rate = tonumber(ARGV[1])
+        local burst = tonumber(ARGV[2])
+        local time = redis.call('TIME')
+        local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+        local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+        local tokens = tonumber(state[1]) or burst
+        local updated = tonumber(state[2]) or now
+        tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+        local wait = 0
+        if tokens >= 1 then
+            tokens = tokens - 1
+        else
+            wait = (1 - tokens) / rate
+        end
+        redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+        redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+        return tostring(wait)
+    """
+
+    def __init__(self, client: redis.Redis, prefix: str = "rate-limit:") -> None:
+        self._prefix = prefix
+        self._script = client.register_script(self.SCRIPT)
+
+    def take(self, key: str, rate: Rate) -> float:
+        """
+        Take a token from a bucket in Redis, or admit the request when Redis is
+        unavailable.
+
+        Args:
+            key (str): The bucket.
+            rate (Rate): The bucket's rate.
+
+        Returns:
+            float: 0 when a token was taken, otherwise the seconds until one is.
+        """
+        try:
+            return self.take_shared(key, rate)
+        except redis.RedisError as e:
+            logger.warning("Rate limit backend unavailable, admitting: %s", e)
+            return 0.0
+
+    def take_shared(self, key: str, rate: Rate) -> float:
+        """
+        Take a token from a bucket in Redis.
+
+        Raises:
+            redis.RedisError: If Redis is unavailable.
+        """
+        return float(
+            self._script(keys=[self._prefix + key], args=[rate.per_second, rate.burst])
+        )
+
+
+Location = Tuple[str, int]
+
+
+def _connect(host: str, port: int) -> redis.Redis:
+    return redis.Redis(
+        host=host, port=port, socket_timeout=0.1, socket_connect_timeout=0.1
+    )
+
+
+class DetectedBackend:  # pylint: disable=too-few-public-methods
+    """
+    Keeps the buckets in Redis while a cache is found, and in memory otherwise.
+
+    The cache is looked for again every interval, so a cache deployed or torn
+    down while the task runs is picked up. When it stops answering the task
+    limits on its own until it is found again, rather than admitting everything.
+
+    Attributes:
+        interval (float): Seconds between looking for the cache.
+    """
+
+    def __init__(
+        self,
+        locate: Callable[[], Optional[Location]],
+        interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        connect: Callable[[str, int], redis.Redis] = _connect,
+    ) -> None:
+        self.interval = interval
+        self._locate = locate
+        self._clock = clock
+        self._connect = connect
+        self._memory = MemoryBackend()
+        self._shared: Optional[RedisBackend] = None
+        self._location: Optional[Location] = None
+        self._checked: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _backend(self) -> Optional[RedisBackend]:
+        with self._lock:
+            now = self._clock()
+            if self._checked is not None and now - self._checked < self.interval:
+                return self._shared
+            # Other threads keep using the current backend while this one looks
+            self._checked = now
+
+        location = self._locate()
+        with self._lock:
+            if location != self._location:
+                self._location = location
+                self._shared = RedisBackend(self._connect(*location)) if location else None
+                logger.info(
+                    "Rate limits are kept in %s.",
+                    f"Redis at {location[0]}:{location[1]}" if location else "memory",
+                )
+            return self._shared
+
+    def take(self, key: str, rate: Rate) -> float:
+        """
+        Take a token from a bucket in Redis while the cache answers, and in
+        memory otherwise.
+
+        Args:
+            key (str): The bucket.
+            rate (Rate): The bucket's rate.
+
+        Returns:
+            float: 0 when a token was taken, otherwise the seconds until one is.
+        """
+        shared = self._backend()
+        if shared is not None:
+            try:
+                return shared.take_shared(key, rate)
+            except redis.RedisError as e:
+                logger.warning("Cache unavailable, keeping rate limits in memory: %s", e)
+                with self._lock:
+                    if self._shared is shared:
+                        self._shared, self._location = None, None
+        return self._memory.take(key, rate)
+
+
+def cache_location(client: Any, parameter: str) -> Optional[Location]:
+    """
+    Look the cache up in an SSM parameter.
+
+    Args:
+        client: An SSM client.
+        parameter (str): The parameter holding the cache's "<host>:<port>".
+
+    Returns:
+        tuple: The cache's host and port, or None when the parameter, i.e. the
+            cache, is not there.
+    """
+    try:
+        value = client.get_parameter(Name=parameter)["Parameter"]["Value"]
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") != "ParameterNotFound":
+            logger.warning("Looking the cache up failed: %s", e)
+        return None
+    except BotoCoreError as e:
+        logger.warning("Looking the cache up failed: %s", e)
+        return None
+    host, _, port = value.rpartition(":")
+    return host, int(port)
+
+
+def create_backend(
+    setting: Optional[str],
+    host: Optional[str],
+    port: Optional[str],
+    locate: Optional[Callable[[], Optional[Location]]] = None,
+) -> Backend:
+    """
+    Create the configured backend.
+
+    Args:
+        setting (str, optional): "memory", "redis" or "auto".
+        host (str, optional): The Redis host.
+        port (str, optional): The Redis port.
+        locate (callable, optional): Finds the cache for "auto", e.g. with
+            cache_location. Defaults to the Redis host and port.
+
+    Returns:
+        Backend: The backend.
+    """
+    if setting == "redis":
+        return RedisBackend(_connect(host or "localhost", int(port or 6379)))
+    if setting == "auto":
+        return DetectedBackend(
+            locate or (lambda: (host or "localhost", int(port or 6379)))
+        )
+    if setting in (None, "", "memory"):
+        return MemoryBackend()
+    raise ValueError(f"Unknown rate limit backend {setting}.")
@@ -0,0 +1,121 @@
+"""
+This module provides the application's rate limits and admission control.
+
+Public request endpoints take a token from a bucket per client IP and per show
+before doing any work, and every request is admitted by its priority class, see
+backend.flask.decorators.limit for marking the endpoints.
+"""
+
+import math
+from typing import Optional
+
+from flask import Flask, Response, current_app, g, jsonify, request
+
+from backend.flask.limits.admission import READ, AdmissionController
+from backend.flask.limits.bucket import Backend, Rate
+
+
+CLIENT_IP_HEADER = "X-Client-Ip"
+
+
+def client_ip() -> str:
+    """
+    The client's IP.
+
+    The proxy Lambda, or API Gateway itself with the direct integration,
+    overwrites X-Client-Ip with the address it was called from, so a client
+    cannot forge it. Without either in front, e.g. locally, it is the peer.
+
+    Returns:
+        str: The IP.
+    """
+    return request.headers.get(CLIENT_IP_HEADER) or request.remote_addr or "unknown"
+
+
+def request_show_hash() -> Optional[str]:
+    """The show the request is for, from its URL or JSON body."""
+    show_hash = (request.view_args or {}).get("show_hash")
+    if show_hash is None and request.is_json:
+        show_hash = (request.get_json(silent=True) or {}).get("show_hash")
+    return show_hash if isinstance(show_hash, str) else None
+
+
+def _rejected(message: str, status: int, retry_after: float) -> Response:
+    response = jsonify({"status": "error", "message": message})
+    response.status_code = status
+    response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+class Limits:
+    """
+    Rate limits and admission control.
+
+    Attributes:
+        backend (Backend): Stores the token buckets.
+        ip_rate (Rate, optional): The rate allowed per client IP.
+        show_rate (Rate, optional): The rate allowed per show.
+        admission (AdmissionController, optional): Admits requests by priority.
+    """
+
+    def __init__(
+        self,
+        backend: Backend,
+        ip_rate: Optional[Rate] = None,
+        show_rate: Optional[Rate] = None,
+        admission: Optional[AdmissionController] = None,
+    ) -> None:
+        self.backend = backend
+        self.ip_rate = ip_rate
+        self.show_rate = show_rate
+        self.admission = admission
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Apply the limits to the app.
+
+        Args:
+            app (Flask): The application.
+        """
+        app.extensions["limits"] = self
+        if self.admission is not None:
+            app.before_request(self._admit)
+            app.teardown_request(self._release)
+
+    def check(self, per_ip: bool = True, per_show: bool = False) -> Optional[Response]:
+        """
+        Take a token from the request's buckets.
+
+        Args:
+            per_ip (bool): Limit the client IP.
+            per_show (bool): Limit the request's show.
+
+        Returns:
+            Response: A 429 response when a bucket is empty, otherwise None.
+        """
+        buckets = []
+        if per_ip and self.ip_rate is not None:
+            buckets.append((f"ip:{client_ip()}", self.ip_rate))
+        show_hash = request_show_hash() if per_show else None
+        if show_hash is not None and self.show_rate is not None:
+            buckets.append((f"show:{show_hash}", self.show_rate))
+
+        for key, rate in buckets:
+            wait = self.backend.take(key, rate)
+            if wait > 0:
+                current_app.logger.info("Rate limited %s on %s", key, request.endpoint)
+                return _rejected("Too many requests, try again shortly.", 429, wait)
+        return None
+
+    def _admit(self) -> Optional[Response]:
+        view = current_app.view_functions.get(request.endpoint or "")
+        priority = getattr(view, "priority", READ)
+        if not self.admission.try_acquire(priority):  # type: ignore[union-attr]
+            current_app.logger.warning("Overloaded, turned away %s request", priority)
+            return _rejected("The service is busy, try again shortly.", 503, 1)
+        g.admitted = True
+        return None
+
+    def _release(self, _: Optional[BaseException]) -> None:
+        if g.pop("admitted", False):
+            self.admission.release()  # type: ignore[union-attr]
@@ -0,0 +1,107 @@
+"""
+This module tells the runtime whether the database is parked.
+
+Outside shows the database instance is stopped, see the scheduler Lambda in
+infra. The scheduler publishes the instance's state to an SSM parameter,
+"available" once it accepts connections. While it is anything else, queries fail
+at once, so fans are told requests are not being taken instead of waiting out
+connection attempts to a stopped instance.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from botocore.exceptions import BotoCoreError, ClientError
+from sqlalchemy.exc import OperationalError
+
+AVAILABLE = "available"
+
+# Seconds a published state is trusted before it is read again
+STATE_TTL = 15.0
+
+# Starting a stopped instance takes minutes, so clients need not retry sooner
+PARKED_RETRY_AFTER = 60
+
+
+class DatabaseParkedError(OperationalError):
+    """
+    Raised instead of querying the database while it is parked.
+
+    It is an OperationalError, so it is handled as the database being
+    unavailable.
+
+    Attributes:
+        state (str): The database's published state, e.g. "stopped".
+        retry_after (float): Seconds until it is worth retrying.
+    """
+
+    def __init__(self, state: str, retry_after: float = PARKED_RETRY_AFTER) -> None:
+        super().__init__(None, None, Exception(f"The database is parked, it is {state}."))
+        self.state = state
+        self.retry_after = retry_after
+
+
+class DatabaseState:
+    """
+    The database's state, as published by the scheduler.
+
+    Until the parameter is first read, and whenever reading it fails, the last
+    known state is kept, so an SSM outage does not take the database away.
+
+    Attributes:
+        parameter (str): The SSM parameter holding the state.
+        ttl (float): Seconds a read state is trusted.
+        state (str): The last state read.
+    """
+
+    def __init__(
+        self,
+        parameter: str,
+        client: Any,
+        ttl: float = STATE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.parameter = parameter
+        self.ttl = ttl
+        self.state = AVAILABLE
+        self._client = client
+        self._clock = clock
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    def current(self) -> str:
+        """
+        The database's state, read again once the last read is older than the ttl.
+
+        Returns:
+            str: The state, "available" when the database can be queried.
+        """
+        with self._lock:
+            if self._clock() < self._expires:
+                return self.state
+            # Other threads keep using the last state while this one reads
+            self._expires = self._clock() + self.ttl
+
+        try:
+            state = self._client.get_parameter(Name=self.parameter)["Parameter"]["Value"]
+        except (BotoCoreError, ClientError) as e:
+            logging.warning("Reading the database state failed, keeping %s: %s", self.state, e)
+            return self.state
+
+        if state != self.state:
+            logging.info("Database state changed from %s to %s.", self.state, state)
+            self.state = state
+        return state
+
+    def check(self) -> None:
+        """
+        Fail unless the database is available.
+
+        Raises:
+            DatabaseParkedError: If the database is parked, or starting or stopping.
+        """
+        state = self.current()
+        if state != AVAILABLE:
+            raise DatabaseParkedError(state)
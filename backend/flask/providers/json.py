@@ -4,9 +4,18 @@ serialization of additional Python objects.
 """
 
 from datetime import time
-from typing import Any
+from typing import Any, Callable, Dict, Optional, Tuple
 
+from flask import current_app, jsonify
 from flask.json.provider import DefaultJSONProvider
+from flask.wrappers import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from backend.flask.telemetry.metrics import record_cache
 
 
 class JSONProvider(DefaultJSONProvider):
@@ -14,11 +23,24 @@ class JSONProvider(DefaultJSONProvider):
     Custom JSON provider for Flask that extends the default JSON provider.
 
     This provider adds support for serializing additional Python objects.
+    Responses are encoded with orjson when it is installed, and payloads that
+    rarely change can be cached as pre-encoded bytes.
+
+    Attributes:
+        fast (bool): Whether responses are encoded with orjson.
 
     Methods:
         default(obj: Any) -> Any: Override to add custom serialization logic.
+        encode(obj: Any) -> bytes: Encode an object as a response body.
+        cached_response(key, version, build) -> Response: Respond from cache.
     """
 
+    fast: bool = orjson is not None
+
+    def __init__(self, app: Any) -> None:
+        super().__init__(app)
+        self._encoded: Dict[str, Tuple[str, bytes]] = {}
+
     def default(self, obj: Any) -> Any:
         """
         Override the default method to add custom serialization.
@@ -32,3 +54,95 @@ class JSONProvider(DefaultJSONProvider):
         if isinstance(obj, time):
             return None
         return super().default(obj)
+
+    def _indent(self) -> bool:
+        """Whether responses are pretty printed, as decided by Flask."""
+        return (self.compact is None and self._app.debug) or self.compact is False
+
+    def encode(self, obj: Any) -> bytes:
+        """
+        Encode an object as a response body.
+
+        Uses orjson when available, keeping the same handling of dates, times,
+        UUIDs and dataclasses by passing them through to default. Anything orjson
+        cannot encode, or pretty printed output, goes through the standard encoder.
+
+        Args:
+            obj: The object to encode.
+
+        Returns:
+            bytes: The encoded JSON.
+        """
+        if self.fast and not self._indent():
+            options = (
+                orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+            if self.sort_keys:
+                options |= orjson.OPT_SORT_KEYS
+            try:
+                return orjson.dumps(obj, default=self.default, option=options)
+            except orjson.JSONEncodeError:
+                pass
+
+        if self._indent():
+            return self.dumps(obj, indent=2).encode("utf-8")
+        return self.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Serialize the given arguments as a JSON response.
+
+        Args:
+            args: A single value to serialize, or multiple values to serialize as a list.
+            kwargs: Treat as a dict to serialize.
+
+        Returns:
+            Response: The JSON response.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            self.encode(obj) + b"\n", mimetype=self.mimetype
+        )
+
+    def cached_response(
+        self, key: str, version: str, build: Callable[[], Any]
+    ) -> Response:
+        """
+        Respond with a payload that is encoded once per version.
+
+        Args:
+            key (str): The name of the cached payload.
+            version (str): Identifies the payload's data. A new version re-encodes it.
+            build (Callable): Produces the payload when it must be encoded.
+
+        Returns:
+            Response: The JSON response.
+        """
+        cached: Optional[Tuple[str, bytes]] = self._encoded.get(key)
+        hit = cached is not None and cached[0] == version
+        record_cache("response", hit)
+        if not hit:
+            cached = (version, self.encode(build()) + b"\n")
+            self._encoded[key] = cached
+
+        return self._app.response_class(cached[1], mimetype=self.mimetype)
+
+
+def cached_jsonify(key: str, version: str, build: Callable[[], Any]) -> Response:
+    """
+    Respond with a pre-encoded payload when the app uses JSONProvider.
+
+    Args:
+        key (str): The name of the cached payload.
+        version (str): Identifies the payload's data.
+        build (Callable): Produces the payload when it must be encoded.
+
+    Returns:
+        Response: The JSON response.
+    """
+    provider = current_app.json
+    if isinstance(provider, JSONProvider):
+        return provider.cached_response(key, version, build)
+    return jsonify(build())
@@ -3,19 +3,75 @@ Data service module for interacting with the database.
 """
 
 import logging
-from contextlib import contextmanager
-from typing import Any, Dict, Generator, List, Set, Tuple, Union
-from uuid import UUID
+import math
+import re
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any, Dict, Generator, List, Optional, Sequence, Set, Tuple, Union
+from weakref import WeakKeyDictionary
 
 from flask import current_app as app
-from sqlalchemy import MetaData, Table, create_engine, text, tuple_
+from flask import has_request_context, request
+from sqlalchemy import MetaData, Result, Row, Table, create_engine, text, tuple_
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.sql.expression import ClauseElement
+from werkzeug.wrappers.response import Response
 
 from backend.flask.config import Config
+from backend.flask.decorators.trace import traced
+from backend.flask.limits.breaker import CircuitBreaker
 from backend.flask.providers.sqlalchemy import SQLALchemyJSONProvider
+from backend.flask.services.replicas import PIN_COOKIE, ReplicaSet
+
+
+_engines: "WeakKeyDictionary[Config, Dict[str, Engine]]" = WeakKeyDictionary()
+
+# The requests table's show partitions, see partition_name, are not tables of their own
+_PARTITIONS = re.compile(r"^requests_(default|[0-9a-f]{16})$")
+
+
+def _shared_engine(config: Config, url: str, **kwargs: Any) -> Engine:
+    """
+    Get the engine for a database, creating it once per config.
+
+    Services created with the same config share an engine, and so its pool,
+    rather than each opening connections of its own.
+
+    Args:
+        config (Config): The configuration object.
+        url (str): The database URL.
+        **kwargs: Arguments for create_engine.
+
+    Returns:
+        Engine: The engine.
+    """
+    engines = _engines.setdefault(config, {})
+    if url not in engines:
+        engines[url] = create_engine(url, **kwargs)
+    return engines[url]
+
+
+def _key_value(column: Any, value: Any) -> Any:
+    """
+    Convert an incoming key to its column's Python type, e.g. UUID for the uuid
+    keys and str for the requests' show_hash, so it compares with the stored keys.
+
+    Args:
+        column (Any): The key column.
+        value (Any): The incoming value.
+
+    Returns:
+        Any: The converted value.
+    """
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if value is None or not isinstance(python_type, type) or isinstance(value, python_type):
+        return value
+    return python_type(value)
 
 
 def get_json_provider_class() -> type:
@@ -41,17 +97,84 @@ class DataService:
             config (Config): The configuration object.
         """
 
-        database_url = (
-            f"{config.db_engine}://"
-            f"{config.db_user}:{config.db_password}@"
-            f"{config.db_host}:{int(config.db_port)}/{config.db_name}"
-        )
+        def database_url(host: Optional[str], port: Optional[str]) -> str:
+            return (
+                f"{config.db_engine}://"
+                f"{config.db_user}:{config.db_password}@"
+                f"{host}:{int(port)}/{config.db_name}"  # type: ignore[arg-type]
+            )
+
+        connect_args: Dict[str, Any] = {
+            "connect_timeout": int(config.db_connect_timeout or 3),
+        }
+        pool_args: Dict[str, Any] = {}
+        if config.db_pooler:
+            # Transaction poolers hand each transaction to any server connection,
+            # so nothing may outlive one: no startup options, which also pin RDS
+            # Proxy sessions, and no server-side prepared statements. The statement
+            # timeout is the database's default instead. The pooler multiplexes, so
+            # a few connections per engine are enough.
+            pool_args = {"pool_size": int(config.db_pool_size or 2), "max_overflow": 0}
+        else:
+            connect_args["options"] = (
+                f"-c statement_timeout={int(config.db_statement_timeout or 0)}"
+            )
+            if config.db_pool_size:
+                pool_args = {"pool_size": int(config.db_pool_size)}
+        if str(config.db_engine).endswith("+psycopg"):
+            connect_args["prepare_threshold"] = (
+                None if config.db_pooler else int(config.db_prepare_threshold or 5)
+            )
 
-        logging.debug("Connecting to database: %s", database_url)
-        self._engine = create_engine(database_url, pool_pre_ping=True)
+        self._engine = _shared_engine(
+            config,
+            database_url(config.db_host, config.db_port),
+            pool_pre_ping=True,
+            # Names the pool in the metrics, which must not show the host
+            pool_logging_name="primary",
+            connect_args=connect_args,
+            **pool_args,
+        )
+        logging.debug(
+            "Connecting to database: %s",
+            self._engine.url.render_as_string(hide_password=True),
+        )
+        # Shares the engine's pool; statements commit as they run, without BEGIN/COMMIT
+        self._reader = self._engine.execution_options(isolation_level="AUTOCOMMIT")
+
+        replicas = []
+        hosts = filter(None, (config.db_replica_hosts or "").split(","))
+        for number, replica in enumerate(hosts):
+            host, _, port = replica.strip().partition(":")
+            engine = _shared_engine(
+                config,
+                database_url(host, port or config.db_port),
+                pool_pre_ping=True,
+                pool_logging_name=f"replica-{number}",
+                connect_args=connect_args,
+                **pool_args,
+            )
+            logging.debug(
+                "Reading from replica: %s", engine.url.render_as_string(hide_password=True)
+            )
+            replicas.append(engine.execution_options(isolation_level="AUTOCOMMIT"))
+        self._replicas = ReplicaSet(
+            replicas, float(config.db_sticky_seconds or 5), config.JWT_SECRET_KEY
+        )
         self._metadata = MetaData()
         self._session = sessionmaker(self._engine)
-        logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+
+    @staticmethod
+    def _guard() -> AbstractContextManager:
+        """
+        Guard a call to the database with the app's circuit breaker, if it has one.
+        While the database is parked outside shows, the call fails at once.
+        """
+        state = app.extensions.get("db_state")
+        if state is not None:
+            state.check()
+        breaker = app.extensions.get("db_breaker")
+        return breaker.guard() if breaker is not None else nullcontext()
 
     @contextmanager
     def _session_scope(self) -> Generator[Session, None, None]:
@@ -60,24 +183,29 @@ class DataService:
         """
         app.logger.debug("Creating session")
 
-        try:
-            session = self._session()
-            yield session
-            app.logger.debug("Committing session")
-            session.commit()
-        except SQLAlchemyError as e:
-            app.logger.error("Error in session: %s. Rolling back.", e)
-            session.rollback()
-            raise e
-        finally:
-            app.logger.debug("Closing session")
-            session.close()
+        with self._guard():
+            try:
+                session = self._session()
+                yield session
+                app.logger.debug("Committing session")
+                session.commit()
+            except SQLAlchemyError as e:
+                app.logger.error("Error in session: %s. Rolling back.", e)
+                session.rollback()
+                raise e
+            finally:
+                app.logger.debug("Closing session")
+                session.close()
 
     def _refresh_metadata(self) -> None:
         """
-        Refresh the metadata to reflect the current database schema.
+        Refresh the metadata to reflect the current database schema, leaving out
+        the requests table's partitions.
         """
-        self._metadata.reflect(bind=self._engine)
+        with self._guard():
+            self._metadata.reflect(
+                bind=self._engine, only=lambda name, _: not _PARTITIONS.match(name)
+            )
 
     def _get_primary_key_columns(self, table: Table) -> List[str]:
         """
@@ -136,6 +264,7 @@ class DataService:
         if not self._metadata.tables or table_name not in self._metadata.tables:
             raise ValueError(f"Table {table_name} does not exist.")
 
+    @traced("db")
     def insert_rows(self, table_name: str, rows: List[Dict[str, Any]]) -> None:
         """
         Inserts rows to a table.
@@ -153,6 +282,7 @@ class DataService:
         with self._session_scope() as session:
             self._insert(table, rows, session)
 
+    @traced("db")
     def write_table(self, table_name: str, rows: List[Dict[str, Any]]) -> None:
         """
         Write a table to the database, replacing existing data completely.
@@ -175,7 +305,7 @@ class DataService:
         ]
 
         incoming_keys = {
-            tuple(UUID(row.get(key)) for key in primary_key_columns)
+            tuple(_key_value(table.c[key], row.get(key)) for key in primary_key_columns)
             for row in incoming_rows_with_keys
         }
         app.logger.debug("Incoming keys: %s", incoming_keys)
@@ -201,6 +331,7 @@ class DataService:
                 session,
             )
 
+    @traced("db")
     def execute(
         self,
         statement: Union[str, ClauseElement],
@@ -230,6 +361,83 @@ class DataService:
                 dict(row._mapping) for row in result  # pylint: disable=protected-access
             ]
 
+    def _pin_reads(self, response: Response) -> None:
+        """
+        Read from the primary for a while after a client's write, see ReplicaSet.
+
+        Args:
+            response (Response): The write's response, which carries the pin.
+        """
+        if self._replicas:
+            response.set_cookie(
+                PIN_COOKIE,
+                self._replicas.pin(),
+                max_age=math.ceil(self._replicas.sticky_seconds),
+                httponly=True,
+                secure=True,
+                samesite="Lax",
+            )
+
+    def _replica(self) -> Optional[Tuple[Engine, CircuitBreaker]]:
+        """
+        Choose a replica to read from, unless the client has just written.
+        """
+        if not self._replicas:
+            return None
+        if has_request_context() and self._replicas.pinned(request.cookies.get(PIN_COOKIE)):
+            return None
+        return self._replicas.choose()
+
+    @traced("db")
+    def fetch(
+        self,
+        statement: Union[str, ClauseElement],
+        params: Union[Dict[str, Any], None] = None,
+        as_dicts: bool = False,
+        primary: bool = False,
+    ) -> Union[Sequence[Row], List[Dict[str, Any]]]:
+        """
+        Run a read-only statement on a pooled connection in autocommit mode.
+
+        Unlike execute, there is no ORM session, no transaction around the
+        statement and no schema reflection, so a query is a single round trip.
+        Only use it for reads. With replicas, it runs on the next one, or on the
+        primary if none is available.
+
+        Args:
+            statement (Union[str, ClauseElement]):
+                 The SQL statement or SQLAlchemy Core expression to run.
+            params (Union[Dict[str, Any], None], optional): Parameters to bind to the SQL statement.
+            as_dicts (bool): Copy each row to a dictionary, e.g. to return it as JSON.
+            primary (bool): Read from the primary, even with replicas.
+
+        Returns:
+            Union[Sequence[Row], List[Dict[str, Any]]]: The rows, as named tuples unless
+                as_dicts is set.
+        """
+        if isinstance(statement, str):
+            statement = text(statement)
+
+        replica = None if primary else self._replica()
+        if replica is not None:
+            engine, breaker = replica
+            try:
+                with breaker.guard(), engine.connect() as connection:
+                    return self._rows(connection.execute(statement, params or {}), as_dicts)
+            except OperationalError as e:
+                app.logger.warning("Replica unavailable, reading from the primary: %s", e)
+
+        with self._guard(), self._reader.connect() as connection:
+            return self._rows(connection.execute(statement, params or {}), as_dicts)
+
+    @staticmethod
+    def _rows(
+        result: Result, as_dicts: bool
+    ) -> Union[Sequence[Row], List[Dict[str, Any]]]:
+        if as_dicts:
+            return [dict(row) for row in result.mappings()]
+        return result.all()
+
     def _insert(
         self,
         table: Table,
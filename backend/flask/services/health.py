@@ -0,0 +1,105 @@
+"""
+This module provides the HealthService class, which checks whether the application
+can serve requests and warms it up before a show.
+"""
+
+import threading
+import time
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, Optional
+
+from flask import current_app as app
+from sqlalchemy.pool import QueuePool
+
+from backend.flask.config import Config
+from backend.flask.limits.breaker import CLOSED
+from backend.flask.services.data import DataService
+from backend.flask.services.statements import HOT_QUERIES, WARM_UP_PARAMS
+
+WARM_UP_INTERVAL = 60.0
+
+
+class HealthService(DataService):
+    """
+    Service class for the liveness and readiness checks and the warm-up.
+    Inherits from DataService to check the database through its circuit breaker.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        clock: Callable[[], float] = time.monotonic,
+        maintenance: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """
+        :param config: The configuration object.
+        :param clock: The monotonic clock the warm-up interval is measured on.
+        :param maintenance: Best-effort upkeep run on each warm-up, while the
+            scheduler has the database started, e.g. the request partitions.
+        """
+        super().__init__(config)
+        self._clock = clock
+        self._maintenance = maintenance
+        self._warmed_at: Optional[float] = None
+        self._warm_lock = threading.Lock()
+
+    def readiness(self) -> Dict[str, Any]:
+        """
+        Check the database, failing at once while its circuit is open.
+
+        :return: The database circuit's state.
+        :raises OperationalError: If the database is unavailable.
+        """
+        self.fetch("SELECT 1", primary=True)
+
+        breaker = app.extensions.get("db_breaker")
+        return {
+            "status": "ok",
+            "database": breaker.state if breaker is not None else CLOSED,
+        }
+
+    def warm(self) -> Dict[str, Any]:
+        """
+        Open the database pool's connections and run each hot query once, so the
+        first fans of a show do not wait on connecting and compiling queries.
+
+        The maintenance then runs, so the scheduler, which warms the tasks every
+        few minutes around a show, also keeps the request partitions up to date.
+
+        The scheduler's runs may overlap, so a warm-up within WARM_UP_INTERVAL of
+        the last one is skipped.
+
+        :return: Whether the task was warmed, and the connections opened.
+        :raises OperationalError: If the database is unavailable.
+        """
+        with self._warm_lock:
+            now = self._clock()
+            if self._warmed_at is not None and now - self._warmed_at < WARM_UP_INTERVAL:
+                return {"status": "ok", "warmed": False}
+            self._warmed_at = now
+
+        try:
+            connections = self._open_pool()
+            for statement in HOT_QUERIES.values():
+                self.fetch(statement, WARM_UP_PARAMS)
+        except Exception:
+            self._warmed_at = None
+            raise
+
+        if self._maintenance is not None:
+            self._maintenance()
+
+        return {"status": "ok", "warmed": True, "connections": connections}
+
+    def _open_pool(self) -> int:
+        """
+        Check out as many connections as the pool keeps at once, then return them.
+
+        :return: The number of connections opened.
+        """
+        pool = self._engine.pool
+        size = pool.size() if isinstance(pool, QueuePool) else 1
+        with self._guard(), ExitStack() as stack:
+            for _ in range(size):
+                stack.enter_context(self._reader.connect()).exec_driver_sql("SELECT 1")
+        return size
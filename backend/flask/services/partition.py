@@ -0,0 +1,178 @@
+"""
+Partition service module for maintaining the partitions of the requests table.
+
+The requests table is list partitioned by show_hash (see the 0004 migration), so
+the duplicate and count queries of a live show only touch that show's partition.
+Each show gets its partition when it is inserted, or, while the database is
+parked, when the scheduler warms the tasks up before the next show. The
+scheduler's warm-ups run until a while after each show, so once a show has ended
+its partition is detached and moved to the archive schema, where it stays
+queryable but out of the way of the live tables.
+"""
+
+import hashlib
+import re
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from flask import current_app as app
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from backend.flask.catalog.times import latest_time
+from backend.flask.services.data import DataService
+
+SHOW_HASH = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+ARCHIVE_SCHEMA = "archive"
+
+
+def partition_name(show_hash: str) -> str:
+    """
+    Name the requests partition of a show.
+
+    Args:
+        show_hash (str): The show's hash.
+
+    Returns:
+        str: A name short enough for a Postgres identifier.
+    """
+    digest = hashlib.sha256(show_hash.encode("utf-8")).hexdigest()[:16]
+    return f"requests_{digest}"
+
+
+def _literal(show_hash: str) -> str:
+    # Partition bounds cannot be bound parameters, so only plain hashes are allowed.
+    if not SHOW_HASH.match(show_hash):
+        raise ValueError(f"Invalid show hash '{show_hash}'.")
+    return f"'{show_hash}'"
+
+
+class PartitionService(DataService):
+    """
+    Service for maintaining the show partitions of the requests table.
+    """
+
+    def attached_partitions(self) -> List[str]:
+        """
+        List the partitions attached to the requests table.
+
+        Returns:
+            List[str]: The partition names, including the default partition.
+        """
+        with self._session_scope() as session:
+            result = session.execute(
+                text(
+                    """
+                    SELECT child.relname
+                    FROM pg_inherits
+                    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                    WHERE parent.relname = 'requests'
+                    """
+                )
+            )
+            return [row[0] for row in result]
+
+    def create_partition(self, show_hash: str) -> str:
+        """
+        Create the requests partition of a show, if it does not exist yet.
+
+        Requests of the show already in the default partition, e.g. written
+        before the show had a partition, are moved into it.
+
+        Args:
+            show_hash (str): The show's hash.
+
+        Returns:
+            str: The partition name.
+        """
+        name = partition_name(show_hash)
+        bound = _literal(show_hash)
+        if name in self.attached_partitions():
+            return name
+
+        with self._session_scope() as session:
+            session.execute(
+                text(f'CREATE TABLE "{name}" (LIKE requests INCLUDING DEFAULTS)')
+            )
+            session.execute(
+                text(
+                    f"""
+                    WITH moved AS (
+                        DELETE FROM requests_default
+                        WHERE show_hash = :show_hash
+                        RETURNING *
+                    )
+                    INSERT INTO "{name}" SELECT * FROM moved
+                    """  # nosec B608
+                ),
+                {"show_hash": show_hash},
+            )
+            session.execute(
+                text(f'ALTER TABLE requests ATTACH PARTITION "{name}" FOR VALUES IN ({bound})')
+            )
+        app.logger.info("Created requests partition %s for show %s.", name, show_hash)
+        return name
+
+    def archive_partitions(
+        self, shows: Iterable[Dict[str, str]], now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Detach the partitions of ended shows and move them to the archive schema.
+
+        Detaching briefly locks the requests table, so a partition is skipped,
+        and retried on the next run, when the lock is not granted quickly. A show
+        whose end_time has no offset is only taken to have ended once it has in
+        every time zone.
+
+        Args:
+            shows (Iterable[Dict[str, str]]): The shows, with their hash and end_time.
+            now (datetime, optional): The current time.
+
+        Returns:
+            List[str]: The archived partition names.
+        """
+        now = now or datetime.now(timezone.utc)
+        attached = set(self.attached_partitions())
+        archived = []
+        for show in shows:
+            name = partition_name(show["hash"])
+            if name not in attached or latest_time(show["end_time"]) > now:
+                continue
+            try:
+                with self._session_scope() as session:
+                    session.execute(text("SET LOCAL lock_timeout = '2s'"))
+                    session.execute(text(f'ALTER TABLE requests DETACH PARTITION "{name}"'))
+                    session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+                    session.execute(text(f'ALTER TABLE "{name}" SET SCHEMA {ARCHIVE_SCHEMA}'))
+            except OperationalError:
+                app.logger.warning("Could not lock requests to archive %s, skipping.", name)
+                continue
+            app.logger.info("Archived requests partition %s of show %s.", name, show["hash"])
+            archived.append(name)
+        return archived
+
+    def maintain(
+        self, shows: Iterable[Dict[str, str]], now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Create the partitions of shows yet to end and archive those of ended shows.
+
+        Args:
+            shows (Iterable[Dict[str, str]]): All shows.
+            now (datetime, optional): The current time.
+
+        Returns:
+            List[str]: The created partition names.
+        """
+        now = now or datetime.now(timezone.utc)
+        shows = list(shows)
+        attached = set(self.attached_partitions())
+        created = [
+            self.create_partition(show["hash"])
+            for show in shows
+            if partition_name(show["hash"]) not in attached
+            and latest_time(show["end_time"]) > now
+        ]
+        self.archive_partitions(shows, now)
+        return created
@@ -0,0 +1,104 @@
+"""
+This module provides the read replicas DataService routes reads to.
+
+Reads go to the replicas in turn, skipping any whose circuit is open, and fall
+back to the primary when none is available. A client that has just written
+reads from the primary for a short window, so it sees its own write while the
+replicas catch up. The window travels with the client in a signed cookie,
+since its next request may be served by another task.
+"""
+
+import hashlib
+import hmac
+import itertools
+import secrets
+import time
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy.engine import Engine
+
+from backend.flask.limits.breaker import OPEN, CircuitBreaker
+
+PIN_COOKIE = "totalRequestLiveReadPrimary"
+
+
+class ReplicaSet:
+    """
+    Read replicas, chosen round-robin.
+
+    Attributes:
+        replicas (list): Each replica's engine and circuit breaker.
+        sticky_seconds (float): How long a client reads from the primary after a write.
+    """
+
+    def __init__(
+        self,
+        engines: List[Engine],
+        sticky_seconds: float = 5.0,
+        secret: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        :param engines: The replicas' engines.
+        :param sticky_seconds: How long a client reads from the primary after a write.
+        :param secret: Signs the pins, the same for every task. Without one, pins
+            only hold on the task that made them.
+        :param clock: The wall clock, shared by the tasks, the pins expire on.
+        """
+        self.replicas: List[Tuple[Engine, CircuitBreaker]] = [
+            (engine, CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock))
+            for engine in engines
+        ]
+        self.sticky_seconds = sticky_seconds
+        self._key = (secret or secrets.token_hex(32)).encode("utf-8")
+        self._clock = clock
+        self._turn = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    def _sign(self, until: str) -> str:
+        return hmac.new(self._key, until.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def pin(self) -> str:
+        """
+        Pin a client that has just written to the primary.
+
+        Returns:
+            str: The pin, to set as the client's PIN_COOKIE: the time it expires
+                and its signature, so a client cannot extend it.
+        """
+        until = f"{self._clock() + self.sticky_seconds:.3f}"
+        return f"{until}.{self._sign(until)}"
+
+    def pinned(self, pin: Optional[str]) -> bool:
+        """
+        Whether a client wrote recently enough to read from the primary.
+
+        Args:
+            pin (str, optional): The client's PIN_COOKIE.
+
+        Returns:
+            bool: Whether to read from the primary.
+        """
+        until, _, signature = (pin or "").rpartition(".")
+        if not until or not hmac.compare_digest(signature, self._sign(until)):
+            return False
+        try:
+            return float(until) > self._clock()
+        except ValueError:
+            return False
+
+    def choose(self) -> Optional[Tuple[Engine, CircuitBreaker]]:
+        """
+        The next replica whose circuit is not open.
+
+        Returns:
+            tuple: The replica's engine and breaker, or None if all are down.
+        """
+        start = next(self._turn)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if replica[1].state != OPEN:
+                return replica
+        return None
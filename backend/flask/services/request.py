@@ -5,20 +5,43 @@ in the application. It interacts with the database to retrieve and process reque
 
 import uuid
 from datetime import datetime
+from typing import Any, Dict, List, Optional
 
 from flask import current_app as app
 from flask import jsonify, make_response, redirect, request, url_for
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import OperationalError
 from werkzeug.wrappers.response import Response
 
+from backend.flask.config import Config
+from backend.flask.limits.parking import DatabaseParkedError
 from backend.flask.services.data import DataService
+from backend.flask.services.spool import RequestSpool
+from backend.flask.services.statements import (
+    DUPLICATE_REQUEST,
+    REQUEST_COUNTS,
+    REQUESTED_SONG,
+    SHOW_REQUEST_COUNTS,
+    SONG,
+)
 
 
 class RequestService(DataService):
     """
     Service class for handling operations related to requests.
     Inherits from DataService to provide database interaction capabilities.
+
+    With a spool, requests keep being taken while the database is unavailable,
+    see backend.flask.services.spool, but not while it is parked between shows.
     """
 
+    _spool: Optional[RequestSpool] = None
+
+    def __init__(self, config: Config, spool: Optional[RequestSpool] = None) -> None:
+        super().__init__(config)
+
+        self._spool = spool
+
     def redirect(self, show_hash: str) -> Response:
         """
         Enforces uniqueness and then redirects to Requests page.
@@ -28,7 +51,22 @@ class RequestService(DataService):
         """
         app.logger.info("Processing redirect for show_hash: %s", show_hash)
         request_id = request.cookies.get("totalRequestLiveRequestId", "")
-        if self._is_duplicate(request_id, show_hash):
+        try:
+            duplicate = self._is_duplicate(request_id, show_hash)
+        except OperationalError as e:
+            if self._spool is None or isinstance(e, DatabaseParkedError):
+                raise
+            app.logger.warning("Database unavailable, checking the spool for duplicates.")
+            if self._spool.contains(request_id):
+                return redirect(
+                    url_for(
+                        "renderblueprint.render_main",
+                        songName="UNABLE TO RETRIEVE SONG NAME",
+                    )
+                )
+            duplicate = False
+
+        if duplicate:
             app.logger.info("Duplicate request %s detected, redirecting to main page.", request_id)
             duplicate_request = self._get_duplicate_request(request_id)
             return redirect(
@@ -54,8 +92,18 @@ class RequestService(DataService):
         song_request["request_time"] = datetime.now().isoformat()
         song_request["request_id"] = uuid.uuid4().hex
 
-        self.insert_rows("requests", [song_request])
-        app.logger.info("Request %s written successfully.", song_request["request_id"])
+        written = False
+        try:
+            self.insert_rows("requests", [song_request])
+            written = True
+            app.logger.info("Request %s written successfully.", song_request["request_id"])
+        except OperationalError as e:
+            if self._spool is None or isinstance(e, DatabaseParkedError):
+                raise
+            self._spool.append(song_request)
+            app.logger.warning(
+                "Database unavailable, spooled request %s.", song_request["request_id"]
+            )
         response = make_response(jsonify(song_request), 201)
 
         response.set_cookie(
@@ -65,6 +113,8 @@ class RequestService(DataService):
             secure=True,
             samesite="Lax",
         )
+        if written:
+            self._pin_reads(response)
         return response
 
     def get_requests_counts(self) -> list:
@@ -72,15 +122,32 @@ class RequestService(DataService):
         Get the requests for each song.
         :return: A list of dictionaries containing song IDs and their request counts.
         """
-        result = self.execute(
-            """
-            SELECT song_id, COUNT(*) as request_count
-            FROM requests
-            GROUP BY song_id
-            """
-        )
+        result = self.fetch(REQUEST_COUNTS, as_dicts=True)
         return result
 
+    def get_show_requests_counts(self, show_hash: str) -> list:
+        """
+        Get the requests for each song of a show, from the show's partition only.
+        :param show_hash: The unique identifier for the show.
+        :return: A list of dictionaries containing song IDs and their request counts.
+        """
+        return self.fetch(SHOW_REQUEST_COUNTS, {"show_hash": show_hash}, as_dicts=True)
+
+    def replay_requests(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Write spooled requests in one statement, skipping those already written.
+
+        :param rows: The spooled request rows.
+        """
+        table = self.get_table("requests")
+        statement = (
+            insert(table)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=self._get_primary_key_columns(table))
+        )
+        with self._session_scope() as session:
+            session.execute(statement)
+
     def _is_duplicate(self, request_id: str, show_hash: str) -> bool:
         """
         Check if the request is a duplicate.
@@ -89,15 +156,8 @@ class RequestService(DataService):
         :return: True if the request is a duplicate, otherwise False.
         """
         if request_id:
-            result = self.execute(
-                # pylint: disable=R0801
-                """
-                SELECT 1
-                FROM requests
-                WHERE request_id = :request_id AND show_hash = :show_hash
-                LIMIT 1
-                """,
-                {"request_id": request_id, "show_hash": show_hash},
+            result = self.fetch(
+                DUPLICATE_REQUEST, {"request_id": request_id, "show_hash": show_hash}
             )
             if result:
                 app.logger.info("Duplicate request %s detected.", request_id)
@@ -111,25 +171,10 @@ class RequestService(DataService):
         :param request_id: The unique identifier for the request.
         :return: JSON response with the duplicate request details.
         """
-        request_result = self.execute(
-            # pylint: disable=R0801
-            """
-            SELECT song_id
-            FROM requests
-            WHERE request_id = :request_id
-            """,
-            {"request_id": request_id},
-        )
+        request_result = self.fetch(REQUESTED_SONG, {"request_id": request_id})
 
-        song_id = next(iter(request_result), {}).get("song_id")
+        song_id = request_result[0].song_id if request_result else None
         if not song_id:
             return []
 
-        return self.execute(
-            """
-            SELECT *
-            FROM songs
-            WHERE id = :song_id
-            """,
-            {"song_id": song_id},
-        )
+        return self.fetch(SONG, {"song_id": song_id}, as_dicts=True)
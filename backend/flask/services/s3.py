@@ -3,11 +3,17 @@ This module provides the S3Service class, which handles operations related to da
 stored in S3.
 """
 
-import hashlib
 import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
 
 import boto3
+from botocore.exceptions import ClientError
 
+from backend.flask.catalog.snapshot import CatalogSnapshot, build_snapshot, create_hash
 from backend.flask.exceptions.boto import raise_http_exception
 
 
@@ -25,15 +31,106 @@ class S3Service:
         )["Parameter"]["Value"]
 
         self._s3_client = boto3.client("s3", region_name=config.AWS_DEFAULT_REGION)
+        self._catalog_dir = config.catalog_cache_dir or os.path.join(
+            tempfile.gettempdir(), f"{config.project_name}-catalog"
+        )
 
     def _create_hash(self, _dict: dict) -> str:
         """Create a hash from dict for use as a machine-readable key."""
-        dict_copy = _dict.copy()
-        dict_copy.pop("hash", None)
-        json_string = json.dumps(
-            dict_copy,
-            sort_keys=True,
-            separators=(",", ":"),
+        return create_hash(_dict)
+
+    def _load_catalog(self, name: str) -> Tuple[CatalogSnapshot, datetime]:
+        """
+        Load a catalog, preferring its prebuilt snapshot over the raw JSON.
+
+        The snapshot is downloaded once per version to local disk and
+        memory-mapped, so every worker in the task shares its pages, and records
+        are only decoded as they are looked up through its index or listed.
+        Without a snapshot, the JSON is parsed, any missing hashes are computed
+        and a snapshot is built in memory.
+
+        :param name: The catalog name, e.g. "songs" for songs/songs.json.
+
+        Returns:
+            tuple: The catalog and its last modified time.
+        """
+        try:
+            response = self._s3_client.head_object(
+                Bucket=self._bucket_name, Key=f"{name}/{name}.snapshot"
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in ("NoSuchKey", "404"):
+                raise
+            logging.info("No %s snapshot found, loading %s.json", name, name)
+        else:
+            return (
+                self._cache_snapshot(name, str(response["ETag"]).strip('"')),
+                response.get("LastModified", datetime.now(timezone.utc)),
+            )
+
+        response = self._s3_client.get_object(
+            Bucket=self._bucket_name, Key=f"{name}/{name}.json"
+        )
+        records: List[Dict[str, Any]] = json.loads(response["Body"].read())
+        for record in records:
+            if "hash" not in record:
+                record["hash"] = self._create_hash(record)
+
+        return (
+            CatalogSnapshot(build_snapshot(records)),
+            response.get("LastModified", datetime.now(timezone.utc)),
+        )
+
+    def _catalog_version(self, name: str) -> str:
+        """
+        The version of a catalog in S3, the ETag of its snapshot or, without one,
+        of its JSON.
+
+        :param name: The catalog name.
+
+        Returns:
+            str: The ETag.
+        """
+        for key in (f"{name}/{name}.snapshot", f"{name}/{name}.json"):
+            try:
+                response = self._s3_client.head_object(Bucket=self._bucket_name, Key=key)
+            except ClientError as e:
+                if e.response["Error"]["Code"] not in ("NoSuchKey", "404"):
+                    raise
+            else:
+                return str(response["ETag"]).strip('"')
+        raise ValueError(f"No {name} catalog found")
+
+    def _cache_snapshot(self, name: str, etag: str) -> CatalogSnapshot:
+        """
+        Map a snapshot from the local catalog cache, downloading it first unless
+        that version is already cached.
+
+        :param name: The catalog name.
+        :param etag: The ETag of the snapshot in S3.
+
+        Returns:
+            CatalogSnapshot: The memory-mapped snapshot.
+        """
+        path = os.path.join(self._catalog_dir, f"{name}-{etag}.snapshot")
+        if os.path.exists(path):
+            try:
+                return CatalogSnapshot.open(path)
+            except ValueError:
+                logging.warning("Cached %s snapshot is invalid, downloading it", name)
+                os.remove(path)
+
+        response = self._s3_client.get_object(
+            Bucket=self._bucket_name, Key=f"{name}/{name}.snapshot"
         )
-        hash_object = hashlib.sha256(json_string.encode("utf-8"))
-        return hash_object.hexdigest()
+        # The snapshot may have changed since it was checked
+        etag = str(response.get("ETag", etag)).strip('"')
+        path = os.path.join(self._catalog_dir, f"{name}-{etag}.snapshot")
+
+        os.makedirs(self._catalog_dir, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=self._catalog_dir)
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(response["Body"].read())
+        os.replace(temporary, path)
+
+        return CatalogSnapshot.open(path)
@@ -3,19 +3,32 @@ This module provides the ShowService class, which handles operations related to
 in the application. It interacts with the database to retrieve and process show data.
 """
 
+import hashlib
 import json
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timezone
 from io import BytesIO
+from typing import Any, Callable, Dict, List, Optional
 
 import qrcode
 import qrcode.constants
+from flask import current_app as app
+from botocore.exceptions import ClientError
 from qrcode.image.base import BaseImage
+from sqlalchemy.exc import SQLAlchemyError
 
+from backend.flask.catalog.snapshot import CatalogSnapshot, build_snapshot
+from backend.flask.catalog.times import show_time
 from backend.flask.exceptions.boto import raise_http_exception
+from backend.flask.services.partition import PartitionService
 from backend.flask.services.s3 import S3Service
 
+# Seconds between checks of the catalog in S3 for shows created on other tasks
+REFRESH_INTERVAL = 30.0
 
-class ShowService(S3Service):
+
+class ShowService(S3Service):  # pylint: disable=too-many-instance-attributes
     """
     Service class for handling operations related to shows.
 
@@ -23,18 +36,63 @@ class ShowService(S3Service):
     """
 
     @raise_http_exception
-    def __init__(self, config):
+    def __init__(
+        self,
+        config,
+        partitions: Optional[PartitionService] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         super().__init__(config)
 
-        self.shows = json.loads(
-            self._s3_client.get_object(
-                Bucket=self._bucket_name, Key="shows/shows.json"
-            )["Body"].read()
-        )
+        self._partitions = partitions
+        self._clock = clock
+
+        self._version = self._catalog_version("shows")
+        self._catalog, self.last_modified = self._load_catalog("shows")
+        self.digest = self._catalog.digest
+        self._checked_at = clock()
+        self._refresh_lock = threading.Lock()
+        # (catalog digest, expires, upcoming shows, upcoming digest)
+        self._upcoming: Optional[tuple] = None
+
+    @property
+    def shows(self) -> List[Dict[str, Any]]:
+        """The shows, decoded on first use."""
+        return self._catalog.records
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Reload the catalog if it has changed in S3.
 
-        for show in self.shows:
-            if "hash" not in show:
-                show["hash"] = self._create_hash(show)
+        Each task keeps the catalog in memory, so a show created on one task is
+        picked up by the others through the catalog's ETag, checked at most every
+        REFRESH_INTERVAL seconds unless forced. When S3 cannot be reached the
+        catalog is kept as loaded.
+
+        :param force: Check now, e.g. on a warm-up or before inserting a show.
+        """
+        # Requests carry on with the catalog they have while another checks it
+        if not self._refresh_lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+            return
+        try:
+            now = self._clock()
+            if not force and now - self._checked_at < REFRESH_INTERVAL:
+                return
+            self._checked_at = now
+
+            version = self._catalog_version("shows")
+            if version == self._version:
+                return
+            catalog, last_modified = self._load_catalog("shows")
+        except (ClientError, ValueError) as e:
+            app.logger.warning("Shows catalog left as loaded: %s", e)
+            return
+        finally:
+            self._refresh_lock.release()
+
+        self._catalog, self.last_modified = catalog, last_modified
+        self.digest = catalog.digest
+        self._version = version
 
     def get_shows(self) -> list[dict[str, str]]:
         """Get the list of shows."""
@@ -49,22 +107,52 @@ class ShowService(S3Service):
         Raises:
             ValueError: If the show_hash is invalid.
         """
-        show = next((show for show in self.shows if show["hash"] == show_hash), None)
+        show = self._catalog.get(show_hash)
+        if show is None:
+            # It may have been created on another task
+            self.refresh()
+            show = self._catalog.get(show_hash)
         if show is None:
             raise ValueError(f"Show with hash '{show_hash}' not found")
 
         return show
 
+    def _get_upcoming(self) -> tuple:
+        """
+        Get the upcoming shows and their digest.
+
+        They are only rebuilt once the catalog changes or the next upcoming show
+        ends, rather than on every request.
+        """
+        now = datetime.now(timezone.utc)
+        upcoming = self._upcoming
+        if upcoming is None or upcoming[0] != self.digest or now >= upcoming[1]:
+            shows = [
+                show
+                for show in self.shows
+                if show_time(show["end_time"]) > now and show.get("name") != "DEMO"
+            ]
+            expires = min(
+                (show_time(show["end_time"]) for show in shows),
+                default=datetime.max.replace(tzinfo=timezone.utc),
+            )
+            hashes = ",".join(show["hash"] for show in shows)
+            digest = hashlib.sha256(f"{self.digest}:{hashes}".encode("utf-8")).hexdigest()
+            upcoming = self._upcoming = (self.digest, expires, shows, digest)
+        return upcoming
+
     def get_upcoming_shows(self) -> list[dict[str, str]]:
         """Get the list of upcoming shows."""
-        return [
-            show
-            for show in self.shows
-            if datetime.fromisoformat(show.get("end_time")) > datetime.now() and show.get("name") != "DEMO"
-        ]
+        return self._get_upcoming()[2]
+
+    def get_upcoming_digest(self) -> str:
+        """Get a digest identifying the current list of upcoming shows."""
+        return self._get_upcoming()[3]
 
     def insert_show(self, show: dict[str, str]) -> None:
         """Insert a new show into the list."""
+        # The catalog is written back whole, so start from the latest
+        self.refresh(force=True)
         show["hash"] = self._create_hash(show)
         show["url"] = (
             f"https://www.throwbackrequestlive.com/api/requests/redirect/{show['hash']}"
@@ -82,12 +170,48 @@ class ShowService(S3Service):
             ContentType="image/png",
         )
 
-        self.shows.append(show)
+        shows = self.shows + [show]
+        snapshot = build_snapshot(shows)
+        self._catalog = CatalogSnapshot(snapshot)
+        self.digest = self._catalog.digest
+        self.last_modified = datetime.now(timezone.utc)
+
         self._s3_client.put_object(
             Bucket=self._bucket_name,
             Key="shows/shows.json",
-            Body=json.dumps(self.shows),
+            Body=json.dumps(shows),
         )
+        response = self._s3_client.put_object(
+            Bucket=self._bucket_name,
+            Key="shows/shows.snapshot",
+            Body=snapshot,
+        )
+        self._version = str(response.get("ETag", "")).strip('"')
+        self.maintain_partitions()
+
+    def maintain(self) -> None:
+        """
+        The upkeep run on each warm-up: pick up the shows created on other tasks,
+        then maintain their request partitions.
+        """
+        self.refresh(force=True)
+        self.maintain_partitions()
+
+    def maintain_partitions(self) -> None:
+        """
+        Create the request partitions of the shows yet to end and archive those of
+        ended shows.
+
+        The database is parked outside shows, so this is best effort: when it cannot
+        be reached the show is still created, its requests land in the default
+        partition, and the scheduler's next warm-up before a show tries again.
+        """
+        if self._partitions is None:
+            return
+        try:
+            self._partitions.maintain(self.shows)
+        except SQLAlchemyError as e:
+            app.logger.warning("Request partitions left for the next warm-up: %s", e)
 
     def create_qr_code(self, url: str) -> BaseImage:
         """
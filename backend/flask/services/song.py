@@ -3,7 +3,7 @@ This module provides the SongService class, which handles operations related to
 in the application. It interacts with the database to retrieve and process song data.
 """
 
-import json
+from typing import Any, Dict, List
 
 from backend.flask.exceptions.boto import raise_http_exception
 from backend.flask.services.s3 import S3Service
@@ -18,14 +18,13 @@ class SongService(S3Service):
     def __init__(self, config):
         super().__init__(config)
 
-        self.songs = json.loads(
-            self._s3_client.get_object(
-                Bucket=self._bucket_name, Key="songs/songs.json"
-            )["Body"].read()
-        )
+        self._catalog, self.last_modified = self._load_catalog("songs")
+        self.digest = self._catalog.digest
 
-        for song in self.songs:
-            song["hash"] = self._create_hash(song)
+    @property
+    def songs(self) -> List[Dict[str, Any]]:
+        """The songs, decoded on first use."""
+        return self._catalog.records
 
     def get_songs(self) -> list[dict[str, str]]:
         """Get the list of songs."""
@@ -40,7 +39,7 @@ class SongService(S3Service):
         Raises:
             ValueError: If the song_hash is invalid.
         """
-        song = next((song for song in self.songs if song["hash"] == song_hash), None)
+        song = self._catalog.get(song_hash)
         if song is None:
             raise ValueError(f"Song with hash '{song_hash}' not found")
 
@@ -0,0 +1,267 @@
+"""
+This module provides a durable on-disk spool for song requests.
+
+While the database is unavailable, request rows are appended to a segment file
+and fsynced before the fan is answered. A background replayer seals the segment
+and drains sealed segments into the database in batches once it is back. Rows
+keep the request_id they were given, so replaying a segment twice, e.g. after a
+crash mid-way, writes each request once.
+
+Segments are only durable for as long as their directory: on Fargate it must be
+shared storage (the runtime tasks mount EFS at SPOOL_DIR), so the segments of a
+task that is stopped are replayed by the others. A task being stopped seals its
+active segment and replays what it can first, see SpoolReplayer.drain.
+"""
+
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from flask import Flask
+from sqlalchemy.exc import OperationalError
+
+REPLAY_INTERVAL = 5.0
+REPLAY_BATCH_SIZE = 500
+SEGMENT_BYTES = 1 << 20
+
+
+def _locked(path: str) -> bool:
+    """Whether a live process holds a segment, i.e. has it locked."""
+    try:
+        with open(path, "rb") as segment:
+            try:
+                fcntl.flock(segment, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return True
+    except FileNotFoundError:
+        return True
+    return False
+
+
+class RequestSpool:
+    """
+    Append-only segments of request rows.
+
+    The active segment, "active-<id>.jsonl", is sealed as "sealed-<ns>-<id>.jsonl"
+    and claimed by a replayer by renaming it to "<sealed>.claimed", so replayers
+    sharing the directory never replay the same segment at once. Active and
+    claimed segments are locked while in use, so ones left unlocked belong to a
+    process that has gone and are sealed again.
+
+    Attributes:
+        directory (str): The spool directory.
+        segment_bytes (int): The size at which the active segment is sealed.
+    """
+
+    def __init__(self, directory: str, segment_bytes: int = SEGMENT_BYTES) -> None:
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self._active = ""
+        self._file: Optional[BinaryIO] = None
+        self._spooled: Set[str] = set()
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+
+    def _recover(self) -> None:
+        """Seal the segments left behind by processes that have gone."""
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith("active-") and not _locked(path):
+                self._seal(path)
+            elif name.endswith(".claimed") and not _locked(path):
+                self.release(path)
+
+    def _seal(self, path: str) -> None:
+        sealed = f"sealed-{time.time_ns()}-{uuid.uuid4().hex}.jsonl"
+        os.replace(path, os.path.join(self.directory, sealed))
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """
+        Append a row, durably, before returning.
+
+        Args:
+            row (dict): The request row, with its request_id.
+        """
+        line = json.dumps(row, separators=(",", ":")).encode("utf-8") + b"\n"
+        with self._lock:
+            if self._file is None:
+                self._active = os.path.join(
+                    self.directory, f"active-{uuid.uuid4().hex}.jsonl"
+                )
+                self._file = open(self._active, "ab")  # pylint: disable=consider-using-with
+                fcntl.flock(self._file, fcntl.LOCK_EX)
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._spooled.add(row["request_id"])
+            if self._file.tell() >= self.segment_bytes:
+                self._close_active()
+
+    def _close_active(self) -> None:
+        if self._file is not None:
+            self._seal(self._active)
+            self._file.close()
+            self._file = None
+
+    def seal(self) -> None:
+        """Seal the active segment, so it can be replayed."""
+        with self._lock:
+            self._close_active()
+
+    def contains(self, request_id: str) -> bool:
+        """Whether a request was spooled by this process and is not replayed yet."""
+        return request_id in self._spooled
+
+    def claim(self) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Claim the sealed segments, oldest first.
+
+        Yields:
+            tuple: The claimed segment's path and its rows. Pass the path to
+                done once the rows are written, or to release to retry later.
+        """
+        for name in sorted(os.listdir(self.directory)):
+            if not name.startswith("sealed-") or name.endswith(".claimed"):
+                continue
+            path = os.path.join(self.directory, name)
+            claimed = f"{path}.claimed"
+            try:
+                os.replace(path, claimed)
+            except FileNotFoundError:
+                continue
+            with open(claimed, "rb") as segment:
+                fcntl.flock(segment, fcntl.LOCK_EX)
+                rows = self._read(segment, claimed)
+                yield claimed, rows
+
+    @staticmethod
+    def _read(segment: BinaryIO, path: str) -> List[Dict[str, Any]]:
+        rows = []
+        for number, line in enumerate(segment, 1):
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                logging.warning("Skipping torn line %d of spool segment %s", number, path)
+        return rows
+
+    def done(self, path: str, rows: List[Dict[str, Any]]) -> None:
+        """Remove a replayed segment."""
+        os.remove(path)
+        with self._lock:
+            self._spooled.difference_update(row.get("request_id") for row in rows)
+
+    @staticmethod
+    def release(path: str) -> None:
+        """Return a claimed segment to be replayed later."""
+        os.replace(path, path[: -len(".claimed")])
+
+    def pending(self) -> int:
+        """The number of segments waiting to be replayed."""
+        with self._lock:
+            active = 1 if self._file is not None else 0
+        return active + sum(
+            name.startswith("sealed-") for name in os.listdir(self.directory)
+        )
+
+
+class SpoolReplayer:
+    """
+    Drains the spool into the database in the background.
+
+    Attributes:
+        spool (RequestSpool): The spool.
+        write (callable): Writes a batch of rows, idempotently by request_id.
+        interval (float): Seconds between replays.
+        batch_size (int): Rows written per batch.
+    """
+
+    def __init__(
+        self,
+        spool: RequestSpool,
+        write: Callable[[List[Dict[str, Any]]], None],
+        interval: float = REPLAY_INTERVAL,
+        batch_size: int = REPLAY_BATCH_SIZE,
+    ) -> None:
+        self.spool = spool
+        self.write = write
+        self.interval = interval
+        self.batch_size = batch_size
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._app: Optional[Flask] = None
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Replay in the background, in the app's context.
+
+        Args:
+            app (Flask): The application.
+        """
+        app.extensions["spool_replayer"] = self
+        self._app = app
+        self._thread = threading.Thread(
+            target=self._run, args=(app,), name="spool-replayer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop replaying."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def drain(self) -> int:
+        """
+        Stop replaying in the background and replay once more, e.g. when the task
+        is being stopped. The active segment is sealed either way, so segments the
+        database refuses are left for the other tasks sharing the spool.
+
+        Returns:
+            int: The number of rows written.
+        """
+        self.stop()
+        try:
+            if self._app is None:
+                return self.replay()
+            with self._app.app_context():
+                return self.replay()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logging.exception("Draining the request spool failed")
+            return 0
+
+    def _run(self, app: Flask) -> None:
+        while not self._stopped.wait(self.interval):
+            with app.app_context():
+                try:
+                    self.replay()
+                except Exception:  # pylint: disable=broad-exception-caught
+                    app.logger.exception("Replaying the request spool failed")
+
+    def replay(self) -> int:
+        """
+        Write the spooled rows, stopping at the first segment the database refuses.
+
+        Returns:
+            int: The number of rows written.
+        """
+        self.spool.seal()
+        written = 0
+        for path, rows in self.spool.claim():
+            try:
+                for start in range(0, len(rows), self.batch_size):
+                    self.write(rows[start : start + self.batch_size])
+            except OperationalError as e:
+                logging.info("Database still unavailable, keeping spool segment: %s", e)
+                self.spool.release(path)
+                break
+            self.spool.done(path, rows)
+            written += len(rows)
+            logging.info("Replayed %d spooled requests from %s", len(rows), path)
+        return written
@@ -0,0 +1,64 @@
+"""
+This module defines the hot queries of the request path, once, as Core constructs.
+
+SQLAlchemy compiles each construct once per engine and reuses the compiled form
+from its cache, instead of parsing a text() statement on every call. On Postgres,
+psycopg prepares a query on the server once a connection has run it
+prepare_threshold times, so it is planned once per connection too. Behind a
+transaction pooler such as PgBouncer server-side prepared statements are turned
+off, see DB_POOLER.
+"""
+
+from typing import Any, Dict
+from uuid import UUID
+
+from sqlalchemy import bindparam, column, func, literal_column, select, table
+from sqlalchemy.sql import Select
+
+requests = table(
+    "requests",
+    column("request_id"),
+    column("show_hash"),
+    column("song_id"),
+    column("request_time"),
+)
+songs = table("songs", column("id"), column("band_name"), column("song_name"))
+
+REQUEST_COUNTS = select(
+    requests.c.song_id, func.count().label("request_count")
+).group_by(requests.c.song_id)
+
+SHOW_REQUEST_COUNTS = REQUEST_COUNTS.where(
+    requests.c.show_hash == bindparam("show_hash")
+)
+
+DUPLICATE_REQUEST = (
+    select(literal_column("1"))
+    .select_from(requests)
+    .where(
+        requests.c.request_id == bindparam("request_id"),
+        requests.c.show_hash == bindparam("show_hash"),
+    )
+    .limit(1)
+)
+
+REQUESTED_SONG = select(requests.c.song_id).where(
+    requests.c.request_id == bindparam("request_id")
+)
+
+SONG = select(songs).where(songs.c.id == bindparam("song_id"))
+
+HOT_QUERIES: Dict[str, Select] = {
+    "request_counts": REQUEST_COUNTS,
+    "show_request_counts": SHOW_REQUEST_COUNTS,
+    "duplicate_request": DUPLICATE_REQUEST,
+    "requested_song": REQUESTED_SONG,
+    "song": SONG,
+}
+
+# Binds for every hot query that match no rows, for running them to warm up
+WARM_UP_PARAMS: Dict[str, Any] = {
+    "show_hash": "",
+    "request_id": str(UUID(int=0)),
+    "song_id": str(UUID(int=0)),
+}
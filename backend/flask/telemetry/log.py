@@ -0,0 +1,225 @@
+"""
+This module provides the application's logging pipeline.
+
+Loggers hand their records to a QueueHandler, which only merges the message
+arguments and stamps the request context (route, show_hash, request_id and
+trace_id) on the request thread. A QueueListener thread formats the records as
+JSON lines and writes them out, so slow log I/O, e.g. a throttled CloudWatch
+stdout pipe, never adds latency to a request. Chatty loggers on hot paths can be
+sampled below WARNING.
+"""
+
+import atexit
+import copy
+import itertools
+import json
+import logging
+import queue
+import secrets
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, Any, Dict, Iterator, Optional
+
+from flask import Flask, g, has_request_context, request
+from flask.logging import default_handler
+
+TEXT_FORMAT = "%(asctime)s %(name)s:%(levelname)s:%(pathname)s:%(lineno)d:%(message)s"
+CONTEXT = ("route", "show_hash", "request_id", "trace_id")
+
+
+def parse_sample_rates(setting: Optional[str]) -> Dict[str, float]:
+    """
+    Parse per-logger sample rates.
+
+    Args:
+        setting (str, optional): Comma separated "<logger>=<rate>" pairs, e.g.
+            "backend.flask.services.request=0.1,sqlalchemy.engine=0".
+
+    Returns:
+        dict: The share of records kept, between 0 and 1, by logger name.
+    """
+    rates: Dict[str, float] = {}
+    for pair in filter(None, (pair.strip() for pair in (setting or "").split(","))):
+        name, _, rate = pair.partition("=")
+        try:
+            value = float(rate)
+        except ValueError as e:
+            raise ValueError(f"Invalid log sample rate {pair}.") from e
+        if not name.strip() or not 0 <= value <= 1:
+            raise ValueError(f"Invalid log sample rate {pair}.")
+        rates[name.strip()] = value
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a share of the records below WARNING from the sampled loggers.
+
+    Sampling is deterministic: a rate of 0.1 keeps every tenth record, so a burst
+    of requests is still represented. A logger's rate also applies to its children.
+
+    Attributes:
+        rates (dict): The share of records kept, by logger name.
+    """
+
+    def __init__(self, rates: Dict[str, float]) -> None:
+        super().__init__()
+        self.rates = rates
+        self._counters: Dict[str, Iterator[int]] = {}
+        self._lock = threading.Lock()
+
+    def _rate(self, name: str) -> Optional[float]:
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        if rate is None or rate >= 1:
+            return True
+        if rate <= 0:
+            return False
+        with self._lock:
+            counter = self._counters.setdefault(record.name, itertools.count())
+            return next(counter) % round(1 / rate) == 0
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Stamps the current request's context on records.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = g.get("log_context") if has_request_context() else None
+        for key in CONTEXT:
+            setattr(record, key, (context or {}).get(key))
+        spans = g.get("trace_spans") if has_request_context() else None
+        if spans:
+            record.trace_id = spans[0].trace_id
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formats records as single line JSON objects.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "location": f"{record.pathname}:{record.lineno}",
+        }
+        for key in CONTEXT:
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return json.dumps(entry, default=str)
+
+
+class _QueueHandler(QueueHandler):
+    """
+    Enqueues records without formatting them, so the listener does it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the arguments now, as they may be mutated once the call returns.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class LogPipeline:
+    """
+    Routes all logging through a background thread.
+
+    Attributes:
+        level (str): The root log level.
+        handler (QueueHandler): The root handler, enqueueing records.
+        listener (QueueListener): The thread writing records out.
+    """
+
+    def __init__(
+        self,
+        level: Optional[str] = "INFO",
+        log_format: Optional[str] = "json",
+        sample_rates: Optional[Dict[str, float]] = None,
+        stream: Optional[IO[str]] = None,
+    ) -> None:
+        if log_format not in ("json", "text"):
+            raise ValueError(f"Unknown log format {log_format}.")
+        self.level = level or "INFO"
+
+        output = logging.StreamHandler(stream or sys.stdout)
+        output.setFormatter(
+            JSONFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT)
+        )
+
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self.handler = _QueueHandler(records)  # type: ignore[arg-type]
+        self.handler.addFilter(RequestContextFilter())
+        if sample_rates:
+            self.handler.addFilter(SamplingFilter(sample_rates))
+        self.listener = QueueListener(records, output)  # type: ignore[arg-type]
+        self._started = False
+        self._previous_level = logging.NOTSET
+
+    def start(self) -> None:
+        """Attach the pipeline to the root logger and start writing."""
+        if self._started:
+            return
+        root = logging.getLogger()
+        self._previous_level = root.level
+        root.setLevel(self.level)
+        root.addHandler(self.handler)
+        self.listener.start()
+        self._started = True
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Detach the pipeline and flush the queued records."""
+        if not self._started:
+            return
+        root = logging.getLogger()
+        root.removeHandler(self.handler)
+        root.setLevel(self._previous_level)
+        self.listener.stop()
+        self._started = False
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Route the app's logs through the pipeline, with its request context.
+
+        Args:
+            app (Flask): The application.
+        """
+        self.start()
+        app.extensions["logs"] = self
+        app.logger.removeHandler(default_handler)
+        app.before_request(self._before_request)
+
+    @staticmethod
+    def _before_request() -> None:
+        view_args = request.view_args or {}
+        g.log_context = {
+            "route": request.url_rule.rule if request.url_rule else request.path,
+            "show_hash": view_args.get("show_hash") or request.args.get("show_hash"),
+            "request_id": request.headers.get("X-Request-Id") or secrets.token_hex(8),
+        }
@@ -0,0 +1,295 @@
+"""
+This module provides Prometheus metrics for the Flask application.
+
+Per route, it records request latency, in-flight requests and how many database
+queries, AWS calls and cache hits each request made. Database queries are counted
+from SQLAlchemy engine events and AWS calls from boto3 session events, so the
+services need no changes. Connection pool usage is read from every engine that
+has connected, and the database circuit breaker's state from the breaker.
+
+The metrics are served on a port of their own, which API Gateway does not route
+to, rather than on the app's public routes. In the task a collector sidecar
+scrapes them into CloudWatch, see infra.constructs.runtime.
+"""
+
+import logging
+import time
+import weakref
+from collections import Counter as CallCounter
+from typing import Any, Dict, Iterator, Optional
+
+import boto3
+from flask import Flask, current_app, g, has_app_context, has_request_context, request
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, start_http_server
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from backend.flask.telemetry import queries
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CALLS_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50)
+
+_engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+
+class PoolCollector(Collector):
+    """
+    Collects the connection pool usage of the engines that have connected.
+
+    Pools are labelled with their logging name, e.g. "primary", never the URL, which
+    would expose the database's user, host and name. Engines with the same name
+    are summed.
+    """
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        connections = GaugeMetricFamily(
+            "db_pool_connections",
+            "Database connections by pool state.",
+            labels=["database", "state"],
+        )
+        states: Dict[tuple, int] = CallCounter()
+        for engine in list(_engines):
+            pool = engine.pool
+            database = getattr(pool, "logging_name", None) or "default"
+            for state in ("size", "checkedin", "checkedout", "overflow"):
+                value = getattr(pool, state, None)
+                if callable(value):
+                    states[(database, state)] += max(0, value())
+
+        for (database, state), value in sorted(states.items()):
+            connections.add_metric([database, state], value)
+        yield connections
+
+
+class BreakerCollector(Collector):
+    """
+    Collects the state of the database circuit breaker.
+
+    Attributes:
+        breaker (CircuitBreaker): The breaker.
+    """
+
+    STATES = ("closed", "half_open", "open")
+
+    def __init__(self, breaker: Any) -> None:
+        self.breaker = breaker
+
+    def collect(self) -> Iterator[Any]:
+        state = GaugeMetricFamily(
+            "db_circuit_state",
+            "The database circuit breaker's state, 1 for the current one.",
+            labels=["state"],
+        )
+        current = self.breaker.state
+        for name in self.STATES:
+            state.add_metric([name], 1 if name == current else 0)
+        yield state
+        yield CounterMetricFamily(
+            "db_circuit_opened",
+            "How many times the database circuit has opened.",
+            value=self.breaker.opened,
+        )
+        yield CounterMetricFamily(
+            "db_circuit_rejected",
+            "Database calls failed at once while the circuit was open.",
+            value=self.breaker.rejected,
+        )
+
+
+class Metrics:
+    """
+    The application's metrics, kept in their own registry.
+
+    Attributes:
+        registry (CollectorRegistry): The registry exposed on /metrics.
+        server (Optional[Any]): The metrics server, once serving.
+    """
+
+    def __init__(self, registry: Optional[CollectorRegistry] = None) -> None:
+        self.registry = registry or CollectorRegistry()
+        self.server: Optional[Any] = None
+        self.request_latency = Histogram(
+            "http_request_duration_seconds",
+            "Request latency by route.",
+            ["method", "endpoint", "status"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.requests_in_flight = Gauge(
+            "http_requests_in_flight",
+            "Requests being handled by route.",
+            ["endpoint"],
+            registry=self.registry,
+        )
+        self.dependency_calls = Counter(
+            "dependency_calls",
+            "Calls to the database, AWS services and caches by route.",
+            ["endpoint", "dependency"],
+            registry=self.registry,
+        )
+        self.calls_per_request = Histogram(
+            "dependency_calls_per_request",
+            "Calls to each dependency made by a single request.",
+            ["endpoint", "dependency"],
+            buckets=CALLS_BUCKETS,
+            registry=self.registry,
+        )
+        self.dependency_latency = Histogram(
+            "dependency_call_duration_seconds",
+            "Latency of database queries and AWS calls.",
+            ["dependency", "operation"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.cache_lookups = Counter(
+            "cache_lookups",
+            "Response cache lookups by result.",
+            ["cache", "result"],
+            registry=self.registry,
+        )
+        self.registry.register(PoolCollector())
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Record the app's requests and the database and AWS calls they make.
+
+        Register before the services are created, as boto3 clients only get the
+        session's event handlers when they are created.
+
+        Args:
+            app (Flask): The application.
+        """
+        app.extensions["metrics"] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+        _listen()
+
+    def serve(self, port: int, addr: str = "0.0.0.0") -> None:  # nosec B104
+        """
+        Serve /metrics on a port of its own, from a background thread.
+
+        The port is not the app's, so neither API Gateway nor the proxy Lambda
+        forward to it; only a scraper inside the task, or let in by the task's
+        security group, can read it. A port already in use, e.g. by the process
+        the debug reloader restarts, is logged and skipped.
+
+        Args:
+            port (int): The port.
+            addr (str): The address to listen on.
+        """
+        try:
+            self.server, _ = start_http_server(port, addr, registry=self.registry)
+        except OSError as e:
+            logger.warning("Metrics not served on port %d: %s", port, e)
+
+    @staticmethod
+    def _endpoint() -> str:
+        return request.endpoint or "unmatched"
+
+    def _before_request(self) -> None:
+        g.metrics_start = time.perf_counter()
+        g.metrics_calls = CallCounter()
+        self.requests_in_flight.labels(self._endpoint()).inc()
+
+    def _after_request(self, response: Any) -> Any:
+        g.metrics_status = response.status_code
+        return response
+
+    def _teardown_request(self, _: Optional[BaseException]) -> None:
+        start = g.pop("metrics_start", None)
+        if start is None:
+            return
+
+        endpoint = self._endpoint()
+        self.requests_in_flight.labels(endpoint).dec()
+        self.request_latency.labels(
+            request.method, endpoint, str(g.pop("metrics_status", 500))
+        ).observe(time.perf_counter() - start)
+
+        calls = g.pop("metrics_calls", CallCounter())
+        for dependency in ("db", "s3", "cognito-idp", "cache"):
+            self.calls_per_request.labels(endpoint, dependency).observe(calls[dependency])
+        for dependency, count in calls.items():
+            self.dependency_calls.labels(endpoint, dependency).inc(count)
+
+
+def _current() -> Optional[Metrics]:
+    """Get the metrics of the current app, if it has any."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get("metrics")
+
+
+def record_call(dependency: str, operation: str, seconds: float) -> None:
+    """
+    Record a call to a dependency.
+
+    Args:
+        dependency (str): The dependency, e.g. "db" or "s3".
+        operation (str): The operation, e.g. "select" or "GetObject".
+        seconds (float): How long the call took.
+    """
+    metrics = _current()
+    if metrics is None:
+        return
+    metrics.dependency_latency.labels(dependency, operation).observe(seconds)
+    if has_request_context() and "metrics_calls" in g:
+        g.metrics_calls[dependency] += 1
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """
+    Record a cache lookup.
+
+    Args:
+        cache (str): The cache, e.g. "response" or "conditional".
+        hit (bool): Whether the lookup was served from the cache.
+    """
+    metrics = _current()
+    if metrics is None:
+        return
+    metrics.cache_lookups.labels(cache, "hit" if hit else "miss").inc()
+    if hit and has_request_context() and "metrics_calls" in g:
+        g.metrics_calls["cache"] += 1
+
+
+def _engine_connect(connection: Any) -> None:
+    _engines.add(connection.engine)
+
+
+def _record_query(statement: str, seconds: float) -> None:
+    operation = statement.lstrip().split(None, 1)[0].lower() if statement.strip() else ""
+    record_call("db", operation, seconds)
+
+
+def _before_aws_call(context: Dict[str, Any], **_: Any) -> None:
+    context["metrics_start"] = time.perf_counter()
+
+
+def _after_aws_call(model: Any, context: Dict[str, Any], **_: Any) -> None:
+    start = context.pop("metrics_start", None)
+    if start is not None:
+        record_call(
+            model.service_model.service_name, model.name, time.perf_counter() - start
+        )
+
+
+def _listen() -> None:
+    """Listen to SQLAlchemy and boto3 events, once per process."""
+    if not event.contains(Engine, "engine_connect", _engine_connect):
+        event.listen(Engine, "engine_connect", _engine_connect)
+    # Queries are timed by the query profiler's cursor listeners
+    queries.subscribe(_record_query)
+
+    if boto3.DEFAULT_SESSION is None:
+        boto3.setup_default_session()
+    events = boto3.DEFAULT_SESSION.events
+    events.register(
+        "before-parameter-build", _before_aws_call, unique_id="metrics-before-call"
+    )
+    events.register("after-call", _after_aws_call, unique_id="metrics-after-call")
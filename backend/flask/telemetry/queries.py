@@ -0,0 +1,285 @@
+"""
+This module provides a SQLAlchemy query profiler.
+
+Every statement run by any engine is recorded with its fingerprint (the statement
+with literals and parameters replaced by ?), its duration and its row count.
+Statements slower than a threshold are logged, and requests that run the same
+fingerprint repeatedly are flagged as likely N+1 queries. Tests can bound the
+queries a block of code may run with query_budget.
+
+Catalog queries issued by schema reflection are recorded but left out of the N+1
+detection and of query budgets by default.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generator, List, Optional
+
+from flask import Flask, current_app, g, has_app_context, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_PARAMETERS = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?")
+_NUMBERS = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES = re.compile(r"(values\s*\(\?\.\.\.\))(?:\s*,\s*\(\?\.\.\.\))+")
+_SPACES = re.compile(r"\s+")
+_CATALOG = re.compile(
+    r"^pragma\b|\b(pg_catalog|information_schema|sqlite_(temp_)?(master|schema))\b"
+)
+
+_local = threading.local()
+
+# Called with every statement and its duration, by the metrics
+_subscribers: List[Callable[[str, float], None]] = []
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a statement so that executions differing only in values match.
+
+    Args:
+        statement (str): The SQL statement.
+
+    Returns:
+        str: The lowercased statement, with literals and parameters as ?,
+            lists of them as (?...) and whitespace collapsed.
+    """
+    normalized = _COMMENTS.sub(" ", statement)
+    normalized = _STRINGS.sub("?", normalized)
+    normalized = _PARAMETERS.sub("?", normalized)
+    normalized = _NUMBERS.sub("?", normalized)
+    normalized = _SPACES.sub(" ", normalized).strip().lower()
+    normalized = _LISTS.sub("(?...)", normalized)
+    normalized = re.sub(r"\(\?\)", "(?...)", normalized)
+    return _VALUES.sub(r"\1", normalized)
+
+
+@dataclass(frozen=True)
+class Query:
+    """
+    A statement run by an engine.
+
+    Attributes:
+        fingerprint (str): The normalized statement.
+        statement (str): The statement as run.
+        duration (float): The seconds it took.
+        rows (int): The rows it returned or affected, -1 when unknown.
+        catalog (bool): Whether it reads the schema catalog, e.g. for reflection.
+    """
+
+    fingerprint: str
+    statement: str
+    duration: float
+    rows: int
+    catalog: bool
+
+
+@dataclass
+class QueryLog:
+    """
+    The queries run while the log is active on the current thread.
+
+    Attributes:
+        queries (List[Query]): The queries, in order.
+    """
+
+    queries: List[Query] = field(default_factory=list)
+
+    def application(self) -> List[Query]:
+        """Get the queries that are not catalog queries."""
+        return [query for query in self.queries if not query.catalog]
+
+    def repeated(self, threshold: int) -> Counter:
+        """
+        Get the application fingerprints run at least threshold times.
+
+        Args:
+            threshold (int): The number of runs from which a fingerprint repeats.
+
+        Returns:
+            Counter: The runs of each repeated fingerprint.
+        """
+        runs = Counter(query.fingerprint for query in self.application())
+        return Counter({key: count for key, count in runs.items() if count >= threshold})
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    Raised when a block of code runs more queries than its budget.
+    """
+
+
+@contextmanager
+def record_queries() -> Generator[QueryLog, None, None]:
+    """
+    Record the queries run on the current thread within the block.
+
+    Yields:
+        QueryLog: The log, filled as queries run.
+    """
+    _listen()
+    log = QueryLog()
+    _local.__dict__.setdefault("logs", []).append(log)
+    try:
+        yield log
+    finally:
+        _local.logs.remove(log)
+
+
+@contextmanager
+def query_budget(
+    max_queries: int, include_catalog: bool = False
+) -> Generator[QueryLog, None, None]:
+    """
+    Fail when the block runs more queries than its budget.
+
+    Args:
+        max_queries (int): The most queries the block may run.
+        include_catalog (bool): Whether catalog queries count against the budget.
+
+    Raises:
+        QueryBudgetExceeded: If the block ran more queries than max_queries.
+    """
+    with record_queries() as log:
+        yield log
+
+    queries = log.queries if include_catalog else log.application()
+    if len(queries) > max_queries:
+        listing = "\n".join(f"  {query.fingerprint}" for query in queries)
+        raise QueryBudgetExceeded(
+            f"Expected at most {max_queries} queries, ran {len(queries)}:\n{listing}"
+        )
+
+
+class QueryProfiler:
+    """
+    Profiles the queries of the app's requests.
+
+    Attributes:
+        slow_query_seconds (float): Statements at least this slow are logged.
+        repeated_query_threshold (int): Requests running an application
+            fingerprint this many times are flagged.
+    """
+
+    def __init__(
+        self, slow_query_ms: float = 100, repeated_query_threshold: int = 3
+    ) -> None:
+        self.slow_query_seconds = float(slow_query_ms) / 1000
+        self.repeated_query_threshold = int(repeated_query_threshold)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Profile the app's requests.
+
+        Args:
+            app (Flask): The application.
+        """
+        app.extensions["query_profiler"] = self
+        app.before_request(self._before_request)
+        app.teardown_request(self._teardown_request)
+        _listen()
+
+    def _before_request(self) -> None:
+        g.query_log = QueryLog()
+        _local.__dict__.setdefault("logs", []).append(g.query_log)
+
+    def _teardown_request(self, _: Optional[BaseException]) -> None:
+        log: Optional[QueryLog] = g.pop("query_log", None)
+        if log is None:
+            return
+        _local.logs.remove(log)
+
+        endpoint = request.endpoint or "unmatched"
+        for query_fingerprint, count in log.repeated(self.repeated_query_threshold).items():
+            logger.warning(
+                "Repeated query on %s: %d runs of %s", endpoint, count, query_fingerprint
+            )
+        logger.debug(
+            "%s ran %d queries (%d catalog) in %.1f ms",
+            endpoint,
+            len(log.queries),
+            len(log.queries) - len(log.application()),
+            sum(query.duration for query in log.queries) * 1000,
+        )
+
+    def observe(self, query: Query) -> None:
+        """
+        Log a query if it is slow.
+
+        Args:
+            query (Query): The query.
+        """
+        if query.duration >= self.slow_query_seconds:
+            logger.warning(
+                "Slow query (%.1f ms, %d rows) on %s: %s",
+                query.duration * 1000,
+                query.rows,
+                request.endpoint if has_request_context() else None,
+                query.fingerprint,
+            )
+
+
+def _before_cursor_execute(connection: Any, *_: Any) -> None:
+    connection.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    connection: Any, cursor: Any, statement: str, *_: Any
+) -> None:
+    starts = connection.info.get("query_start")
+    if not starts:
+        return
+    duration = time.perf_counter() - starts.pop()
+    for subscriber in _subscribers:
+        subscriber(statement, duration)
+
+    logs = getattr(_local, "logs", None)
+    profiler = current_app.extensions.get("query_profiler") if has_app_context() else None
+    if not logs and profiler is None:
+        return
+
+    query_fingerprint = fingerprint(statement)
+    query = Query(
+        fingerprint=query_fingerprint,
+        statement=statement,
+        duration=duration,
+        rows=getattr(cursor, "rowcount", -1),
+        catalog=bool(_CATALOG.search(query_fingerprint)),
+    )
+    for log in logs or ():
+        log.queries.append(query)
+    if profiler is not None:
+        profiler.observe(query)
+
+
+def subscribe(subscriber: Callable[[str, float], None]) -> None:
+    """
+    Call a function with every statement run and its duration, timed by the
+    profiler's listeners rather than a second set on the same engines.
+
+    Args:
+        subscriber (Callable[[str, float], None]): The function, called once.
+    """
+    if subscriber not in _subscribers:
+        _subscribers.append(subscriber)
+    _listen()
+
+
+def _listen() -> None:
+    """Listen to SQLAlchemy events, once per process."""
+    for name, listener in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+    ):
+        if not event.contains(Engine, name, listener):
+            event.listen(Engine, name, listener)
@@ -0,0 +1,103 @@
+"""
+This module reports the task's request rate, which the runtime service scales on.
+
+There is no load balancer in front of the tasks to count requests per target, so
+each task writes its own count to stdout once a minute in CloudWatch's embedded
+metric format. CloudWatch Logs turns the lines into a metric, whose average
+across tasks is the requests per task.
+"""
+
+import json
+import sys
+import threading
+import time
+from typing import IO, Any, Optional
+
+from flask import Flask, request
+
+NAMESPACE = "ThrowbackRequestLive"
+METRIC = "Requests"
+
+# Checks and the warm-up are not fan traffic, so they do not drive scaling
+UNCOUNTED = ("/health/", "/metrics")
+
+
+class RequestRateReporter:
+    """
+    Counts the task's requests and reports them at an interval.
+
+    Attributes:
+        service (str): The service dimension, "<project>-<environment>".
+        interval (float): Seconds between reports.
+    """
+
+    def __init__(
+        self, service: str, interval: float = 60.0, stream: Optional[IO[str]] = None
+    ) -> None:
+        self.service = service
+        self.interval = interval
+        self._stream = stream
+        self._requests = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Count the app's requests and report them in the background.
+
+        Args:
+            app (Flask): The application.
+        """
+        app.extensions["request_rate"] = self
+        app.after_request(self._count)
+        self._thread = threading.Thread(
+            target=self._run, name="request-rate", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop reporting."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _count(self, response: Any) -> Any:
+        if not request.path.startswith(UNCOUNTED):
+            with self._lock:
+                self._requests += 1
+        return response
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.report()
+
+    def report(self) -> int:
+        """
+        Write the requests counted since the last report, and reset the count.
+
+        Returns:
+            int: The requests reported.
+        """
+        with self._lock:
+            requests, self._requests = self._requests, 0
+
+        line = {
+            "_aws": {
+                "Timestamp": int(time.time() * 1000),
+                "CloudWatchMetrics": [
+                    {
+                        "Namespace": NAMESPACE,
+                        "Dimensions": [["Service"]],
+                        "Metrics": [{"Name": METRIC, "Unit": "Count"}],
+                    }
+                ],
+            },
+            "Service": self.service,
+            METRIC: requests,
+        }
+        stream = self._stream or sys.stdout
+        stream.write(json.dumps(line, separators=(",", ":")) + "\n")
+        stream.flush()
+        return requests
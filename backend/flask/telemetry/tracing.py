@@ -0,0 +1,302 @@
+"""
+This module provides lightweight request tracing for the Flask application.
+
+Each request continues the W3C trace context it receives in its traceparent header,
+e.g. from the gateway proxy Lambda, or starts a new trace. Service calls made
+while handling it are recorded as child spans: functions decorated with traced,
+and AWS calls through boto3 session events. Responses carry a Server-Timing
+header summing the spans by category, and finished spans can be exported as JSON
+lines to stdout or a file, so no tracing backend is needed.
+"""
+
+import json
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import IO, Any, Dict, Generator, List, Optional, Tuple
+
+import boto3
+from flask import Flask, current_app, g, has_app_context, has_request_context, request
+
+TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str, str]]:
+    """
+    Parse a W3C traceparent header.
+
+    Args:
+        header (str, optional): The header value.
+
+    Returns:
+        tuple: The trace id, parent span id and flags, or None if the header is
+            missing or invalid.
+    """
+    match = TRACEPARENT.match((header or "").strip().lower())
+    if match is None or set(match.group(1)) == {"0"} or set(match.group(2)) == {"0"}:
+        return None
+    return match.group(1), match.group(2), match.group(3)
+
+
+def format_traceparent(trace_id: str, span_id: str, flags: str = "01") -> str:
+    """Format a W3C traceparent header."""
+    return f"00-{trace_id}-{span_id}-{flags}"
+
+
+@dataclass
+class Span:
+    """
+    A timed operation within a trace.
+
+    Attributes:
+        name (str): The operation, e.g. "GET requestblueprint.redirect_request".
+        category (str): The Server-Timing metric it counts towards, e.g. "db".
+        trace_id (str): The trace it belongs to.
+        span_id (str): Its id.
+        parent_id (str, optional): The span it is nested in.
+        start (float): When it started, in seconds since the epoch.
+        duration (float): How long it took, in seconds.
+        attributes (dict): Details about the operation.
+    """
+
+    name: str
+    category: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: secrets.token_hex(8))
+    parent_id: Optional[str] = None
+    start: float = field(default_factory=time.time)
+    duration: float = 0.0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._started = time.perf_counter()
+
+    def finish(self) -> None:
+        """Record the span's duration."""
+        self.duration = time.perf_counter() - self._started
+
+
+class SpanExporter:
+    """
+    Writes finished spans as JSON lines.
+
+    Attributes:
+        stream (IO): Where the spans are written.
+    """
+
+    def __init__(self, stream: IO[str]) -> None:
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_setting(cls, setting: Optional[str]) -> Optional["SpanExporter"]:
+        """
+        Create an exporter from a setting.
+
+        Args:
+            setting (str, optional): "stdout", "file:<path>", or empty to disable.
+
+        Returns:
+            SpanExporter: The exporter, or None when disabled.
+        """
+        if not setting:
+            return None
+        if setting == "stdout":
+            return cls(sys.stdout)
+        if setting.startswith("file:"):
+            return cls(
+                open(  # pylint: disable=consider-using-with
+                    setting[len("file:") :], "a", encoding="utf-8", buffering=1
+                )
+            )
+        raise ValueError(f"Unknown trace exporter {setting}.")
+
+    def export(self, spans: List[Span]) -> None:
+        """
+        Write spans, one JSON object per line.
+
+        Args:
+            spans (List[Span]): The finished spans.
+        """
+        lines = "".join(json.dumps(asdict(span), default=str) + "\n" for span in spans)
+        with self._lock:
+            self.stream.write(lines)
+            self.stream.flush()
+
+
+class Tracer:
+    """
+    Traces the app's requests.
+
+    Attributes:
+        exporter (SpanExporter, optional): Exports the spans of each request.
+    """
+
+    def __init__(self, exporter: Optional[SpanExporter] = None) -> None:
+        self.exporter = exporter
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Trace the app's requests.
+
+        Register before the services are created, as boto3 clients only get the
+        session's event handlers when they are created.
+
+        Args:
+            app (Flask): The application.
+        """
+        app.extensions["tracer"] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+        _listen()
+
+    def _before_request(self) -> None:
+        context = parse_traceparent(request.headers.get("traceparent"))
+        trace_id, parent_id = context[:2] if context else (secrets.token_hex(16), None)
+        root = Span(
+            f"{request.method} {request.endpoint or 'unmatched'}",
+            "app",
+            trace_id,
+            parent_id=parent_id,
+            attributes={"path": request.path},
+        )
+        g.trace_spans = [root]
+        g.trace_stack = [root]
+
+    def _after_request(self, response: Any) -> Any:
+        spans: Optional[List[Span]] = g.get("trace_spans")
+        if not spans:
+            return response
+
+        root = spans[0]
+        root.attributes["status"] = response.status_code
+        root.finish()
+        response.headers["traceparent"] = format_traceparent(root.trace_id, root.span_id)
+        response.headers.add("Server-Timing", server_timing(spans))
+        return response
+
+    def _teardown_request(self, _: Optional[BaseException]) -> None:
+        spans: Optional[List[Span]] = g.pop("trace_spans", None)
+        g.pop("trace_stack", None)
+        if not spans:
+            return
+        if not spans[0].duration:
+            spans[0].finish()
+        if self.exporter is not None:
+            self.exporter.export(spans)
+
+
+def server_timing(spans: List[Span]) -> str:
+    """
+    Summarize spans as a Server-Timing header.
+
+    Args:
+        spans (List[Span]): The request's spans, the root first.
+
+    Returns:
+        str: The total time as "app", then the time and count of each category.
+    """
+    totals: Dict[str, List[float]] = defaultdict(list)
+    for span in spans[1:]:
+        totals[span.category].append(span.duration)
+
+    metrics = [f"app;dur={spans[0].duration * 1000:.1f}"]
+    for category, durations in sorted(totals.items()):
+        metrics.append(
+            f'{category};dur={sum(durations) * 1000:.1f};desc="{len(durations)} calls"'
+        )
+    return ", ".join(metrics)
+
+
+def _active() -> bool:
+    return (
+        has_request_context()
+        and has_app_context()
+        and "tracer" in current_app.extensions
+        and bool(g.get("trace_stack"))
+    )
+
+
+def start_span(name: str, category: str, **attributes: Any) -> Optional[Span]:
+    """
+    Start a child span of the current span, when the request is traced.
+
+    Args:
+        name (str): The operation.
+        category (str): The Server-Timing metric it counts towards.
+        attributes: Details about the operation.
+
+    Returns:
+        Span: The span, or None outside a traced request.
+    """
+    if not _active():
+        return None
+    parent = g.trace_stack[-1]
+    span = Span(name, category, parent.trace_id, parent_id=parent.span_id, attributes=attributes)
+    g.trace_spans.append(span)
+    g.trace_stack.append(span)
+    return span
+
+
+def end_span(span: Optional[Span]) -> None:
+    """
+    Finish a span started with start_span.
+
+    Args:
+        span (Span, optional): The span.
+    """
+    if span is None:
+        return
+    span.finish()
+    stack = g.get("trace_stack") or []
+    if span in stack:
+        stack.remove(span)
+
+
+@contextmanager
+def trace(name: str, category: str, **attributes: Any) -> Generator[Optional[Span], None, None]:
+    """
+    Trace the block as a child span of the current span.
+
+    Args:
+        name (str): The operation.
+        category (str): The Server-Timing metric it counts towards.
+        attributes: Details about the operation.
+    """
+    span = start_span(name, category, **attributes)
+    try:
+        yield span
+    finally:
+        end_span(span)
+
+
+def _before_aws_call(model: Any, context: Dict[str, Any], **_: Any) -> None:
+    context["trace_span"] = start_span(
+        f"{model.service_model.service_name}.{model.name}",
+        model.service_model.service_name,
+    )
+
+
+def _after_aws_call(context: Dict[str, Any], **kwargs: Any) -> None:
+    span = context.pop("trace_span", None)
+    if span is not None:
+        http_response = kwargs.get("http_response")
+        span.attributes["status"] = getattr(http_response, "status_code", None)
+        end_span(span)
+
+
+def _listen() -> None:
+    """Listen to boto3 events, once per process."""
+    if boto3.DEFAULT_SESSION is None:
+        boto3.setup_default_session()
+    events = boto3.DEFAULT_SESSION.events
+    events.register(
+        "before-parameter-build", _before_aws_call, unique_id="tracing-before-call"
+    )
+    events.register("after-call", _after_aws_call, unique_id="tracing-after-call")
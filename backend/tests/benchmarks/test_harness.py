@@ -0,0 +1,39 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring
+from pathlib import Path
+
+from backend.benchmarks.harness import Result, compare, load, measure, save
+
+
+def _result(name: str, median_us: float) -> Result:
+    return Result(name, 10, 3, median_us, median_us, median_us)
+
+
+def test_when_measure_then_per_call_timings() -> None:
+    calls = []
+
+    result = measure("append", lambda: calls.append(1), number=10, repeat=3)
+
+    assert len(calls) == 31
+    assert result.number == 10 and result.repeat == 3
+    assert 0 < result.min_us <= result.median_us <= result.p95_us
+
+
+def test_when_save_then_load_round_trips(tmp_path: Path) -> None:
+    path = str(tmp_path / "baseline.json")
+
+    save([_result("data.execute", 1.5)], path)
+
+    assert load(path) == {"data.execute": _result("data.execute", 1.5)}
+
+
+def test_given_slower_than_tolerance_when_compare_then_regressed() -> None:
+    baseline = {"fast": _result("fast", 100.0), "slow": _result("slow", 100.0)}
+
+    rows = compare(
+        [_result("fast", 120.0), _result("slow", 130.0), _result("new", 1.0)],
+        baseline,
+        tolerance=0.25,
+    )
+
+    assert [row["regressed"] for row in rows] == [False, True, False]
+    assert rows[2]["ratio"] is None
@@ -0,0 +1,99 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring
+import logging
+
+import pytest
+
+from backend.benchmarks.load import (
+    Crowd,
+    LocalApp,
+    Sample,
+    Scenario,
+    compare,
+    percentile,
+    summarize,
+)
+
+
+@pytest.mark.parametrize("burst", ["spike", "ramp", "uniform"])
+def test_when_arrivals_then_one_per_fan_within_window(burst: str) -> None:
+    arrivals = Scenario(crowd=200, burst=burst, scan_window=10).arrivals()
+
+    assert len(arrivals) == 200
+    assert arrivals == sorted(arrivals)
+    assert all(0 <= arrival <= 10 for arrival in arrivals)
+
+
+def test_given_spike_when_arrivals_then_front_loaded() -> None:
+    spike = Scenario(crowd=500, burst="spike", scan_window=10).arrivals()
+    ramp = Scenario(crowd=500, burst="ramp", scan_window=10).arrivals()
+
+    assert sum(arrival < 2 for arrival in spike) > 250
+    assert sum(arrival < 2 for arrival in ramp) < 50
+
+
+def test_given_unknown_burst_when_scenario_then_value_error() -> None:
+    with pytest.raises(ValueError):
+        Scenario(burst="wave")
+
+
+def test_when_percentile_then_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 95) == 0
+
+
+def test_when_summarize_then_errors_are_unexpected_statuses() -> None:
+    samples = [
+        Sample("scan", 302, 0.01),
+        Sample("request", 201, 0.02),
+        Sample("request", 503, 0.03),
+        Sample("count", 0, 0.04),
+    ]
+
+    summary = summarize(samples, elapsed=2.0)
+
+    assert summary["request"]["errors"] == 1
+    assert summary["request"]["error_rate"] == 0.5
+    assert summary["count"]["errors"] == 1
+    assert summary["total"]["count"] == 4
+    assert summary["total"]["throughput"] == 2.0
+
+
+def test_when_compare_then_latency_change_per_kind() -> None:
+    before = {"calls": summarize([Sample("scan", 302, 0.1), Sample("count", 200, 0.2)], 1.0)}
+    after = {"calls": summarize([Sample("scan", 302, 0.05), Sample("count", 0, 0.2)], 1.0)}
+
+    lines = compare(before, after).splitlines()
+    scan = next(line for line in lines if line.startswith("scan"))
+    count = next(line for line in lines if line.startswith("count"))
+
+    assert "100.0 ->    50.0    -50%" in scan
+    assert count.split()[1:3] == ["0.0", "100.0"]
+
+
+def test_when_crowd_plays_against_local_app_then_all_calls_succeed() -> None:
+    logging.disable(logging.CRITICAL)
+    scenario = Scenario(
+        crowd=5,
+        scan_window=0.2,
+        request_ratio=1.0,
+        rescan_ratio=1.0,
+        think_time=0.05,
+        poll_interval=0.2,
+        duration=1.0,
+    )
+
+    try:
+        with LocalApp(songs=5) as app:
+            crowd = Crowd(scenario, "127.0.0.1", app.port, app.show_hash, app.song_ids)
+            summary = summarize(crowd.samples, crowd.play())
+    finally:
+        logging.disable(logging.NOTSET)
+
+    assert summary["scan"]["count"] == 5
+    assert summary["request"]["count"] == 5
+    assert summary["rescan"]["count"] == 5
+    assert summary["count"]["count"] > 0
+    assert summary["total"]["errors"] == 0
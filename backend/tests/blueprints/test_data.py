@@ -165,7 +165,7 @@ def test_given_table_name_when_get_rows_then_table_name_validated(
 ) -> None:
     with patch.object(blueprint, "_service") as service:
         with app.app_context():
-            service.execute.return_value = [{"success": True}]
+            service.fetch.return_value = [{"success": True}]
             blueprint._get_rows("table")
 
             service.validate_table_name.assert_called_once_with("table")
@@ -177,10 +177,12 @@ def test_given_request_when_get_rows_then_rows_returned(
     with patch.object(blueprint, "_service") as service:
         with app.app_context():
             rows = [{"data": "row_data"}]
-            service.execute.return_value = rows
+            service.fetch.return_value = rows
             table_name = "table"
             response = blueprint._get_rows(table_name)
 
-            service.execute.assert_called_once_with(f"SELECT * FROM {table_name}")
+            service.fetch.assert_called_once_with(
+                f"SELECT * FROM {table_name}", as_dicts=True
+            )
 
             assert response == rows
@@ -0,0 +1,175 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+from typing import Generator
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from prometheus_client import generate_latest
+from sqlalchemy.exc import OperationalError
+
+from backend.flask.blueprints.health import HealthBlueprint
+from backend.flask.config import Config
+from backend.flask.limits.breaker import CircuitBreaker
+from backend.flask.services.health import HealthService
+from backend.flask.services.statements import HOT_QUERIES
+from backend.flask.telemetry.metrics import BreakerCollector, Metrics
+
+
+@pytest.fixture()
+def breaker() -> CircuitBreaker:
+    return CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+
+@pytest.fixture()
+def maintenance() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture()
+def app(
+    config: Config,
+    breaker: CircuitBreaker,
+    maintenance: MagicMock,
+    mock_sql_alchemy_libraries: None,  # pylint: disable=unused-argument
+) -> Generator[Flask, None, None]:
+    app = Flask(__name__)
+    app.extensions["db_breaker"] = breaker
+    app.register_blueprint(
+        HealthBlueprint(service=HealthService(config, maintenance=maintenance))
+    )
+    yield app
+
+
+@pytest.fixture()
+def connection(engine: MagicMock) -> MagicMock:
+    return engine.execution_options.return_value.connect.return_value.__enter__.return_value
+
+
+def test_when_live_then_ok(client: FlaskClient, connection: MagicMock) -> None:
+    response = client.get("/health/live")
+
+    assert response.status_code == 200
+    connection.execute.assert_not_called()
+
+
+def test_given_database_up_when_ready_then_ok(client: FlaskClient) -> None:
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    assert response.json == {"status": "ok", "database": "closed"}
+
+
+def test_given_database_down_when_ready_then_circuit_opens_and_fails_fast(
+    client: FlaskClient, connection: MagicMock
+) -> None:
+    connection.execute.side_effect = OperationalError(None, None, Exception("timeout"))
+
+    statuses = [client.get("/health/ready").status_code for _ in range(3)]
+    response = client.get("/health/ready")
+
+    assert statuses == [503, 503, 503]
+    assert connection.execute.call_count == 2
+    assert response.json["database"] == "open"
+    assert response.headers["Retry-After"] == "30"
+
+
+def test_given_open_circuit_when_collect_then_state_exported(
+    breaker: CircuitBreaker,
+) -> None:
+    metrics = Metrics()
+    metrics.registry.register(BreakerCollector(breaker))
+    for _ in range(2):
+        with pytest.raises(OperationalError):
+            with breaker.guard():
+                raise OperationalError(None, None, Exception("timeout"))
+
+    exposition = generate_latest(metrics.registry).decode()
+
+    assert 'db_circuit_state{state="open"} 1.0' in exposition
+    assert 'db_circuit_state{state="closed"} 0.0' in exposition
+    assert "db_circuit_opened_total 1.0" in exposition
+
+
+def test_when_warm_then_pool_opened_hot_queries_run_and_responses_built(
+    app: Flask, client: FlaskClient, connection: MagicMock
+) -> None:
+    built = []
+    app.add_url_rule("/api/songs", "songs", lambda: built.append("songs") or "[]")
+
+    response = client.post("/health/warm")
+
+    assert response.status_code == 200
+    assert response.json == {"status": "ok", "warmed": True, "connections": 1}
+    connection.exec_driver_sql.assert_called_once_with("SELECT 1")
+    assert connection.execute.call_count == len(HOT_QUERIES)
+    assert built == ["songs"]
+
+
+def test_when_warm_then_maintenance_run(client: FlaskClient, maintenance: MagicMock) -> None:
+    client.post("/health/warm")
+
+    maintenance.assert_called_once_with()
+
+
+def test_given_database_down_when_warm_then_maintenance_not_run(
+    client: FlaskClient, connection: MagicMock, maintenance: MagicMock
+) -> None:
+    connection.exec_driver_sql.side_effect = OperationalError(
+        None, None, Exception("timeout")
+    )
+
+    client.post("/health/warm")
+
+    maintenance.assert_not_called()
+
+
+def test_given_warmed_recently_when_warm_then_skipped(
+    client: FlaskClient, connection: MagicMock
+) -> None:
+    client.post("/health/warm")
+    response = client.post("/health/warm")
+
+    assert response.json == {"status": "ok", "warmed": False}
+    assert connection.execute.call_count == len(HOT_QUERIES)
+
+
+def test_given_database_down_when_warm_then_503_and_retried(
+    client: FlaskClient, connection: MagicMock
+) -> None:
+    connection.exec_driver_sql.side_effect = OperationalError(
+        None, None, Exception("timeout")
+    )
+
+    first = client.post("/health/warm")
+    connection.exec_driver_sql.side_effect = None
+    second = client.post("/health/warm")
+
+    assert first.status_code == 503
+    assert first.headers["Retry-After"] == "1"
+    assert second.json["warmed"] is True
+
+
+def test_when_spool_then_pending_segments_returned(app: Flask, client: FlaskClient) -> None:
+    replayer = MagicMock()
+    replayer.spool.pending.return_value = 2
+    app.extensions["spool_replayer"] = replayer
+
+    response = client.get("/health/spool")
+
+    assert response.status_code == 200
+    assert response.json == {"status": "ok", "pending": 2}
+
+
+def test_given_no_spool_when_spool_then_none_pending(client: FlaskClient) -> None:
+    assert client.get("/health/spool").json["pending"] == 0
+
+
+@pytest.mark.parametrize("method, path", [("POST", "/health/warm"), ("GET", "/health/spool")])
+def test_given_request_through_api_when_internal_endpoint_then_not_found(
+    client: FlaskClient, maintenance: MagicMock, method: str, path: str
+) -> None:
+    response = client.open(path, method=method, headers={"X-Client-Ip": "203.0.113.1"})
+
+    assert response.status_code == 404
+    maintenance.assert_not_called()
@@ -0,0 +1,60 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+import json
+from pathlib import Path
+
+import pytest
+
+from backend.flask.catalog.build import build, validate
+from backend.flask.catalog.snapshot import CatalogSnapshot
+
+SONGS = [{"band_name": "Blink 182", "song_name": "All The Small Things"}]
+SHOWS = [
+    {
+        "name": "DEMO",
+        "venue": "DEMO",
+        "start_time": "2000-01-01T00:00:00",
+        "end_time": "2099-01-01T00:00:00",
+        "hash": "DEMO",
+    }
+]
+
+
+@pytest.fixture
+def assets(tmp_path: Path) -> Path:
+    for name, records in (("songs", SONGS), ("shows", SHOWS)):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / f"{name}.json").write_text(json.dumps(records))
+    return tmp_path
+
+
+def test_given_assets_when_build_then_snapshots_written(assets: Path) -> None:
+    written = build(str(assets))
+
+    assert written == {
+        "songs": str(assets / "songs" / "songs.snapshot"),
+        "shows": str(assets / "shows" / "shows.snapshot"),
+    }
+    assert CatalogSnapshot.open(written["shows"]).get("DEMO") == SHOWS[0]
+    assert len(CatalogSnapshot.open(written["songs"])) == 1
+
+
+def test_given_song_without_name_when_validate_then_raises_error() -> None:
+    with pytest.raises(ValueError, match="song_name"):
+        validate("songs", [{"band_name": "Blink 182"}])
+
+
+def test_given_show_ending_before_start_when_validate_then_raises_error() -> None:
+    show = {**SHOWS[0], "end_time": "1999-01-01T00:00:00"}
+
+    with pytest.raises(ValueError, match="end_time"):
+        validate("shows", [show])
+
+
+def test_given_show_with_bad_time_when_validate_then_raises_error() -> None:
+    with pytest.raises(ValueError):
+        validate("shows", [{**SHOWS[0], "start_time": "tonight"}])
+
+
+def test_given_object_catalog_when_validate_then_raises_error() -> None:
+    with pytest.raises(ValueError, match="array"):
+        validate("songs", {"songs": SONGS})
@@ -0,0 +1,82 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+import json
+from pathlib import Path
+
+import pytest
+
+from backend.flask.catalog.snapshot import (
+    HEADER,
+    CatalogSnapshot,
+    build_snapshot,
+    catalog_digest,
+    create_hash,
+)
+
+SONG = {"band_name": "Blink 182", "song_name": "All The Small Things"}
+DEMO = {"name": "DEMO", "hash": "DEMO"}
+
+
+@pytest.fixture
+def records() -> list:
+    return [dict(SONG), {"band_name": "KoRn", "song_name": "Freak on a Leash"}, DEMO]
+
+
+def test_given_record_with_hash_when_create_hash_then_hash_is_ignored() -> None:
+    assert create_hash({**SONG, "hash": "stale"}) == create_hash(SONG)
+
+
+def test_given_records_when_build_snapshot_then_missing_hashes_added(
+    records: list,
+) -> None:
+    snapshot = CatalogSnapshot(build_snapshot(records))
+
+    assert len(snapshot) == 3
+    assert snapshot.records[0]["hash"] == create_hash(SONG)
+    assert snapshot.records[2]["hash"] == "DEMO"
+    assert "hash" not in records[0]
+
+
+def test_given_snapshot_when_digest_then_matches_catalog_digest(records: list) -> None:
+    snapshot = CatalogSnapshot(build_snapshot(records))
+
+    assert snapshot.digest == catalog_digest(snapshot.records)
+
+
+def test_given_snapshot_when_get_then_record_returned(records: list) -> None:
+    snapshot = CatalogSnapshot(build_snapshot(records))
+
+    assert snapshot.get(create_hash(SONG)) == {**SONG, "hash": create_hash(SONG)}
+    assert snapshot.get("DEMO") == DEMO
+    assert snapshot.get("missing") is None
+
+
+def test_given_duplicate_hashes_when_build_snapshot_then_raises_error() -> None:
+    with pytest.raises(ValueError, match="duplicate"):
+        build_snapshot([SONG, SONG])
+
+
+def test_given_corrupted_payload_when_snapshot_loaded_then_raises_error(
+    records: list,
+) -> None:
+    encoded = bytearray(build_snapshot(records))
+    encoded[HEADER.size + 2] ^= 0xFF
+
+    with pytest.raises(ValueError, match="digest"):
+        CatalogSnapshot(bytes(encoded))
+
+
+def test_given_other_file_when_snapshot_loaded_then_raises_error() -> None:
+    with pytest.raises(ValueError):
+        CatalogSnapshot(json.dumps([SONG]).encode() * 10)
+
+
+def test_given_snapshot_file_when_open_then_snapshot_mapped(
+    records: list, tmp_path: Path
+) -> None:
+    path = tmp_path / "songs.snapshot"
+    path.write_bytes(build_snapshot(records))
+
+    snapshot = CatalogSnapshot.open(str(path))
+
+    assert snapshot.get("DEMO") == DEMO
+    assert [record["hash"] for record in snapshot.records][2] == "DEMO"
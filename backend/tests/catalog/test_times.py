@@ -0,0 +1,31 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.flask.catalog.times import latest_time, show_time
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2030-06-01T20:00:00", datetime(2030, 6, 1, 20, tzinfo=timezone.utc)),
+        ("2030-06-01T20:00:00-04:00", datetime(2030, 6, 2, 0, tzinfo=timezone.utc)),
+    ],
+)
+def test_when_show_time_then_utc(value: str, expected: datetime) -> None:
+    assert show_time(value) == expected
+    assert show_time(value).tzinfo == timezone.utc
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2030-06-01T20:00:00", datetime(2030, 6, 2, 8, tzinfo=timezone.utc)),
+        ("2030-06-01T20:00:00-04:00", datetime(2030, 6, 2, 0, tzinfo=timezone.utc)),
+    ],
+)
+def test_when_latest_time_then_naive_taken_at_utc_minus_twelve(
+    value: str, expected: datetime
+) -> None:
+    assert latest_time(value) == expected
@@ -0,0 +1,100 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+from datetime import datetime, timedelta, timezone
+from typing import Generator
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+
+from backend.flask.decorators.cache import SONGS_CACHE_CONTROL, conditional
+
+ETAG = "digest"
+LAST_MODIFIED = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def endpoint() -> MagicMock:
+    return MagicMock(return_value=(["song"], 200))
+
+
+@pytest.fixture
+def app(endpoint: MagicMock) -> Generator[Flask, None, None]:
+    app = Flask(__name__)
+
+    @app.route("/songs")
+    @conditional(lambda: ETAG, SONGS_CACHE_CONTROL, lambda: LAST_MODIFIED)
+    def songs():
+        return endpoint()
+
+    @app.route("/upcoming")
+    @conditional(lambda: ETAG, SONGS_CACHE_CONTROL)
+    def upcoming():
+        return endpoint()
+
+    yield app
+
+
+def test_when_get_then_validators_and_policy_set(
+    client: FlaskClient, endpoint: MagicMock
+) -> None:
+    response = client.get("/songs")
+
+    endpoint.assert_called_once()
+    assert response.status_code == 200
+    assert response.headers["ETag"] == f'"{ETAG}"'
+    assert response.headers["Cache-Control"] == SONGS_CACHE_CONTROL
+    assert response.last_modified == LAST_MODIFIED
+    assert response.json == ["song"]
+
+
+def test_given_matching_etag_when_get_then_not_modified_without_calling_endpoint(
+    client: FlaskClient, endpoint: MagicMock
+) -> None:
+    response = client.get("/songs", headers={"If-None-Match": f'"{ETAG}"'})
+
+    endpoint.assert_not_called()
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == f'"{ETAG}"'
+    assert response.headers["Cache-Control"] == SONGS_CACHE_CONTROL
+
+
+def test_given_stale_etag_when_get_then_full_response(
+    client: FlaskClient, endpoint: MagicMock
+) -> None:
+    response = client.get(
+        "/songs",
+        headers={
+            "If-None-Match": '"stale"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 12:00:00 GMT",
+        },
+    )
+
+    endpoint.assert_called_once()
+    assert response.status_code == 200
+
+
+def test_given_if_modified_since_after_change_when_get_then_not_modified(
+    client: FlaskClient, endpoint: MagicMock
+) -> None:
+    since = LAST_MODIFIED + timedelta(minutes=1)
+
+    response = client.get(
+        "/songs", headers={"If-Modified-Since": since.strftime("%a, %d %b %Y %H:%M:%S GMT")}
+    )
+
+    endpoint.assert_not_called()
+    assert response.status_code == 304
+
+
+def test_given_no_last_modified_when_if_modified_since_then_full_response(
+    client: FlaskClient, endpoint: MagicMock
+) -> None:
+    response = client.get(
+        "/upcoming", headers={"If-Modified-Since": "Wed, 01 Jan 2099 12:00:00 GMT"}
+    )
+
+    endpoint.assert_called_once()
+    assert response.status_code == 200
+    assert "Last-Modified" not in response.headers
@@ -0,0 +1,156 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+import threading
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from backend.flask.limits.breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+class Clock:  # pylint: disable=missing-class-docstring
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class LockNotAvailable(Exception):  # pylint: disable=missing-class-docstring
+    sqlstate = "55P03"
+
+
+@pytest.fixture()
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture()
+def breaker(clock: Clock) -> CircuitBreaker:
+    return CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+
+
+def _fail(breaker: CircuitBreaker, error: Exception = None) -> None:
+    with pytest.raises(Exception):
+        with breaker.guard():
+            raise error or OperationalError(None, None, Exception("timeout"))
+
+
+def _succeed(breaker: CircuitBreaker) -> None:
+    with breaker.guard():
+        pass
+
+
+def test_given_consecutive_failures_when_threshold_reached_then_open(
+    breaker: CircuitBreaker,
+) -> None:
+    for _ in range(2):
+        _fail(breaker)
+    assert breaker.state == CLOSED
+
+    _fail(breaker)
+
+    assert breaker.state == OPEN
+    assert breaker.opened == 1
+
+
+def test_given_success_between_failures_when_guard_then_stays_closed(
+    breaker: CircuitBreaker,
+) -> None:
+    for _ in range(2):
+        _fail(breaker)
+    _succeed(breaker)
+    for _ in range(2):
+        _fail(breaker)
+
+    assert breaker.state == CLOSED
+
+
+def test_given_open_circuit_when_guard_then_fails_at_once(
+    breaker: CircuitBreaker, clock: Clock
+) -> None:
+    for _ in range(3):
+        _fail(breaker)
+    clock.now = 4
+
+    with pytest.raises(CircuitOpenError) as error:
+        with breaker.guard():
+            pytest.fail("The call should not be made.")
+
+    assert isinstance(error.value, OperationalError)
+    assert error.value.retry_after == 6
+    assert breaker.rejected == 1
+
+
+def test_given_reset_timeout_passed_when_probe_succeeds_then_closed(
+    breaker: CircuitBreaker, clock: Clock
+) -> None:
+    for _ in range(3):
+        _fail(breaker)
+    clock.now = 10
+    assert breaker.state == HALF_OPEN
+
+    _succeed(breaker)
+
+    assert breaker.state == CLOSED
+
+
+def test_given_reset_timeout_passed_when_probe_fails_then_open_again(
+    breaker: CircuitBreaker, clock: Clock
+) -> None:
+    for _ in range(3):
+        _fail(breaker)
+    clock.now = 10
+
+    _fail(breaker)
+
+    assert breaker.state == OPEN
+    assert breaker.opened == 2
+
+
+def test_given_probe_in_flight_when_guard_then_other_calls_rejected(
+    breaker: CircuitBreaker, clock: Clock
+) -> None:
+    for _ in range(3):
+        _fail(breaker)
+    clock.now = 10
+    probing, done = threading.Event(), threading.Event()
+
+    def probe() -> None:
+        with breaker.guard():
+            probing.set()
+            done.wait()
+
+    thread = threading.Thread(target=probe)
+    thread.start()
+    probing.wait()
+    try:
+        with pytest.raises(CircuitOpenError):
+            _succeed(breaker)
+    finally:
+        done.set()
+        thread.join()
+
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        IntegrityError(None, None, Exception("duplicate")),
+        OperationalError(None, None, LockNotAvailable()),
+        ValueError(),
+    ],
+)
+def test_given_other_errors_when_guard_then_not_counted(
+    breaker: CircuitBreaker, error: Exception
+) -> None:
+    for _ in range(3):
+        _fail(breaker, error)
+
+    assert breaker.state == CLOSED
@@ -0,0 +1,179 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+from botocore.exceptions import ClientError
+
+from backend.flask.limits.bucket import (
+    DetectedBackend,
+    MemoryBackend,
+    Rate,
+    RedisBackend,
+    cache_location,
+    create_backend,
+)
+
+RATE = Rate(per_second=2, burst=3)
+
+
+class Clock:  # pylint: disable=missing-class-docstring
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture()
+def backend(clock: Clock) -> MemoryBackend:
+    return MemoryBackend(max_keys=2, clock=clock)
+
+
+def test_given_full_bucket_when_take_then_burst_admitted_then_wait(
+    backend: MemoryBackend,
+) -> None:
+    waits = [backend.take("key", RATE) for _ in range(4)]
+
+    assert waits == [0, 0, 0, 0.5]
+
+
+def test_given_empty_bucket_when_time_passes_then_refilled(
+    backend: MemoryBackend, clock: Clock
+) -> None:
+    for _ in range(3):
+        backend.take("key", RATE)
+
+    clock.now = 0.5
+
+    assert backend.take("key", RATE) == 0
+    assert backend.take("key", RATE) == 0.5
+
+
+def test_given_separate_keys_when_take_then_separate_buckets(
+    backend: MemoryBackend,
+) -> None:
+    for _ in range(3):
+        backend.take("a", RATE)
+
+    assert backend.take("b", RATE) == 0
+
+
+def test_given_max_keys_when_take_then_least_recent_dropped(
+    backend: MemoryBackend,
+) -> None:
+    for _ in range(3):
+        backend.take("a", RATE)
+    backend.take("b", RATE)
+    backend.take("c", RATE)
+
+    assert backend.take("a", RATE) == 0
+
+
+def test_given_redis_error_when_take_then_admitted() -> None:
+    client = MagicMock()
+    client.register_script.return_value.side_effect = redis.ConnectionError()
+
+    assert RedisBackend(client).take("key", RATE) == 0
+
+
+def test_given_redis_wait_when_take_then_wait_returned() -> None:
+    client = MagicMock()
+    client.register_script.return_value.return_value = b"0.25"
+
+    assert RedisBackend(client, prefix="p:").take("key", RATE) == 0.25
+    client.register_script.return_value.assert_called_once_with(
+        keys=["p:key"], args=[2, 3]
+    )
+
+
+@pytest.mark.parametrize(
+    "setting, rate",
+    [("2:20", Rate(2, 20)), ("0.5:1", Rate(0.5, 1)), ("4", Rate(4, 4)), ("", None)],
+)
+def test_when_parse_rate_then_rate(setting: str, rate: Rate) -> None:
+    assert Rate.parse(setting) == rate
+
+
+@pytest.mark.parametrize("setting", ["often", "0:10", "1:0", "1:x"])
+def test_given_invalid_setting_when_parse_rate_then_value_error(setting: str) -> None:
+    with pytest.raises(ValueError):
+        Rate.parse(setting)
+
+
+def test_given_unknown_backend_when_create_backend_then_value_error() -> None:
+    with pytest.raises(ValueError):
+        create_backend("memcached", None, None)
+
+
+def test_given_redis_setting_when_create_backend_then_redis_backend() -> None:
+    assert isinstance(create_backend("redis", "localhost", "6379"), RedisBackend)
+
+
+def _redis(wait: bytes = b"0") -> MagicMock:
+    client = MagicMock()
+    client.register_script.return_value.return_value = wait
+    return client
+
+
+def test_given_no_cache_when_take_then_kept_in_memory(clock: Clock) -> None:
+    connect = MagicMock()
+    backend = DetectedBackend(lambda: None, clock=clock, connect=connect)
+
+    assert [backend.take("key", RATE) for _ in range(4)][-1] > 0
+    connect.assert_not_called()
+
+
+def test_given_cache_deployed_when_interval_passes_then_kept_in_redis(clock: Clock) -> None:
+    locations = iter([None, ("cache", 6379)])
+    client = _redis(b"0.5")
+    connect = MagicMock(return_value=client)
+    backend = DetectedBackend(lambda: next(locations), interval=30, clock=clock, connect=connect)
+
+    assert backend.take("key", RATE) == 0
+    clock.now = 30
+
+    assert backend.take("key", RATE) == 0.5
+    connect.assert_called_once_with("cache", 6379)
+
+
+def test_given_cache_unavailable_when_take_then_memory_until_found_again(clock: Clock) -> None:
+    client = _redis()
+    client.register_script.return_value.side_effect = redis.ConnectionError()
+    connect = MagicMock(return_value=client)
+    backend = DetectedBackend(lambda: ("cache", 6379), interval=30, clock=clock, connect=connect)
+
+    assert [backend.take("key", RATE) for _ in range(4)][-1] > 0
+    assert client.register_script.return_value.call_count == 1
+
+    clock.now = 30
+    backend.take("key", RATE)
+
+    assert connect.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "response, location",
+    [
+        ({"Parameter": {"Value": "cache.example:6379"}}, ("cache.example", 6379)),
+        (ClientError({"Error": {"Code": "ParameterNotFound"}}, "GetParameter"), None),
+    ],
+)
+def test_when_cache_location_then_parameter_parsed(response: object, location: object) -> None:
+    client = MagicMock()
+    if isinstance(response, Exception):
+        client.get_parameter.side_effect = response
+    else:
+        client.get_parameter.return_value = response
+
+    assert cache_location(client, "/project-test/cache-endpoint") == location
+    client.get_parameter.assert_called_once_with(Name="/project-test/cache-endpoint")
+
+
+def test_given_auto_setting_when_create_backend_then_detected_backend() -> None:
+    assert isinstance(create_backend("auto", "localhost", "6379"), DetectedBackend)
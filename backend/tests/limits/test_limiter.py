@@ -0,0 +1,154 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+import threading
+from typing import Generator
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+
+from backend.flask.blueprints.request import RequestBlueprint
+from backend.flask.decorators.auth import restrict_access
+from backend.flask.decorators.limit import priority, rate_limited
+from backend.flask.limits.admission import ADMIN, POLL, SUBMIT, AdmissionController
+from backend.flask.limits.bucket import MemoryBackend, Rate
+from backend.flask.limits.limiter import Limits
+from backend.flask.services.request import RequestService
+
+
+@pytest.fixture()
+def admission() -> AdmissionController:
+    return AdmissionController(capacity=10)
+
+
+@pytest.fixture()
+def app(admission: AdmissionController) -> Generator[Flask, None, None]:
+    app = Flask(__name__)
+    Limits(MemoryBackend(), Rate(1, 2), Rate(1, 3), admission).init_app(app)
+
+    @app.route("/redirect/<show_hash>")
+    @priority(SUBMIT)
+    @rate_limited(per_show=True)
+    def redirect(show_hash: str) -> str:
+        return show_hash
+
+    @app.route("/requests", methods=["POST"])
+    @priority(SUBMIT)
+    @rate_limited(per_ip=False, per_show=True)
+    def write() -> str:
+        return "ok"
+
+    @app.route("/count")
+    @priority(POLL)
+    def count() -> str:
+        return "ok"
+
+    yield app
+
+
+def _from(ip: str) -> dict:
+    return {"X-Forwarded-For": "10.0.0.1", "X-Client-Ip": ip}
+
+
+def test_given_ip_over_limit_when_request_then_429_with_retry_after(
+    client: FlaskClient,
+) -> None:
+    statuses = [
+        client.get(f"/redirect/show-{i}", headers=_from("1.1.1.1")).status_code
+        for i in range(3)
+    ]
+    response = client.get("/redirect/other", headers=_from("1.1.1.1"))
+
+    assert statuses == [200, 200, 429]
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    assert response.json["status"] == "error"
+
+
+def test_given_spoofed_forwarded_for_when_request_then_client_ip_limited(
+    client: FlaskClient,
+) -> None:
+    for i in range(2):
+        client.get(
+            f"/redirect/show-{i}", headers={**_from("1.1.1.1"), "X-Forwarded-For": f"6.6.6.{i}"}
+        )
+
+    response = client.get(
+        "/redirect/show", headers={**_from("1.1.1.1"), "X-Forwarded-For": "6.6.6.9"}
+    )
+
+    assert response.status_code == 429
+
+
+def test_given_show_over_limit_when_request_then_429(client: FlaskClient) -> None:
+    statuses = [
+        client.post(
+            "/requests", json={"show_hash": "show"}, headers=_from(f"2.2.2.{i}")
+        ).status_code
+        for i in range(4)
+    ]
+
+    assert statuses == [200, 200, 200, 429]
+
+
+def test_given_overload_when_request_then_polls_shed_before_submissions(
+    client: FlaskClient, admission: AdmissionController
+) -> None:
+    admission.in_flight = 7
+
+    poll = client.get("/count")
+    submit = client.get("/redirect/show", headers=_from("3.3.3.3"))
+
+    assert poll.status_code == 503
+    assert poll.headers["Retry-After"] == "1"
+    assert submit.status_code == 200
+    assert admission.in_flight == 7
+
+
+def test_when_request_then_admission_released(
+    client: FlaskClient, admission: AdmissionController
+) -> None:
+    client.get("/count")
+
+    assert admission.in_flight == 0
+
+
+def test_given_restricted_endpoint_then_admin_priority() -> None:
+    @restrict_access(["superuser"])
+    def endpoint() -> str:
+        return "ok"
+
+    assert endpoint.priority == ADMIN  # type: ignore[attr-defined]
+
+
+def test_given_concurrent_requests_when_at_capacity_then_class_limit_held() -> None:
+    admission = AdmissionController(capacity=10)
+    admitted = []
+
+    def acquire() -> None:
+        admitted.append(admission.try_acquire(ADMIN))
+
+    threads = [threading.Thread(target=acquire) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(admitted) == 4
+    assert admission.try_acquire(SUBMIT)
+
+
+def test_given_shared_ip_when_polling_counts_then_not_rate_limited() -> None:
+    app = Flask(__name__)
+    Limits(MemoryBackend(), Rate(1, 2), Rate(1, 3), AdmissionController(10)).init_app(app)
+    service = MagicMock(spec=RequestService)
+    service.get_show_requests_counts.return_value = []
+    app.register_blueprint(RequestBlueprint(service=service), url_prefix="/api")
+    client = app.test_client()
+
+    statuses = {
+        client.get("/api/requests/count/show", headers=_from("1.1.1.1")).status_code
+        for _ in range(10)
+    }
+
+    assert statuses == {200}
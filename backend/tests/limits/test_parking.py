@@ -0,0 +1,89 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+from flask import Flask
+
+from backend.flask.config import Config
+from backend.flask.limits.parking import (
+    AVAILABLE,
+    DatabaseParkedError,
+    DatabaseState,
+)
+from backend.flask.services.data import DataService
+
+PARAMETER = "/project-test/db-state"
+
+
+class Clock:  # pylint: disable=missing-class-docstring
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _published(*states: str) -> MagicMock:
+    client = MagicMock()
+    client.get_parameter.side_effect = [
+        {"Parameter": {"Value": state}} for state in states
+    ]
+    return client
+
+
+@pytest.fixture()
+def clock() -> Clock:
+    return Clock()
+
+
+def test_given_read_state_when_within_ttl_then_not_read_again(clock: Clock) -> None:
+    client = _published("stopped", AVAILABLE)
+    state = DatabaseState(PARAMETER, client, ttl=15, clock=clock)
+
+    assert state.current() == "stopped"
+    clock.now = 14
+    assert state.current() == "stopped"
+    clock.now = 15
+    assert state.current() == AVAILABLE
+
+    assert client.get_parameter.call_count == 2
+    client.get_parameter.assert_called_with(Name=PARAMETER)
+
+
+def test_given_read_fails_when_current_then_last_state_kept(clock: Clock) -> None:
+    client = MagicMock()
+    client.get_parameter.side_effect = ClientError(
+        {"Error": {"Code": "ThrottlingException"}}, "GetParameter"
+    )
+
+    assert DatabaseState(PARAMETER, client, clock=clock).current() == AVAILABLE
+
+
+@pytest.mark.parametrize("published", ["stopped", "starting", "stopping"])
+def test_given_database_not_available_when_check_then_parked_error(
+    clock: Clock, published: str
+) -> None:
+    state = DatabaseState(PARAMETER, _published(published), clock=clock)
+
+    with pytest.raises(DatabaseParkedError) as error:
+        state.check()
+
+    assert error.value.state == published
+    assert error.value.retry_after == 60
+
+
+def test_given_parked_database_when_fetch_then_not_queried(
+    app: Flask,
+    config: Config,
+    clock: Clock,
+    mock_sql_alchemy_libraries: None,  # pylint: disable=unused-argument
+) -> None:
+    service = DataService(config)
+    app.extensions["db_state"] = DatabaseState(PARAMETER, _published("stopped"), clock=clock)
+
+    with app.app_context(), pytest.raises(DatabaseParkedError):
+        service.fetch("SELECT 1")
+
+    service._reader.connect.assert_not_called()  # pylint: disable=protected-access
+
@@ -1,10 +1,15 @@
 # pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
-from datetime import time
+import json
+from datetime import datetime, time
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
 
 import pytest
 from flask import Flask
 
-from backend.flask.providers.json import JSONProvider
+from backend.flask.providers.json import JSONProvider, cached_jsonify
+
+UUID_VALUE = uuid4()
 
 
 @pytest.fixture
@@ -33,3 +38,72 @@ def test_given_supported_type_when_app_json_dumps_then_return_value(app: Flask)
     test_dict = {"key": "value"}
     result = app.json.dumps(test_dict)
     assert result == '{"key": "value"}'
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_given_supported_types_when_response_then_semantics_match_default(
+    app: Flask, fast: bool
+) -> None:
+    payload = {
+        "time": time(12, 34, 56),
+        "datetime": datetime(2025, 1, 2, 3, 4, 5),
+        "uuid": UUID_VALUE,
+        "b": 1,
+        "a": "ü",
+    }
+
+    with patch.object(app.json, "fast", fast), app.app_context():
+        response = app.json.response(payload)
+
+    assert json.loads(response.data) == {
+        "time": None,
+        "datetime": "Thu, 02 Jan 2025 03:04:05 GMT",
+        "uuid": str(UUID_VALUE),
+        "b": 1,
+        "a": "ü",
+    }
+    assert response.data.index(b'"a"') < response.data.index(b'"b"')
+    assert response.data.endswith(b"\n")
+
+
+def test_given_unsupported_type_when_response_then_raises_type_error(
+    app: Flask,
+) -> None:
+    with pytest.raises(TypeError), app.app_context():
+        app.json.response({"key": object()})
+
+
+def test_given_same_version_when_cached_response_then_payload_encoded_once(
+    app: Flask,
+) -> None:
+    build = MagicMock(return_value=[{"key": "value"}])
+
+    with app.app_context():
+        first = app.json.cached_response("songs", "v1", build)
+        second = app.json.cached_response("songs", "v1", build)
+
+    build.assert_called_once()
+    assert first.data == second.data == b'[{"key":"value"}]\n'
+    assert second.mimetype == "application/json"
+
+
+def test_given_new_version_when_cached_response_then_payload_encoded_again(
+    app: Flask,
+) -> None:
+    build = MagicMock(side_effect=[["old"], ["new"]])
+
+    with app.app_context():
+        app.json.cached_response("songs", "v1", build)
+        response = app.json.cached_response("songs", "v2", build)
+
+    assert build.call_count == 2
+    assert json.loads(response.data) == ["new"]
+
+
+def test_given_default_provider_when_cached_jsonify_then_payload_jsonified() -> None:
+    app = Flask(__name__)
+
+    with app.app_context():
+        response = cached_jsonify("songs", "v1", lambda: ["song"])
+
+    assert json.loads(response.data) == ["song"]
@@ -1,19 +1,22 @@
 # pylint: disable=redefined-outer-name, protected-access, missing-function-docstring, missing-module-docstring
 import copy
-from typing import Dict, Generator
+from typing import Any, Dict, Generator
 from unittest.mock import MagicMock, patch
+from uuid import UUID as UUIDType
 from uuid import uuid4
 
 import pytest
 from flask import Flask
+from sqlalchemy import Column, String, Uuid, event, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker as SessionMaker
 from sqlalchemy.sql.schema import Table
 
+from backend.benchmarks.database import create_local_engine, local_database
 from backend.flask.providers.sqlalchemy import SQLALchemyJSONProvider
-from backend.flask.services.data import DataService, get_json_provider_class
+from backend.flask.services.data import DataService, _key_value, get_json_provider_class
 
 TABLE_NAME = "table_name"
 PRIMARY_KEY_NAME = "primary_key"
@@ -132,7 +135,7 @@ def test_when_refresh_metadata_then_metadata_reflect_invoked(
     with patch.object(service, "_metadata", metadata):
         service._refresh_metadata()
 
-    metadata.reflect.assert_called_with(bind=engine)
+    assert metadata.reflect.call_args.kwargs["bind"] == engine
 
 
 def test_given_table_when_get_primary_keys_then_primary_keys_returned(
@@ -369,3 +372,73 @@ def test_given_table_and_keys_and_no_session_when_delete_then_session_instantiat
     session.__enter__.return_value.execute.assert_called_once_with(
         table.delete.return_value.where.return_value
     )
+
+
+@pytest.fixture()
+def local_service(config: MagicMock) -> DataService:
+    engine = create_local_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO songs VALUES ('id', 'band', 'song')"))
+    with local_database(engine):
+        return DataService(config)
+
+
+def test_given_text_query_when_fetch_then_rows_returned_without_session(
+    local_service: DataService,
+) -> None:
+    with patch.object(local_service, "_session") as session:
+        rows = local_service.fetch(
+            "SELECT id, song_name FROM songs WHERE id = :id", {"id": "id"}
+        )
+
+    session.assert_not_called()
+    assert rows[0].song_name == "song"
+    assert rows[0] == ("id", "song")
+
+
+def test_given_as_dicts_when_fetch_then_dicts_returned(
+    local_service: DataService,
+) -> None:
+    rows = local_service.fetch("SELECT id, song_name FROM songs", as_dicts=True)
+
+    assert rows == [{"id": "id", "song_name": "song"}]
+
+
+def test_when_fetch_then_autocommit_without_reflection(local_service: DataService) -> None:
+    statements = []
+    engine = local_service._engine
+
+    def listener(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        local_service.fetch("SELECT COUNT(*) FROM songs")
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert statements == ["SELECT COUNT(*) FROM songs"]
+    assert local_service._reader.get_execution_options()["isolation_level"] == "AUTOCOMMIT"
+
+
+def test_given_typed_key_columns_when_key_value_then_converted_per_column() -> None:
+    request_id = _key_value(Column("request_id", Uuid()), UUID)
+    show_hash = _key_value(Column("show_hash", String()), "f" * 64)
+
+    assert request_id == UUIDType(UUID)
+    assert show_hash == "f" * 64
+
+
+def test_given_request_partitions_when_list_tables_then_left_out(
+    local_service: DataService,
+) -> None:
+    with local_service._engine.begin() as connection:
+        for name in ("requests_default", "requests_0123456789abcdef"):
+            connection.execute(text(f"CREATE TABLE {name} (id VARCHAR PRIMARY KEY)"))
+
+    tables = local_service.list_tables()
+
+    assert "requests" in tables and "songs" in tables
+    assert not any(name.startswith("requests_") for name in tables)
+    with pytest.raises(ValueError):
+        local_service.get_table("requests_default")
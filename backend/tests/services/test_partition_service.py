@@ -0,0 +1,156 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+from datetime import datetime, timezone
+from typing import Generator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+from sqlalchemy.exc import OperationalError
+
+from backend.flask.config import Config
+from backend.flask.services.partition import PartitionService, partition_name
+
+SHOW_HASH = "a1b2c3"
+ENDED = {"hash": "ended", "end_time": "2000-01-01T00:00:00"}
+UPCOMING = {"hash": "upcoming", "end_time": "2099-01-01T00:00:00"}
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def app_context(app: Flask) -> Generator[None, None, None]:
+    with app.app_context():
+        yield
+
+
+@pytest.fixture()
+def service(
+    config: Config,
+    mock_sql_alchemy_libraries: None,  # pylint: disable=unused-argument
+) -> PartitionService:
+    return PartitionService(config)
+
+
+def _statements(session: MagicMock) -> List[str]:
+    return [" ".join(str(call.args[0]).split()) for call in session.execute.call_args_list]
+
+
+def test_when_partition_name_then_valid_identifier() -> None:
+    name = partition_name("f" * 64)
+
+    assert name.startswith("requests_")
+    assert len(name) <= 63
+    assert partition_name(SHOW_HASH) != partition_name(SHOW_HASH.upper())
+
+
+def test_given_new_show_when_create_partition_then_rows_moved_and_attached(
+    service: PartitionService, session: MagicMock
+) -> None:
+    name = partition_name(SHOW_HASH)
+
+    with patch.object(service, "attached_partitions", return_value=["requests_default"]):
+        assert service.create_partition(SHOW_HASH) == name
+
+    create, move, attach = _statements(session)
+    assert create == f'CREATE TABLE "{name}" (LIKE requests INCLUDING DEFAULTS)'
+    assert move.startswith("WITH moved AS ( DELETE FROM requests_default")
+    assert session.execute.call_args_list[1].args[1] == {"show_hash": SHOW_HASH}
+    assert attach == (
+        f"ALTER TABLE requests ATTACH PARTITION \"{name}\" FOR VALUES IN ('{SHOW_HASH}')"
+    )
+    session.commit.assert_called_once()
+
+
+def test_given_existing_partition_when_create_partition_then_nothing_executed(
+    service: PartitionService, session: MagicMock
+) -> None:
+    with patch.object(
+        service, "attached_partitions", return_value=[partition_name(SHOW_HASH)]
+    ):
+        service.create_partition(SHOW_HASH)
+
+    session.execute.assert_not_called()
+
+
+@pytest.mark.parametrize("show_hash", ["", "a'); DROP TABLE requests; --", "a" * 129])
+def test_given_invalid_hash_when_create_partition_then_value_error(
+    service: PartitionService, session: MagicMock, show_hash: str
+) -> None:
+    with pytest.raises(ValueError):
+        service.create_partition(show_hash)
+
+    session.execute.assert_not_called()
+
+
+def test_given_ended_show_when_archive_partitions_then_detached_to_archive(
+    service: PartitionService, session: MagicMock
+) -> None:
+    name = partition_name(ENDED["hash"])
+    attached = [name, partition_name(UPCOMING["hash"])]
+
+    with patch.object(service, "attached_partitions", return_value=attached):
+        archived = service.archive_partitions([ENDED, UPCOMING], NOW)
+
+    assert archived == [name]
+    assert _statements(session) == [
+        "SET LOCAL lock_timeout = '2s'",
+        f'ALTER TABLE requests DETACH PARTITION "{name}"',
+        "CREATE SCHEMA IF NOT EXISTS archive",
+        f'ALTER TABLE "{name}" SET SCHEMA archive',
+    ]
+
+
+@pytest.mark.parametrize(
+    "end_time, archived",
+    [
+        ("2024-12-31T23:00:00", False),
+        ("2024-12-31T11:59:00", True),
+        ("2024-12-31T19:00:00-04:00", True),
+        ("2024-12-31T20:00:00-05:00", False),
+    ],
+)
+def test_given_end_time_when_archive_partitions_then_naive_ones_wait_for_every_zone(
+    service: PartitionService, end_time: str, archived: bool
+) -> None:
+    show = {"hash": "show", "end_time": end_time}
+
+    with patch.object(
+        service, "attached_partitions", return_value=[partition_name(show["hash"])]
+    ):
+        assert bool(service.archive_partitions([show], NOW)) is archived
+
+
+def test_given_lock_timeout_when_archive_partitions_then_skipped(
+    service: PartitionService, session: MagicMock
+) -> None:
+    session.execute.side_effect = [None, OperationalError("DETACH", {}, Exception())]
+
+    with patch.object(
+        service, "attached_partitions", return_value=[partition_name(ENDED["hash"])]
+    ):
+        assert not service.archive_partitions([ENDED], NOW)
+
+    session.rollback.assert_called_once()
+
+
+def test_given_detached_partition_when_archive_partitions_then_nothing_executed(
+    service: PartitionService, session: MagicMock
+) -> None:
+    with patch.object(service, "attached_partitions", return_value=[]):
+        assert not service.archive_partitions([ENDED], NOW)
+
+    session.execute.assert_not_called()
+
+
+def test_given_shows_when_maintain_then_missing_upcoming_created_and_ended_archived(
+    service: PartitionService,
+) -> None:
+    attached = [partition_name(ENDED["hash"])]
+
+    with patch.object(service, "attached_partitions", return_value=attached), patch.object(
+        service, "create_partition", side_effect=partition_name
+    ) as create, patch.object(service, "archive_partitions") as archive:
+        created = service.maintain([ENDED, UPCOMING], NOW)
+
+    assert created == [partition_name(UPCOMING["hash"])]
+    create.assert_called_once_with(UPCOMING["hash"])
+    archive.assert_called_once_with([ENDED, UPCOMING], NOW)
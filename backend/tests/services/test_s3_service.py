@@ -0,0 +1,105 @@
+# pylint: disable=redefined-outer-name, protected-access, missing-function-docstring, missing-module-docstring
+import io
+import json
+from pathlib import Path
+from typing import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from backend.flask.catalog.snapshot import build_snapshot, catalog_digest, create_hash
+from backend.flask.config import Config
+from backend.flask.services.s3 import S3Service
+
+SONGS = [{"band_name": "Blink 182", "song_name": "All The Small Things"}]
+NOT_FOUND = ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+
+
+@pytest.fixture
+def s3_client() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def service(
+    config: Config, s3_client: MagicMock, tmp_path: Path
+) -> Generator[S3Service, None, None]:
+    config.catalog_cache_dir = str(tmp_path)
+    with patch("backend.flask.services.s3.boto3") as mock_boto:
+        mock_boto.client.side_effect = lambda name, **_: (
+            s3_client if name == "s3" else MagicMock()
+        )
+        yield S3Service(config)
+
+
+def test_given_snapshot_when_load_catalog_then_snapshot_downloaded_and_mapped(
+    service: S3Service, s3_client: MagicMock, tmp_path: Path
+) -> None:
+    s3_client.head_object.return_value = {"ETag": '"etag"'}
+    s3_client.get_object.return_value = {
+        "Body": io.BytesIO(build_snapshot(SONGS)),
+        "ETag": '"etag"',
+    }
+
+    catalog, _ = service._load_catalog("songs")
+
+    s3_client.get_object.assert_called_once_with(
+        Bucket=service._bucket_name, Key="songs/songs.snapshot"
+    )
+    song = {**SONGS[0], "hash": create_hash(SONGS[0])}
+    assert catalog.get(song["hash"]) == song
+    assert catalog.records == [song]
+    assert catalog.digest == catalog_digest(catalog.records)
+    assert (tmp_path / "songs-etag.snapshot").exists()
+
+
+def test_given_snapshot_cached_when_load_catalog_then_not_downloaded(
+    service: S3Service, s3_client: MagicMock, tmp_path: Path
+) -> None:
+    (tmp_path / "songs-etag.snapshot").write_bytes(build_snapshot(SONGS))
+    s3_client.head_object.return_value = {"ETag": '"etag"'}
+
+    catalog, _ = service._load_catalog("songs")
+
+    s3_client.get_object.assert_not_called()
+    assert len(catalog) == 1
+
+
+def test_given_invalid_cached_snapshot_when_load_catalog_then_downloaded_again(
+    service: S3Service, s3_client: MagicMock, tmp_path: Path
+) -> None:
+    (tmp_path / "songs-etag.snapshot").write_bytes(b"invalid")
+    s3_client.head_object.return_value = {"ETag": '"etag"'}
+    s3_client.get_object.return_value = {
+        "Body": io.BytesIO(build_snapshot(SONGS)),
+        "ETag": '"etag"',
+    }
+
+    catalog, _ = service._load_catalog("songs")
+
+    assert len(catalog) == 1
+    s3_client.get_object.assert_called_once()
+
+
+def test_given_no_snapshot_when_load_catalog_then_json_records_hashed(
+    service: S3Service, s3_client: MagicMock
+) -> None:
+    s3_client.head_object.side_effect = NOT_FOUND
+    s3_client.get_object.return_value = {"Body": io.BytesIO(json.dumps(SONGS).encode())}
+
+    catalog, _ = service._load_catalog("songs")
+
+    assert catalog.records == [{**SONGS[0], "hash": create_hash(SONGS[0])}]
+    assert catalog.digest == catalog_digest(catalog.records)
+
+
+def test_given_access_denied_when_load_catalog_then_error_raised(
+    service: S3Service, s3_client: MagicMock
+) -> None:
+    s3_client.head_object.side_effect = ClientError(
+        {"Error": {"Code": "AccessDenied", "Message": "Denied"}}, "HeadObject"
+    )
+
+    with pytest.raises(ClientError):
+        service._load_catalog("songs")
@@ -0,0 +1,163 @@
+# pylint: disable=redefined-outer-name, protected-access, missing-function-docstring, missing-module-docstring
+from datetime import datetime, timezone
+from typing import Any, Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from flask import Flask
+from sqlalchemy.exc import OperationalError
+
+from backend.flask.catalog.snapshot import CatalogSnapshot, build_snapshot
+from backend.flask.config import Config
+from backend.flask.services.show import ShowService
+
+ENDED = {"name": "Ended", "hash": "ended", "end_time": "2000-01-01T00:00:00"}
+SOON = {"name": "Soon", "hash": "soon", "end_time": "2030-01-01T00:00:00"}
+LATER = {"name": "Later", "hash": "later", "end_time": "2040-01-01T00:00:00"}
+DEMO = {"name": "DEMO", "hash": "DEMO", "end_time": "2099-01-01T00:00:00"}
+
+
+def _catalog(*shows: dict) -> CatalogSnapshot:
+    return CatalogSnapshot(build_snapshot(list(shows)))
+
+
+@pytest.fixture
+def partitions() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def service(config: Config, partitions: MagicMock) -> Generator[ShowService, None, None]:
+    with patch("backend.flask.services.s3.boto3"), patch.object(
+        ShowService,
+        "_load_catalog",
+        return_value=(_catalog(ENDED, SOON, LATER, DEMO), datetime.now(timezone.utc)),
+    ):
+        yield ShowService(config, partitions)
+
+
+def _now(value: str) -> MagicMock:
+    now = MagicMock(wraps=datetime)
+    now.now.return_value = datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+    return now
+
+
+def test_when_get_upcoming_then_ended_and_demo_shows_left_out(service: ShowService) -> None:
+    with patch("backend.flask.services.show.datetime", _now("2025-01-01T00:00:00")):
+        assert service.get_upcoming_shows() == [SOON, LATER]
+
+
+def test_given_no_show_ended_when_get_upcoming_twice_then_built_once(
+    service: ShowService,
+) -> None:
+    with patch("backend.flask.services.show.datetime", _now("2025-01-01T00:00:00")):
+        digest = service.get_upcoming_digest()
+        upcoming = service._upcoming
+
+        assert service.get_upcoming_digest() == digest
+        assert service.get_upcoming_shows() is upcoming[2]
+        assert service._upcoming is upcoming
+
+
+def test_given_next_show_ended_when_get_upcoming_then_rebuilt(service: ShowService) -> None:
+    with patch("backend.flask.services.show.datetime", _now("2025-01-01T00:00:00")):
+        digest = service.get_upcoming_digest()
+    with patch("backend.flask.services.show.datetime", _now("2035-01-01T00:00:00")):
+        assert service.get_upcoming_shows() == [LATER]
+        assert service.get_upcoming_digest() != digest
+
+
+def test_given_catalog_changed_when_get_upcoming_then_rebuilt(service: ShowService) -> None:
+    with patch("backend.flask.services.show.datetime", _now("2025-01-01T00:00:00")):
+        service.get_upcoming_digest()
+        service.digest = "changed"
+
+        assert service._get_upcoming()[0] == "changed"
+
+
+def test_given_database_parked_when_insert_show_then_show_created(
+    app: Flask, service: ShowService, partitions: MagicMock
+) -> None:
+    partitions.maintain.side_effect = OperationalError("SELECT", {}, Exception("parked"))
+    show = {"name": "New", "venue": "Venue", "start_time": "2030-01-01T20:00:00"}
+
+    with app.app_context():
+        service.insert_show({**show, "end_time": "2030-01-01T23:00:00"})
+
+    assert service.shows[-1]["name"] == "New"
+    assert service._s3_client.put_object.call_count == 3
+    partitions.maintain.assert_called_once_with(service.shows)
+
+
+def test_given_show_with_offset_when_get_upcoming_then_listed_until_its_end(
+    service: ShowService,
+) -> None:
+    show = {"name": "East", "hash": "east", "end_time": "2030-01-01T23:00:00-05:00"}
+    service._catalog = _catalog(show)
+
+    with patch("backend.flask.services.show.datetime", _now("2030-01-02T03:59:00")):
+        assert service.get_upcoming_shows() == [show]
+    with patch("backend.flask.services.show.datetime", _now("2030-01-02T04:00:00")):
+        assert service.get_upcoming_shows() == []
+
+
+def test_when_get_show_then_looked_up_by_hash(service: ShowService) -> None:
+    assert service.get_show("soon") == SOON
+    with pytest.raises(ValueError):
+        service.get_show("unknown")
+
+
+def _changed(service: ShowService, *shows: dict) -> Any:
+    service._s3_client.head_object.return_value = {"ETag": '"changed"'}
+    return patch.object(
+        service, "_load_catalog", return_value=(_catalog(*shows), datetime.now(timezone.utc))
+    )
+
+
+def test_given_catalog_changed_elsewhere_when_refresh_forced_then_reloaded(
+    service: ShowService,
+) -> None:
+    with _changed(service, SOON, LATER) as load:
+        service.refresh(force=True)
+        service.refresh(force=True)
+
+    load.assert_called_once_with("shows")
+    assert service.shows == [SOON, LATER]
+    assert service.digest == _catalog(SOON, LATER).digest
+
+
+def test_given_checked_recently_when_refresh_then_s3_not_asked(service: ShowService) -> None:
+    service._s3_client.head_object.reset_mock()
+
+    with _changed(service, SOON) as load:
+        service.refresh()
+
+    service._s3_client.head_object.assert_not_called()
+    load.assert_not_called()
+
+
+def test_given_show_created_elsewhere_when_get_show_then_found_after_refresh(
+    config: Config, partitions: MagicMock
+) -> None:
+    clock = MagicMock(side_effect=[0.0, 100.0])
+    with patch("backend.flask.services.s3.boto3"), patch.object(
+        ShowService, "_load_catalog", return_value=(_catalog(SOON), datetime.now(timezone.utc))
+    ):
+        service = ShowService(config, partitions, clock)
+
+    with _changed(service, SOON, LATER):
+        assert service.get_show("later") == LATER
+
+
+def test_given_s3_unavailable_when_refresh_then_catalog_kept(
+    app: Flask, service: ShowService
+) -> None:
+    service._s3_client.head_object.side_effect = ClientError(
+        {"Error": {"Code": "SlowDown", "Message": "Slow down"}}, "HeadObject"
+    )
+
+    with app.app_context():
+        service.refresh(force=True)
+
+    assert service.get_show("soon") == SOON
@@ -0,0 +1,225 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring, protected-access
+import fcntl
+import json
+import os
+from typing import Any, Dict, Generator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+from sqlalchemy.exc import OperationalError
+
+from backend.flask.config import Config
+from backend.flask.limits.breaker import CircuitOpenError
+from backend.flask.limits.parking import DatabaseParkedError
+from backend.flask.services.request import RequestService
+from backend.flask.services.spool import RequestSpool, SpoolReplayer
+
+DOWN = OperationalError(None, None, Exception("connection refused"))
+
+
+def _row(number: int) -> Dict[str, Any]:
+    return {"request_id": f"id-{number}", "show_hash": "show", "song_id": "song"}
+
+
+@pytest.fixture(autouse=True)
+def app_context(app: Flask) -> Generator[None, None, None]:
+    with app.app_context():
+        yield
+
+
+@pytest.fixture()
+def spool(tmp_path: Any) -> RequestSpool:
+    return RequestSpool(str(tmp_path))
+
+
+@pytest.fixture()
+def service(
+    config: Config,
+    spool: RequestSpool,
+    mock_sql_alchemy_libraries: None,  # pylint: disable=unused-argument
+) -> RequestService:
+    return RequestService(config, spool)
+
+
+def test_given_rows_when_append_then_durable_jsonl_segment(spool: RequestSpool) -> None:
+    spool.append(_row(1))
+    spool.append(_row(2))
+
+    (name,) = os.listdir(spool.directory)
+    with open(os.path.join(spool.directory, name), encoding="utf-8") as segment:
+        rows = [json.loads(line) for line in segment]
+
+    assert name.startswith("active-")
+    assert rows == [_row(1), _row(2)]
+    assert spool.contains("id-1")
+    assert spool.pending() == 1
+
+
+def test_given_full_segment_when_append_then_sealed(tmp_path: Any) -> None:
+    spool = RequestSpool(str(tmp_path), segment_bytes=1)
+
+    spool.append(_row(1))
+    spool.append(_row(2))
+
+    assert sorted(name.split("-")[0] for name in os.listdir(tmp_path)) == ["sealed", "sealed"]
+
+
+def test_given_segments_of_gone_process_when_spool_created_then_recovered(
+    tmp_path: Any,
+) -> None:
+    (tmp_path / "active-gone.jsonl").write_text(json.dumps(_row(1)) + "\n")
+    (tmp_path / "sealed-1-gone.jsonl.claimed").write_text(json.dumps(_row(2)) + "\n")
+
+    spool = RequestSpool(str(tmp_path))
+
+    assert [rows for _, rows in spool.claim()] == [[_row(2)], [_row(1)]]
+    assert not [name for name in os.listdir(tmp_path) if name.startswith("active-")]
+
+
+def test_given_locked_segment_when_spool_created_then_left_alone(tmp_path: Any) -> None:
+    path = tmp_path / "active-live.jsonl"
+    path.write_text(json.dumps(_row(1)) + "\n")
+
+    with open(path, "rb") as segment:
+        fcntl.flock(segment, fcntl.LOCK_EX)
+        RequestSpool(str(tmp_path))
+
+        assert os.listdir(tmp_path) == ["active-live.jsonl"]
+
+
+def test_given_torn_line_when_claim_then_skipped(spool: RequestSpool) -> None:
+    spool.append(_row(1))
+    spool.seal()
+    (name,) = os.listdir(spool.directory)
+    with open(os.path.join(spool.directory, name), "ab") as segment:
+        segment.write(b'{"request_id": "to')
+
+    ((_, rows),) = list(spool.claim())
+
+    assert rows == [_row(1)]
+
+
+def test_given_spooled_rows_when_replay_then_written_in_batches(
+    spool: RequestSpool,
+) -> None:
+    batches: List[List[Dict[str, Any]]] = []
+    for number in range(5):
+        spool.append(_row(number))
+
+    written = SpoolReplayer(spool, batches.append, batch_size=2).replay()
+
+    assert written == 5
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert os.listdir(spool.directory) == []
+    assert not spool.contains("id-0")
+
+
+def test_given_database_down_when_replay_then_segment_kept(spool: RequestSpool) -> None:
+    spool.append(_row(1))
+
+    written = SpoolReplayer(spool, MagicMock(side_effect=CircuitOpenError(5))).replay()
+
+    assert written == 0
+    assert [name.split("-")[0] for name in os.listdir(spool.directory)] == ["sealed"]
+    assert spool.contains("id-1")
+
+    batches: List[List[Dict[str, Any]]] = []
+    assert SpoolReplayer(spool, batches.append).replay() == 1
+    assert batches == [[_row(1)]]
+
+
+def test_given_database_parked_when_drain_then_sealed_for_other_tasks(
+    app: Flask, spool: RequestSpool
+) -> None:
+    spool.append(_row(1))
+    replayer = SpoolReplayer(spool, MagicMock(side_effect=DatabaseParkedError("stopped")))
+    replayer.init_app(app)
+
+    assert replayer.drain() == 0
+    assert replayer._thread is None
+
+    batches: List[List[Dict[str, Any]]] = []
+    other = SpoolReplayer(RequestSpool(spool.directory), batches.append)
+    assert other.replay() == 1
+    assert batches == [[_row(1)]]
+
+
+def test_given_database_down_when_write_request_then_spooled(
+    service: RequestService, spool: RequestSpool
+) -> None:
+    with patch.object(service, "insert_rows", side_effect=DOWN):
+        response = service.write_request({"show_hash": "show", "song_id": "song"})
+
+    request_id = response.json["request_id"]
+    assert response.status_code == 201
+    assert spool.contains(request_id)
+    assert request_id in response.headers["Set-Cookie"]
+
+
+def test_given_no_spool_when_write_request_fails_then_raised(
+    config: Config,
+    mock_sql_alchemy_libraries: None,  # pylint: disable=unused-argument
+) -> None:
+    service = RequestService(config)
+
+    with patch.object(service, "insert_rows", side_effect=DOWN), pytest.raises(
+        OperationalError
+    ):
+        service.write_request({"show_hash": "show", "song_id": "song"})
+
+
+def test_given_parked_database_when_write_request_then_raised_not_spooled(
+    service: RequestService, spool: RequestSpool
+) -> None:
+    with patch.object(
+        service, "insert_rows", side_effect=DatabaseParkedError("stopped")
+    ), pytest.raises(DatabaseParkedError):
+        service.write_request({"show_hash": "show", "song_id": "song"})
+
+    assert spool.pending() == 0
+
+
+def test_given_database_down_when_redirect_then_request_page(
+    app: Flask, service: RequestService
+) -> None:
+    with app.test_request_context("/"), patch.object(
+        service, "_is_duplicate", side_effect=DOWN
+    ), patch("backend.flask.services.request.url_for", side_effect=lambda name, **_: name):
+        response = service.redirect("show")
+
+    assert response.location == "renderblueprint.render_request"
+
+
+def test_given_spooled_request_when_redirect_then_main_page(
+    app: Flask, service: RequestService, spool: RequestSpool
+) -> None:
+    spool.append(_row(1))
+
+    with app.test_request_context(
+        "/", headers={"Cookie": "totalRequestLiveRequestId=id-1"}
+    ), patch.object(service, "_is_duplicate", side_effect=DOWN), patch(
+        "backend.flask.services.request.url_for", side_effect=lambda name, **_: name
+    ):
+        response = service.redirect("show")
+
+    assert response.location == "renderblueprint.render_main"
+
+
+def test_when_replay_requests_then_conflicts_skipped(
+    service: RequestService, session: MagicMock
+) -> None:
+    table = MagicMock()
+    with patch.object(service, "get_table", return_value=table), patch.object(
+        service, "_get_primary_key_columns", return_value=["show_hash", "request_id"]
+    ), patch("backend.flask.services.request.insert") as insert:
+        service.replay_requests([_row(1), _row(2)])
+
+    insert.assert_called_once_with(table)
+    insert.return_value.values.assert_called_once_with([_row(1), _row(2)])
+    insert.return_value.values.return_value.on_conflict_do_nothing.assert_called_once_with(
+        index_elements=["show_hash", "request_id"]
+    )
+    session.execute.assert_called_once_with(
+        insert.return_value.values.return_value.on_conflict_do_nothing.return_value
+    )
@@ -0,0 +1,106 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, protected-access
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from backend.flask.config import Config
+from backend.flask.services.data import DataService
+from backend.flask.services.statements import HOT_QUERIES, SHOW_REQUEST_COUNTS
+
+
+def _sql(name: str) -> str:
+    return " ".join(str(HOT_QUERIES[name].compile(dialect=postgresql.dialect())).split())
+
+
+def test_when_compile_hot_queries_then_named_binds() -> None:
+    assert _sql("show_request_counts") == (
+        "SELECT requests.song_id, count(*) AS request_count FROM requests "
+        "WHERE requests.show_hash = %(show_hash)s GROUP BY requests.song_id"
+    )
+    assert _sql("duplicate_request") == (
+        "SELECT 1 FROM requests WHERE requests.request_id = %(request_id)s "
+        "AND requests.show_hash = %(show_hash)s LIMIT %(param_1)s"
+    )
+    assert _sql("song") == (
+        "SELECT songs.id, songs.band_name, songs.song_name FROM songs "
+        "WHERE songs.id = %(song_id)s"
+    )
+
+
+def test_when_cache_key_then_stable_across_params() -> None:
+    first = SHOW_REQUEST_COUNTS.params(show_hash="a")._generate_cache_key()
+    second = SHOW_REQUEST_COUNTS.params(show_hash="b")._generate_cache_key()
+
+    assert first == second
+
+
+def _config(**overrides: str) -> Config:
+    with patch("boto3.client") as client:
+        client.return_value.get_secret_value.return_value = {"SecretString": "{}"}
+        return Config(
+            **{
+                "db_engine": "postgresql+psycopg",
+                "db_user": "user",
+                "db_password": "password",
+                "db_host": "localhost",
+                "db_name": "db",
+                "db_port": "5432",
+                **overrides,
+            }
+        )
+
+
+@pytest.mark.parametrize(
+    "db_engine, db_pooler, threshold",
+    [
+        ("postgresql+psycopg", "", 5),
+        ("postgresql+psycopg", "pgbouncer", None),
+        ("postgresql+psycopg2", "", "absent"),
+    ],
+)
+def test_given_pooler_when_data_service_created_then_prepare_threshold_set(
+    db_engine: str, db_pooler: str, threshold: object
+) -> None:
+    config = _config(db_engine=db_engine, db_pooler=db_pooler)
+    with patch("backend.flask.services.data.create_engine") as create_engine:
+        DataService(config)
+
+    connect_args = create_engine.call_args.kwargs["connect_args"]
+    assert connect_args.get("prepare_threshold", "absent") == threshold
+    assert connect_args["connect_timeout"] == 3
+    assert connect_args.get("options", "absent") == (
+        "absent" if db_pooler else "-c statement_timeout=5000"
+    )
+
+
+@pytest.mark.parametrize(
+    "db_pooler, db_pool_size, pool_args",
+    [
+        ("", "", {}),
+        ("", "8", {"pool_size": 8}),
+        ("rds-proxy", "", {"pool_size": 2, "max_overflow": 0}),
+        ("rds-proxy", "4", {"pool_size": 4, "max_overflow": 0}),
+    ],
+)
+def test_given_pooler_when_data_service_created_then_small_pool(
+    db_pooler: str, db_pool_size: str, pool_args: dict
+) -> None:
+    config = _config(db_pooler=db_pooler, db_pool_size=db_pool_size)
+    with patch("backend.flask.services.data.create_engine") as create_engine:
+        DataService(config)
+
+    kwargs = create_engine.call_args.kwargs
+    assert {key: kwargs[key] for key in ("pool_size", "max_overflow") if key in kwargs} == (
+        pool_args
+    )
+
+
+def test_given_same_config_when_services_created_then_engine_shared() -> None:
+    config = _config(db_replica_hosts="replica")
+    with patch("backend.flask.services.data.create_engine") as create_engine:
+        first, second = DataService(config), DataService(config)
+        DataService(_config())
+
+    assert first._engine is second._engine
+    assert create_engine.call_count == 3
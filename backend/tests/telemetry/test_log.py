@@ -0,0 +1,146 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+import io
+import json
+import logging
+import threading
+from typing import Generator, List
+
+import pytest
+from flask import Flask, current_app
+from flask.testing import FlaskClient
+
+from backend.flask.telemetry.log import LogPipeline, SamplingFilter, parse_sample_rates
+
+LOGGER = "backend.tests.telemetry.log"
+
+
+class RecordingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: List[str] = []
+
+    def write(self, s: str) -> int:
+        self.threads.append(threading.current_thread().name)
+        return super().write(s)
+
+
+@pytest.fixture()
+def stream() -> RecordingStream:
+    return RecordingStream()
+
+
+@pytest.fixture()
+def pipeline(stream: RecordingStream) -> Generator[LogPipeline, None, None]:
+    pipeline = LogPipeline("DEBUG", "json", {f"{LOGGER}.sampled": 0.25}, stream)
+    yield pipeline
+    pipeline.stop()
+
+
+@pytest.fixture()
+def app(pipeline: LogPipeline) -> Flask:
+    app = Flask(__name__)
+    pipeline.init_app(app)
+
+    @app.route("/shows/<show_hash>")
+    def show(show_hash: str) -> str:
+        current_app.logger.info("Show %s", show_hash)
+        return "ok"
+
+    return app
+
+
+def _records(pipeline: LogPipeline, stream: RecordingStream) -> List[dict]:
+    pipeline.stop()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_when_logged_then_written_as_json_off_the_calling_thread(
+    pipeline: LogPipeline, stream: RecordingStream
+) -> None:
+    pipeline.start()
+
+    logging.getLogger(LOGGER).info("Hello %s", "world")
+
+    (record,) = _records(pipeline, stream)
+    assert record["message"] == "Hello world"
+    assert record["level"] == "INFO"
+    assert record["logger"] == LOGGER
+    assert threading.current_thread().name not in stream.threads
+
+
+def test_given_mutated_argument_when_logged_then_message_as_at_call(
+    pipeline: LogPipeline, stream: RecordingStream
+) -> None:
+    pipeline.start()
+    rows = [1]
+
+    logging.getLogger(LOGGER).info("Rows %s", rows)
+    rows.append(2)
+
+    assert _records(pipeline, stream)[0]["message"] == "Rows [1]"
+
+
+def test_given_exception_when_logged_then_traceback_included(
+    pipeline: LogPipeline, stream: RecordingStream
+) -> None:
+    pipeline.start()
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logging.getLogger(LOGGER).exception("Failed")
+
+    assert "ValueError: boom" in _records(pipeline, stream)[0]["exception"]
+
+
+def test_given_request_when_logged_then_request_context_included(
+    client: FlaskClient, pipeline: LogPipeline, stream: RecordingStream
+) -> None:
+    client.get("/shows/abc", headers={"X-Request-Id": "request-1"})
+
+    record = next(
+        record for record in _records(pipeline, stream) if record["message"] == "Show abc"
+    )
+    assert record["route"] == "/shows/<show_hash>"
+    assert record["show_hash"] == "abc"
+    assert record["request_id"] == "request-1"
+
+
+def test_given_sampled_logger_when_logged_then_share_of_records_kept(
+    pipeline: LogPipeline, stream: RecordingStream
+) -> None:
+    pipeline.start()
+    logger = logging.getLogger(f"{LOGGER}.sampled.child")
+
+    for i in range(8):
+        logger.debug("Debug %d", i)
+    logger.warning("Warning")
+
+    messages = [record["message"] for record in _records(pipeline, stream)]
+    assert messages == ["Debug 0", "Debug 4", "Warning"]
+
+
+@pytest.mark.parametrize("rate, kept", [(0, 0), (1, 4)])
+def test_given_edge_rate_when_filtered_then_none_or_all_kept(rate: float, kept: int) -> None:
+    sampling = SamplingFilter({LOGGER: rate})
+    record = logging.LogRecord(LOGGER, logging.INFO, __file__, 1, "message", None, None)
+
+    assert sum(sampling.filter(record) for _ in range(4)) == kept
+
+
+def test_when_parse_sample_rates_then_rates_by_logger() -> None:
+    assert parse_sample_rates(" a=0.1, b.c=0 ") == {"a": 0.1, "b.c": 0.0}
+    assert parse_sample_rates("") == {}
+
+
+@pytest.mark.parametrize("setting", ["a", "a=2", "=0.5", "a=often"])
+def test_given_invalid_setting_when_parse_sample_rates_then_value_error(
+    setting: str,
+) -> None:
+    with pytest.raises(ValueError):
+        parse_sample_rates(setting)
+
+
+def test_given_unknown_format_when_pipeline_created_then_value_error() -> None:
+    with pytest.raises(ValueError):
+        LogPipeline(log_format="xml")
@@ -0,0 +1,174 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+from pathlib import Path
+from typing import Generator
+from urllib.request import urlopen
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+from flask import Flask
+from flask.testing import FlaskClient
+from prometheus_client import generate_latest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from backend.flask.telemetry.metrics import Metrics, record_cache
+from backend.flask.telemetry.queries import QueryProfiler
+
+
+@pytest.fixture()
+def metrics() -> Metrics:
+    return Metrics()
+
+
+@pytest.fixture()
+def engine() -> Engine:
+    return create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+
+
+@pytest.fixture()
+def app(metrics: Metrics, engine: Engine) -> Generator[Flask, None, None]:
+    app = Flask(__name__)
+    metrics.init_app(app)
+
+    s3 = boto3.client(
+        "s3",
+        region_name="us-east-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    stubber = Stubber(s3)
+
+    @app.route("/queries")
+    def queries():
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        record_cache("response", True)
+        return "ok"
+
+    @app.route("/s3")
+    def s3_call():
+        stubber.add_response("list_buckets", {"Buckets": []})
+        with stubber:
+            s3.list_buckets()
+        return "ok"
+
+    @app.route("/fail")
+    def fail():
+        raise RuntimeError("boom")
+
+    yield app
+
+
+def _sample(metrics: Metrics, name: str, **labels: str) -> float:
+    return metrics.registry.get_sample_value(name, labels) or 0.0
+
+
+def test_when_request_then_latency_recorded_per_route(
+    client: FlaskClient, metrics: Metrics
+) -> None:
+    client.get("/queries")
+
+    labels = {"method": "GET", "endpoint": "queries", "status": "200"}
+    assert _sample(metrics, "http_request_duration_seconds_count", **labels) == 1
+    assert _sample(metrics, "http_requests_in_flight", endpoint="queries") == 0
+
+
+def test_when_request_queries_then_db_calls_counted_per_request(
+    client: FlaskClient, metrics: Metrics
+) -> None:
+    client.get("/queries")
+
+    assert _sample(metrics, "dependency_calls_total", endpoint="queries", dependency="db") == 2
+    assert (
+        _sample(metrics, "dependency_calls_total", endpoint="queries", dependency="cache")
+        == 1
+    )
+    assert (
+        _sample(
+            metrics,
+            "dependency_calls_per_request_bucket",
+            endpoint="queries",
+            dependency="db",
+            le="2.0",
+        )
+        == 1
+    )
+    assert _sample(metrics, "cache_lookups_total", cache="response", result="hit") == 1
+
+
+def test_when_request_calls_aws_then_call_counted(
+    client: FlaskClient, metrics: Metrics
+) -> None:
+    client.get("/s3")
+
+    assert _sample(metrics, "dependency_calls_total", endpoint="s3_call", dependency="s3") == 1
+    assert (
+        _sample(
+            metrics,
+            "dependency_call_duration_seconds_count",
+            dependency="s3",
+            operation="ListBuckets",
+        )
+        == 1
+    )
+
+
+def test_given_error_when_request_then_recorded_as_500(
+    app: Flask, client: FlaskClient, metrics: Metrics
+) -> None:
+    app.testing = False
+
+    client.get("/fail")
+
+    labels = {"method": "GET", "endpoint": "fail", "status": "500"}
+    assert _sample(metrics, "http_request_duration_seconds_count", **labels) == 1
+    assert _sample(metrics, "http_requests_in_flight", endpoint="fail") == 0
+
+
+def test_given_connected_engine_when_scrape_then_pool_stats_exposed(
+    client: FlaskClient, metrics: Metrics
+) -> None:
+    client.get("/queries")
+    metrics.serve(0, "127.0.0.1")
+    host, port = metrics.server.server_address
+
+    try:
+        with urlopen(f"http://{host}:{port}/metrics") as response:
+            body = response.read()
+    finally:
+        metrics.server.shutdown()
+
+    assert b"db_pool_connections" in body
+    assert b'http_request_duration_seconds_count{endpoint="queries"' in body
+
+
+def test_given_named_pool_when_scrape_then_labelled_by_name_not_url(
+    metrics: Metrics, tmp_path: Path
+) -> None:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'shows.db'}", poolclass=QueuePool, pool_logging_name="primary"
+    )
+    with engine.connect():
+        body = generate_latest(metrics.registry)
+
+    assert b'db_pool_connections{database="primary"' in body
+    assert b"shows.db" not in body
+
+
+def test_when_app_requested_then_metrics_not_routed(client: FlaskClient) -> None:
+    assert client.get("/metrics").status_code == 404
+
+
+def test_given_profiler_when_query_then_counted_from_its_listeners(
+    app: Flask, client: FlaskClient, metrics: Metrics
+) -> None:
+    QueryProfiler().init_app(app)
+
+    client.get("/queries")
+
+    assert _sample(metrics, "dependency_calls_total", endpoint="queries", dependency="db") == 2
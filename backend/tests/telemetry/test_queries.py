@@ -0,0 +1,124 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+import logging
+from typing import Generator
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+from backend.flask.telemetry.queries import (
+    QueryBudgetExceeded,
+    QueryProfiler,
+    fingerprint,
+    query_budget,
+    record_queries,
+)
+
+
+@pytest.fixture()
+def engine() -> Engine:
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE songs (id INTEGER PRIMARY KEY, name TEXT)"))
+    return engine
+
+
+@pytest.fixture()
+def app(engine: Engine) -> Generator[Flask, None, None]:
+    app = Flask(__name__)
+    QueryProfiler(slow_query_ms=1000, repeated_query_threshold=3).init_app(app)
+
+    @app.route("/songs/<int:count>")
+    def songs(count: int):
+        with engine.connect() as connection:
+            for song_id in range(count):
+                connection.execute(
+                    text("SELECT name FROM songs WHERE id = :id"), {"id": song_id}
+                )
+        return "ok"
+
+    yield app
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        (
+            "SELECT 1\n  FROM requests\n WHERE request_id = :request_id LIMIT 1",
+            "select ? from requests where request_id = ? limit ?",
+        ),
+        (
+            "SELECT * FROM songs WHERE id = 'abc' AND n IN (1, 2, 3) -- note",
+            "select * from songs where id = ? and n in (?...)",
+        ),
+        (
+            "INSERT INTO requests (a, b) VALUES (%(a)s, %(b)s), (%(c)s, %(d)s)",
+            "insert into requests (a, b) values (?...)",
+        ),
+        ("SELECT x::uuid FROM t1 WHERE y = $1", "select x::uuid from t1 where y = ?"),
+    ],
+)
+def test_when_fingerprint_then_values_normalized(statement: str, expected: str) -> None:
+    assert fingerprint(statement) == expected
+
+
+def test_when_record_queries_then_fingerprints_and_rows_recorded(engine: Engine) -> None:
+    with record_queries() as log:
+        with engine.begin() as connection:
+            connection.execute(text("INSERT INTO songs (name) VALUES ('a'), ('b')"))
+
+    assert [query.fingerprint for query in log.queries] == [
+        "insert into songs (name) values (?...)"
+    ]
+    assert log.queries[0].rows == 2
+    assert log.queries[0].catalog is False
+
+
+def test_given_within_budget_when_query_budget_then_passes(engine: Engine) -> None:
+    with query_budget(1), engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        connection.execute(text("PRAGMA table_info(songs)"))
+
+
+def test_given_over_budget_when_query_budget_then_exceeded(engine: Engine) -> None:
+    with pytest.raises(QueryBudgetExceeded, match="at most 1 queries, ran 2"):
+        with query_budget(1), engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+
+def test_given_repeated_queries_when_request_then_flagged(
+    client: FlaskClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.WARNING, "backend.flask.telemetry.queries"):
+        client.get("/songs/3")
+
+    assert "Repeated query on songs: 3 runs of select name from songs where id = ?" in (
+        caplog.text
+    )
+
+
+def test_given_distinct_queries_when_request_then_not_flagged(
+    client: FlaskClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.WARNING, "backend.flask.telemetry.queries"):
+        client.get("/songs/2")
+
+    assert "Repeated query" not in caplog.text
+
+
+def test_given_slow_query_when_request_then_logged(
+    app: Flask, client: FlaskClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    app.extensions["query_profiler"].slow_query_seconds = 0
+
+    with caplog.at_level(logging.WARNING, "backend.flask.telemetry.queries"):
+        client.get("/songs/1")
+
+    assert "Slow query" in caplog.text
+    assert "on songs: select name from songs where id = ?" in caplog.text
@@ -0,0 +1,86 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+import uuid
+from typing import Generator
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from backend.benchmarks.database import create_local_engine, local_database
+from backend.flask.blueprints.render import RenderBlueprint
+from backend.flask.blueprints.request import RequestBlueprint
+from backend.flask.config import Config
+from backend.flask.services.request import RequestService
+from backend.flask.telemetry.queries import query_budget
+
+SHOW_HASH = "show"
+SONG_ID = str(uuid.UUID(int=1))
+REQUEST_ID = uuid.UUID(int=2).hex
+
+
+@pytest.fixture()
+def engine() -> Engine:
+    engine = create_local_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(
+            text("INSERT INTO songs VALUES (:id, 'band', 'song')"), {"id": SONG_ID}
+        )
+        connection.execute(
+            text("INSERT INTO requests VALUES (:id, :show, :song, NULL)"),
+            {"id": REQUEST_ID, "show": SHOW_HASH, "song": SONG_ID},
+        )
+    return engine
+
+
+@pytest.fixture()
+def app(config: Config, engine: Engine) -> Generator[Flask, None, None]:
+    with local_database(engine):
+        service = RequestService(config)
+    app = Flask(__name__)
+    app.register_blueprint(RequestBlueprint(service=service), url_prefix="/api")
+    app.register_blueprint(RenderBlueprint())
+    yield app
+
+
+def test_when_redirect_then_no_queries(client: FlaskClient) -> None:
+    with query_budget(0):
+        response = client.get(f"/api/requests/redirect/{SHOW_HASH}")
+
+    assert response.status_code == 302
+
+
+def test_given_duplicate_when_redirect_then_within_three_queries(
+    client: FlaskClient,
+) -> None:
+    client.set_cookie("totalRequestLiveRequestId", REQUEST_ID)
+
+    with query_budget(3):
+        response = client.get(f"/api/requests/redirect/{SHOW_HASH}")
+
+    assert response.status_code == 302
+    assert response.location.startswith("/?songName=")
+
+
+def test_when_write_request_then_within_one_query(client: FlaskClient) -> None:
+    with query_budget(1):
+        response = client.post(
+            "/api/requests", json={"show_hash": SHOW_HASH, "song_id": SONG_ID}
+        )
+
+    assert response.status_code == 201
+
+
+def test_when_count_then_within_one_query(client: FlaskClient) -> None:
+    with query_budget(1):
+        response = client.get("/api/requests/count")
+
+    assert response.json == [{"song_id": SONG_ID, "request_count": 1}]
+
+
+def test_when_count_show_then_within_one_query(client: FlaskClient) -> None:
+    with query_budget(1):
+        response = client.get(f"/api/requests/count/{SHOW_HASH}")
+
+    assert response.json == [{"song_id": SONG_ID, "request_count": 1}]
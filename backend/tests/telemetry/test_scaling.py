@@ -0,0 +1,62 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+import io
+import json
+from typing import Generator
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+
+from backend.flask.telemetry.scaling import METRIC, NAMESPACE, RequestRateReporter
+
+
+@pytest.fixture()
+def stream() -> io.StringIO:
+    return io.StringIO()
+
+
+@pytest.fixture()
+def reporter(stream: io.StringIO) -> RequestRateReporter:
+    return RequestRateReporter("project-env", interval=3600, stream=stream)
+
+
+@pytest.fixture()
+def app(reporter: RequestRateReporter) -> Generator[Flask, None, None]:
+    app = Flask(__name__)
+    reporter.init_app(app)
+    app.add_url_rule("/api/songs", "songs", lambda: "[]")
+    app.add_url_rule("/health/ready", "ready", lambda: "ok")
+    yield app
+    reporter.stop()
+
+
+def test_given_requests_when_report_then_embedded_metric_written(
+    client: FlaskClient, reporter: RequestRateReporter, stream: io.StringIO
+) -> None:
+    for _ in range(3):
+        client.get("/api/songs")
+    client.get("/health/ready")
+
+    reported = reporter.report()
+
+    line = json.loads(stream.getvalue())
+    assert reported == 3
+    assert line["Service"] == "project-env"
+    assert line[METRIC] == 3
+    assert line["_aws"]["CloudWatchMetrics"] == [
+        {
+            "Namespace": NAMESPACE,
+            "Dimensions": [["Service"]],
+            "Metrics": [{"Name": METRIC, "Unit": "Count"}],
+        }
+    ]
+
+
+def test_when_reported_then_count_reset(
+    client: FlaskClient, reporter: RequestRateReporter, stream: io.StringIO
+) -> None:
+    client.get("/api/songs")
+    reporter.report()
+
+    assert reporter.report() == 0
+    assert json.loads(stream.getvalue().splitlines()[-1])[METRIC] == 0
@@ -0,0 +1,139 @@
+# pylint: disable=redefined-outer-name, missing-function-docstring, missing-module-docstring
+import io
+import json
+from typing import Generator
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+from flask import Flask
+from flask.testing import FlaskClient
+
+from backend.flask.decorators.trace import traced
+from backend.flask.telemetry.tracing import (
+    SpanExporter,
+    Tracer,
+    format_traceparent,
+    parse_traceparent,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture()
+def stream() -> io.StringIO:
+    return io.StringIO()
+
+
+@pytest.fixture()
+def app(stream: io.StringIO) -> Generator[Flask, None, None]:
+    app = Flask(__name__)
+    Tracer(SpanExporter(stream)).init_app(app)
+
+    s3 = boto3.client(
+        "s3",
+        region_name="us-east-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    stubber = Stubber(s3)
+
+    @traced("db")
+    def query() -> int:
+        return 1
+
+    @app.route("/traced")
+    def traced_route():
+        query()
+        query()
+        stubber.add_response("list_buckets", {"Buckets": []})
+        with stubber:
+            s3.list_buckets()
+        return "ok"
+
+    yield app
+
+
+def _spans(stream: io.StringIO) -> list:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_when_parse_traceparent_then_context_returned() -> None:
+    header = format_traceparent(TRACE_ID, PARENT_ID)
+
+    assert parse_traceparent(header) == (TRACE_ID, PARENT_ID, "01")
+
+
+@pytest.mark.parametrize(
+    "header",
+    [None, "", "garbage", f"00-{'0' * 32}-{PARENT_ID}-01", f"01-{TRACE_ID}-{PARENT_ID}"],
+)
+def test_given_invalid_traceparent_when_parse_then_none(header: str) -> None:
+    assert parse_traceparent(header) is None
+
+
+def test_given_traceparent_when_request_then_trace_continued(
+    client: FlaskClient, stream: io.StringIO
+) -> None:
+    response = client.get(
+        "/traced", headers={"traceparent": format_traceparent(TRACE_ID, PARENT_ID)}
+    )
+
+    root, *children = _spans(stream)
+    assert root["trace_id"] == TRACE_ID
+    assert root["parent_id"] == PARENT_ID
+    assert root["name"] == "GET traced_route"
+    assert response.headers["traceparent"] == format_traceparent(TRACE_ID, root["span_id"])
+    assert all(child["trace_id"] == TRACE_ID for child in children)
+    assert all(child["parent_id"] == root["span_id"] for child in children)
+
+
+def test_given_no_traceparent_when_request_then_trace_started(
+    client: FlaskClient, stream: io.StringIO
+) -> None:
+    client.get("/traced")
+
+    root = _spans(stream)[0]
+    assert len(root["trace_id"]) == 32
+    assert root["parent_id"] is None
+
+
+def test_when_request_then_service_calls_traced(
+    client: FlaskClient, stream: io.StringIO
+) -> None:
+    client.get("/traced")
+
+    names = [span["name"] for span in _spans(stream)[1:]]
+    assert names == [
+        "db.app.<locals>.query",
+        "db.app.<locals>.query",
+        "s3.ListBuckets",
+    ]
+
+
+def test_when_request_then_server_timing_per_category(client: FlaskClient) -> None:
+    response = client.get("/traced")
+
+    metrics = [metric.split(";") for metric in response.headers["Server-Timing"].split(", ")]
+    assert [metric[0] for metric in metrics] == ["app", "db", "s3"]
+    assert metrics[1][2] == 'desc="2 calls"'
+    assert metrics[2][2] == 'desc="1 calls"'
+
+
+def test_given_no_request_when_traced_function_called_then_runs_untraced() -> None:
+    @traced("db")
+    def query() -> int:
+        return 1
+
+    assert query() == 1
+
+
+@pytest.mark.parametrize("setting", [None, ""])
+def test_given_no_setting_when_from_setting_then_no_exporter(setting: str) -> None:
+    assert SpanExporter.from_setting(setting) is None
+
+
+def test_given_unknown_setting_when_from_setting_then_value_error() -> None:
+    with pytest.raises(ValueError):
+        SpanExporter.from_setting("zipkin")
@@ -28,10 +28,42 @@ DB_HOST = MagicMock()
 DB_NAME = MagicMock()
 DB_ENGINE = MagicMock()
 DB_PORT = MagicMock()
+DB_CONNECT_TIMEOUT = MagicMock()
+DB_STATEMENT_TIMEOUT = MagicMock()
+DB_BREAKER_THRESHOLD = MagicMock()
+DB_BREAKER_RESET = MagicMock()
+DB_STATE_PARAMETER = MagicMock()
+DB_PREPARE_THRESHOLD = MagicMock()
+DB_POOLER = MagicMock()
+DB_POOL_SIZE = MagicMock()
+DB_REPLICA_HOSTS = MagicMock()
+DB_STICKY_SECONDS = MagicMock()
 
 # Redis
 REDIS_HOST = MagicMock()
 REDIS_PORT = MagicMock()
+CACHE_PARAMETER = MagicMock()
+
+# Catalog
+CATALOG_CACHE_DIR = MagicMock()
+
+# Spool
+SPOOL_DIR = MagicMock()
+
+# Telemetry
+SLOW_QUERY_MS = MagicMock()
+REPEATED_QUERY_THRESHOLD = MagicMock()
+TRACE_EXPORT = MagicMock()
+LOG_FORMAT = MagicMock()
+LOG_SAMPLE_RATES = MagicMock()
+REQUEST_RATE_INTERVAL = MagicMock()
+METRICS_PORT = MagicMock()
+
+# Limits
+RATE_LIMIT_BACKEND = MagicMock()
+RATE_LIMIT_IP = MagicMock()
+RATE_LIMIT_SHOW = MagicMock()
+ADMISSION_CAPACITY = MagicMock()
 
 
 @pytest.fixture(autouse=True)
@@ -90,10 +122,42 @@ def test_given_no_overrides_when_config_instantiated_then_config_set_to_default(
     assert config.db_host == DB_HOST
     assert config.db_name == DB_NAME
     assert config.db_engine == DB_ENGINE
+    assert config.db_connect_timeout == DB_CONNECT_TIMEOUT
+    assert config.db_statement_timeout == DB_STATEMENT_TIMEOUT
+    assert config.db_breaker_threshold == DB_BREAKER_THRESHOLD
+    assert config.db_breaker_reset == DB_BREAKER_RESET
+    assert config.db_state_parameter == DB_STATE_PARAMETER
+    assert config.db_prepare_threshold == DB_PREPARE_THRESHOLD
+    assert config.db_pooler == DB_POOLER
+    assert config.db_pool_size == DB_POOL_SIZE
+    assert config.db_replica_hosts == DB_REPLICA_HOSTS
+    assert config.db_sticky_seconds == DB_STICKY_SECONDS
 
     # Redis
     assert config.redis_host == REDIS_HOST
     assert config.redis_port == REDIS_PORT
+    assert config.cache_parameter == CACHE_PARAMETER
+
+    # Catalog
+    assert config.catalog_cache_dir == CATALOG_CACHE_DIR
+
+    # Spool
+    assert config.spool_dir == SPOOL_DIR
+
+    # Telemetry
+    assert config.slow_query_ms == SLOW_QUERY_MS
+    assert config.repeated_query_threshold == REPEATED_QUERY_THRESHOLD
+    assert config.trace_export == TRACE_EXPORT
+    assert config.log_format == LOG_FORMAT
+    assert config.log_sample_rates == LOG_SAMPLE_RATES
+    assert config.request_rate_interval == REQUEST_RATE_INTERVAL
+    assert config.metrics_port == METRICS_PORT
+
+    # Limits
+    assert config.rate_limit_backend == RATE_LIMIT_BACKEND
+    assert config.rate_limit_ip == RATE_LIMIT_IP
+    assert config.rate_limit_show == RATE_LIMIT_SHOW
+    assert config.admission_capacity == ADMISSION_CAPACITY
 
 
 def test_given_overrides_when_config_instantiated_then_overrirdes_set(
@@ -128,10 +192,42 @@ def test_given_overrides_when_config_instantiated_then_overrirdes_set(
     assert config.db_host == DB_HOST
     assert config.db_name == DB_NAME
     assert config.db_engine == DB_ENGINE
+    assert config.db_connect_timeout == DB_CONNECT_TIMEOUT
+    assert config.db_statement_timeout == DB_STATEMENT_TIMEOUT
+    assert config.db_breaker_threshold == DB_BREAKER_THRESHOLD
+    assert config.db_breaker_reset == DB_BREAKER_RESET
+    assert config.db_state_parameter == DB_STATE_PARAMETER
+    assert config.db_prepare_threshold == DB_PREPARE_THRESHOLD
+    assert config.db_pooler == DB_POOLER
+    assert config.db_pool_size == DB_POOL_SIZE
+    assert config.db_replica_hosts == DB_REPLICA_HOSTS
+    assert config.db_sticky_seconds == DB_STICKY_SECONDS
 
     # Redis
     assert config.redis_host == REDIS_HOST
     assert config.redis_port == REDIS_PORT
+    assert config.cache_parameter == CACHE_PARAMETER
+
+    # Catalog
+    assert config.catalog_cache_dir == CATALOG_CACHE_DIR
+
+    # Spool
+    assert config.spool_dir == SPOOL_DIR
+
+    # Telemetry
+    assert config.slow_query_ms == SLOW_QUERY_MS
+    assert config.repeated_query_threshold == REPEATED_QUERY_THRESHOLD
+    assert config.trace_export == TRACE_EXPORT
+    assert config.log_format == LOG_FORMAT
+    assert config.log_sample_rates == LOG_SAMPLE_RATES
+    assert config.request_rate_interval == REQUEST_RATE_INTERVAL
+    assert config.metrics_port == METRICS_PORT
+
+    # Limits
+    assert config.rate_limit_backend == RATE_LIMIT_BACKEND
+    assert config.rate_limit_ip == RATE_LIMIT_IP
+    assert config.rate_limit_show == RATE_LIMIT_SHOW
+    assert config.admission_capacity == ADMISSION_CAPACITY
 
 
 def test_given_no_environment_or_overrirdes_when_get_config_then_config_set_to_default() -> (
@@ -162,10 +258,42 @@ def test_given_no_environment_or_overrirdes_when_get_config_then_config_set_to_d
     assert config.db_name == ""
     assert config.db_engine == "postgresql+psycopg"
     assert config.db_port == "5432"
+    assert config.db_connect_timeout == "3"
+    assert config.db_statement_timeout == "5000"
+    assert config.db_breaker_threshold == "5"
+    assert config.db_breaker_reset == "10"
+    assert config.db_state_parameter == ""
+    assert config.db_prepare_threshold == "5"
+    assert config.db_pooler == ""
+    assert config.db_pool_size == ""
+    assert config.db_replica_hosts == ""
+    assert config.db_sticky_seconds == "5"
 
     # Redis
     assert config.redis_host == "redis"
     assert config.redis_port == "6379"
+    assert config.cache_parameter == ""
+
+    # Catalog
+    assert config.catalog_cache_dir is None
+
+    # Spool
+    assert config.spool_dir is None
+
+    # Telemetry
+    assert config.slow_query_ms == "100"
+    assert config.repeated_query_threshold == "3"
+    assert config.trace_export is None
+    assert config.log_format == "json"
+    assert config.log_sample_rates == ""
+    assert config.request_rate_interval == "0"
+    assert config.metrics_port == ""
+
+    # Limits
+    assert config.rate_limit_backend == "memory"
+    assert config.rate_limit_ip == "50:500"
+    assert config.rate_limit_show == "200:1000"
+    assert config.admission_capacity == "64"
 
 
 def test_given_secret_client_when_config_instantiated_then_secrets_retrieved(
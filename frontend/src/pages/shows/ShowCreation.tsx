@@ -4,6 +4,21 @@ import { useAuth } from '../../contexts/AuthContext';
 import { useError } from '../../contexts/ErrorContext';
 import { default as ShowService } from '../../services/show';
 
+/**
+ * Add the browser's UTC offset on that date to a datetime-local value, so the
+ * time names an instant rather than a wall time in an unknown zone.
+ * @param {string} value - The value, e.g. "2030-06-01T20:00".
+ * @returns {string} The ISO 8601 time, e.g. "2030-06-01T20:00:00-04:00".
+ */
+const withOffset = (value: string): string => {
+    const offset = -new Date(value).getTimezoneOffset();
+    const pad = (n: number) => String(Math.floor(n)).padStart(2, '0');
+    const sign = offset < 0 ? '-' : '+';
+    const hours = pad(Math.abs(offset) / 60);
+    const minutes = pad(Math.abs(offset) % 60);
+    return `${value.slice(0, 16)}:00${sign}${hours}:${minutes}`;
+};
+
 /**
  * ShowCreation component that renders the form for creating a show.
  * @component
@@ -29,8 +44,13 @@ const ShowCreation: React.FC = ({}) => {
 
     const handleSubmit = (e: React.FormEvent) => {
         e.preventDefault();
-        console.log('Form submitted:', formData);
-        ShowService.insertShow(formData, token)
+        const show = {
+            ...formData,
+            start_time: withOffset(formData.start_time),
+            end_time: withOffset(formData.end_time),
+        };
+        console.log('Form submitted:', show);
+        ShowService.insertShow(show, token)
             .then(() => {
                 toast.success('Show created successfully:');
             })
@@ -44,7 +64,7 @@ const ShowCreation: React.FC = ({}) => {
             <h1 className="text-center">Create a Show</h1>
             <form onSubmit={handleSubmit}>
                 <div className="form-group">
-                    <label>Start Time:</label>
+                    <label>Start Time (your local time):</label>
                     <input
                         type="datetime-local"
                         name="start_time"
@@ -54,7 +74,7 @@ const ShowCreation: React.FC = ({}) => {
                     />
                 </div>
                 <div className="form-group">
-                    <label>End Time:</label>
+                    <label>End Time (your local time):</label>
                     <input
                         type="datetime-local"
                         name="end_time"
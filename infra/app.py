@@ -10,6 +10,7 @@ Modules:
     stacks.compute: Compute stack module.
     stacks.network: Network stack module.
     stacks.runtime: Runtime stack module.
+    stacks.show: Show stack module.
     stacks.storage: Storage stack module.
     stacks.user_management: User management stack module.
 
@@ -26,6 +27,7 @@ from infra.stacks.compute import ComputeStack, ComputeStackArgs
 from infra.stacks.deployment import DeploymentStack, DeploymentStackArgs
 from infra.stacks.network import NetworkStack, NetworkStackArgs
 from infra.stacks.runtime import RuntimeStack, RuntimeStackArgs
+from infra.stacks.show import ShowStack, ShowStackArgs
 from infra.stacks.storage import StorageStack, StorageStackArgs
 from infra.stacks.user_management import UserManagementStack, UserManagementStackArgs
 
@@ -67,9 +69,15 @@ runtime_stack = RuntimeStack(
         bucket=storage_stack.s3_construct.bucket,
         db_instance=storage_stack.rds_construct.db_instance,
         gateway_security_group=network_stack.gateway_construct.security_group,
+        db_proxy=storage_stack.rds_construct.proxy,
+        http_api=network_stack.gateway_construct.http_api,
+        proxy_alias=network_stack.gateway_construct.alias,
     ),
 )
 
+# Deployed for shows only, the runtime does without it
+show_stack = ShowStack(app, ShowStackArgs(config, vpc=network_stack.vpc_construct.vpc))
+
 deployment_stack = DeploymentStack(
     app,
     DeploymentStackArgs(
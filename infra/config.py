@@ -4,6 +4,7 @@ This module contains the Config class holding
 the configuration details for the AWS CDK application.
 
 Classes:
+    ScalingConfig: How far the runtime service scales, and on what.
     Config: A class that holds configuration details.
 
 Usage example:
@@ -13,6 +14,56 @@ Usage example:
 import aws_cdk as cdk
 
 
+class ScalingConfig:
+    """
+    How far the runtime service scales, and on what.
+
+    Attributes:
+        min_tasks: Tasks always running.
+        max_tasks: The most tasks running.
+        show_tasks: Tasks running from shortly before a show until after it ends.
+        cpu_target: Average CPU utilization, in percent, to scale to.
+        memory_target: Average memory utilization, in percent, to scale to.
+        requests_target: Requests per task per minute to scale to.
+        proxy_concurrency: Proxy Lambda environments kept initialized during
+            shows, none when 0.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        min_tasks: int = 1,
+        max_tasks: int = 4,
+        show_tasks: int = 2,
+        cpu_target: int = 60,
+        memory_target: int = 75,
+        requests_target: int = 3000,
+        proxy_concurrency: int = 0,
+    ) -> None:
+        self.min_tasks = min_tasks
+        self.max_tasks = max(max_tasks, show_tasks, min_tasks)
+        self.show_tasks = show_tasks
+        self.cpu_target = cpu_target
+        self.memory_target = memory_target
+        self.requests_target = requests_target
+        self.proxy_concurrency = proxy_concurrency
+
+
+# Scaling by environment name; other environments get the ScalingConfig defaults.
+SCALING = {
+    "production": ScalingConfig(min_tasks=1, max_tasks=10, show_tasks=3),
+}
+
+# How API Gateway reaches the runtime service. "lambda" goes through the proxy
+# Lambda, "direct" through a VPC Link to the service's Cloud Map registrations.
+INTEGRATION_TYPES = ("lambda", "direct")
+
+# The integration by environment name; other environments use the proxy Lambda.
+INTEGRATION = {
+    "production": "direct",
+}
+
+
 class Config:
     """
     A class that holds configuration details for the AWS CDK application.
@@ -21,6 +72,9 @@ class Config:
         project_name: The name of the project.
         environment_name: The name of the environment.
         cdk_environment: The AWS CDK environment configuration.
+        scaling: How far the runtime service scales, and on what.
+        integration: How API Gateway reaches the runtime service, one of
+            INTEGRATION_TYPES.
 
     Methods:
         __init__: Initializes the Config with the given parameters.
@@ -32,6 +86,8 @@ class Config:
         project_name: str | None,
         environment_name: str | None,
         cdk_environment: cdk.Environment | None,
+        scaling: ScalingConfig | None = None,
+        integration: str | None = None,
     ) -> None:
         """
         Initializes the Config with the given parameters.
@@ -41,10 +97,23 @@ class Config:
             environment_name (str, optional): The name of the environment. Defaults to None.
             cdk_environment (cdk.Environment, optional): The AWS CDK environment configuration.
                 Defaults to None.
+            scaling (ScalingConfig, optional): How far the runtime service scales.
+                Defaults to the environment's entry in SCALING.
+            integration (str, optional): How API Gateway reaches the runtime service.
+                Defaults to the environment's entry in INTEGRATION.
+
+        Raises:
+            ValueError: If the integration is not one of INTEGRATION_TYPES.
         """
         self.project_name = project_name
         self.environment_name = environment_name
         self.cdk_environment = cdk_environment
+        self.scaling = scaling or SCALING.get(str(environment_name), ScalingConfig())
+        self.integration = integration or INTEGRATION.get(str(environment_name), "lambda")
+        if self.integration not in INTEGRATION_TYPES:
+            raise ValueError(
+                f"Unknown integration {self.integration}, expected one of {INTEGRATION_TYPES}."
+            )
 
     def __str__(self) -> str:
         """
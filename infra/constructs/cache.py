@@ -0,0 +1,118 @@
+"""
+This module contains the CacheConstruct class, which sets up a Redis cache
+cluster within a specified VPC, for the duration of a show.
+
+Classes:
+    CacheConstruct: A construct that sets up a Redis cache cluster.
+
+Usage example:
+    cache_construct = CacheConstruct(scope, CacheConstructArgs(config, vpc))
+"""
+
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_elasticache as elasticache
+from aws_cdk import aws_ssm as ssm
+
+from infra.config import Config
+from infra.constructs.construct import Construct, ConstructArgs
+from infra.stacks.stack import Stack
+
+REDIS_PORT = 6379
+
+
+class CacheConstructArgs(ConstructArgs):  # pylint: disable=too-few-public-methods
+    """
+    Arguments for the CacheConstruct class.
+
+    Attributes:
+        config: Configuration object.
+        vpc: The VPC in which to create the cache cluster.
+        node_type: The cache node type.
+            Defaults to "cache.t4g.micro".
+        uid: The ID of the construct.
+            Defaults to "cache".
+        prefix: The prefix for resource names.
+            Defaults to f"{config.project_name}-{config.environment_name}-".
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        config: Config,
+        vpc: ec2.IVpc,
+        node_type: str = "cache.t4g.micro",
+        uid: str = "cache",
+        prefix: str = "",
+    ) -> None:
+        super().__init__(config=config, uid=uid, prefix=prefix)
+        self.vpc = vpc
+        self.node_type = node_type
+
+
+class CacheConstruct(Construct):
+    """
+    A construct that sets up a single node Redis cache cluster.
+
+    Its endpoint is published as "<host>:<port>" to the
+    "/<project>-<environment>/cache-endpoint" parameter. The runtime looks the
+    parameter up to find the cache, and keeps its rate limits in process while
+    the parameter, i.e. the cache, is not there.
+
+    Attributes:
+        security_group: The security group for the cache cluster.
+        cache_cluster: The cache cluster.
+        endpoint: The parameter holding the cache's endpoint.
+
+    Methods:
+        __init__: Initializes the CacheConstruct with the given parameters.
+    """
+
+    def __init__(
+        self,
+        scope: Stack,
+        args: CacheConstructArgs,
+    ) -> None:
+        """
+        Initializes the CacheConstruct with the given parameters.
+
+        Args:
+            scope (Stack): The parent stack.
+            args (CacheConstructArgs): The arguments for the construct.
+        """
+        super().__init__(scope, ConstructArgs(args.config, args.uid, args.prefix))
+
+        self.security_group = ec2.SecurityGroup(
+            self, "cache-security-group", vpc=args.vpc
+        )
+
+        self.security_group.add_ingress_rule(
+            ec2.Peer.ipv4(args.vpc.vpc_cidr_block),
+            ec2.Port.tcp(REDIS_PORT),
+            "Allow ECS to access the cache",
+        )
+
+        subnet_group = elasticache.CfnSubnetGroup(
+            self,
+            "cache-subnet-group",
+            description="Subnets for the show cache",
+            subnet_ids=args.vpc.select_subnets().subnet_ids,
+        )
+
+        self.cache_cluster = elasticache.CfnCacheCluster(
+            self,
+            "cache-cluster",
+            cluster_name=f"{args.config.project_name}-{args.config.environment_name}-cache",
+            engine="redis",
+            cache_node_type=args.node_type,
+            num_cache_nodes=1,
+            port=REDIS_PORT,
+            cache_subnet_group_name=subnet_group.ref,
+            vpc_security_group_ids=[self.security_group.security_group_id],
+        )
+
+        self.endpoint = ssm.StringParameter(
+            self,
+            "cache-endpoint-parameter",
+            parameter_name=f"/{args.config.project_name}-{args.config.environment_name}/cache-endpoint",  # pylint: disable=line-too-long
+            string_value=f"{self.cache_cluster.attr_redis_endpoint_address}:"
+            f"{self.cache_cluster.attr_redis_endpoint_port}",
+        )
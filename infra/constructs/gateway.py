@@ -1,7 +1,7 @@
 """
 This module defines the GatewayConstruct class, which sets up the API Gateway and its associated resources.
 """
-from aws_cdk import Duration, BundlingOptions
+from aws_cdk import Duration
 from aws_cdk import aws_ec2 as ec2
 from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as _lambda
@@ -39,6 +39,17 @@ class GatewayConstructArgs(ConstructArgs):
 class GatewayConstruct(Construct):
     """
     This construct sets up the API Gateway and its associated resources.
+
+    Every request goes through the proxy Lambda by the API's default route.
+    With the "direct" integration, the runtime stack adds routes to the API that
+    take precedence, see VpcLinkConstruct, and the Lambda is only the fallback.
+
+    Attributes:
+        security_group (ec2.SecurityGroup): The proxy Lambda's security group.
+        function (_lambda.Function): The proxy Lambda.
+        alias (_lambda.Alias): The alias API Gateway invokes, with
+            config.scaling.proxy_concurrency set, or None.
+        http_api (apigwv2.HttpApi): The HTTP API.
     """
     def __init__(self, scope: Stack, args: GatewayConstructArgs) -> None:
         super().__init__(scope, ConstructArgs(args.config, args.uid, args.prefix))
@@ -64,17 +75,10 @@ class GatewayConstruct(Construct):
             ],
         )
 
-        code = _lambda.Code.from_asset("infra/lambda/gateway", 
-            bundling=BundlingOptions(
-                image=_lambda.Runtime.PYTHON_3_12.bundling_image,
-                command=[
-                    "bash", "-c",
-                    "pip install -r requirements.txt -t /asset-output && cp -r . /asset-output"
-                ]
-            ),
-        )
+        # The proxy only imports the standard library, so there is nothing to bundle
+        code = _lambda.Code.from_asset("infra/lambda/gateway")
 
-        lambda_fn = _lambda.Function(
+        self.function = lambda_fn = _lambda.Function(
             self,
             f"{args.config.project_name}-runtime-proxy-lambda",
             function_name=f"{args.config.project_name}-{args.config.environment_name}-runtime-proxy-lambda",
@@ -93,13 +97,24 @@ class GatewayConstruct(Construct):
             f"http://runtime.{args.config.project_name}-{args.config.environment_name}.local:5000"
         )
 
+        # Provisioned concurrency is set on an alias, by the scheduler for each show
+        self.alias = None
+        target = lambda_fn
+        if args.config.scaling.proxy_concurrency:
+            self.alias = target = _lambda.Alias(
+                self,
+                "proxy-alias",
+                alias_name="live",
+                version=lambda_fn.current_version,
+            )
+
         integration = integrations.HttpLambdaIntegration(
             f"{args.config.project_name}-lambda-integration",
-            lambda_fn,
+            target,
             payload_format_version=apigwv2.PayloadFormatVersion.VERSION_2_0,
         )
 
-        apigwv2.HttpApi(
+        self.http_api = apigwv2.HttpApi(
             self,
             f"{args.config.project_name}-http-api",
             default_integration=integration,
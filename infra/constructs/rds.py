@@ -30,13 +30,21 @@ class RdsConstructArgs(ConstructArgs):  # pylint: disable=too-few-public-methods
         prefix: The prefix for resource names.
             Defaults to f"{config.project_name}-{config.environment_name}-rds".
         vpc: The VPC in which to create the RDS instance.
+        proxy: Whether to put an RDS Proxy in front of the instance.
+            Defaults to True.
     """
 
-    def __init__(
-        self, config: Config, vpc: ec2.Vpc, uid: str = "rds", prefix: str = ""
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        config: Config,
+        vpc: ec2.Vpc,
+        uid: str = "rds",
+        prefix: str = "",
+        proxy: bool = True,
     ) -> None:
         super().__init__(config=config, uid=uid, prefix=prefix)
         self.vpc = vpc
+        self.proxy = proxy
 
 
 class RdsConstruct(Construct):
@@ -45,6 +53,7 @@ class RdsConstruct(Construct):
 
     Attributes:
         db_instance: The RDS database instance.
+        proxy: The RDS Proxy the runtime connects through, or None.
         task_definition: The ECS task definition for database schema deployment.
         security_group: The security group for ECS tasks.
 
@@ -76,13 +85,24 @@ class RdsConstruct(Construct):
             "Allow ECS to access RDS",
         )
 
+        engine = rds.DatabaseInstanceEngine.postgres(
+            version=rds.PostgresEngineVersion.VER_16_4
+        )
+
+        # Connections through the proxy carry no startup options, so the
+        # statement timeout is the database's default.
+        parameter_group = rds.ParameterGroup(
+            self,
+            "rds-parameter-group",
+            engine=engine,
+            parameters={"statement_timeout": "5000"},
+        )
+
         self.db_instance = rds.DatabaseInstance(
             self,
             "rds-instance",
             database_name=args.config.project_name,
-            engine=rds.DatabaseInstanceEngine.postgres(
-                version=rds.PostgresEngineVersion.VER_16_4
-            ),
+            engine=engine,
             instance_type=ec2.InstanceType.of(
                 ec2.InstanceClass.BURSTABLE3, ec2.InstanceSize.MICRO
             ),
@@ -98,5 +118,22 @@ class RdsConstruct(Construct):
             security_groups=[self.security_group],
             instance_identifier=f"{args.config.project_name}-{args.config.environment_name}-rds-instance",  # pylint: disable=line-too-long
             allocated_storage=20,
-            storage_type=rds.StorageType.GP2
+            storage_type=rds.StorageType.GP2,
+            parameter_group=parameter_group,
+        )
+
+        # The proxy shares a small pool of database connections between all
+        # runtime tasks, so scaling out does not run the instance out of them.
+        self.proxy = (
+            self.db_instance.add_proxy(
+                "rds-proxy",
+                db_proxy_name=f"{args.config.project_name}-{args.config.environment_name}-rds-proxy",  # pylint: disable=line-too-long
+                secrets=[self.db_instance.secret],
+                vpc=args.vpc,
+                security_groups=[self.security_group],
+                require_tls=True,
+                max_connections_percent=90,
+            )
+            if args.proxy
+            else None
         )
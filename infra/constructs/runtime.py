@@ -10,11 +10,15 @@ Usage example:
         policy, cluster, runtime_variables, runtime_secrets)
 """
 
+import json
+
 from aws_cdk import Duration, RemovalPolicy
 from aws_cdk import aws_certificatemanager as acm
+from aws_cdk import aws_cloudwatch as cloudwatch
 from aws_cdk import aws_ec2 as ec2
 from aws_cdk import aws_ecr_assets as ecr_assets
 from aws_cdk import aws_ecs as ecs, aws_servicediscovery as servicediscovery
+from aws_cdk import aws_efs as efs
 from aws_cdk import aws_iam as iam
 from aws_cdk import aws_logs
 from aws_cdk import aws_rds as rds
@@ -25,6 +29,10 @@ from infra.config import Config
 from infra.constructs.construct import Construct, ConstructArgs
 from infra.stacks.stack import Stack
 
+# The collector scraping the tasks' Prometheus metrics into CloudWatch
+METRICS_COLLECTOR_IMAGE = "public.ecr.aws/aws-observability/aws-otel-collector:v0.40.0"
+METRICS_PORT = 9100
+
 
 class RuntimeConstructArgs(ConstructArgs):  # pylint: disable=too-few-public-methods
     """
@@ -39,6 +47,7 @@ class RuntimeConstructArgs(ConstructArgs):  # pylint: disable=too-few-public-met
         db_instance (rds.IDatabaseInstance): The RDS database instance.
         gateway_security_group (ec2.ISecurityGroup): The security group for the API Gateway.
         runtime_variables (dict): The environment variables for the ECS task.
+        db_proxy (rds.IDatabaseProxy): The RDS Proxy to connect through, if any.
         uid: Unique identifier for the resource.
             Defaults to runtime.
         prefix: Prefix for resource names.
@@ -56,6 +65,7 @@ class RuntimeConstructArgs(ConstructArgs):  # pylint: disable=too-few-public-met
         db_instance: rds.IDatabaseInstance,
         gateway_security_group: ec2.ISecurityGroup,
         runtime_variables: dict[str, str] | None = None,
+        db_proxy: rds.IDatabaseProxy | None = None,
         uid: str = "runtime",
         prefix: str = "",
     ) -> None:
@@ -68,6 +78,7 @@ class RuntimeConstructArgs(ConstructArgs):  # pylint: disable=too-few-public-met
         self.bucket = bucket
         self.db_instance = db_instance
         self.gateway_security_group = gateway_security_group
+        self.db_proxy = db_proxy
 
 
 class RuntimeConstruct(Construct):
@@ -77,6 +88,12 @@ class RuntimeConstruct(Construct):
     Attributes:
         runtime_service (ecs_patterns.ApplicationLoadBalancedFargateService):
             The ECS Fargate service.
+        security_group (ec2.SecurityGroup): The security group of the service's tasks.
+        container (ecs.ContainerDefinition): The Flask container.
+        cloud_map_service (servicediscovery.IService): The tasks' Cloud Map service.
+        scaling (ecs.ScalableTaskCount): The service's task count autoscaling.
+        spool (efs.FileSystem): The request spool shared by the tasks.
+        alarms (list[cloudwatch.Alarm]): Alarms for a service that cannot keep up.
 
     Methods:
         __init__: Initializes the RuntimeEcsConstruct with the given parameters.
@@ -147,7 +164,7 @@ class RuntimeConstruct(Construct):
             ],
         )
 
-        security_group = ec2.SecurityGroup(
+        self.security_group = security_group = ec2.SecurityGroup(
             self,
             f"{args.config.project_name}-{args.config.environment_name}-runtime-sg",
             vpc=args.vpc,
@@ -214,6 +231,25 @@ class RuntimeConstruct(Construct):
             f"{args.config.project_name}-runtime-task-def",
             task_role=task_role,
         )
+
+        # Requests spooled while the database is down outlive the task that took
+        # them, e.g. one scaled in, and are replayed by whichever task is running
+        self.spool = efs.FileSystem(
+            self,
+            f"{args.config.project_name}-{args.config.environment_name}-spool",
+            vpc=args.vpc,
+            encrypted=True,
+        )
+        self.spool.connections.allow_default_port_from(security_group)
+        self.spool.grant_read_write(task_role)
+        task_definition.add_volume(
+            name="spool",
+            efs_volume_configuration=ecs.EfsVolumeConfiguration(
+                file_system_id=self.spool.file_system_id,
+                transit_encryption="ENABLED",
+                authorization_config=ecs.AuthorizationConfig(iam="ENABLED"),
+            ),
+        )
         
         docker_image = ecr_assets.DockerImageAsset(
             self,
@@ -222,15 +258,83 @@ class RuntimeConstruct(Construct):
             exclude=["infra", "infra/*", "cdk.out", "node_modules"],
         )
 
-        container = task_definition.add_container(
+        environment = dict(args.runtime_variables or {})
+        # The tasks report their request rate, which the service scales on
+        environment["REQUEST_RATE_INTERVAL"] = "60"
+        # Metrics are served apart from the app, on a port API Gateway does not
+        # route to and the security group does not open, for the collector below
+        environment["METRICS_PORT"] = str(METRICS_PORT)
+        environment["SPOOL_DIR"] = "/spool"
+        # Rate limits are shared through the show cache while it is deployed
+        environment["RATE_LIMIT_BACKEND"] = "auto"
+        environment["CACHE_PARAMETER"] = (
+            f"/{args.config.project_name}-{args.config.environment_name}/cache-endpoint"
+        )
+        if args.db_proxy is not None:
+            # The proxy pools transactions, see DB_POOLER in the Flask config
+            environment["DB_HOST"] = args.db_proxy.endpoint
+            environment["DB_POOLER"] = "rds-proxy"
+
+        self.container = task_definition.add_container(
             f"{args.config.project_name}-{args.config.environment_name}-flask-container",
             image=ecs.ContainerImage.from_docker_image_asset(docker_image),
             logging=ecs.LogDrivers.aws_logs(stream_prefix=args.config.project_name, log_group=log_group),
-            environment=args.runtime_variables,
+            environment=environment,
             secrets={"JWT_SECRET_KEY": ecs.Secret.from_secrets_manager(jwt_secret)},
         )
 
-        container.add_port_mappings(ecs.PortMapping(container_port=5000))
+        self.container.add_port_mappings(
+            ecs.PortMapping(container_port=5000),
+            ecs.PortMapping(container_port=METRICS_PORT, name="metrics"),
+        )
+        self.container.add_mount_points(
+            ecs.MountPoint(container_path="/spool", source_volume="spool", read_only=False)
+        )
+
+        # The task's containers share localhost, so the collector scrapes the
+        # metrics there every minute and writes them to the log group in
+        # CloudWatch's embedded metric format, which CloudWatch turns into metrics
+        collector_config = {
+            "receivers": {
+                "prometheus": {
+                    "config": {
+                        "scrape_configs": [
+                            {
+                                "job_name": "runtime",
+                                "scrape_interval": "60s",
+                                "static_configs": [
+                                    {"targets": [f"localhost:{METRICS_PORT}"]}
+                                ],
+                            }
+                        ]
+                    }
+                }
+            },
+            "exporters": {
+                "awsemf": {
+                    "namespace": "ThrowbackRequestLive",
+                    "log_group_name": log_group.log_group_name,
+                    "log_stream_name": "metrics/{TaskId}",
+                    "dimension_rollup_option": "NoDimensionRollup",
+                }
+            },
+            "service": {
+                "pipelines": {
+                    "metrics": {"receivers": ["prometheus"], "exporters": ["awsemf"]}
+                }
+            },
+        }
+        log_group.grant_write(task_role)
+        self.metrics_collector = task_definition.add_container(
+            f"{args.config.project_name}-{args.config.environment_name}-metrics-collector",
+            image=ecs.ContainerImage.from_registry(METRICS_COLLECTOR_IMAGE),
+            logging=ecs.LogDrivers.aws_logs(stream_prefix="metrics-collector", log_group=log_group),
+            # YAML, of which JSON is a subset
+            environment={"AOT_CONFIG_CONTENT": json.dumps(collector_config)},
+            memory_reservation_mib=64,
+            # The app serves on without its metrics
+            essential=False,
+        )
 
         namespace = servicediscovery.PrivateDnsNamespace(
             self, 
@@ -245,7 +349,7 @@ class RuntimeConstruct(Construct):
             cluster=args.cluster,
             task_definition=task_definition,
             assign_public_ip=False,   
-            desired_count=1,
+            desired_count=args.config.scaling.min_tasks,
             security_groups=[security_group],
             cloud_map_options=ecs.CloudMapOptions(
                 name="runtime",
@@ -253,4 +357,79 @@ class RuntimeConstruct(Construct):
                 dns_record_type=servicediscovery.DnsRecordType.A,
                 dns_ttl=Duration.seconds(30)
             )
-        )
\ No newline at end of file
+        )
+        self.cloud_map_service = self.runtime_service.cloud_map_service
+
+        if args.config.integration == "direct":
+            # API Gateway finds the tasks through Cloud Map rather than DNS, and needs
+            # their port as well as their IP, which ECS only registers when given
+            service = self.runtime_service.node.default_child
+            service.add_property_override(
+                "ServiceRegistries.0.ContainerName", self.container.container_name
+            )
+            service.add_property_override("ServiceRegistries.0.ContainerPort", 5000)
+
+        scaling_config = args.config.scaling
+        self.scaling = self.runtime_service.auto_scale_task_count(
+            min_capacity=scaling_config.min_tasks,
+            max_capacity=scaling_config.max_tasks,
+        )
+        # Scale out within a minute, but in slowly, so a lull between songs
+        # does not drop tasks the next rush needs
+        self.scaling.scale_on_cpu_utilization(
+            "cpu-scaling",
+            target_utilization_percent=scaling_config.cpu_target,
+            scale_out_cooldown=Duration.seconds(60),
+            scale_in_cooldown=Duration.minutes(5),
+        )
+        self.scaling.scale_on_memory_utilization(
+            "memory-scaling",
+            target_utilization_percent=scaling_config.memory_target,
+            scale_out_cooldown=Duration.seconds(60),
+            scale_in_cooldown=Duration.minutes(5),
+        )
+        requests = cloudwatch.Metric(
+            namespace="ThrowbackRequestLive",
+            metric_name="Requests",
+            dimensions_map={
+                "Service": f"{args.config.project_name}-{args.config.environment_name}"
+            },
+            statistic=cloudwatch.Stats.AVERAGE,
+            period=Duration.minutes(1),
+        )
+        self.scaling.scale_to_track_custom_metric(
+            "request-scaling",
+            metric=requests,
+            target_value=scaling_config.requests_target,
+            scale_out_cooldown=Duration.seconds(60),
+            scale_in_cooldown=Duration.minutes(5),
+        )
+
+        # Sustained load over the targets means scaling is not keeping up,
+        # e.g. the service is at max_tasks
+        self.alarms = [
+            cloudwatch.Alarm(
+                self,
+                f"{name}-alarm",
+                alarm_name=f"{args.config.project_name}-{args.config.environment_name}-runtime-{name}",  # pylint: disable=line-too-long
+                alarm_description=f"The runtime service's {name} has been over target for 5 minutes.",  # pylint: disable=line-too-long
+                metric=metric,
+                threshold=threshold,
+                evaluation_periods=5,
+                comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
+                treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
+            )
+            for name, metric, threshold in (
+                (
+                    "cpu",
+                    self.runtime_service.metric_cpu_utilization(period=Duration.minutes(1)),
+                    min(95, scaling_config.cpu_target + 25),
+                ),
+                (
+                    "memory",
+                    self.runtime_service.metric_memory_utilization(period=Duration.minutes(1)),
+                    min(95, scaling_config.memory_target + 15),
+                ),
+                ("requests", requests, scaling_config.requests_target * 1.5),
+            )
+        ]
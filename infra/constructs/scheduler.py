@@ -0,0 +1,242 @@
+"""
+This module contains the SchedulerConstruct class, which scales the runtime
+service for the show schedule, warms its tasks up before doors, parks the
+database between shows and provisions the proxy Lambda's concurrency for shows.
+
+Classes:
+    SchedulerConstruct: A construct that sets up the show scheduler.
+
+Usage example:
+    scheduler_construct = SchedulerConstruct(scope, SchedulerConstructArgs(config,
+        vpc, cluster, service, security_group, bucket))
+"""
+
+from aws_cdk import Duration
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_ecs as ecs
+from aws_cdk import aws_events as events
+from aws_cdk import aws_events_targets as targets
+from aws_cdk import aws_iam as iam
+from aws_cdk import aws_lambda as _lambda
+from aws_cdk import aws_rds as rds
+from aws_cdk import aws_s3 as s3
+from aws_cdk import aws_ssm as ssm
+
+from infra.config import Config
+from infra.constructs.construct import Construct, ConstructArgs
+from infra.stacks.stack import Stack
+
+
+class SchedulerConstructArgs(ConstructArgs):  # pylint: disable=too-few-public-methods, too-many-instance-attributes
+    """
+    Arguments for the SchedulerConstruct class.
+
+    Attributes:
+        config: Configuration object.
+        vpc (ec2.IVpc): The VPC the runtime tasks run in.
+        cluster (ecs.ICluster): The ECS cluster.
+        service (ecs.FargateService): The runtime service to scale.
+        security_group (ec2.ISecurityGroup): The runtime tasks' security group.
+        bucket (s3.IBucket): The bucket holding shows/shows.json.
+        lead_minutes (int): Minutes before a show starts to scale out and warm up.
+            Defaults to 30.
+        linger_minutes (int): Minutes after a show ends to scale in.
+            Defaults to 30.
+        db_instance (rds.IDatabaseInstance): The database instance to start for
+            shows and stop between them, if any.
+        proxy_alias (_lambda.IAlias): The proxy Lambda's alias to provision
+            concurrency on for shows, if any.
+        uid: The ID of the construct.
+            Defaults to "scheduler".
+        prefix: The prefix for resource names.
+            Defaults to f"{config.project_name}-{config.environment_name}-".
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        config: Config,
+        vpc: ec2.IVpc,
+        cluster: ecs.ICluster,
+        service: ecs.FargateService,
+        security_group: ec2.ISecurityGroup,
+        bucket: s3.IBucket,
+        lead_minutes: int = 30,
+        linger_minutes: int = 30,
+        db_instance: rds.IDatabaseInstance | None = None,
+        proxy_alias: _lambda.IAlias | None = None,
+        uid: str = "scheduler",
+        prefix: str = "",
+    ) -> None:
+        super().__init__(config, uid, prefix)
+        self.vpc = vpc
+        self.cluster = cluster
+        self.service = service
+        self.security_group = security_group
+        self.bucket = bucket
+        self.lead_minutes = lead_minutes
+        self.linger_minutes = linger_minutes
+        self.db_instance = db_instance
+        self.proxy_alias = proxy_alias
+
+
+class SchedulerConstruct(Construct):
+    """
+    A construct that runs the show scheduler Lambda every five minutes.
+
+    Around a show the Lambda raises the service's minimum task count to
+    config.scaling.show_tasks, or to the tasks running if more, so autoscaling
+    cannot scale in until the show is over.
+
+    With a database instance, the Lambda starts it for the same window and stops
+    it afterwards, publishing its state to the "/<project>-<environment>/db-state"
+    parameter the runtime reads.
+
+    With the proxy Lambda's alias, the Lambda provisions config.scaling.proxy_concurrency
+    on it for the same window, so the first scans after a quiet period do not
+    wait for cold starts.
+
+    Attributes:
+        function (_lambda.Function): The scheduler Lambda.
+        security_group (ec2.SecurityGroup): The Lambda's security group.
+        db_state (ssm.StringParameter): The database's published state, or None.
+
+    Methods:
+        __init__: Initializes the SchedulerConstruct with the given parameters.
+    """
+
+    def __init__(self, scope: Stack, args: SchedulerConstructArgs) -> None:
+        """
+        Initializes the SchedulerConstruct with the given parameters.
+
+        Args:
+            scope (Stack): The parent stack.
+            args (SchedulerConstructArgs): The arguments for the construct.
+        """
+        super().__init__(scope, ConstructArgs(args.config, args.uid, args.prefix))
+
+        self.security_group = ec2.SecurityGroup(
+            self,
+            f"{args.config.project_name}-{args.config.environment_name}-scheduler-sg",
+            vpc=args.vpc,
+            allow_all_outbound=True,
+        )
+
+        args.security_group.add_ingress_rule(
+            peer=self.security_group,
+            connection=ec2.Port.tcp(5000),
+            description="Allow warm-up calls from the scheduler",
+        )
+
+        statements = [
+            iam.PolicyStatement(
+                actions=["ecs:DescribeServices", "ecs:UpdateService"],
+                resources=[args.service.service_arn],
+            ),
+            iam.PolicyStatement(
+                actions=[
+                    "application-autoscaling:DescribeScalableTargets",
+                    "application-autoscaling:RegisterScalableTarget",
+                ],
+                resources=["*"],
+            ),
+            iam.PolicyStatement(
+                actions=["s3:GetObject"],
+                resources=[f"{args.bucket.bucket_arn}/shows/shows.json"],
+            ),
+        ]
+        environment = {
+            "BUCKET_NAME": args.bucket.bucket_name,
+            "CLUSTER_NAME": args.cluster.cluster_name,
+            "SERVICE_NAME": args.service.service_name,
+            "RUNTIME_HOST": f"runtime.{args.config.project_name}-{args.config.environment_name}.local",  # pylint: disable=line-too-long
+            "RUNTIME_PORT": "5000",
+            "MIN_TASKS": str(args.config.scaling.min_tasks),
+            "SHOW_TASKS": str(args.config.scaling.show_tasks),
+            "LEAD_MINUTES": str(args.lead_minutes),
+            "LINGER_MINUTES": str(args.linger_minutes),
+        }
+
+        self.db_state = None
+        if args.db_instance is not None:
+            # Available at deployment, the scheduler updates it from its first run
+            self.db_state = ssm.StringParameter(
+                self,
+                "db-state-parameter",
+                parameter_name=f"/{args.config.project_name}-{args.config.environment_name}/db-state",  # pylint: disable=line-too-long
+                string_value="available",
+            )
+            statements += [
+                iam.PolicyStatement(
+                    actions=[
+                        "rds:DescribeDBInstances",
+                        "rds:StartDBInstance",
+                        "rds:StopDBInstance",
+                    ],
+                    resources=[args.db_instance.instance_arn],
+                ),
+                iam.PolicyStatement(
+                    actions=["ssm:GetParameter", "ssm:PutParameter"],
+                    resources=[self.db_state.parameter_arn],
+                ),
+            ]
+            environment.update(
+                {
+                    "DB_INSTANCE": args.db_instance.instance_identifier,
+                    "DB_STATE_PARAMETER": self.db_state.parameter_name,
+                }
+            )
+
+        if args.proxy_alias is not None:
+            statements.append(
+                iam.PolicyStatement(
+                    actions=[
+                        "lambda:GetProvisionedConcurrencyConfig",
+                        "lambda:PutProvisionedConcurrencyConfig",
+                        "lambda:DeleteProvisionedConcurrencyConfig",
+                    ],
+                    resources=[args.proxy_alias.function_arn],
+                )
+            )
+            environment.update(
+                {
+                    "PROXY_FUNCTION": args.proxy_alias.version.lambda_.function_name,
+                    "PROXY_ALIAS": args.proxy_alias.alias_name,
+                    "PROXY_CONCURRENCY": str(args.config.scaling.proxy_concurrency),
+                }
+            )
+
+        role = iam.Role(
+            self,
+            f"{args.config.project_name}-scheduler-lambda-role",
+            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name(
+                    "service-role/AWSLambdaVPCAccessExecutionRole"
+                ),
+            ],
+            inline_policies={
+                "SchedulerPolicy": iam.PolicyDocument(statements=statements)
+            },
+        )
+
+        self.function = _lambda.Function(
+            self,
+            f"{args.config.project_name}-scheduler-lambda",
+            function_name=f"{args.config.project_name}-{args.config.environment_name}-scheduler-lambda",  # pylint: disable=line-too-long
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="index.handler",
+            code=_lambda.Code.from_asset("infra/lambda/scheduler"),
+            role=role,
+            vpc=args.vpc,
+            security_groups=[self.security_group],
+            # Long enough to wait for the database and warm the tasks up
+            timeout=Duration.minutes(3),
+            environment=environment,
+        )
+
+        events.Rule(
+            self,
+            "scheduler-rule",
+            schedule=events.Schedule.rate(Duration.minutes(5)),
+            targets=[targets.LambdaFunction(self.function)],
+        )
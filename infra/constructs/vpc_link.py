@@ -0,0 +1,130 @@
+"""
+This module contains the VpcLinkConstruct class, which routes the HTTP API
+straight to the runtime service's tasks, without the proxy Lambda.
+
+Classes:
+    VpcLinkConstruct: A construct that sets up a VPC Link private integration.
+
+Usage example:
+    vpc_link_construct = VpcLinkConstruct(scope, VpcLinkConstructArgs(config, vpc,
+        http_api, service, security_group))
+"""
+
+from aws_cdk import aws_apigatewayv2 as apigwv2
+from aws_cdk import aws_apigatewayv2_integrations as integrations
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_servicediscovery as servicediscovery
+
+from infra.config import Config
+from infra.constructs.construct import Construct, ConstructArgs
+from infra.stacks.stack import Stack
+
+# Read by the runtime's rate limits, see backend.flask.limits.limiter.client_ip
+CLIENT_IP_HEADER = "X-Client-Ip"
+
+
+class VpcLinkConstructArgs(ConstructArgs):  # pylint: disable=too-few-public-methods
+    """
+    Arguments for the VpcLinkConstruct class.
+
+    Attributes:
+        config: Configuration object.
+        vpc (ec2.IVpc): The VPC the runtime tasks run in.
+        http_api (apigwv2.IHttpApi): The HTTP API to route.
+        service (servicediscovery.IService): The runtime tasks' Cloud Map service.
+        security_group (ec2.ISecurityGroup): The runtime tasks' security group.
+        uid: The ID of the construct.
+            Defaults to "vpc-link".
+        prefix: The prefix for resource names.
+            Defaults to f"{config.project_name}-{config.environment_name}-".
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        config: Config,
+        vpc: ec2.IVpc,
+        http_api: apigwv2.IHttpApi,
+        service: servicediscovery.IService,
+        security_group: ec2.ISecurityGroup,
+        uid: str = "vpc-link",
+        prefix: str = "",
+    ) -> None:
+        super().__init__(config, uid, prefix)
+        self.vpc = vpc
+        self.http_api = http_api
+        self.service = service
+        self.security_group = security_group
+
+
+class VpcLinkConstruct(Construct):
+    """
+    A construct that routes every path of the HTTP API through a VPC Link to the
+    runtime service's Cloud Map registrations.
+
+    API Gateway calls a healthy task itself, overwriting X-Client-Ip with the
+    address it was called from as the proxy Lambda does, so the rate limits key
+    on an address the client cannot forge. The routes take precedence over the
+    API's default route, so removing this construct falls back to the Lambda.
+
+    Attributes:
+        security_group (ec2.SecurityGroup): The VPC Link's security group.
+        vpc_link (apigwv2.VpcLink): The VPC Link.
+        routes (list[apigwv2.HttpRoute]): The routes to the runtime service.
+
+    Methods:
+        __init__: Initializes the VpcLinkConstruct with the given parameters.
+    """
+
+    def __init__(self, scope: Stack, args: VpcLinkConstructArgs) -> None:
+        """
+        Initializes the VpcLinkConstruct with the given parameters.
+
+        Args:
+            scope (Stack): The parent stack.
+            args (VpcLinkConstructArgs): The arguments for the construct.
+        """
+        super().__init__(scope, ConstructArgs(args.config, args.uid, args.prefix))
+
+        self.security_group = ec2.SecurityGroup(
+            self,
+            f"{args.config.project_name}-{args.config.environment_name}-vpc-link-sg",
+            vpc=args.vpc,
+            allow_all_outbound=True,
+        )
+
+        args.security_group.add_ingress_rule(
+            peer=self.security_group,
+            connection=ec2.Port.tcp(5000),
+            description="Allow Flask traffic from API Gateway",
+        )
+
+        self.vpc_link = apigwv2.VpcLink(
+            self,
+            "vpc-link",
+            vpc_link_name=f"{args.config.project_name}-{args.config.environment_name}-vpc-link",
+            vpc=args.vpc,
+            # The tasks' private subnets
+            subnets=ec2.SubnetSelection(),
+            security_groups=[self.security_group],
+        )
+
+        integration = integrations.HttpServiceDiscoveryIntegration(
+            f"{args.config.project_name}-runtime-integration",
+            args.service,
+            vpc_link=self.vpc_link,
+            parameter_mapping=apigwv2.ParameterMapping().overwrite_header(
+                CLIENT_IP_HEADER, apigwv2.MappingValue.context_variable("identity.sourceIp")
+            ),
+        )
+
+        # "/{proxy+}" does not match the root path, so it gets a route of its own
+        self.routes = [
+            apigwv2.HttpRoute(
+                self,
+                f"{name}-route",
+                http_api=args.http_api,
+                route_key=apigwv2.HttpRouteKey.with_(path, apigwv2.HttpMethod.ANY),
+                integration=integration,
+            )
+            for name, path in (("root", "/"), ("proxy", "/{proxy+}"))
+        ]
@@ -70,6 +70,12 @@ class SqlDeploymentConstruct(Construct):
         """
         super().__init__(scope, ConstructArgs(args.config, args.uid, args.prefix))
 
+        bucket_name = (
+            f"{args.config.project_name.lower() if args.config.project_name else None}-"
+            f"{args.config.environment_name.lower() if args.config.environment_name else None}"
+            "-bucket"
+        )
+
         policy = iam.ManagedPolicy(
             self,
             "sql-task-policy",
@@ -88,6 +94,11 @@ class SqlDeploymentConstruct(Construct):
                     actions=["rds-db:connect"],
                     resources=[args.db_instance.instance_arn],
                 ),
+                # Database snapshots, see snapshot.py
+                iam.PolicyStatement(
+                    actions=["s3:GetObject", "s3:PutObject"],
+                    resources=[f"arn:aws:s3:::{bucket_name}/snapshots/*"],
+                ),
             ],
         )
 
@@ -120,22 +131,7 @@ class SqlDeploymentConstruct(Construct):
             image=ecs.ContainerImage.from_asset(
                 "infra", file="deployment/sql/Dockerfile"
             ),
-            command=[
-                "sh",
-                "-c",
-                'echo "Running entrypoints.sql"; '
-                "psql postgresql://$DB_USER:$DB_PASSWORD@$DB_HOST:5432/throwbackrequestlive "
-                "-f /schema/entrypoints.sql; "
-                'echo "Running songs.sql"; '
-                "psql postgresql://$DB_USER:$DB_PASSWORD@$DB_HOST:5432/throwbackrequestlive "
-                "-f /schema/songs.sql; "
-                'echo "Running requests.sql"; '
-                "psql postgresql://$DB_USER:$DB_PASSWORD@$DB_HOST:5432/throwbackrequestlive "
-                "-f /schema/requests.sql; "
-                'echo "Running submissions.sql"; '
-                "psql postgresql://$DB_USER:$DB_PASSWORD@$DB_HOST:5432/throwbackrequestlive "
-                "-f /schema/submissions.sql;",
-            ],
+            command=["python3", "/schema/migrate.py"],
             logging=ecs.LogDrivers.aws_logs(
                 stream_prefix="sql-deployment",
                 log_group=log_group,
@@ -150,5 +146,8 @@ class SqlDeploymentConstruct(Construct):
             },
             environment={
                 "DB_HOST": args.db_instance.db_instance_endpoint_address,
+                "DB_PORT": args.db_instance.db_instance_endpoint_port,
+                "DB_NAME": "throwbackrequestlive",
+                "BUCKET_NAME": bucket_name,
             },
         )
@@ -0,0 +1,254 @@
+"""
+This script applies the versioned schema migrations to the database.
+
+Migrations are the NNNN_<name>.sql files in the migrations directory, applied in
+version order and recorded in the schema_migrations table, so running the script
+again only applies the new ones. Each migration runs in a transaction together
+with its version row, unless it starts with a "-- migrate: no-transaction"
+line, which CREATE INDEX CONCURRENTLY needs. Those migrations run statement by
+statement and must be idempotent, e.g. with IF NOT EXISTS, so an interrupted run
+can be retried; indexes a failed concurrent build left invalid are dropped and
+rebuilt on the retry. An advisory lock keeps concurrent deployments from
+applying the same migration twice.
+
+Usage:
+    python migrate.py [--dir <migrations>] [--dry-run]
+"""
+
+import argparse
+import hashlib
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import psycopg
+
+FILENAME = re.compile(r"^(\d{4})_(\w+)\.sql$")
+NO_TRANSACTION = "-- migrate: no-transaction"
+CONCURRENT_INDEX = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)",
+    re.IGNORECASE,
+)
+LOCK_ID = 73_617_002  # Any constant shared by every runner.
+
+
+class MigrationError(Exception):
+    """Raised when the migrations cannot be applied safely."""
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    A schema migration.
+
+    Attributes:
+        version (str): Its version, the file's four digit prefix.
+        name (str): Its name.
+        sql (str): Its statements.
+    """
+
+    version: str
+    name: str
+    sql: str
+
+    @property
+    def transactional(self) -> bool:
+        """Whether it runs in a single transaction."""
+        return not self.sql.lstrip().lower().startswith(NO_TRANSACTION)
+
+    @property
+    def checksum(self) -> str:
+        """The SHA-256 of its statements, to detect edits once applied."""
+        return hashlib.sha256(self.sql.encode("utf-8")).hexdigest()
+
+    def statements(self) -> List[str]:
+        """
+        Split the migration into statements.
+
+        Only "--" comments and ";" at the end of a statement are understood, which
+        is all the plain DDL of a no-transaction migration needs.
+
+        Returns:
+            List[str]: The statements, without their terminating ";".
+        """
+        lines = [
+            line for line in self.sql.splitlines() if not line.strip().startswith("--")
+        ]
+        return [
+            statement.strip()
+            for statement in "\n".join(lines).split(";")
+            if statement.strip()
+        ]
+
+    def concurrent_indexes(self) -> List[str]:
+        """The indexes it builds concurrently."""
+        return CONCURRENT_INDEX.findall(self.sql)
+
+
+def discover(directory: str) -> List[Migration]:
+    """
+    Read the migrations from a directory.
+
+    Args:
+        directory (str): The migrations directory.
+
+    Returns:
+        List[Migration]: The migrations, by version.
+    """
+    migrations: Dict[str, Migration] = {}
+    for filename in sorted(os.listdir(directory)):
+        match = FILENAME.match(filename)
+        if not match:
+            continue
+        version, name = match.groups()
+        if version in migrations:
+            raise MigrationError(f"Duplicate migration version {version}.")
+        with open(os.path.join(directory, filename), encoding="utf-8") as file:
+            migrations[version] = Migration(version, name, file.read())
+    return list(migrations.values())
+
+
+def pending(migrations: List[Migration], applied: Dict[str, str]) -> List[Migration]:
+    """
+    Select the migrations still to apply.
+
+    Args:
+        migrations (List[Migration]): All migrations.
+        applied (dict): The checksums of the applied migrations, by version.
+
+    Returns:
+        List[Migration]: The migrations not applied yet.
+
+    Raises:
+        MigrationError: If an applied migration has since been edited.
+    """
+    for migration in migrations:
+        checksum = applied.get(migration.version)
+        if checksum is not None and checksum != migration.checksum:
+            raise MigrationError(
+                f"Migration {migration.version}_{migration.name} changed after it "
+                "was applied, add a new migration instead."
+            )
+    return [migration for migration in migrations if migration.version not in applied]
+
+
+def _applied(connection: psycopg.Connection) -> Dict[str, str]:
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version VARCHAR PRIMARY KEY,
+            name VARCHAR NOT NULL,
+            checksum VARCHAR NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT NOW()
+        )
+        """
+    )
+    rows = connection.execute("SELECT version, checksum FROM schema_migrations")
+    return dict(rows.fetchall())
+
+
+def _record(connection: psycopg.Connection, migration: Migration) -> None:
+    connection.execute(
+        "INSERT INTO schema_migrations (version, name, checksum) VALUES (%s, %s, %s)",
+        (migration.version, migration.name, migration.checksum),
+    )
+
+
+def _drop_invalid_indexes(connection: psycopg.Connection, migration: Migration) -> None:
+    names = migration.concurrent_indexes()
+    if not names:
+        return
+    rows = connection.execute(
+        """
+        SELECT c.relname
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE NOT i.indisvalid AND c.relname = ANY(%s)
+        """,
+        (names,),
+    )
+    for (name,) in rows.fetchall():
+        print(f"Dropping invalid index {name} left by an interrupted build.")
+        connection.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+
+def apply(connection: psycopg.Connection, migration: Migration) -> None:
+    """
+    Apply a migration and record its version.
+
+    Args:
+        connection (psycopg.Connection): An autocommit connection.
+        migration (Migration): The migration.
+    """
+    if migration.transactional:
+        with connection.transaction():
+            connection.execute(migration.sql)
+            _record(connection, migration)
+        return
+
+    _drop_invalid_indexes(connection, migration)
+    for statement in migration.statements():
+        connection.execute(statement)
+    _record(connection, migration)
+
+
+def migrate(
+    connection: psycopg.Connection, migrations: List[Migration], dry_run: bool = False
+) -> List[Migration]:
+    """
+    Apply the pending migrations.
+
+    Args:
+        connection (psycopg.Connection): An autocommit connection.
+        migrations (List[Migration]): All migrations.
+        dry_run (bool): Only report the pending migrations.
+
+    Returns:
+        List[Migration]: The migrations applied, or pending on a dry run.
+    """
+    connection.execute("SELECT pg_advisory_lock(%s)", (LOCK_ID,))
+    try:
+        todo = pending(migrations, _applied(connection))
+        for migration in todo:
+            print(f"{'Pending' if dry_run else 'Applying'} {migration.version}_{migration.name}")
+            if not dry_run:
+                apply(connection, migration)
+        if not todo:
+            print("Schema is up to date.")
+        return todo
+    finally:
+        connection.execute("SELECT pg_advisory_unlock(%s)", (LOCK_ID,))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Apply the migrations to the database configured by the environment."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--dir",
+        default=os.getenv(
+            "MIGRATIONS_DIR",
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations"),
+        ),
+        help="The migrations directory.",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="List the pending migrations only."
+    )
+    args = parser.parse_args(argv)
+
+    with psycopg.connect(
+        host=os.environ["DB_HOST"],
+        port=os.getenv("DB_PORT", "5432"),
+        dbname=os.getenv("DB_NAME", "throwbackrequestlive"),
+        user=os.environ["DB_USER"],
+        password=os.environ["DB_PASSWORD"],
+        autocommit=True,
+        # Lift the database's default statement timeout, which is sized for the app
+        options="-c statement_timeout=0",
+    ) as connection:
+        migrate(connection, discover(args.dir), args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+"""
+This script parks the database in S3 and brings it back, so the RDS instance only
+has to run during shows.
+
+export streams every application table with COPY ... TO STDOUT into a gzipped
+object under snapshots/<name>/ in the project bucket, one object per table or
+partition, and writes a manifest.json once all of them are uploaded. Tables are
+exported in parallel from a single exported snapshot, so they are consistent
+with each other. The asset sync in push_to_s3.yml excludes snapshots/, so its
+--delete leaves them in place.
+
+restore expects a fresh instance migrated to the snapshot's schema version by
+migrate.py. It creates the partitions and archived tables the snapshot has and
+the schema lacks, drops the primary keys and indexes, loads the tables in
+parallel with COPY ... FROM STDIN, then recreates the primary keys and indexes
+and analyzes the tables, which is much faster than loading into indexed tables.
+
+Usage:
+    python snapshot.py export [--name <name>] [--jobs <n>]
+    python snapshot.py restore --name <name> [--jobs <n>]
+
+Run it as the SQL deployment task, overriding its command, e.g.
+    aws ecs run-task ... --overrides '{"containerOverrides": [{"name":
+        "sql-container", "command": ["python3", "/schema/snapshot.py", "export"]}]}'
+"""
+
+import argparse
+import gzip
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import boto3
+import psycopg
+
+SCHEMAS = ("public", "archive")
+EXCLUDED = ("schema_migrations",)
+CHUNK_SIZE = 1024 * 1024
+MANIFEST_VERSION = 1
+
+Connect = Callable[[], psycopg.Connection]
+
+
+@dataclass
+class Column:
+    """
+    A table column, to create tables the schema lacks.
+
+    Attributes:
+        name (str): Its name.
+        type (str): Its SQL type.
+        not_null (bool): Whether it is NOT NULL.
+        default (str, optional): Its default expression.
+    """
+
+    name: str
+    type: str
+    not_null: bool = False
+    default: Optional[str] = None
+
+    def definition(self) -> str:
+        """The column's definition in a CREATE TABLE statement."""
+        definition = f'"{self.name}" {self.type}'
+        if self.not_null:
+            definition += " NOT NULL"
+        if self.default is not None:
+            definition += f" DEFAULT {self.default}"
+        return definition
+
+
+@dataclass
+class Table:
+    """
+    A table or partition in a snapshot.
+
+    Attributes:
+        schema (str): Its schema.
+        name (str): Its name.
+        columns (List[Column]): Its columns.
+        parent (str, optional): The qualified partitioned table it belongs to.
+        bound (str, optional): Its partition bound, e.g. "FOR VALUES IN ('abc')".
+        rows (int): The rows exported.
+        bytes (int): The size of its compressed object.
+    """
+
+    schema: str
+    name: str
+    columns: List[Column] = field(default_factory=list)
+    parent: Optional[str] = None
+    bound: Optional[str] = None
+    rows: int = 0
+    bytes: int = 0
+
+    @property
+    def qualified(self) -> str:
+        """Its quoted, schema qualified name."""
+        return f'"{self.schema}"."{self.name}"'
+
+    def key(self, prefix: str) -> str:
+        """The key of its object under a snapshot prefix."""
+        return f"{prefix}/{self.schema}.{self.name}.copy.gz"
+
+    def create_statement(self) -> str:
+        """The statement creating it when the schema lacks it."""
+        if self.parent is not None:
+            return f"CREATE TABLE {self.qualified} PARTITION OF {self.parent} {self.bound}"
+        columns = ", ".join(column.definition() for column in self.columns)
+        return f"CREATE TABLE {self.qualified} ({columns})"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Table":
+        """Read a table from its manifest entry."""
+        columns = [Column(**column) for column in data.pop("columns", [])]
+        return cls(columns=columns, **data)
+
+
+def connect() -> psycopg.Connection:
+    """Connect to the database configured by the environment."""
+    return psycopg.connect(
+        host=os.environ["DB_HOST"],
+        port=os.getenv("DB_PORT", "5432"),
+        dbname=os.getenv("DB_NAME", "throwbackrequestlive"),
+        user=os.environ["DB_USER"],
+        password=os.environ["DB_PASSWORD"],
+        autocommit=True,
+        # Lift the database's default statement timeout, which is sized for the app
+        options="-c statement_timeout=0",
+    )
+
+
+def schema_version(connection: psycopg.Connection) -> Optional[str]:
+    """The latest migration applied to the database."""
+    if connection.execute("SELECT to_regclass('public.schema_migrations')").fetchone()[0] is None:
+        return None
+    return connection.execute("SELECT MAX(version) FROM schema_migrations").fetchone()[0]
+
+
+def list_tables(connection: psycopg.Connection) -> List[Table]:
+    """
+    List the application tables holding rows.
+
+    Partitioned tables hold none themselves, so their partitions are listed.
+
+    Args:
+        connection (psycopg.Connection): The connection.
+
+    Returns:
+        List[Table]: The tables and partitions.
+    """
+    rows = connection.execute(
+        """
+        SELECT n.nspname, c.relname, c.oid,
+            format('%%I.%%I', pn.nspname, p.relname),
+            pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        LEFT JOIN pg_inherits i ON i.inhrelid = c.oid AND c.relispartition
+        LEFT JOIN pg_class p ON p.oid = i.inhparent
+        LEFT JOIN pg_namespace pn ON pn.oid = p.relnamespace
+        WHERE c.relkind = 'r' AND n.nspname = ANY(%s) AND NOT c.relname = ANY(%s)
+        ORDER BY c.relispartition, n.nspname, c.relname
+        """,
+        (list(SCHEMAS), list(EXCLUDED)),
+    ).fetchall()
+
+    tables = []
+    for schema, name, oid, parent, bound in rows:
+        columns = connection.execute(
+            """
+            SELECT a.attname, format_type(a.atttypid, a.atttypmod), a.attnotnull,
+                pg_get_expr(d.adbin, d.adrelid)
+            FROM pg_attribute a
+            LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+            WHERE a.attrelid = %s AND a.attnum > 0 AND NOT a.attisdropped
+            ORDER BY a.attnum
+            """,
+            (oid,),
+        ).fetchall()
+        tables.append(
+            Table(
+                schema,
+                name,
+                [Column(*column) for column in columns],
+                parent if bound else None,
+                bound,
+            )
+        )
+    return tables
+
+
+def _export_table(
+    connect_: Connect, s3: Any, bucket: str, prefix: str, snapshot: str, table: Table
+) -> Table:
+    with connect_() as connection, tempfile.TemporaryFile() as buffer:
+        with connection.transaction():
+            connection.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            connection.execute(f"SET TRANSACTION SNAPSHOT '{snapshot}'")
+            with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=6) as compressed:
+                with connection.cursor() as cursor:
+                    with cursor.copy(f"COPY {table.qualified} TO STDOUT") as copy:
+                        for data in copy:
+                            compressed.write(data)
+                    table.rows = cursor.rowcount
+        table.bytes = buffer.tell()
+        buffer.seek(0)
+        s3.upload_fileobj(buffer, bucket, table.key(prefix))
+    print(f"Exported {table.qualified}: {table.rows} rows, {table.bytes} bytes")
+    return table
+
+
+def export(
+    connect_: Connect, s3: Any, bucket: str, prefix: str, jobs: int = 4
+) -> Dict[str, Any]:
+    """
+    Export the application tables to S3.
+
+    Args:
+        connect_ (Connect): Opens an autocommit connection.
+        s3: The S3 client.
+        bucket (str): The bucket.
+        prefix (str): The snapshot's key prefix.
+        jobs (int): The tables exported at once.
+
+    Returns:
+        dict: The manifest.
+    """
+    started = time.perf_counter()
+    with connect_() as connection:
+        # Hold the snapshot open until every table is exported from it.
+        with connection.transaction():
+            connection.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            snapshot = connection.execute("SELECT pg_export_snapshot()").fetchone()[0]
+            version = schema_version(connection)
+            tables = list_tables(connection)
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                tables = list(
+                    executor.map(
+                        lambda table: _export_table(
+                            connect_, s3, bucket, prefix, snapshot, table
+                        ),
+                        tables,
+                    )
+                )
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "schema_version": version,
+        "tables": [asdict(table) for table in tables],
+    }
+    s3.put_object(
+        Bucket=bucket,
+        Key=f"{prefix}/manifest.json",
+        Body=json.dumps(manifest, indent=2).encode("utf-8"),
+        ContentType="application/json",
+    )
+    print(f"Exported {len(tables)} tables in {time.perf_counter() - started:.1f}s")
+    return manifest
+
+
+def _deferred(
+    connection: psycopg.Connection, tables: List[Table]
+) -> Tuple[List[Tuple[str, str, str]], List[Tuple[str, str]]]:
+    """List the primary keys, unique constraints and indexes of the top level tables."""
+    names = sorted({table.parent or table.qualified for table in tables})
+    constraints = connection.execute(
+        """
+        SELECT conrelid::regclass::text, quote_ident(conname), pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE conrelid = ANY(%s::regclass[]) AND contype IN ('p', 'u')
+        ORDER BY 1, 2
+        """,
+        (names,),
+    ).fetchall()
+    indexes = connection.execute(
+        """
+        SELECT indexrelid::regclass::text, pg_get_indexdef(indexrelid)
+        FROM pg_index
+        WHERE indrelid = ANY(%s::regclass[])
+            AND NOT EXISTS (
+                SELECT 1 FROM pg_constraint WHERE conindid = pg_index.indexrelid
+            )
+        ORDER BY 1
+        """,
+        (names,),
+    ).fetchall()
+    return constraints, indexes
+
+
+def _restore_table(
+    connect_: Connect, s3: Any, bucket: str, prefix: str, table: Table
+) -> None:
+    with tempfile.TemporaryFile() as buffer:
+        s3.download_fileobj(bucket, table.key(prefix), buffer)
+        buffer.seek(0)
+        with connect_() as connection, connection.cursor() as cursor:
+            with gzip.GzipFile(fileobj=buffer, mode="rb") as compressed:
+                with cursor.copy(f"COPY {table.qualified} FROM STDIN") as copy:
+                    while data := compressed.read(CHUNK_SIZE):
+                        copy.write(data)
+    print(f"Restored {table.qualified}: {table.rows} rows")
+
+
+def _execute(connect_: Connect, statement: str) -> None:
+    with connect_() as connection:
+        connection.execute(statement)
+
+
+def restore(
+    connect_: Connect, s3: Any, bucket: str, prefix: str, jobs: int = 4
+) -> List[Table]:
+    """
+    Restore a snapshot into a freshly migrated database.
+
+    Args:
+        connect_ (Connect): Opens an autocommit connection.
+        s3: The S3 client.
+        bucket (str): The bucket.
+        prefix (str): The snapshot's key prefix.
+        jobs (int): The tables loaded, and indexes built, at once.
+
+    Returns:
+        List[Table]: The restored tables.
+
+    Raises:
+        ValueError: If the database is not migrated to the snapshot's schema
+            version, or already has rows.
+    """
+    started = time.perf_counter()
+    manifest = json.loads(
+        s3.get_object(Bucket=bucket, Key=f"{prefix}/manifest.json")["Body"].read()
+    )
+    if manifest["version"] != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version {manifest['version']}.")
+    tables = [Table.from_dict(table) for table in manifest["tables"]]
+
+    with connect_() as connection:
+        version = schema_version(connection)
+        if version != manifest["schema_version"]:
+            raise ValueError(
+                f"Database is at schema version {version}, the snapshot at "
+                f"{manifest['schema_version']}; migrate it first."
+            )
+
+        for table in tables:
+            if connection.execute(
+                "SELECT to_regclass(%s)", (table.qualified,)
+            ).fetchone()[0] is None:
+                connection.execute(f'CREATE SCHEMA IF NOT EXISTS "{table.schema}"')
+                connection.execute(table.create_statement())
+            elif connection.execute(
+                f"SELECT EXISTS (SELECT 1 FROM {table.qualified})"  # nosec B608
+            ).fetchone()[0]:
+                raise ValueError(f"{table.qualified} already has rows.")
+
+        constraints, indexes = _deferred(connection, tables)
+        for name, _ in indexes:
+            connection.execute(f"DROP INDEX {name}")
+        for table, name, _ in constraints:
+            connection.execute(f"ALTER TABLE {table} DROP CONSTRAINT {name}")
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        list(
+            executor.map(
+                lambda table: _restore_table(connect_, s3, bucket, prefix, table), tables
+            )
+        )
+
+        with connect_() as connection:
+            for table, name, definition in constraints:
+                connection.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition}")
+        list(
+            executor.map(
+                lambda statement: _execute(connect_, statement),
+                # Definitions of partitioned indexes skip the partitions.
+                [definition.replace(" ON ONLY ", " ON ", 1) for _, definition in indexes],
+            )
+        )
+
+    with connect_() as connection:
+        for table in tables:
+            connection.execute(f"ANALYZE {table.qualified}")
+
+    print(f"Restored {len(tables)} tables in {time.perf_counter() - started:.1f}s")
+    return tables
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Export or restore a snapshot of the database configured by the environment."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("command", choices=["export", "restore"])
+    parser.add_argument(
+        "--name",
+        help="The snapshot name, by default the current time on export.",
+    )
+    parser.add_argument(
+        "--bucket",
+        default=os.getenv("BUCKET_NAME"),
+        help="The bucket holding the snapshots.",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=4, help="The tables processed at once."
+    )
+    args = parser.parse_args(argv)
+    if not args.bucket:
+        parser.error("--bucket or BUCKET_NAME is required.")
+    if args.command == "restore" and not args.name:
+        parser.error("--name is required to restore.")
+
+    name = args.name or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    prefix = f"snapshots/{name}"
+    s3 = boto3.client("s3")
+    if args.command == "export":
+        export(connect, s3, args.bucket, prefix, args.jobs)
+    else:
+        restore(connect, s3, args.bucket, prefix, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
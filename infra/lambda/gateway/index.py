@@ -1,52 +1,182 @@
-import os
+"""
+Proxy API Gateway requests to the runtime service.
+
+Only the standard library is imported, and everything that does not change
+between requests is set up at import, so a cold start has little to do before
+forwarding its first request.
+"""
+
 import base64
-import requests
-from urllib.parse import urljoin, urlencode, urlparse
+import json
+import os
+import re
+import secrets
+import time
+from http.client import HTTPConnection, HTTPException, RemoteDisconnected
+from urllib.parse import urlencode, urlsplit
 
 HOP_BY_HOP = {
     "connection", "keep-alive", "proxy-authenticate",
     "proxy-authorization", "te", "trailers", "transfer-encoding", "upgrade"
 }
 
+TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# Methods safe to send again when a kept-alive connection turns out to be closed
+IDEMPOTENT = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# A kept-alive connection idle longer than this may have been closed upstream,
+# so a request that cannot be sent again goes on a new one
+IDLE_SECONDS = 1.0
+
+# Less than the function's timeout, so a slow upstream gets a 504, not a timeout
+UPSTREAM_TIMEOUT = float(os.environ.get("UPSTREAM_TIMEOUT", "25"))
+
+UPSTREAM = urlsplit(os.environ.get("FARGATE_URL", ""))
+TRACE_EXPORT = os.environ.get("TRACE_EXPORT")
+
+# The connection is kept between invocations of the execution environment
+_connection = None  # pylint: disable=invalid-name
+_last_used = 0.0  # pylint: disable=invalid-name
+
+
+def trace_context(headers):
+    """Continue the caller's W3C trace context, or start a new trace."""
+    value = next((v for k, v in headers.items() if k.lower() == "traceparent"), "")
+    match = TRACEPARENT.match(value.strip().lower())
+    if match and set(match.group(1)) != {"0"} and set(match.group(2)) != {"0"}:
+        return match.group(1), match.group(2), match.group(3)
+    return secrets.token_hex(16), None, "01"
+
+
+def connection():
+    """The connection to the runtime service, opened on first use."""
+    global _connection  # pylint: disable=global-statement
+    if _connection is None:
+        _connection = HTTPConnection(
+            UPSTREAM.hostname, UPSTREAM.port or 80, timeout=UPSTREAM_TIMEOUT
+        )
+    return _connection
+
+
+def forward(method, target, headers, body):
+    """Send a request upstream and read its response."""
+    global _connection, _last_used  # pylint: disable=global-statement
+    retry = method in IDEMPOTENT
+    if not retry and _connection is not None and time.monotonic() - _last_used > IDLE_SECONDS:
+        _connection.close()
+        _connection = None
+    while True:
+        conn = connection()
+        try:
+            conn.request(method, target, body=body, headers=headers)
+            response = conn.getresponse()
+            content = response.read()
+            _last_used = time.monotonic()
+            return response, content
+        except (RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            _connection = None
+            if not retry:
+                raise
+            retry = False
+        except (HTTPException, OSError):
+            conn.close()
+            _connection = None
+            raise
+
+
 def handler(event, context):
-    fargate_url = os.environ.get("FARGATE_URL")
-    if not fargate_url:
+    started = time.perf_counter()
+    if not UPSTREAM.hostname:
         return {"statusCode": 500, "body": "FARGATE_URL not set"}
-    
+
     method = event.get("httpMethod") or event.get("requestContext", {}).get("http", {}).get("method")
     path = event.get("path", event.get("rawPath", "/"))
-    qs = event.get("queryStringParameters") or {}
-    raw_qs = urlencode(qs)
-    target = urljoin(fargate_url, path)
-    if raw_qs:
-        target = f"{target}?{raw_qs}"
-    
+    query = event.get("rawQueryString") or urlencode(event.get("queryStringParameters") or {})
+    target = f"{path}?{query}" if query else path
+
     headers = {k: v for k, v in (event.get("headers") or {}).items()
                if k and k.lower() not in HOP_BY_HOP and k.lower() != "host"}
+    # Payload format 2.0 passes the cookies apart from the headers
+    if cookies := event.get("cookies"):
+        headers["Cookie"] = "; ".join(cookies)
 
-    if source := event.get("requestContext", {}).get("http", {}).get("sourceIp"):
-        xff = headers.get("X-Forwarded-For")
+    # The client cannot forge X-Client-Ip, which the runtime's rate limits read and
+    # which keeps its internal endpoints off the API, so it is set on every request
+    headers = {k: v for k, v in headers.items() if k.lower() != "x-client-ip"}
+    source = event.get("requestContext", {}).get("http", {}).get("sourceIp")
+    if source:
+        xff = next((v for k, v in headers.items() if k.lower() == "x-forwarded-for"), None)
+        headers = {k: v for k, v in headers.items() if k.lower() != "x-forwarded-for"}
         headers["X-Forwarded-For"] = f"{xff}, {source}" if xff else source
+    headers["X-Client-Ip"] = source or "unknown"
+
+    trace_id, parent_id, flags = trace_context(headers)
+    span_id = secrets.token_hex(8)
+    headers = {k: v for k, v in headers.items() if k.lower() != "traceparent"}
+    headers["traceparent"] = f"00-{trace_id}-{span_id}-{flags}"
 
     body = event.get("body")
-    data = base64.b64decode(body) if event.get("isBase64Encoded") else body or None
-    
-    resp = requests.request(method, target, headers=headers, data=data, stream=True, allow_redirects=False)
-    
-    resp_headers = {k: v for k, v in resp.raw.headers.items()
-                    if k.lower() not in HOP_BY_HOP}
-    
+    if event.get("isBase64Encoded"):
+        data = base64.b64decode(body)
+    else:
+        data = body.encode("utf-8") if body else None
+
+    upstream_started = time.perf_counter()
+    try:
+        resp, content = forward(method, target, headers, data)
+    except TimeoutError:
+        return {"statusCode": 504, "body": "Upstream timed out"}
+    except (HTTPException, OSError):
+        return {"statusCode": 502, "body": "Upstream unavailable"}
+    upstream = time.perf_counter() - upstream_started
+
+    resp_headers, set_cookies, timings = {}, [], []
+    for k, v in resp.getheaders():
+        name = k.lower()
+        if name == "set-cookie":
+            set_cookies.append(v)
+        elif name == "server-timing":
+            timings += [t.strip() for t in v.split(",") if t.strip()]
+        elif name not in HOP_BY_HOP:
+            resp_headers[k] = v
+
     try:
-        text = resp.content.decode("utf-8")
+        body_out = content.decode("utf-8")
         is_b64 = False
-        body_out = text
-    except:
+    except UnicodeDecodeError:
+        body_out = base64.b64encode(content).decode("ascii")
         is_b64 = True
-        body_out = base64.b64encode(resp.content).decode("ascii")
 
-    return {
-        "statusCode": resp.status_code,
+    # The proxy's own time less the upstream round trip is the Lambda hop's overhead,
+    # and the upstream round trip less the app's time is the network to Fargate.
+    duration = time.perf_counter() - started
+    timings += [f"upstream;dur={upstream * 1000:.1f}", f"proxy;dur={duration * 1000:.1f}"]
+    resp_headers["Server-Timing"] = ", ".join(timings)
+    resp_headers["traceparent"] = headers["traceparent"]
+
+    if TRACE_EXPORT == "stdout":
+        print(json.dumps({
+            "name": f"proxy {method} {path}",
+            "category": "proxy",
+            "trace_id": trace_id,
+            "span_id": span_id,
+            "parent_id": parent_id,
+            "duration": duration,
+            "attributes": {
+                "status": resp.status,
+                "upstream": upstream,
+                "request_id": getattr(context, "aws_request_id", None),
+            },
+        }))
+
+    response = {
+        "statusCode": resp.status,
         "headers": resp_headers,
         "body": body_out,
         "isBase64Encoded": is_b64
     }
+    if set_cookies:
+        response["cookies"] = set_cookies
+    return response
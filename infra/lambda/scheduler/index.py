@@ -0,0 +1,288 @@
+"""
+Scale the runtime service for the show schedule and warm its tasks up.
+
+Runs every few minutes. From LEAD_MINUTES before a show starts until
+LINGER_MINUTES after it ends the service's minimum task count is held at
+SHOW_TASKS, or at the tasks running if more, so autoscaling cannot scale in
+mid-show. A show time without a UTC offset is taken to span every zone it may
+have been written in, so the window covers the show wherever it is. Outside
+the window the minimum is MIN_TASKS and autoscaling scales in as traffic drops.
+During a show every task is asked to warm up, including ones started since the
+last run.
+
+With DB_INSTANCE set the database instance is parked too: started for the same
+window, polled until it is available, and stopped afterwards. Its state is
+published to the DB_STATE_PARAMETER SSM parameter, which the tasks read to stop
+querying it before it is stopped and to start again once it is available. AWS
+starts an instance that has been stopped for seven days; the next run outside a
+show stops it again.
+
+Outside a show the tasks are asked how many request segments they have spooled
+while the database was down. Until those are replayed the service is held as
+during a show, neither scaled in nor left without its database, as the spool is
+only replayed into a running database.
+
+With PROXY_FUNCTION set, PROXY_CONCURRENCY environments of the proxy Lambda's
+PROXY_ALIAS are kept initialized for the same window, and none otherwise.
+"""
+
+import json
+import os
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from http.client import HTTPConnection, HTTPException
+
+import boto3
+from botocore.exceptions import ClientError
+
+WARM_UP_PATH = "/health/warm"
+SPOOL_PATH = "/health/spool"
+AVAILABLE = "available"
+STOPPED = "stopped"
+POLL_SECONDS = 10
+
+# The span of UTC offsets a show time without one may have been written in
+EARLIEST_OFFSET = timedelta(hours=14)
+LATEST_OFFSET = timedelta(hours=12)
+
+
+def window(show):
+    """
+    The earliest a show may start and the latest it may end.
+
+    A time with an offset names an instant. One without, written before the form
+    sent offsets, is the venue's wall time in an unknown zone, so it may be as
+    early as UTC+14:00 or as late as UTC-12:00.
+    """
+    start = datetime.fromisoformat(show["start_time"])
+    end = datetime.fromisoformat(show["end_time"])
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc) - EARLIEST_OFFSET
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc) + LATEST_OFFSET
+    return start, end
+
+
+def showtime(shows, now, lead, linger):
+    """Whether a show is on, or about to start, at the given time."""
+    for show in shows:
+        if show.get("name") == "DEMO":
+            continue
+        try:
+            start, end = window(show)
+        except (KeyError, TypeError, ValueError):
+            print(f"Skipping show without valid times: {show.get('hash')}")
+            continue
+        if start - lead <= now <= end + linger:
+            return True
+    return False
+
+
+def load_shows(s3, bucket):
+    response = s3.get_object(Bucket=bucket, Key="shows/shows.json")
+    return json.loads(response["Body"].read())
+
+
+def scale(autoscaling, ecs, cluster, service, floor, on):
+    """
+    Set the service's minimum task count. During a show it is never below the
+    tasks running, e.g. ones added by autoscaling, so none are taken away.
+    """
+    current = ecs.describe_services(cluster=cluster, services=[service])["services"][0]
+    count = current["desiredCount"]
+    minimum = max(floor, count) if on else floor
+    autoscaling.register_scalable_target(
+        ServiceNamespace="ecs",
+        ResourceId=f"service/{cluster}/{service}",
+        ScalableDimension="ecs:service:DesiredCount",
+        MinCapacity=minimum,
+    )
+    if count < minimum:
+        ecs.update_service(cluster=cluster, service=service, desiredCount=minimum)
+        count = minimum
+    return minimum, count
+
+
+def db_status(rds, instance):
+    response = rds.describe_db_instances(DBInstanceIdentifier=instance)
+    return response["DBInstances"][0]["DBInstanceStatus"]
+
+
+def publish(ssm, parameter, state):
+    """Publish the database's state, unless it is already published."""
+    try:
+        if ssm.get_parameter(Name=parameter)["Parameter"]["Value"] == state:
+            return
+    except ClientError:
+        pass
+    ssm.put_parameter(Name=parameter, Value=state, Type="String", Overwrite=True)
+
+
+def park(rds, ssm, instance, parameter, on, timeout):  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    """
+    Start the database for a show, waiting up to timeout seconds for it to be
+    available, and stop it otherwise. Returns its status.
+    """
+    status = db_status(rds, instance)
+    if on:
+        deadline = time.monotonic() + timeout
+        while True:
+            if status == STOPPED:
+                rds.start_db_instance(DBInstanceIdentifier=instance)
+                status = "starting"
+            if status == AVAILABLE or time.monotonic() >= deadline:
+                break
+            time.sleep(POLL_SECONDS)
+            status = db_status(rds, instance)
+    elif status == AVAILABLE:
+        # The tasks stop querying before the instance goes away
+        publish(ssm, parameter, "stopping")
+        try:
+            rds.stop_db_instance(DBInstanceIdentifier=instance)
+            status = "stopping"
+        except ClientError as e:
+            print(f"Could not stop {instance}: {e}")
+    publish(ssm, parameter, status)
+    return status
+
+
+def provision(lambda_, function, alias, concurrency, on):  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    """
+    Provision concurrency on the proxy Lambda's alias for a show, and remove it
+    otherwise. Returns the provisioned concurrency requested.
+    """
+    try:
+        current = lambda_.get_provisioned_concurrency_config(
+            FunctionName=function, Qualifier=alias
+        )["RequestedProvisionedConcurrentExecutions"]
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "ProvisionedConcurrencyConfigNotFoundException":
+            raise
+        current = 0
+
+    wanted = concurrency if on else 0
+    if wanted == current:
+        return current
+    try:
+        if wanted:
+            lambda_.put_provisioned_concurrency_config(
+                FunctionName=function,
+                Qualifier=alias,
+                ProvisionedConcurrentExecutions=wanted,
+            )
+        else:
+            lambda_.delete_provisioned_concurrency_config(FunctionName=function, Qualifier=alias)
+    except ClientError as e:
+        print(f"Could not provision {function}:{alias}: {e}")
+        return current
+    return wanted
+
+
+def tasks(host, port):
+    """The addresses of the tasks registered under the service's DNS name."""
+    try:
+        return sorted(
+            {info[4][0] for info in socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)}
+        )
+    except socket.gaierror as e:
+        print(f"No tasks found for {host}: {e}")
+        return []
+
+
+def call(address, port, method, path, timeout):
+    """Call a task directly, over plain HTTP inside the VPC, for its status and body."""
+    connection = HTTPConnection(address, port, timeout=timeout)
+    try:
+        connection.request(method, path, body=b"" if method == "POST" else None)
+        response = connection.getresponse()
+        return response.status, response.read()
+    finally:
+        connection.close()
+
+
+def spooled(host, port, timeout):
+    """
+    Ask every task how many spooled request segments wait to be replayed. A task
+    that does not answer is reported with its error, and counts as none pending.
+    """
+    results = {}
+    for address in tasks(host, port):
+        try:
+            _, body = call(address, port, "GET", SPOOL_PATH, timeout)
+            results[address] = int(json.loads(body)["pending"])
+        except (HTTPException, OSError, ValueError, KeyError) as e:
+            results[address] = str(e)
+    return results
+
+
+def warm(host, port, timeout):
+    """Ask every task registered under the service's DNS name to warm up."""
+    addresses = tasks(host, port)
+    results = {}
+    for address in addresses:
+        try:
+            results[address] = call(address, port, "POST", WARM_UP_PATH, timeout)[0]
+        except (HTTPException, OSError) as e:
+            results[address] = str(e)
+    return results
+
+
+def handler(event, context):
+    now = datetime.now(timezone.utc)
+    lead = timedelta(minutes=int(os.environ.get("LEAD_MINUTES", "30")))
+    linger = timedelta(minutes=int(os.environ.get("LINGER_MINUTES", "30")))
+
+    shows = load_shows(boto3.client("s3"), os.environ["BUCKET_NAME"])
+    on = showtime(shows, now, lead, linger)
+    host = os.environ["RUNTIME_HOST"]
+    port = int(os.environ.get("RUNTIME_PORT", "5000"))
+    timeout = float(os.environ.get("WARM_UP_TIMEOUT", "20"))
+
+    # Spooled requests are lost with the task, or never replayed without the database
+    spool = {} if on else spooled(host, port, timeout)
+    held = on or any(isinstance(count, int) and count > 0 for count in spool.values())
+    floor = int(os.environ.get("SHOW_TASKS" if held else "MIN_TASKS", "1"))
+
+    minimum, count = scale(
+        boto3.client("application-autoscaling"),
+        boto3.client("ecs"),
+        os.environ["CLUSTER_NAME"],
+        os.environ["SERVICE_NAME"],
+        floor,
+        held,
+    )
+    database = None
+    if os.environ.get("DB_INSTANCE"):
+        database = park(
+            boto3.client("rds"),
+            boto3.client("ssm"),
+            os.environ["DB_INSTANCE"],
+            os.environ["DB_STATE_PARAMETER"],
+            held,
+            float(os.environ.get("DB_READY_TIMEOUT", "60")),
+        )
+
+    proxy = None
+    if os.environ.get("PROXY_FUNCTION"):
+        proxy = provision(
+            boto3.client("lambda"),
+            os.environ["PROXY_FUNCTION"],
+            os.environ["PROXY_ALIAS"],
+            int(os.environ.get("PROXY_CONCURRENCY", "1")),
+            on,
+        )
+
+    warmed = warm(host, port, timeout) if on and database in (None, AVAILABLE) else {}
+
+    result = {
+        "showtime": on,
+        "spooled": spool,
+        "min_capacity": minimum,
+        "desired_count": count,
+        "database": database,
+        "proxy_concurrency": proxy,
+        "warmed": warmed,
+    }
+    print(json.dumps(result))
+    return result
@@ -0,0 +1,6 @@
+CREATE TABLE IF NOT EXISTS requests (
+    request_id UUID NOT NULL PRIMARY KEY,
+    show_hash VARCHAR NOT NULL,
+    song_id UUID NOT NULL,
+    request_time TIMESTAMP DEFAULT NOW()
+);
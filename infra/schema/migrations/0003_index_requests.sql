@@ -0,0 +1,14 @@
+-- migrate: no-transaction
+-- Built concurrently so requests keep being written during a show.
+
+-- Admin views and per show counts filter on show_hash, grouping by song_id.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS requests_show_hash_song_id_idx
+    ON requests (show_hash, song_id);
+
+-- Admin views list a show's requests in order.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS requests_show_hash_request_time_idx
+    ON requests (show_hash, request_time);
+
+-- get_requests_counts groups every request by song_id.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS requests_song_id_idx
+    ON requests (song_id);
@@ -0,0 +1,34 @@
+-- Partition requests by show, so a live show's duplicate and count queries only
+-- touch its own partition. The backend's PartitionService creates a show's
+-- partition when the show is inserted and archives it once the show has ended.
+-- Existing rows, and rows of shows without a partition, stay in the default
+-- partition. Renaming the table locks it briefly, so run this outside a show.
+
+ALTER TABLE requests RENAME TO requests_default;
+ALTER TABLE requests_default DROP CONSTRAINT IF EXISTS requests_pkey;
+ALTER INDEX IF EXISTS requests_show_hash_song_id_idx
+    RENAME TO requests_default_show_hash_song_id_idx;
+ALTER INDEX IF EXISTS requests_show_hash_request_time_idx
+    RENAME TO requests_default_show_hash_request_time_idx;
+ALTER INDEX IF EXISTS requests_song_id_idx
+    RENAME TO requests_default_song_id_idx;
+
+-- The partition key has to be part of the primary key.
+CREATE TABLE requests (
+    request_id UUID NOT NULL,
+    show_hash VARCHAR NOT NULL,
+    song_id UUID NOT NULL,
+    request_time TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (show_hash, request_id)
+) PARTITION BY LIST (show_hash);
+
+CREATE INDEX requests_show_hash_song_id_idx ON requests (show_hash, song_id);
+CREATE INDEX requests_show_hash_request_time_idx ON requests (show_hash, request_time);
+CREATE INDEX requests_song_id_idx ON requests (song_id);
+-- Duplicate redirects look a request up by its id alone.
+CREATE INDEX requests_request_id_idx ON requests (request_id);
+
+-- The existing indexes of the default partition are attached to the new ones.
+ALTER TABLE requests ATTACH PARTITION requests_default DEFAULT;
+
+CREATE SCHEMA IF NOT EXISTS archive;
@@ -2,20 +2,24 @@
 This module defines the RuntimeStack class,
 which sets up the runtime environment for the application.
 
-It creates ECS runtime constructs and Route 53 configurations
+It creates ECS runtime constructs, the show scheduler and Route 53 configurations
 using the provided AWS resources and configuration.
 """
 
+from aws_cdk import aws_apigatewayv2 as apigwv2
 from aws_cdk import aws_certificatemanager as acm
 from aws_cdk import aws_ec2 as ec2
 from aws_cdk import aws_ecs as ecs
 from aws_cdk import aws_iam as iam
+from aws_cdk import aws_lambda as _lambda
 from aws_cdk import aws_rds as rds
 from aws_cdk import aws_s3 as s3
 from constructs import Construct
 
 from infra.config import Config
 from infra.constructs.runtime import RuntimeConstruct, RuntimeConstructArgs
+from infra.constructs.scheduler import SchedulerConstruct, SchedulerConstructArgs
+from infra.constructs.vpc_link import VpcLinkConstruct, VpcLinkConstructArgs
 from infra.stacks.stack import Stack, StackArgs
 
 
@@ -33,6 +37,11 @@ class RuntimeStackArgs(  # pylint: disable=too-few-public-methods, too-many-inst
         cluster (ecs.Cluster): The ECS cluster.
         db_instance (rds.IDatabaseInstance): The database instance.
         gateway_security_group (ec2.ISecurityGroup): The security group for the API Gateway.
+        db_proxy (rds.IDatabaseProxy): The RDS Proxy in front of the database, if any.
+        http_api (apigwv2.IHttpApi): The HTTP API to route straight to the service
+            with the "direct" integration, if any.
+        proxy_alias (_lambda.IAlias): The proxy Lambda's alias to provision
+            concurrency on for shows, if any.
         uid (str): The ID of the stack.
             Defaults to "runtime".
         prefix (str): The prefix for the stack name.
@@ -49,6 +58,9 @@ class RuntimeStackArgs(  # pylint: disable=too-few-public-methods, too-many-inst
         bucket: s3.IBucket,
         db_instance: rds.IDatabaseInstance,
         gateway_security_group: ec2.ISecurityGroup,
+        db_proxy: rds.IDatabaseProxy | None = None,
+        http_api: apigwv2.IHttpApi | None = None,
+        proxy_alias: _lambda.IAlias | None = None,
         uid: str = "runtime",
         prefix: str = "",
     ) -> None:
@@ -60,14 +72,18 @@ class RuntimeStackArgs(  # pylint: disable=too-few-public-methods, too-many-inst
         self.bucket = bucket
         self.db_instance = db_instance
         self.gateway_security_group = gateway_security_group
+        self.db_proxy = db_proxy
+        self.http_api = http_api
+        self.proxy_alias = proxy_alias
 
 
 class RuntimeStack(Stack):
     """
     This stack sets up the runtime environment for the application.
 
-    It creates ECS runtime constructs and Route 53 configurations
-    using the provided stacks and configuration.
+    It creates ECS runtime constructs, the show scheduler and Route 53 configurations
+    using the provided stacks and configuration. With the "direct" integration it
+    also routes the HTTP API straight to the service.
     """
 
     def __init__(
@@ -84,7 +100,7 @@ class RuntimeStack(Stack):
         """
         super().__init__(scope, StackArgs(args.config, args.uid, args.prefix))
 
-        RuntimeConstruct(
+        runtime_construct = RuntimeConstruct(
             self,
             RuntimeConstructArgs(
                 config=args.config,
@@ -95,6 +111,7 @@ class RuntimeStack(Stack):
                 bucket=args.bucket,
                 db_instance=args.db_instance,
                 gateway_security_group=args.gateway_security_group,
+                db_proxy=args.db_proxy,
                 runtime_variables={
                     # pylint:disable=line-too-long
                     "PROJECT_NAME": str(args.config.project_name),
@@ -102,3 +119,36 @@ class RuntimeStack(Stack):
                 },
             ),
         )
+
+        # Scale out and warm up before each show, rather than in its first rush,
+        # and only run the database and keep the proxy Lambda warm for shows
+        scheduler_construct = SchedulerConstruct(
+            self,
+            SchedulerConstructArgs(
+                config=args.config,
+                vpc=args.vpc,
+                cluster=args.cluster,
+                service=runtime_construct.runtime_service,
+                security_group=runtime_construct.security_group,
+                bucket=args.bucket,
+                db_instance=args.db_instance,
+                proxy_alias=args.proxy_alias,
+            ),
+        )
+        # The tasks stop querying the database while it is parked
+        runtime_construct.container.add_environment(
+            "DB_STATE_PARAMETER", scheduler_construct.db_state.parameter_name
+        )
+
+        # API Gateway calls the tasks itself, and the proxy Lambda is the fallback
+        if args.config.integration == "direct" and args.http_api is not None:
+            VpcLinkConstruct(
+                self,
+                VpcLinkConstructArgs(
+                    config=args.config,
+                    vpc=args.vpc,
+                    http_api=args.http_api,
+                    service=runtime_construct.cloud_map_service,
+                    security_group=runtime_construct.security_group,
+                ),
+            )
@@ -0,0 +1,66 @@
+"""
+This module defines the ShowStack class, which sets up the resources only needed
+while a show is on.
+
+It is deployed before a show and destroyed after it, e.g. with the Deploy Stack
+and Destroy Stack workflows and the stack name "show", so the resources cost
+nothing between shows. The runtime works without them.
+"""
+
+from aws_cdk import aws_ec2 as ec2
+from constructs import Construct
+
+from infra.config import Config
+from infra.constructs.cache import CacheConstruct, CacheConstructArgs
+from infra.stacks.stack import Stack, StackArgs
+
+
+class ShowStackArgs(StackArgs):  # pylint: disable=too-few-public-methods
+    """
+    A class that defines args for the ShowStack class.
+
+    Attributes:
+        config (Config): Configuration object.
+        vpc (ec2.IVpc): The VPC in which to create the show resources.
+        uid (str): The ID of the stack.
+            Defaults to "show".
+        prefix (str): The prefix for the stack name.
+            Defaults to "{config.project_name}-{config.environment_name}-".
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        vpc: ec2.IVpc,
+        uid: str = "show",
+        prefix: str = "",
+    ) -> None:
+        super().__init__(config, uid, prefix)
+        self.vpc = vpc
+
+
+class ShowStack(Stack):
+    """
+    This stack sets up the resources only needed while a show is on.
+
+    It creates the Cache construct, which the runtime tasks share their rate
+    limits through.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        args: ShowStackArgs,
+    ) -> None:
+        """
+        Initialize the ShowStack.
+
+        Args:
+            scope (Construct): The scope in which this stack is defined.
+            args (ShowStackArgs): Arguments containing the VPC and configuration.
+        """
+        super().__init__(scope, StackArgs(args.config, args.uid, args.prefix))
+
+        self.cache_construct = CacheConstruct(
+            self, CacheConstructArgs(args.config, args.vpc)
+        )
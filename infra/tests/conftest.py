@@ -204,6 +204,11 @@ def db_instances(template: assertions.Template) -> Mapping[str, Any]:
     return template.find_resources("AWS::RDS::DBInstance")
 
 
+@pytest.fixture(scope="module")
+def db_proxies(template: assertions.Template) -> Mapping[str, Any]:
+    return template.find_resources("AWS::RDS::DBProxy")
+
+
 @pytest.fixture(scope="module")
 def log_groups(template: assertions.Template) -> Mapping[str, Any]:
     return template.find_resources("AWS::Logs::LogGroup")
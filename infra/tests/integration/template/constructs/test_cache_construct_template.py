@@ -0,0 +1,55 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, redefined-outer-name
+from typing import Any, Mapping
+
+import pytest
+from aws_cdk import assertions
+from aws_cdk import aws_ec2 as ec2
+
+from infra.config import Config
+from infra.constructs.cache import CacheConstruct, CacheConstructArgs
+from infra.stacks.stack import Stack
+
+
+@pytest.fixture(scope="module", autouse=True)
+def construct(stack: Stack, config: Config, vpc: ec2.IVpc) -> CacheConstruct:
+    return CacheConstruct(stack, CacheConstructArgs(config, vpc))
+
+
+def test_cache_cluster(config: Config, cache_clusters: Mapping[str, Any]) -> None:
+    cluster = next(iter(cache_clusters.values()))
+
+    assert len(cache_clusters) == 1
+    assert cluster["Properties"]["ClusterName"] == (
+        f"{config.project_name}-{config.environment_name}-cache"
+    )
+    assert cluster["Properties"]["Engine"] == "redis"
+    assert cluster["Properties"]["NumCacheNodes"] == 1
+    assert cluster["Properties"]["Port"] == 6379
+
+
+def test_cache_ingress(template: assertions.Template) -> None:
+    template.has_resource_properties(
+        "AWS::EC2::SecurityGroup",
+        {
+            "SecurityGroupIngress": [
+                assertions.Match.object_like(
+                    {
+                        "Description": "Allow ECS to access the cache",
+                        "FromPort": 6379,
+                        "ToPort": 6379,
+                    }
+                )
+            ]
+        },
+    )
+
+
+def test_cache_endpoint_parameter(
+    config: Config, ssm_parameters: Mapping[str, Any]
+) -> None:
+    parameter = next(iter(ssm_parameters.values()))
+
+    assert parameter["Properties"]["Name"] == (
+        f"/{config.project_name}-{config.environment_name}/cache-endpoint"
+    )
+    assert "Fn::Join" in parameter["Properties"]["Value"]
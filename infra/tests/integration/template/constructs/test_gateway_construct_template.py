@@ -0,0 +1,77 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, redefined-outer-name
+from typing import Any, Mapping
+
+import aws_cdk as cdk
+import pytest
+from aws_cdk import assertions
+from aws_cdk import aws_apigatewayv2 as apigwv2
+from aws_cdk import aws_certificatemanager as acm
+from aws_cdk import aws_ec2 as ec2
+
+from infra.config import Config, ScalingConfig
+from infra.constructs.gateway import GatewayConstruct, GatewayConstructArgs
+from infra.stacks.stack import Stack
+from infra.tests.conftest import ACCOUNT, ENVIRONMENT_NAME, PROJECT_NAME, REGION
+
+
+@pytest.fixture(scope="module")
+def config() -> Config:
+    return Config(
+        project_name=PROJECT_NAME,
+        environment_name=ENVIRONMENT_NAME,
+        cdk_environment=cdk.Environment(account=ACCOUNT, region=REGION),
+        scaling=ScalingConfig(proxy_concurrency=2),
+    )
+
+
+@pytest.fixture(scope="module")
+def vpc(stack: Stack) -> ec2.IVpc:
+    # The proxy Lambda runs in subnets with egress
+    return ec2.Vpc(stack, "Vpc", nat_gateways=1)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def construct(
+    stack: Stack, config: Config, vpc: ec2.IVpc, certificate: acm.Certificate
+) -> GatewayConstruct:
+    return GatewayConstruct(
+        stack,
+        GatewayConstructArgs(
+            config,
+            vpc,
+            apigwv2.DomainName(
+                stack,
+                "TestDomainName",
+                domain_name="test.example.com",
+                certificate=certificate,
+            ),
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def functions(template: assertions.Template) -> Mapping[str, Any]:
+    return template.find_resources("AWS::Lambda::Function")
+
+
+def test_proxy_function(config: Config, functions: Mapping[str, Any]) -> None:
+    function = next(iter(functions.values()))
+
+    assert function["Properties"]["FunctionName"] == (
+        f"{config.project_name}-{config.environment_name}-runtime-proxy-lambda"
+    )
+    assert function["Properties"]["Handler"] == "index.handler"
+    assert function["Properties"]["Environment"]["Variables"]["FARGATE_URL"] == (
+        f"http://runtime.{config.project_name}-{config.environment_name}.local:5000"
+    )
+
+
+def test_proxy_alias_invoked(template: assertions.Template) -> None:
+    template.has_resource_properties("AWS::Lambda::Alias", {"Name": "live"})
+    template.has_resource_properties(
+        "AWS::ApiGatewayV2::Integration",
+        {
+            "IntegrationType": "AWS_PROXY",
+            "IntegrationUri": {"Ref": assertions.Match.string_like_regexp("proxyalias")},
+        },
+    )
@@ -61,3 +61,13 @@ def test_db_instance(config: Config, db_instances: Mapping[str, Any]) -> None:
         db_instance["Properties"]["DBInstanceIdentifier"]
         == f"{config.project_name.lower()}-{config.environment_name}-rds-instance"
     )
+
+
+def test_db_proxy(config: Config, db_proxies: Mapping[str, Any]) -> None:
+    db_proxy = next(iter(db_proxies.values()))
+
+    assert db_proxy["Properties"]["DBProxyName"] == (
+        f"{config.project_name}-{config.environment_name}-rds-proxy"
+    )
+    assert db_proxy["Properties"]["EngineFamily"] == "POSTGRESQL"
+    assert db_proxy["Properties"]["RequireTLS"] is True
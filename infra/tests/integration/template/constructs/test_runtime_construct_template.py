@@ -200,7 +200,8 @@ def test_task_definition(
         iter(task_definition["Properties"]["ContainerDefinitions"])
     )
     assert container_definition["PortMappings"] == [
-        {"ContainerPort": 5000, "Protocol": "tcp"}
+        {"ContainerPort": 5000, "Protocol": "tcp"},
+        {"ContainerPort": 9100, "Name": "metrics", "Protocol": "tcp"},
     ]
     assert container_definition["Environment"] == [
         {"Name": key, "Value": value} for key, value in runtime_variables.items()
@@ -0,0 +1,62 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, redefined-outer-name
+from typing import Any, Mapping
+
+import aws_cdk as cdk
+import pytest
+from aws_cdk import aws_certificatemanager as acm
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_ecs as ecs
+from aws_cdk import aws_iam as iam
+from aws_cdk import aws_rds as rds
+from aws_cdk import aws_s3 as s3
+
+from infra.config import Config
+from infra.constructs.runtime import RuntimeConstruct, RuntimeConstructArgs
+from infra.stacks.stack import Stack
+from infra.tests.conftest import ACCOUNT, ENVIRONMENT_NAME, PROJECT_NAME, REGION
+
+
+@pytest.fixture(scope="module")
+def config() -> Config:
+    return Config(
+        project_name=PROJECT_NAME,
+        environment_name=ENVIRONMENT_NAME,
+        cdk_environment=cdk.Environment(account=ACCOUNT, region=REGION),
+        integration="direct",
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def construct(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    stack: Stack,
+    config: Config,
+    vpc: ec2.IVpc,
+    certificate: acm.Certificate,
+    policy: iam.ManagedPolicy,
+    db_instance: rds.IDatabaseInstance,
+) -> RuntimeConstruct:
+    return RuntimeConstruct(
+        stack,
+        RuntimeConstructArgs(
+            config=config,
+            vpc=vpc,
+            certificate=certificate,
+            policy=policy,
+            cluster=ecs.Cluster(stack, "TestRuntimeCluster", vpc=vpc),
+            bucket=s3.Bucket(stack, "TestBucket"),
+            db_instance=db_instance,
+            gateway_security_group=ec2.SecurityGroup(
+                stack, "TestGatewaySecurityGroup", vpc=vpc
+            ),
+        ),
+    )
+
+
+def test_service_registry_has_port(
+    construct: RuntimeConstruct, services: Mapping[str, Any]
+) -> None:
+    registry = next(iter(services.values()))["Properties"]["ServiceRegistries"][0]
+
+    assert registry["ContainerName"] == construct.container.container_name
+    assert registry["ContainerPort"] == 5000
+    assert "RegistryArn" in registry
@@ -0,0 +1,170 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, redefined-outer-name
+import json
+from typing import Any, Mapping
+
+import pytest
+from aws_cdk import assertions
+from aws_cdk import aws_certificatemanager as acm
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_ecs as ecs
+from aws_cdk import aws_iam as iam
+from aws_cdk import aws_rds as rds
+from aws_cdk import aws_s3 as s3
+
+from infra.config import Config
+from infra.constructs.runtime import RuntimeConstruct, RuntimeConstructArgs
+from infra.stacks.stack import Stack
+
+
+@pytest.fixture(scope="module", autouse=True)
+def construct(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    stack: Stack,
+    config: Config,
+    vpc: ec2.IVpc,
+    certificate: acm.Certificate,
+    policy: iam.ManagedPolicy,
+    db_instance: rds.IDatabaseInstance,
+) -> RuntimeConstruct:
+    return RuntimeConstruct(
+        stack,
+        RuntimeConstructArgs(
+            config=config,
+            vpc=vpc,
+            certificate=certificate,
+            policy=policy,
+            cluster=ecs.Cluster(stack, "TestRuntimeCluster", vpc=vpc),
+            bucket=s3.Bucket(stack, "TestBucket"),
+            db_instance=db_instance,
+            gateway_security_group=ec2.SecurityGroup(
+                stack, "TestGatewaySecurityGroup", vpc=vpc
+            ),
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def scaling_policies(template: assertions.Template) -> Mapping[str, Any]:
+    return template.find_resources("AWS::ApplicationAutoScaling::ScalingPolicy")
+
+
+@pytest.fixture(scope="module")
+def alarms(template: assertions.Template) -> Mapping[str, Any]:
+    return template.find_resources("AWS::CloudWatch::Alarm")
+
+
+def test_scalable_target(config: Config, template: assertions.Template) -> None:
+    template.has_resource_properties(
+        "AWS::ApplicationAutoScaling::ScalableTarget",
+        {
+            "MinCapacity": config.scaling.min_tasks,
+            "MaxCapacity": config.scaling.max_tasks,
+            "ScalableDimension": "ecs:service:DesiredCount",
+            "ServiceNamespace": "ecs",
+        },
+    )
+
+
+def test_service_starts_at_min_tasks(
+    config: Config, services: Mapping[str, Any]
+) -> None:
+    service = next(iter(services.values()))
+
+    assert service["Properties"]["DesiredCount"] == config.scaling.min_tasks
+
+
+def test_target_tracking_policies(
+    config: Config, scaling_policies: Mapping[str, Any]
+) -> None:
+    targets = [
+        policy["Properties"]["TargetTrackingScalingPolicyConfiguration"]
+        for policy in scaling_policies.values()
+    ]
+
+    assert len(targets) == 3
+    predefined = {
+        target["PredefinedMetricSpecification"]["PredefinedMetricType"]: target
+        for target in targets
+        if "PredefinedMetricSpecification" in target
+    }
+    assert predefined["ECSServiceAverageCPUUtilization"]["TargetValue"] == (
+        config.scaling.cpu_target
+    )
+    assert predefined["ECSServiceAverageMemoryUtilization"]["TargetValue"] == (
+        config.scaling.memory_target
+    )
+    custom = next(
+        target["CustomizedMetricSpecification"]
+        for target in targets
+        if "CustomizedMetricSpecification" in target
+    )
+    assert custom["MetricName"] == "Requests"
+    assert custom["Namespace"] == "ThrowbackRequestLive"
+    assert custom["Dimensions"] == [
+        {
+            "Name": "Service",
+            "Value": f"{config.project_name}-{config.environment_name}",
+        }
+    ]
+    assert all(target["ScaleInCooldown"] == 300 for target in targets)
+
+
+def test_alarms(config: Config, alarms: Mapping[str, Any]) -> None:
+    names = sorted(alarm["Properties"]["AlarmName"] for alarm in alarms.values())
+
+    prefix = f"{config.project_name}-{config.environment_name}-runtime"
+    assert names == [f"{prefix}-cpu", f"{prefix}-memory", f"{prefix}-requests"]
+    assert all(
+        alarm["Properties"]["EvaluationPeriods"] == 5 for alarm in alarms.values()
+    )
+
+
+def test_request_rate_reported(task_definitions: Mapping[str, Any]) -> None:
+    task_definition = next(iter(task_definitions.values()))
+    container = task_definition["Properties"]["ContainerDefinitions"][0]
+
+    assert {"Name": "REQUEST_RATE_INTERVAL", "Value": "60"} in container["Environment"]
+
+
+def test_metrics_served_on_own_port_and_scraped_by_collector(
+    task_definitions: Mapping[str, Any]
+) -> None:
+    task_definition = next(iter(task_definitions.values()))
+    container, collector = task_definition["Properties"]["ContainerDefinitions"]
+
+    assert {"Name": "METRICS_PORT", "Value": "9100"} in container["Environment"]
+    assert [mapping["ContainerPort"] for mapping in container["PortMappings"]] == [5000, 9100]
+    assert collector["Image"].startswith("public.ecr.aws/aws-observability/aws-otel-collector")
+    assert collector["Essential"] is False
+    config = next(
+        variable["Value"]
+        for variable in collector["Environment"]
+        if variable["Name"] == "AOT_CONFIG_CONTENT"
+    )
+    assert "localhost:9100" in json.dumps(config)
+    assert "awsemf" in json.dumps(config)
+
+
+def test_metrics_port_not_opened(template: assertions.Template) -> None:
+    ingress = template.find_resources("AWS::EC2::SecurityGroupIngress")
+
+    assert all(
+        rule["Properties"].get("FromPort") != 9100 for rule in ingress.values()
+    )
+
+
+def test_spool_shared_on_efs(
+    template: assertions.Template, task_definitions: Mapping[str, Any]
+) -> None:
+    template.resource_count_is("AWS::EFS::FileSystem", 1)
+    template.has_resource_properties(
+        "AWS::EC2::SecurityGroupIngress", {"FromPort": 2049, "ToPort": 2049}
+    )
+    properties = next(iter(task_definitions.values()))["Properties"]
+    container = properties["ContainerDefinitions"][0]
+
+    assert properties["Volumes"][0]["Name"] == "spool"
+    assert properties["Volumes"][0]["EFSVolumeConfiguration"]["TransitEncryption"] == "ENABLED"
+    assert container["MountPoints"] == [
+        {"ContainerPath": "/spool", "SourceVolume": "spool", "ReadOnly": False}
+    ]
+    assert {"Name": "SPOOL_DIR", "Value": "/spool"} in container["Environment"]
@@ -0,0 +1,196 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, redefined-outer-name
+from typing import Any, Mapping
+
+import pytest
+from aws_cdk import assertions
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_ecs as ecs
+from aws_cdk import aws_lambda as _lambda
+from aws_cdk import aws_rds as rds
+from aws_cdk import aws_s3 as s3
+
+from infra.config import Config
+from infra.constructs.scheduler import SchedulerConstruct, SchedulerConstructArgs
+from infra.stacks.stack import Stack
+
+
+@pytest.fixture(scope="module")
+def service(stack: Stack, vpc: ec2.IVpc) -> ecs.FargateService:
+    task_definition = ecs.FargateTaskDefinition(stack, "TestTaskDefinition")
+    task_definition.add_container(
+        "TestContainer", image=ecs.ContainerImage.from_registry("python:3.12-slim")
+    )
+    return ecs.FargateService(
+        stack,
+        "TestService",
+        cluster=ecs.Cluster(stack, "TestCluster", vpc=vpc),
+        task_definition=task_definition,
+    )
+
+
+@pytest.fixture(scope="module")
+def runtime_security_group(stack: Stack, vpc: ec2.IVpc) -> ec2.SecurityGroup:
+    return ec2.SecurityGroup(stack, "TestRuntimeSecurityGroup", vpc=vpc)
+
+
+@pytest.fixture(scope="module")
+def proxy_alias(stack: Stack) -> _lambda.Alias:
+    function = _lambda.Function(
+        stack,
+        "TestProxyFunction",
+        runtime=_lambda.Runtime.PYTHON_3_12,
+        handler="proxy.handler",
+        code=_lambda.Code.from_inline("def handler(event, context): pass"),
+    )
+    return _lambda.Alias(
+        stack, "TestProxyAlias", alias_name="live", version=function.current_version
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def construct(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    stack: Stack,
+    config: Config,
+    vpc: ec2.IVpc,
+    service: ecs.FargateService,
+    runtime_security_group: ec2.SecurityGroup,
+    db_instance: rds.IDatabaseInstance,
+    proxy_alias: _lambda.Alias,
+) -> SchedulerConstruct:
+    return SchedulerConstruct(
+        stack,
+        SchedulerConstructArgs(
+            config=config,
+            vpc=vpc,
+            cluster=service.cluster,
+            service=service,
+            security_group=runtime_security_group,
+            bucket=s3.Bucket(stack, "TestBucket"),
+            db_instance=db_instance,
+            proxy_alias=proxy_alias,
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def functions(template: assertions.Template) -> Mapping[str, Any]:
+    return template.find_resources("AWS::Lambda::Function")
+
+
+@pytest.fixture(scope="module")
+def rules(template: assertions.Template) -> Mapping[str, Any]:
+    return template.find_resources("AWS::Events::Rule")
+
+
+def test_function(config: Config, functions: Mapping[str, Any]) -> None:
+    function = next(
+        function
+        for function in functions.values()
+        if function["Properties"].get("Handler") == "index.handler"
+    )
+
+    assert function["Properties"]["FunctionName"] == (
+        f"{config.project_name}-{config.environment_name}-scheduler-lambda"
+    )
+    assert function["Properties"]["Runtime"] == "python3.12"
+    variables = function["Properties"]["Environment"]["Variables"]
+    assert variables["RUNTIME_HOST"] == (
+        f"runtime.{config.project_name}-{config.environment_name}.local"
+    )
+    assert variables["SHOW_TASKS"] == str(config.scaling.show_tasks)
+    assert variables["MIN_TASKS"] == str(config.scaling.min_tasks)
+    assert variables["LEAD_MINUTES"] == "30"
+    assert "dbstateparameter" in variables["DB_STATE_PARAMETER"]["Ref"]
+    assert "DB_INSTANCE" in variables
+    assert variables["PROXY_ALIAS"] == "live"
+    assert variables["PROXY_CONCURRENCY"] == str(config.scaling.proxy_concurrency)
+    assert "TestProxyFunction" in variables["PROXY_FUNCTION"]["Ref"]
+    assert "VpcConfig" in function["Properties"]
+
+
+def test_db_state_parameter(config: Config, ssm_parameters: Mapping[str, Any]) -> None:
+    parameter = next(
+        parameter
+        for parameter in ssm_parameters.values()
+        if parameter["Properties"]["Name"]
+        == f"/{config.project_name}-{config.environment_name}/db-state"
+    )
+
+    assert parameter["Properties"]["Value"] == "available"
+
+
+def test_rule(rules: Mapping[str, Any]) -> None:
+    rule = next(iter(rules.values()))
+
+    assert rule["Properties"]["ScheduleExpression"] == "rate(5 minutes)"
+    assert len(rule["Properties"]["Targets"]) == 1
+
+
+def test_warm_up_ingress(template: assertions.Template) -> None:
+    template.has_resource_properties(
+        "AWS::EC2::SecurityGroupIngress",
+        {
+            "Description": "Allow warm-up calls from the scheduler",
+            "FromPort": 5000,
+            "ToPort": 5000,
+            "IpProtocol": "tcp",
+        },
+    )
+
+
+def test_scheduler_policy(template: assertions.Template) -> None:
+    template.has_resource_properties(
+        "AWS::IAM::Role",
+        {
+            "Policies": assertions.Match.array_with(
+                [
+                    assertions.Match.object_like(
+                        {
+                            "PolicyName": "SchedulerPolicy",
+                            "PolicyDocument": {
+                                "Statement": assertions.Match.array_with(
+                                    [
+                                        assertions.Match.object_like(
+                                            {
+                                                "Action": [
+                                                    "ecs:DescribeServices",
+                                                    "ecs:UpdateService",
+                                                ]
+                                            }
+                                        ),
+                                        assertions.Match.object_like(
+                                            {
+                                                "Action": [
+                                                    "application-autoscaling:DescribeScalableTargets",  # pylint: disable=line-too-long
+                                                    "application-autoscaling:RegisterScalableTarget",  # pylint: disable=line-too-long
+                                                ],
+                                                "Resource": "*",
+                                            }
+                                        ),
+                                        assertions.Match.object_like(
+                                            {
+                                                "Action": [
+                                                    "rds:DescribeDBInstances",
+                                                    "rds:StartDBInstance",
+                                                    "rds:StopDBInstance",
+                                                ]
+                                            }
+                                        ),
+                                        assertions.Match.object_like(
+                                            {
+                                                "Action": [
+                                                    "lambda:GetProvisionedConcurrencyConfig",  # pylint: disable=line-too-long
+                                                    "lambda:PutProvisionedConcurrencyConfig",  # pylint: disable=line-too-long
+                                                    "lambda:DeleteProvisionedConcurrencyConfig",  # pylint: disable=line-too-long
+                                                ]
+                                            }
+                                        ),
+                                    ]
+                                )
+                            },
+                        }
+                    )
+                ]
+            )
+        },
+    )
@@ -0,0 +1,82 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, redefined-outer-name
+from typing import Any, Mapping
+
+import pytest
+from aws_cdk import assertions
+from aws_cdk import aws_apigatewayv2 as apigwv2
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_servicediscovery as servicediscovery
+
+from infra.config import Config
+from infra.constructs.vpc_link import VpcLinkConstruct, VpcLinkConstructArgs
+from infra.stacks.stack import Stack
+
+
+@pytest.fixture(scope="module", autouse=True)
+def construct(stack: Stack, config: Config, vpc: ec2.IVpc) -> VpcLinkConstruct:
+    namespace = servicediscovery.PrivateDnsNamespace(
+        stack, "TestNamespace", name="test.local", vpc=vpc
+    )
+    return VpcLinkConstruct(
+        stack,
+        VpcLinkConstructArgs(
+            config,
+            vpc,
+            http_api=apigwv2.HttpApi(stack, "TestHttpApi"),
+            service=namespace.create_service("TestService", name="runtime"),
+            security_group=ec2.SecurityGroup(stack, "TestRuntimeSecurityGroup", vpc=vpc),
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def routes(template: assertions.Template) -> Mapping[str, Any]:
+    return template.find_resources("AWS::ApiGatewayV2::Route")
+
+
+def test_vpc_link(config: Config, template: assertions.Template) -> None:
+    template.has_resource_properties(
+        "AWS::ApiGatewayV2::VpcLink",
+        {"Name": f"{config.project_name}-{config.environment_name}-vpc-link"},
+    )
+
+
+def test_integration(template: assertions.Template) -> None:
+    template.has_resource_properties(
+        "AWS::ApiGatewayV2::Integration",
+        {
+            "IntegrationType": "HTTP_PROXY",
+            "ConnectionType": "VPC_LINK",
+            "IntegrationMethod": "ANY",
+            "IntegrationUri": {"Fn::GetAtt": [assertions.Match.any_value(), "Arn"]},
+        },
+    )
+
+
+def test_integration_overwrites_client_ip(template: assertions.Template) -> None:
+    template.has_resource_properties(
+        "AWS::ApiGatewayV2::Integration",
+        {
+            "RequestParameters": {
+                "overwrite:header.X-Client-Ip": "$context.identity.sourceIp",
+            },
+        },
+    )
+
+
+def test_routes(routes: Mapping[str, Any]) -> None:
+    assert sorted(route["Properties"]["RouteKey"] for route in routes.values()) == [
+        "ANY /",
+        "ANY /{proxy+}",
+    ]
+
+
+def test_runtime_ingress(template: assertions.Template) -> None:
+    template.has_resource_properties(
+        "AWS::EC2::SecurityGroupIngress",
+        {
+            "Description": "Allow Flask traffic from API Gateway",
+            "FromPort": 5000,
+            "ToPort": 5000,
+        },
+    )
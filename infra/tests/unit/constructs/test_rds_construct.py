@@ -61,7 +61,7 @@ def test_db_instance_creation(
         construct,
         "rds-instance",
         database_name=config.project_name,
-        engine=ANY,
+        engine=mocks.rds.DatabaseInstanceEngine.postgres.return_value,
         instance_type=ANY,
         vpc=vpc,
         vpc_subnets=mocks.ec2.SubnetSelection.return_value,
@@ -71,6 +71,9 @@ def test_db_instance_creation(
         backup_retention=mocks.duration.days(7),
         security_groups=[mocks.ec2.SecurityGroup.return_value],
         instance_identifier=f"{config.project_name}-{config.environment_name}-rds-instance",
+        allocated_storage=20,
+        storage_type=mocks.rds.StorageType.GP2,
+        parameter_group=mocks.rds.ParameterGroup.return_value,
     )
 
     mocks.rds.DatabaseInstanceEngine.postgres.assert_called_once_with(
@@ -89,3 +92,44 @@ def test_db_instance_creation(
         "db_master_user",
         secret_name=f"{config.project_name}-{config.environment_name}-db-credentials",
     )
+
+
+def test_parameter_group_creation(mock_rds_construct: tuple[RdsConstruct, Mocks]):
+    construct, mocks = mock_rds_construct
+
+    mocks.rds.ParameterGroup.assert_called_once_with(
+        construct,
+        ANY,
+        engine=mocks.rds.DatabaseInstanceEngine.postgres.return_value,
+        parameters={"statement_timeout": "5000"},
+    )
+
+
+def test_proxy_creation(
+    mock_rds_construct: tuple[RdsConstruct, Mocks], config: Config, vpc: ec2.Vpc
+):
+    construct, mocks = mock_rds_construct
+    db_instance = mocks.rds.DatabaseInstance.return_value
+
+    db_instance.add_proxy.assert_called_once_with(
+        ANY,
+        db_proxy_name=f"{config.project_name}-{config.environment_name}-rds-proxy",
+        secrets=[db_instance.secret],
+        vpc=vpc,
+        security_groups=[mocks.ec2.SecurityGroup.return_value],
+        require_tls=True,
+        max_connections_percent=90,
+    )
+    assert construct.proxy == db_instance.add_proxy.return_value
+
+
+def test_given_no_proxy_when_created_then_proxy_none(
+    vpc: ec2.Vpc, config: Config, stack: Stack
+):
+    with patch("infra.constructs.rds.ec2"), patch("infra.constructs.rds.rds") as mock_rds:
+        construct = RdsConstruct(
+            stack, RdsConstructArgs(config, vpc, uid="rds-direct", proxy=False)
+        )
+
+    assert construct.proxy is None
+    mock_rds.DatabaseInstance.return_value.add_proxy.assert_not_called()
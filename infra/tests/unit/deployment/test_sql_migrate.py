@@ -0,0 +1,152 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, redefined-outer-name
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from infra.deployment.sql.migrate import (
+    Migration,
+    MigrationError,
+    apply,
+    discover,
+    migrate,
+    pending,
+)
+
+SCHEMA = "infra/schema/migrations"
+
+
+class FakeConnection:  # pylint: disable=missing-class-docstring
+    def __init__(self, applied=None, invalid=None):
+        self.applied = applied or []
+        self.invalid = invalid or []
+        self.statements = []
+        self.transactions = 0
+
+    def execute(self, statement, params=None):
+        self.statements.append(" ".join(statement.split()))
+        cursor = MagicMock()
+        if "FROM schema_migrations" in statement:
+            cursor.fetchall.return_value = self.applied
+        elif "FROM pg_index" in statement:
+            cursor.fetchall.return_value = [
+                (name,) for name in self.invalid if name in params[0]
+            ]
+        return cursor
+
+    @contextmanager
+    def transaction(self):
+        self.transactions += 1
+        yield
+
+
+@pytest.fixture
+def migrations():
+    return [
+        Migration("0001", "create_songs", "CREATE TABLE songs (id UUID);"),
+        Migration(
+            "0002",
+            "index_songs",
+            "-- migrate: no-transaction\n"
+            "-- Concurrent builds.\n"
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS songs_a_idx ON songs (a);\n"
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS songs_b_idx ON songs (b);\n",
+        ),
+    ]
+
+
+def test_repo_migrations_discovered_in_order():
+    migrations = discover(SCHEMA)
+
+    assert [migration.version for migration in migrations] == [
+        "0001",
+        "0002",
+        "0003",
+        "0004",
+    ]
+    assert migrations[2].transactional is False
+    assert migrations[3].transactional is True
+    assert migrations[2].concurrent_indexes() == [
+        "requests_show_hash_song_id_idx",
+        "requests_show_hash_request_time_idx",
+        "requests_song_id_idx",
+    ]
+
+
+def test_duplicate_versions_rejected(tmp_path):
+    (tmp_path / "0001_a.sql").write_text("SELECT 1;")
+    (tmp_path / "0001_b.sql").write_text("SELECT 1;")
+
+    with pytest.raises(MigrationError):
+        discover(str(tmp_path))
+
+
+def test_non_migration_files_ignored(tmp_path):
+    (tmp_path / "0001_a.sql").write_text("SELECT 1;")
+    (tmp_path / "README.md").write_text("")
+
+    assert [migration.name for migration in discover(str(tmp_path))] == ["a"]
+
+
+def test_statements_split_without_comments(migrations):
+    assert migrations[1].statements() == [
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS songs_a_idx ON songs (a)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS songs_b_idx ON songs (b)",
+    ]
+
+
+def test_applied_migrations_not_pending(migrations):
+    applied = {"0001": migrations[0].checksum}
+
+    assert pending(migrations, applied) == migrations[1:]
+
+
+def test_edited_migration_rejected(migrations):
+    with pytest.raises(MigrationError):
+        pending(migrations, {"0001": "stale"})
+
+
+def test_transactional_migration_recorded_in_its_transaction(migrations):
+    connection = FakeConnection()
+
+    apply(connection, migrations[0])
+
+    assert connection.transactions == 1
+    assert connection.statements[0] == "CREATE TABLE songs (id UUID);"
+    assert connection.statements[1].startswith("INSERT INTO schema_migrations")
+
+
+def test_no_transaction_migration_rebuilds_invalid_indexes(migrations):
+    connection = FakeConnection(invalid=["songs_b_idx"])
+
+    apply(connection, migrations[1])
+
+    assert connection.transactions == 0
+    assert connection.statements[1:] == [
+        'DROP INDEX CONCURRENTLY IF EXISTS "songs_b_idx"',
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS songs_a_idx ON songs (a)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS songs_b_idx ON songs (b)",
+        connection.statements[-1],
+    ]
+    assert connection.statements[-1].startswith("INSERT INTO schema_migrations")
+
+
+def test_migrate_applies_pending_under_lock(migrations):
+    connection = FakeConnection(applied=[("0001", migrations[0].checksum)])
+
+    applied = migrate(connection, migrations)
+
+    assert applied == migrations[1:]
+    assert connection.statements[0].startswith("SELECT pg_advisory_lock")
+    assert connection.statements[-1].startswith("SELECT pg_advisory_unlock")
+    assert "CREATE TABLE songs (id UUID);" not in connection.statements
+
+
+def test_dry_run_applies_nothing(migrations):
+    connection = FakeConnection()
+
+    assert migrate(connection, migrations, dry_run=True) == migrations
+    assert not any(
+        statement.startswith(("CREATE TABLE songs", "CREATE INDEX", "INSERT"))
+        for statement in connection.statements
+    )
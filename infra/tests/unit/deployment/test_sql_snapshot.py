@@ -0,0 +1,229 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, redefined-outer-name
+import gzip
+import io
+import json
+from contextlib import contextmanager
+from dataclasses import asdict
+from unittest.mock import MagicMock
+
+import pytest
+
+from infra.deployment.sql.snapshot import Column, Table, export, restore
+
+BUCKET = "bucket"
+PREFIX = "snapshots/test"
+SONGS = Table(
+    "public",
+    "songs",
+    [
+        Column("id", "uuid", True, "uuid_generate_v4()"),
+        Column("song_name", "character varying(255)", True),
+    ],
+)
+PARTITION = Table(
+    "public",
+    "requests_abc",
+    [Column("request_id", "uuid", True)],
+    parent="public.requests",
+    bound="FOR VALUES IN ('abc')",
+)
+DATA = {
+    "songs": [b"1\tsong\n", b"2\tother\n"],
+    "requests_abc": [b"3\n"],
+}
+
+
+class FakeS3:  # pylint: disable=missing-class-docstring
+    def __init__(self):
+        self.objects = {}
+
+    def upload_fileobj(self, fileobj, bucket, key):
+        self.objects[(bucket, key)] = fileobj.read()
+
+    def download_fileobj(self, bucket, key, fileobj):
+        fileobj.write(self.objects[(bucket, key)])
+
+    def put_object(self, Bucket, Key, Body, **_):  # pylint: disable=invalid-name
+        self.objects[(Bucket, Key)] = Body
+
+    def get_object(self, Bucket, Key):  # pylint: disable=invalid-name
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+
+class FakeCopy:  # pylint: disable=missing-class-docstring
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.written = b""
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+    def write(self, data):
+        self.written += data
+
+
+class FakeConnection:  # pylint: disable=missing-class-docstring
+    def __init__(self, database):
+        self.database = database
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+    @contextmanager
+    def transaction(self):
+        yield
+
+    def execute(self, statement, params=None):
+        statement = " ".join(statement.split())
+        self.database.statements.append(statement)
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (self.database.answer(statement, params),)
+        cursor.fetchall.return_value = self.database.rows(statement)
+        return cursor
+
+    @contextmanager
+    def cursor(self):
+        cursor = MagicMock()
+
+        @contextmanager
+        def copy(statement):
+            name = statement.split('"')[3]
+            copy = FakeCopy(DATA.get(name, []))
+            yield copy
+            self.database.loaded[name] = copy.written
+            cursor.rowcount = len(copy.chunks)
+
+        cursor.copy = copy
+        yield cursor
+
+
+class FakeDatabase:  # pylint: disable=missing-class-docstring
+    def __init__(self, version="0004", existing=("public.songs",), rows=False):
+        self.version = version
+        self.existing = existing
+        self.has_rows = rows
+        self.statements = []
+        self.loaded = {}
+
+    def connect(self):
+        return FakeConnection(self)
+
+    def answer(self, statement, params):
+        if statement.startswith("SELECT pg_export_snapshot"):
+            return "snapshot-1"
+        if "to_regclass('public.schema_migrations')" in statement:
+            return "schema_migrations"
+        if "MAX(version)" in statement:
+            return self.version
+        if statement.startswith("SELECT to_regclass"):
+            name = params[0].replace('"', "")
+            return name if name in self.existing else None
+        if statement.startswith("SELECT EXISTS"):
+            return self.has_rows
+        return None
+
+    def rows(self, statement):
+        if "FROM pg_class c" in statement:
+            return [
+                ("public", "songs", 1, None, None),
+                ("public", "requests_abc", 2, "public.requests", "FOR VALUES IN ('abc')"),
+            ]
+        if "FROM pg_attribute" in statement:
+            return [("id", "uuid", True, None)]
+        if "FROM pg_index" in statement:
+            return [
+                (
+                    "requests_song_id_idx",
+                    "CREATE INDEX requests_song_id_idx ON ONLY public.requests (song_id)",
+                )
+            ]
+        if "FROM pg_constraint" in statement:
+            return [("requests", "requests_pkey", "PRIMARY KEY (show_hash, request_id)")]
+        return []
+
+
+def _manifest(version="0004"):
+    return {
+        "version": 1,
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "schema_version": version,
+        "tables": [asdict(SONGS), asdict(PARTITION)],
+    }
+
+
+def _s3_with_snapshot(version="0004"):
+    s3 = FakeS3()
+    s3.put_object(BUCKET, f"{PREFIX}/manifest.json", json.dumps(_manifest(version)).encode())
+    for table in (SONGS, PARTITION):
+        s3.objects[(BUCKET, table.key(PREFIX))] = gzip.compress(b"".join(DATA[table.name]))
+    return s3
+
+
+def test_table_create_statement_defines_columns():
+    assert SONGS.create_statement() == (
+        'CREATE TABLE "public"."songs" ("id" uuid NOT NULL DEFAULT uuid_generate_v4(), '
+        '"song_name" character varying(255) NOT NULL)'
+    )
+
+
+def test_partition_create_statement_attaches_to_parent():
+    assert PARTITION.create_statement() == (
+        'CREATE TABLE "public"."requests_abc" PARTITION OF public.requests '
+        "FOR VALUES IN ('abc')"
+    )
+
+
+def test_table_round_trips_through_manifest():
+    assert Table.from_dict(json.loads(json.dumps(asdict(PARTITION)))) == PARTITION
+
+
+def test_export_uploads_compressed_tables_and_manifest():
+    database, s3 = FakeDatabase(), FakeS3()
+
+    manifest = export(database.connect, s3, BUCKET, PREFIX, jobs=2)
+
+    assert gzip.decompress(s3.objects[(BUCKET, SONGS.key(PREFIX))]) == b"".join(DATA["songs"])
+    assert json.loads(s3.objects[(BUCKET, f"{PREFIX}/manifest.json")]) == manifest
+    assert manifest["schema_version"] == "0004"
+    assert [table["name"] for table in manifest["tables"]] == ["songs", "requests_abc"]
+    assert manifest["tables"][0]["rows"] == 2
+    assert "SET TRANSACTION SNAPSHOT 'snapshot-1'" in database.statements
+
+
+def test_restore_loads_tables_before_building_indexes():
+    database = FakeDatabase()
+
+    restore(database.connect, _s3_with_snapshot(), BUCKET, PREFIX, jobs=2)
+
+    assert database.loaded == {name: b"".join(chunks) for name, chunks in DATA.items()}
+    statements = database.statements
+    assert PARTITION.create_statement() in statements
+    assert SONGS.create_statement() not in statements
+    drop = statements.index("DROP INDEX requests_song_id_idx")
+    add = statements.index(
+        "ALTER TABLE requests ADD CONSTRAINT requests_pkey PRIMARY KEY (show_hash, request_id)"
+    )
+    build = statements.index("CREATE INDEX requests_song_id_idx ON public.requests (song_id)")
+    assert drop < add < build
+    assert statements[-1] == 'ANALYZE "public"."requests_abc"'
+
+
+def test_given_other_schema_version_when_restore_then_value_error():
+    database = FakeDatabase(version="0003")
+
+    with pytest.raises(ValueError, match="migrate it first"):
+        restore(database.connect, _s3_with_snapshot(), BUCKET, PREFIX)
+
+    assert not database.loaded
+
+
+def test_given_rows_when_restore_then_value_error():
+    database = FakeDatabase(rows=True)
+
+    with pytest.raises(ValueError, match="already has rows"):
+        restore(database.connect, _s3_with_snapshot(), BUCKET, PREFIX)
+
+    assert not database.loaded
@@ -0,0 +1,263 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, redefined-outer-name
+import importlib
+import json
+import os
+import subprocess
+import sys
+from http.client import RemoteDisconnected
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from urllib.parse import urlsplit
+
+import pytest
+
+gateway = importlib.import_module("infra.lambda.gateway.index")
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+FARGATE_URL = "http://runtime.local:5000"
+GATEWAY_DIRECTORY = os.path.dirname(gateway.__file__)
+
+# The seconds a cold start may spend importing the proxy, about 25 ms here
+IMPORT_BUDGET = 0.08
+
+
+@pytest.fixture(autouse=True)
+def environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gateway, "UPSTREAM", urlsplit(FARGATE_URL))
+    monkeypatch.setattr(gateway, "TRACE_EXPORT", None)
+
+
+def _response(status=200, content=b"[]", headers=None):
+    response = MagicMock()
+    response.status = status
+    response.read.return_value = content
+    response.getheaders.return_value = headers or [
+        ("Content-Type", "application/json"),
+        ("Server-Timing", "app;dur=12.0, db;dur=3.0"),
+    ]
+    return response
+
+
+@pytest.fixture
+def upstream():
+    connection = MagicMock()
+    connection.getresponse.return_value = _response()
+    with patch.object(gateway, "_connection", connection), patch.object(
+        gateway, "_last_used", gateway.time.monotonic()
+    ):
+        yield connection
+
+
+def _event(headers=None, **fields):
+    return {
+        "rawPath": "/api/songs",
+        "headers": headers or {},
+        "requestContext": {"http": {"method": "GET", "sourceIp": "203.0.113.1"}},
+        **fields,
+    }
+
+
+def _forwarded_headers(upstream):
+    return upstream.request.call_args.kwargs["headers"]
+
+
+def test_given_traceparent_when_proxied_then_trace_continued_with_lambda_span(upstream):
+    response = gateway.handler(
+        _event({"Traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"}), SimpleNamespace()
+    )
+
+    forwarded = _forwarded_headers(upstream)
+    assert "Traceparent" not in forwarded
+    version, trace_id, span_id, flags = forwarded["traceparent"].split("-")
+    assert (version, trace_id, flags) == ("00", TRACE_ID, "01")
+    assert span_id != PARENT_ID
+    assert response["headers"]["traceparent"] == forwarded["traceparent"]
+
+
+def test_given_no_traceparent_when_proxied_then_trace_started(upstream):
+    gateway.handler(_event(), SimpleNamespace())
+
+    version, trace_id, span_id, flags = _forwarded_headers(upstream)["traceparent"].split("-")
+    assert version == "00" and flags == "01"
+    assert len(trace_id) == 32 and len(span_id) == 16
+
+
+def test_when_proxied_then_server_timing_adds_upstream_and_proxy(upstream):
+    response = gateway.handler(_event(), SimpleNamespace())
+
+    names = [metric.split(";")[0] for metric in response["headers"]["Server-Timing"].split(", ")]
+    assert names == ["app", "db", "upstream", "proxy"]
+
+
+def test_given_stdout_export_when_proxied_then_span_printed(
+    upstream, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+):
+    monkeypatch.setattr(gateway, "TRACE_EXPORT", "stdout")
+
+    gateway.handler(
+        _event({"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"}),
+        SimpleNamespace(aws_request_id="request-id"),
+    )
+
+    span = json.loads(capsys.readouterr().out)
+    assert span["trace_id"] == TRACE_ID
+    assert span["parent_id"] == PARENT_ID
+    assert span["attributes"]["request_id"] == "request-id"
+    assert span["attributes"]["status"] == 200
+
+
+def test_when_proxied_then_query_cookies_and_client_forwarded(upstream):
+    event = _event(
+        {
+            "x-forwarded-for": "198.51.100.7",
+            "x-client-ip": "198.51.100.7",
+            "content-type": "application/json",
+        },
+        rawQueryString="a=1&a=2",
+        cookies=["session=abc", "theme=dark"],
+        body='{"song": "é"}',
+    )
+    event["requestContext"]["http"]["method"] = "POST"
+
+    gateway.handler(event, SimpleNamespace())
+
+    method, target = upstream.request.call_args.args
+    forwarded = _forwarded_headers(upstream)
+    assert (method, target) == ("POST", "/api/songs?a=1&a=2")
+    assert forwarded["Cookie"] == "session=abc; theme=dark"
+    assert forwarded["X-Forwarded-For"] == "198.51.100.7, 203.0.113.1"
+    assert "x-forwarded-for" not in forwarded
+    assert forwarded["X-Client-Ip"] == "203.0.113.1"
+    assert "x-client-ip" not in forwarded
+    assert upstream.request.call_args.kwargs["body"] == '{"song": "é"}'.encode("utf-8")
+
+
+def test_given_no_source_ip_when_proxied_then_client_ip_still_overwritten(upstream):
+    event = _event({"X-Client-Ip": "10.0.0.1"})
+    del event["requestContext"]["http"]["sourceIp"]
+
+    gateway.handler(event, SimpleNamespace())
+
+    assert _forwarded_headers(upstream)["X-Client-Ip"] == "unknown"
+
+
+def test_given_set_cookies_when_proxied_then_returned_as_cookies(upstream):
+    upstream.getresponse.return_value = _response(
+        302,
+        b"",
+        [("Location", "/"), ("Set-Cookie", "a=1; Path=/"), ("Set-Cookie", "b=2; Path=/")],
+    )
+
+    response = gateway.handler(_event(), SimpleNamespace())
+
+    assert response["statusCode"] == 302
+    assert response["cookies"] == ["a=1; Path=/", "b=2; Path=/"]
+    assert response["headers"]["Location"] == "/"
+    assert "Set-Cookie" not in response["headers"]
+
+
+def test_given_binary_body_when_proxied_then_base64_encoded(upstream):
+    upstream.getresponse.return_value = _response(content=b"\xff\xd8")
+
+    response = gateway.handler(_event(), SimpleNamespace())
+
+    assert response["isBase64Encoded"] is True
+    assert response["body"] == "/9g="
+
+
+def test_given_dropped_connection_when_get_then_sent_again_on_new_connection(upstream):
+    upstream.request.side_effect = [RemoteDisconnected("closed"), None]
+    fresh = MagicMock()
+    fresh.getresponse.return_value = _response()
+
+    with patch.object(gateway, "HTTPConnection", return_value=fresh):
+        response = gateway.handler(_event(), SimpleNamespace())
+
+    assert response["statusCode"] == 200
+    upstream.close.assert_called_once()
+    fresh.request.assert_called_once()
+
+
+def test_given_dropped_connection_when_post_then_bad_gateway(upstream):
+    upstream.request.side_effect = RemoteDisconnected("closed")
+    event = _event()
+    event["requestContext"]["http"]["method"] = "POST"
+
+    response = gateway.handler(event, SimpleNamespace())
+
+    assert response["statusCode"] == 502
+    assert gateway._connection is None  # pylint: disable=protected-access
+
+
+def test_given_idle_connection_when_post_then_sent_on_new_connection(upstream, monkeypatch):
+    monkeypatch.setattr(gateway, "_last_used", gateway.time.monotonic() - gateway.IDLE_SECONDS - 1)
+    fresh = MagicMock()
+    fresh.getresponse.return_value = _response()
+    event = _event()
+    event["requestContext"]["http"]["method"] = "POST"
+
+    with patch.object(gateway, "HTTPConnection", return_value=fresh):
+        response = gateway.handler(event, SimpleNamespace())
+
+    assert response["statusCode"] == 200
+    upstream.close.assert_called_once()
+    upstream.request.assert_not_called()
+    fresh.request.assert_called_once()
+
+
+def test_given_recently_used_connection_when_post_then_connection_reused(upstream):
+    event = _event()
+    event["requestContext"]["http"]["method"] = "POST"
+
+    gateway.handler(event, SimpleNamespace())
+
+    upstream.close.assert_not_called()
+    upstream.request.assert_called_once()
+
+
+def test_given_upstream_timeout_when_proxied_then_gateway_timeout(upstream):
+    upstream.getresponse.side_effect = TimeoutError("timed out")
+
+    assert gateway.handler(_event(), SimpleNamespace())["statusCode"] == 504
+
+
+def _import_proxy() -> tuple:
+    # The packages a cold interpreter loads with the proxy, and its cumulative
+    # import time in seconds
+    script = (
+        "import json, sys\n"
+        f"sys.path.insert(0, {GATEWAY_DIRECTORY!r})\n"
+        "before = set(sys.modules)\n"
+        "import index\n"
+        "loaded = sorted({name.split('.')[0] for name in set(sys.modules) - before})\n"
+        "print(json.dumps(loaded))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-I", "-X", "importtime", "-c", script],
+        env={"FARGATE_URL": FARGATE_URL},
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    cumulative = next(
+        line.split("|")[1]
+        for line in result.stderr.splitlines()
+        if line.split("|")[-1].strip() == "index"
+    )
+    return json.loads(result.stdout), int(cumulative) / 1_000_000
+
+
+def test_when_imported_then_only_standard_library_loaded():
+    loaded, _ = _import_proxy()
+
+    assert [name for name in loaded if name not in sys.stdlib_module_names] == ["index"]
+
+
+def test_when_imported_then_within_import_budget():
+    # The interpreter's own import timing leaves its startup out, and the best of a
+    # few cold imports against a budget well above the usual time keeps a busy
+    # machine from failing it
+    elapsed = min(_import_proxy()[1] for _ in range(5))
+
+    assert elapsed < IMPORT_BUDGET
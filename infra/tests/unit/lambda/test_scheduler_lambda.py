@@ -0,0 +1,353 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, redefined-outer-name
+import importlib
+import io
+import json
+import socket
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+scheduler = importlib.import_module("infra.lambda.scheduler.index")
+
+LEAD = timedelta(minutes=30)
+LINGER = timedelta(minutes=30)
+SHOW = {
+    "name": "Show",
+    "hash": "abc",
+    "start_time": "2030-06-01T20:00:00-04:00",
+    "end_time": "2030-06-01T23:00:00-04:00",
+}
+DEMO = {
+    "name": "DEMO",
+    "hash": "DEMO",
+    "start_time": "2000-01-01T00:00:00",
+    "end_time": "2099-01-01T00:00:00",
+}
+
+
+def _at(value: str) -> datetime:
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "now, on",
+    [
+        ("2030-06-01T23:29:00", False),
+        ("2030-06-01T23:30:00", True),
+        ("2030-06-02T01:00:00", True),
+        ("2030-06-02T03:30:00", True),
+        ("2030-06-02T03:31:00", False),
+    ],
+)
+def test_when_showtime_then_window_from_lead_to_linger(now: str, on: bool) -> None:
+    assert scheduler.showtime([DEMO, SHOW], _at(now), LEAD, LINGER) is on
+
+
+@pytest.mark.parametrize(
+    "now, on",
+    [
+        ("2030-06-01T05:29:00", False),
+        ("2030-06-01T05:30:00", True),
+        ("2030-06-02T03:00:00", True),
+        ("2030-06-02T11:30:00", True),
+        ("2030-06-02T11:31:00", False),
+    ],
+)
+def test_given_show_without_offset_when_showtime_then_window_spans_every_zone(
+    now: str, on: bool
+) -> None:
+    show = {**SHOW, "start_time": "2030-06-01T20:00:00", "end_time": "2030-06-01T23:00:00"}
+
+    assert scheduler.showtime([show], _at(now), LEAD, LINGER) is on
+
+
+def test_given_only_demo_or_invalid_show_when_showtime_then_off() -> None:
+    shows = [DEMO, {"name": "Broken", "start_time": "soon"}]
+
+    assert scheduler.showtime(shows, _at("2030-06-01T21:00:00"), LEAD, LINGER) is False
+
+
+@pytest.mark.parametrize(
+    "current, floor, on, minimum, updated",
+    [
+        (1, 3, True, 3, 3),
+        (5, 3, True, 5, None),
+        (3, 3, True, 3, None),
+        (5, 1, False, 1, None),
+        (0, 1, False, 1, 1),
+    ],
+)
+def test_when_scale_then_floor_held_at_running_tasks_during_show(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    current: int, floor: int, on: bool, minimum: int, updated: int | None
+) -> None:
+    autoscaling, ecs = MagicMock(), MagicMock()
+    ecs.describe_services.return_value = {"services": [{"desiredCount": current}]}
+
+    result = scheduler.scale(autoscaling, ecs, "cluster", "service", floor, on)
+
+    autoscaling.register_scalable_target.assert_called_once_with(
+        ServiceNamespace="ecs",
+        ResourceId="service/cluster/service",
+        ScalableDimension="ecs:service:DesiredCount",
+        MinCapacity=minimum,
+    )
+    if updated is None:
+        ecs.update_service.assert_not_called()
+        assert result == (minimum, current)
+    else:
+        ecs.update_service.assert_called_once_with(
+            cluster="cluster", service="service", desiredCount=updated
+        )
+        assert result == (minimum, updated)
+
+
+def _rds(*statuses: str) -> MagicMock:
+    rds = MagicMock()
+    rds.describe_db_instances.side_effect = [
+        {"DBInstances": [{"DBInstanceStatus": status}]} for status in statuses
+    ]
+    return rds
+
+
+def _ssm(published: str) -> MagicMock:
+    ssm = MagicMock()
+    ssm.get_parameter.return_value = {"Parameter": {"Value": published}}
+    return ssm
+
+
+def _published(ssm: MagicMock) -> list:
+    return [call.kwargs["Value"] for call in ssm.put_parameter.call_args_list]
+
+
+def test_given_stopped_database_when_show_on_then_started_and_polled_until_available() -> None:
+    rds, ssm = _rds("stopped", "starting", "available"), _ssm("stopped")
+
+    with patch.object(scheduler.time, "sleep") as sleep:
+        status = scheduler.park(rds, ssm, "instance", "/p-e/db-state", True, 60)
+
+    assert status == "available"
+    rds.start_db_instance.assert_called_once_with(DBInstanceIdentifier="instance")
+    assert sleep.call_count == 2
+    assert _published(ssm) == ["available"]
+
+
+def test_given_database_not_ready_when_show_on_then_starting_published() -> None:
+    rds, ssm = _rds("stopped"), _ssm("stopped")
+
+    status = scheduler.park(rds, ssm, "instance", "/p-e/db-state", True, 0)
+
+    assert status == "starting"
+    assert _published(ssm) == ["starting"]
+
+
+def test_given_available_database_when_show_off_then_stopping_published_before_stop() -> None:
+    rds, ssm = _rds("available"), _ssm("available")
+    calls = MagicMock()
+    calls.attach_mock(ssm.put_parameter, "put_parameter")
+    calls.attach_mock(rds.stop_db_instance, "stop_db_instance")
+
+    status = scheduler.park(rds, ssm, "instance", "/p-e/db-state", False, 60)
+
+    assert status == "stopping"
+    assert calls.mock_calls[0] == (
+        "put_parameter",
+        (),
+        {"Name": "/p-e/db-state", "Value": "stopping", "Type": "String", "Overwrite": True},
+    )
+    rds.stop_db_instance.assert_called_once_with(DBInstanceIdentifier="instance")
+
+
+def test_given_stopped_database_when_show_off_then_left_alone() -> None:
+    rds, ssm = _rds("stopped"), _ssm("stopped")
+
+    assert scheduler.park(rds, ssm, "instance", "/p-e/db-state", False, 60) == "stopped"
+
+    rds.start_db_instance.assert_not_called()
+    rds.stop_db_instance.assert_not_called()
+    ssm.put_parameter.assert_not_called()
+
+
+def _lambda_client(requested: int | None) -> MagicMock:
+    client = MagicMock()
+    if requested is None:
+        client.get_provisioned_concurrency_config.side_effect = ClientError(
+            {"Error": {"Code": "ProvisionedConcurrencyConfigNotFoundException"}},
+            "GetProvisionedConcurrencyConfig",
+        )
+    else:
+        client.get_provisioned_concurrency_config.return_value = {
+            "RequestedProvisionedConcurrentExecutions": requested
+        }
+    return client
+
+
+def test_given_none_provisioned_when_show_on_then_provisioned() -> None:
+    client = _lambda_client(None)
+
+    assert scheduler.provision(client, "proxy", "live", 2, True) == 2
+
+    client.put_provisioned_concurrency_config.assert_called_once_with(
+        FunctionName="proxy", Qualifier="live", ProvisionedConcurrentExecutions=2
+    )
+
+
+def test_given_provisioned_when_show_on_then_left_alone() -> None:
+    client = _lambda_client(2)
+
+    assert scheduler.provision(client, "proxy", "live", 2, True) == 2
+
+    client.put_provisioned_concurrency_config.assert_not_called()
+    client.delete_provisioned_concurrency_config.assert_not_called()
+
+
+def test_given_provisioned_when_show_off_then_removed() -> None:
+    client = _lambda_client(2)
+
+    assert scheduler.provision(client, "proxy", "live", 2, False) == 0
+
+    client.delete_provisioned_concurrency_config.assert_called_once_with(
+        FunctionName="proxy", Qualifier="live"
+    )
+
+
+def test_given_none_provisioned_when_show_off_then_left_alone() -> None:
+    client = _lambda_client(None)
+
+    assert scheduler.provision(client, "proxy", "live", 2, False) == 0
+
+    client.delete_provisioned_concurrency_config.assert_not_called()
+
+
+def test_given_provisioning_fails_when_show_on_then_current_kept() -> None:
+    client = _lambda_client(None)
+    client.put_provisioned_concurrency_config.side_effect = ClientError(
+        {"Error": {"Code": "TooManyRequestsException"}}, "PutProvisionedConcurrencyConfig"
+    )
+
+    assert scheduler.provision(client, "proxy", "live", 2, True) == 0
+
+
+def test_when_warm_then_every_task_called() -> None:
+    addresses = [
+        (socket.AF_INET, None, None, "", (ip, 5000))
+        for ip in ("10.0.0.2", "10.0.0.1", "10.0.0.2")
+    ]
+    connection = MagicMock()
+    connection.getresponse.side_effect = [MagicMock(status=200), MagicMock(status=503)]
+
+    with patch.object(
+        scheduler.socket, "getaddrinfo", return_value=addresses
+    ), patch.object(scheduler, "HTTPConnection", return_value=connection) as connect:
+        results = scheduler.warm("runtime.local", 5000, 5)
+
+    assert results == {"10.0.0.1": 200, "10.0.0.2": 503}
+    connect.assert_any_call("10.0.0.1", 5000, timeout=5)
+    connection.request.assert_called_with("POST", "/health/warm", body=b"")
+    assert connection.close.call_count == 2
+
+
+def test_given_task_not_answering_when_warm_then_error_reported() -> None:
+    addresses = [(socket.AF_INET, None, None, "", ("10.0.0.1", 5000))]
+    connection = MagicMock()
+    connection.request.side_effect = ConnectionRefusedError("refused")
+
+    with patch.object(
+        scheduler.socket, "getaddrinfo", return_value=addresses
+    ), patch.object(scheduler, "HTTPConnection", return_value=connection):
+        assert scheduler.warm("runtime.local", 5000, 5) == {"10.0.0.1": "refused"}
+
+
+def test_given_no_tasks_when_warm_then_nothing_called() -> None:
+    with patch.object(
+        scheduler.socket, "getaddrinfo", side_effect=socket.gaierror("unknown")
+    ):
+        assert not scheduler.warm("runtime.local", 5000, 5)
+
+
+def test_when_spooled_then_pending_per_task_and_errors_reported() -> None:
+    addresses = [(socket.AF_INET, None, None, "", (ip, 5000)) for ip in ("10.0.0.1", "10.0.0.2")]
+    connection = MagicMock()
+    connection.getresponse.return_value.read.return_value = b'{"status": "ok", "pending": 2}'
+    connection.request.side_effect = [None, OSError("refused")]
+
+    with patch.object(
+        scheduler.socket, "getaddrinfo", return_value=addresses
+    ), patch.object(scheduler, "HTTPConnection", return_value=connection):
+        results = scheduler.spooled("runtime.local", 5000, 5)
+
+    assert results == {"10.0.0.1": 2, "10.0.0.2": "refused"}
+    connection.request.assert_any_call("GET", "/health/spool", body=None)
+
+
+@pytest.fixture()
+def environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name, value in {
+        "BUCKET_NAME": "bucket",
+        "CLUSTER_NAME": "cluster",
+        "SERVICE_NAME": "service",
+        "RUNTIME_HOST": "runtime.local",
+        "SHOW_TASKS": "3",
+        "MIN_TASKS": "1",
+    }.items():
+        monkeypatch.setenv(name, value)
+
+
+def test_given_show_on_when_handler_then_scaled_out_and_warmed(
+    environment: None,  # pylint: disable=unused-argument
+) -> None:
+    now = datetime.now(timezone.utc)
+    show = {
+        **SHOW,
+        "start_time": now.isoformat(),
+        "end_time": (now + timedelta(hours=2)).isoformat(),
+    }
+    s3, ecs, autoscaling = MagicMock(), MagicMock(), MagicMock()
+    s3.get_object.return_value = {"Body": io.BytesIO(json.dumps([show]).encode())}
+    ecs.describe_services.return_value = {"services": [{"desiredCount": 1}]}
+
+    clients = {"s3": s3, "ecs": ecs, "application-autoscaling": autoscaling}
+
+    with patch.object(scheduler.boto3, "client", side_effect=clients.get), patch.object(
+        scheduler, "warm", return_value={"10.0.0.1": 200}
+    ) as warm:
+        result = scheduler.handler({}, None)
+
+    assert result == {
+        "showtime": True,
+        "spooled": {},
+        "min_capacity": 3,
+        "desired_count": 3,
+        "database": None,
+        "proxy_concurrency": None,
+        "warmed": {"10.0.0.1": 200},
+    }
+    s3.get_object.assert_called_once_with(Bucket="bucket", Key="shows/shows.json")
+    warm.assert_called_once_with("runtime.local", 5000, 20.0)
+
+
+def test_given_spooled_requests_when_show_off_then_held_and_database_kept(
+    environment: None,  # pylint: disable=unused-argument
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("DB_INSTANCE", "instance")
+    monkeypatch.setenv("DB_STATE_PARAMETER", "/p-e/db-state")
+    s3, ecs, autoscaling = MagicMock(), MagicMock(), MagicMock()
+    s3.get_object.return_value = {"Body": io.BytesIO(json.dumps([SHOW]).encode())}
+    ecs.describe_services.return_value = {"services": [{"desiredCount": 2}]}
+    rds, ssm = _rds("available"), _ssm("available")
+    clients = {
+        "s3": s3, "ecs": ecs, "application-autoscaling": autoscaling, "rds": rds, "ssm": ssm
+    }
+
+    with patch.object(scheduler.boto3, "client", side_effect=clients.get), patch.object(
+        scheduler, "spooled", return_value={"10.0.0.1": 1, "10.0.0.2": "refused"}
+    ), patch.object(scheduler, "warm") as warm:
+        result = scheduler.handler({}, None)
+
+    assert result["showtime"] is False
+    assert result["min_capacity"] == 3
+    assert result["database"] == "available"
+    rds.stop_db_instance.assert_not_called()
+    warm.assert_not_called()
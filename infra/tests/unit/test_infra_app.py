@@ -18,6 +18,8 @@ with patch("aws_cdk.App"), patch("aws_cdk.Environment"), patch(
     "infra.stacks.runtime.RuntimeStack"
 ), patch(
     "infra.stacks.runtime.RuntimeStackArgs"
+), patch(
+    "infra.stacks.show.ShowStack"
 ), patch(
     "infra.stacks.deployment.DeploymentStack"
 ):
@@ -37,6 +39,8 @@ def test_default_project_name():
         "infra.stacks.runtime.RuntimeStack"
     ), patch(
         "infra.stacks.runtime.RuntimeStackArgs"
+    ), patch(
+        "infra.stacks.show.ShowStack"
     ), patch(
         "infra.stacks.deployment.DeploymentStack"
     ):
@@ -66,6 +70,8 @@ class Mocks:  # pylint: disable=missing-class-docstring, too-many-instance-attri
     storage_stack_args: MagicMock
     runtime_stack: MagicMock
     runtime_stack_args: MagicMock
+    show_stack: MagicMock
+    show_stack_args: MagicMock
     deployment_stack: MagicMock
     deployment_stack_args: MagicMock
 
@@ -97,6 +103,10 @@ def mock_invocations():  # pylint: disable=missing-function-docstring, missing-m
     ) as mock_runtime_stack, patch(
         "infra.stacks.runtime.RuntimeStackArgs"
     ) as mock_runtime_stack_args, patch(
+        "infra.stacks.show.ShowStack"
+    ) as mock_show_stack, patch(
+        "infra.stacks.show.ShowStackArgs"
+    ) as mock_show_stack_args, patch(
         "infra.stacks.deployment.DeploymentStack"
     ) as mock_deployment_stack, patch(
         "infra.stacks.deployment.DeploymentStackArgs"
@@ -118,6 +128,8 @@ def mock_invocations():  # pylint: disable=missing-function-docstring, missing-m
         storage_stack_args=mock_storage_stack_args,
         runtime_stack=mock_runtime_stack,
         runtime_stack_args=mock_runtime_stack_args,
+        show_stack=mock_show_stack,
+        show_stack_args=mock_show_stack_args,
         deployment_stack=mock_deployment_stack,
         deployment_stack_args=mock_deployment_stack_args,
     )
@@ -201,6 +213,9 @@ def test_runtime_stack(mock_invocations):
         policy=mock_invocations.user_management_stack.return_value.superuser_construct.policy,
         cluster=mock_invocations.compute_stack.return_value.cluster_construct.cluster,
         db_instance=mock_invocations.storage_stack.return_value.rds_construct.db_instance,
+        db_proxy=mock_invocations.storage_stack.return_value.rds_construct.proxy,
+        http_api=mock_invocations.network_stack.return_value.gateway_construct.http_api,
+        proxy_alias=mock_invocations.network_stack.return_value.gateway_construct.alias,
         cache_cluster=mock_invocations.storage_stack.return_value.cache_construct.cluster,
         load_balancer=mock_invocations.network_stack.return_value.load_balancer_construct.load_balancer,  # pylint: disable=line-too-long
     )
@@ -210,6 +225,17 @@ def test_runtime_stack(mock_invocations):
     )
 
 
+def test_show_stack(mock_invocations):
+    mock_invocations.show_stack_args.assert_called_once_with(
+        mock_invocations.config.return_value,
+        vpc=mock_invocations.network_stack.return_value.vpc_construct.vpc,
+    )
+    mock_invocations.show_stack.assert_called_once_with(
+        mock_invocations.cdk_app.return_value,
+        mock_invocations.show_stack_args.return_value,
+    )
+
+
 def test_deployment_stack(mock_invocations):
     mock_invocations.deployment_stack_args.assert_called_once_with(
         config=mock_invocations.config.return_value,
@@ -2,7 +2,7 @@
 import aws_cdk as cdk
 import pytest
 
-from infra.config import Config
+from infra.config import Config, ScalingConfig
 
 PROJECT_NAME = "TestProject"
 ENVIRONMENT_NAME = "TestEnvironment"
@@ -25,3 +25,45 @@ def test_config_str_representation(config: Config):
         str(config)
         == f"Config(project_name={PROJECT_NAME}, environment_name={ENVIRONMENT_NAME}, cdk_environment={CDK_ENVIRONMENT})"  # pylint: disable=line-too-long
     )
+
+
+def test_config_scaling_defaults(config: Config):
+    assert config.scaling.min_tasks == 1
+    assert config.scaling.max_tasks == 4
+    assert config.scaling.show_tasks == 2
+    assert config.scaling.proxy_concurrency == 0
+
+
+def test_config_scaling_production():
+    config = Config(PROJECT_NAME, "production", CDK_ENVIRONMENT)
+
+    assert config.scaling.min_tasks == 1
+    assert config.scaling.max_tasks == 10
+    assert config.scaling.show_tasks == 3
+
+
+def test_scaling_config_max_covers_show_tasks():
+    scaling = ScalingConfig(min_tasks=2, max_tasks=1, show_tasks=5)
+
+    assert scaling.max_tasks == 5
+
+
+def test_config_integration_defaults_to_lambda(config: Config):
+    assert config.integration == "lambda"
+
+
+def test_config_integration_production():
+    config = Config(PROJECT_NAME, "production", CDK_ENVIRONMENT)
+
+    assert config.integration == "direct"
+
+
+def test_config_integration_override():
+    config = Config(PROJECT_NAME, "production", CDK_ENVIRONMENT, integration="lambda")
+
+    assert config.integration == "lambda"
+
+
+def test_config_unknown_integration():
+    with pytest.raises(ValueError):
+        Config(PROJECT_NAME, ENVIRONMENT_NAME, CDK_ENVIRONMENT, integration="alb")